@@ -0,0 +1,276 @@
+import contextvars
+import itertools
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any
+
+from botocore.client import BaseClient
+from opentelemetry import metrics
+
+from swo_aws_extension.utils.latency import LatencyPercentiles, LatencyWindow
+
+SUMMARY_ROW_FORMAT = (
+    "{0:<20}{1:<40}{2:<14}{3:>8}{4:>9}{5:>11}{6:>8}{7:>10}{8:>9}{9:>9}{10:>9}{11:>14}"
+)
+# Latest call durations per operation the p50 and p95 of the run summary are taken from.
+CALL_DURATIONS_WINDOW_SIZE = 1000
+CALL_IN_PROGRESS_KEY = "swo_aws_call_in_progress"
+# Error codes botocore's standard retry mode treats as throttling.
+THROTTLING_ERROR_CODES = frozenset((
+    "BandwidthLimitExceeded",
+    "EC2ThrottledException",
+    "LimitExceededException",
+    "PriorRequestNotComplete",
+    "ProvisionedThroughputExceededException",
+    "RequestLimitExceeded",
+    "RequestThrottled",
+    "RequestThrottledException",
+    "SlowDown",
+    "ThrottledException",
+    "Throttling",
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "TransactionInProgressException",
+))
+
+meter = metrics.get_meter(__name__)
+aws_call_duration = meter.create_histogram(
+    "aws.call.duration", unit="s", description="Duration of an AWS API call, including retries"
+)
+aws_calls = meter.create_counter("aws.call.calls", description="AWS API calls")
+aws_call_retries = meter.create_counter("aws.call.retries", description="Retries of AWS API calls")
+aws_call_throttles = meter.create_counter(
+    "aws.call.throttles", description="Throttled attempts of AWS API calls"
+)
+aws_call_errors = meter.create_counter("aws.call.errors", description="Failed AWS API calls")
+aws_call_bytes = meter.create_counter(
+    "aws.call.bytes", unit="By", description="Response bytes received from AWS API calls"
+)
+
+
+@dataclass(frozen=True, order=True)
+class AWSCallKey:
+    """Service, operation and account an AWS API call is accounted to."""
+
+    service: str
+    operation: str
+    account_id: str
+
+
+@dataclass
+class AWSCallCounts:
+    """Retries, throttles and bytes of one AWS API call, filled in by the botocore handlers."""
+
+    retries: int = 0
+    throttles: int = 0
+    byte_count: int = 0
+    failed: bool = False
+
+
+@dataclass
+class AWSCallTotals:
+    """Calls, time and counts of an AWS API operation over a command run."""
+
+    calls: int = 0
+    retries: int = 0
+    throttles: int = 0
+    errors: int = 0
+    byte_count: int = 0
+    seconds: float = 0
+    max_seconds: float = 0
+    durations: LatencyWindow = field(
+        default_factory=lambda: LatencyWindow(CALL_DURATIONS_WINDOW_SIZE),
+        repr=False,
+        compare=False,
+    )
+
+    def add(self, seconds: float, counts: AWSCallCounts) -> None:
+        """Add a call of the operation."""
+        self.calls += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.durations.record(seconds)
+        self.retries += counts.retries
+        self.throttles += counts.throttles
+        self.errors += int(counts.failed)
+        self.byte_count += counts.byte_count
+
+    def get_percentiles(self) -> LatencyPercentiles:
+        """Median and 95th percentile of the latest ``CALL_DURATIONS_WINDOW_SIZE`` calls."""
+        return self.durations.get_percentiles()
+
+
+class AWSCallMetrics:
+    """Per-operation accounting of the AWS API calls of a command run.
+
+    Calls are recorded by the botocore handlers ``register_call_metrics`` adds to the
+    clients, and collected with ``collect_aws_call_metrics``, including from worker
+    threads as long as they run in a copy of the caller context.
+    """
+
+    def __init__(self) -> None:
+        self._totals: dict[AWSCallKey, AWSCallTotals] = {}
+        self._lock = threading.Lock()
+
+    def record(self, call_key: AWSCallKey, seconds: float, counts: AWSCallCounts) -> None:
+        """Add a call to the run totals."""
+        with self._lock:
+            self._totals.setdefault(call_key, AWSCallTotals()).add(seconds, counts)
+
+    @property
+    def totals(self) -> dict[AWSCallKey, AWSCallTotals]:
+        """Totals of the called operations, sorted by service, operation and account."""
+        with self._lock:
+            return dict(sorted(self._totals.items()))
+
+    @property
+    def total_calls(self) -> int:
+        """Count the AWS API calls of the run, e.g. to check them against a budget."""
+        return sum(totals.calls for totals in self.totals.values())
+
+    def format_summary(self) -> str:
+        """Format the totals as a plain text table."""
+        summary_rows = [
+            SUMMARY_ROW_FORMAT.format(
+                "Service",
+                "Operation",
+                "Account",
+                "Calls",
+                "Retries",
+                "Throttles",
+                "Errors",
+                "Seconds",
+                "p50 (s)",
+                "p95 (s)",
+                "Max (s)",
+                "Bytes",
+            )
+        ]
+        summary_rows.extend(itertools.starmap(self._format_row, self.totals.items()))
+        return "\n".join(summary_rows)
+
+    def _format_row(self, call_key: AWSCallKey, totals: AWSCallTotals) -> str:
+        percentiles = totals.get_percentiles()
+        return SUMMARY_ROW_FORMAT.format(
+            call_key.service,
+            call_key.operation,
+            call_key.account_id,
+            totals.calls,
+            totals.retries,
+            totals.throttles,
+            totals.errors,
+            f"{totals.seconds:.2f}",
+            f"{percentiles.p50:.3f}",
+            f"{percentiles.p95:.3f}",
+            f"{totals.max_seconds:.3f}",
+            totals.byte_count,
+        )
+
+
+_aws_call_metrics: contextvars.ContextVar[AWSCallMetrics | None] = contextvars.ContextVar(
+    "aws_call_metrics", default=None
+)
+
+
+@contextmanager
+def collect_aws_call_metrics() -> Iterator[AWSCallMetrics]:
+    """Collect the AWS API calls made in the current context until the block exits."""
+    aws_call_metrics = AWSCallMetrics()
+    token = _aws_call_metrics.set(aws_call_metrics)
+    try:
+        yield aws_call_metrics
+    finally:
+        _aws_call_metrics.reset(token)
+
+
+class _CallMetricsHandlers:
+    """Botocore event handlers timing and counting the calls of a client.
+
+    The state of a call in progress is kept in the botocore request context, which
+    is shared by the events of the call and all its retry attempts.
+    """
+
+    def __init__(self, service: str, account_id: str) -> None:
+        self._service = service
+        self._account_id = account_id
+
+    def start_call(self, model: Any, context: dict, **kwargs: Any) -> None:
+        """Start timing a call, before its first attempt is sent."""
+        call_key = AWSCallKey(self._service, model.name, self._account_id)
+        context[CALL_IN_PROGRESS_KEY] = (call_key, time.perf_counter(), AWSCallCounts())
+
+    def count_attempt(
+        self, attempts: int, request_dict: dict, response: Any = None, **kwargs: Any
+    ) -> None:
+        """Count the retries and throttles of a call after each of its attempts."""
+        call_in_progress = request_dict.get("context", {}).get(CALL_IN_PROGRESS_KEY)
+        if call_in_progress is None:
+            return
+        counts = call_in_progress[2]
+        counts.retries = attempts - 1
+        counts.throttles += int(self._is_throttled(response))
+
+    def finish_call(self, http_response: Any, context: dict, **kwargs: Any) -> None:
+        """Record a call that got a response, successful or not."""
+        call_in_progress = context.pop(CALL_IN_PROGRESS_KEY, None)
+        if call_in_progress is None:
+            return
+        counts = call_in_progress[2]
+        counts.byte_count = int(http_response.headers.get("content-length") or 0)
+        counts.failed = http_response.status_code >= HTTPStatus.MULTIPLE_CHOICES
+        self._record_call(*call_in_progress)
+
+    def fail_call(self, context: dict, **kwargs: Any) -> None:
+        """Record a call that failed without a response, e.g. on connection errors."""
+        call_in_progress = context.pop(CALL_IN_PROGRESS_KEY, None)
+        if call_in_progress is None:
+            return
+        call_in_progress[2].failed = True
+        self._record_call(*call_in_progress)
+
+    def _record_call(self, call_key: AWSCallKey, start_time: float, counts: AWSCallCounts) -> None:
+        seconds = time.perf_counter() - start_time
+        attributes = {
+            "service": call_key.service,
+            "operation": call_key.operation,
+            "account": call_key.account_id,
+        }
+        aws_call_duration.record(seconds, attributes)
+        aws_calls.add(1, attributes)
+        aws_call_retries.add(counts.retries, attributes)
+        aws_call_throttles.add(counts.throttles, attributes)
+        aws_call_errors.add(int(counts.failed), attributes)
+        aws_call_bytes.add(counts.byte_count, attributes)
+        aws_call_metrics = _aws_call_metrics.get()
+        if aws_call_metrics is not None:
+            aws_call_metrics.record(call_key, seconds, counts)
+
+    def _is_throttled(self, response: Any) -> bool:
+        if response is None:
+            return False
+        http_response, parsed = response
+        error_code = parsed.get("Error", {}).get("Code")
+        return (
+            error_code in THROTTLING_ERROR_CODES
+            or http_response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+        )
+
+
+def register_call_metrics(client: BaseClient, account_id: str) -> BaseClient:
+    """Register the handlers accounting the calls of a boto3 client.
+
+    Every call is recorded as OpenTelemetry metrics per service, operation and
+    account, and added to the ``AWSCallMetrics`` being collected, if any.
+    """
+    handlers = _CallMetricsHandlers(client.meta.service_model.service_name, account_id or "")
+    # Handlers of more specific events run first and a before-call handler can answer
+    # the call itself, as stubs do, so start timing ahead of all of them.
+    client.meta.events.register_first("before-call.*.*", handlers.start_call)
+    client.meta.events.register("needs-retry", handlers.count_attempt)
+    client.meta.events.register("after-call", handlers.finish_call)
+    client.meta.events.register("after-call-error", handlers.fail_call)
+    return client
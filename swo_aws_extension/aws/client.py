@@ -1,5 +1,6 @@
 import datetime as dt
 import logging
+import threading
 import time
 from collections.abc import Callable
 
@@ -7,9 +8,11 @@ import boto3
 import requests
 from botocore.config import Config as BotoConfig
 
+from swo_aws_extension.aws.call_metrics import register_call_metrics
 from swo_aws_extension.aws.errors import (
     AWSError,
     InvalidDateInTerminateResponsibilityError,
+    InvoicePDFNotReadyError,
     wrap_boto3_error,
 )
 from swo_aws_extension.config import Config
@@ -23,6 +26,9 @@ INVOICE_PDF_DOWNLOAD_TIMEOUT_SECONDS = 60
 # Standard mode retries throttling, server (5xx) and connection errors with
 # exponential backoff and jitter, keeping the default total max attempts.
 BOTO3_CLIENT_CONFIG = BotoConfig(retries={"mode": "standard"})
+# boto3.client() goes through the shared default session, which is not thread-safe;
+# invoice PDFs are downloaded from worker threads.
+_INVOICING_CLIENT_LOCK = threading.Lock()
 
 logger = logging.getLogger(__name__)
 
@@ -380,34 +386,40 @@ class AWSClient:
         )
 
     @wrap_boto3_error
-    def get_invoice_pdf(self, invoice_id: str) -> dict:
+    def get_invoice_pdf(
+        self, invoice_id: str, max_attempts: int = INVOICE_PDF_MAX_ATTEMPTS
+    ) -> dict:
         """Return AWS invoice PDF metadata for an invoice.
 
         ResourceNotFoundException (PDF not yet generated) is retried with
-        exponential backoff before giving up; other errors rely on boto3's
-        built-in retries.
+        exponential backoff up to ``max_attempts`` before raising
+        InvoicePDFNotReadyError; other errors rely on boto3's built-in retries.
         """
         invoicing_client = self._get_invoicing_client()
         attempt = 1
         while True:
             try:
                 return invoicing_client.get_invoice_pdf(InvoiceId=invoice_id)
-            except invoicing_client.exceptions.ResourceNotFoundException:
+            except invoicing_client.exceptions.ResourceNotFoundException as error:
                 # Raised while the PDF is not yet generated; boto3 never retries it,
                 # unlike throttling and 5xx errors, which boto3 retries itself.
-                if attempt >= INVOICE_PDF_MAX_ATTEMPTS:
-                    raise
+                if attempt >= max_attempts:
+                    raise InvoicePDFNotReadyError(
+                        f"Invoice PDF for {invoice_id} is not generated yet. {error}"
+                    ) from error
                 time.sleep(2 ** (attempt - 1))
                 attempt += 1
 
     @wrap_boto3_error
-    def download_invoice_pdf(self, invoice_id: str) -> bytes:
+    def download_invoice_pdf(
+        self, invoice_id: str, max_attempts: int = INVOICE_PDF_MAX_ATTEMPTS
+    ) -> bytes:
         """Return the AWS invoice PDF document content for an invoice.
 
         Resolves the pre-signed URL via GetInvoicePDF and downloads its content.
         The URL is used immediately and never stored.
         """
-        invoice_pdf = self.get_invoice_pdf(invoice_id).get("InvoicePDF", {})
+        invoice_pdf = self.get_invoice_pdf(invoice_id, max_attempts).get("InvoicePDF", {})
         document_url = invoice_pdf.get("DocumentUrl")
         if not isinstance(document_url, str) or not document_url:
             raise AWSError(f"Invoice PDF URL is missing for invoice {invoice_id}")
@@ -461,7 +473,10 @@ class AWSClient:
             raise AWSError("Parameter 'account_id' must be provided to assume the role.")
 
         role_arn = f"arn:aws:iam::{self.account_id}:role/{self.role_name}"
-        response = boto3.client("sts", config=BOTO3_CLIENT_CONFIG).assume_role_with_web_identity(
+        sts_client = register_call_metrics(
+            boto3.client("sts", config=BOTO3_CLIENT_CONFIG), self.account_id
+        )
+        response = sts_client.assume_role_with_web_identity(
             RoleArn=role_arn,
             RoleSessionName="SWOExtensionOnboardingSession",
             WebIdentityToken=self._openid_client.fetch_access_token(self.config.aws_openid_scope),
@@ -478,21 +493,27 @@ class AWSClient:
         return self._get_client("organizations")
 
     def _get_client(self, service_name):
-        return boto3.client(
-            service_name,
-            aws_access_key_id=self.credentials["AccessKeyId"],
-            aws_secret_access_key=self.credentials["SecretAccessKey"],
-            aws_session_token=self.credentials["SessionToken"],
-            config=BOTO3_CLIENT_CONFIG,
+        return register_call_metrics(
+            boto3.client(
+                service_name,
+                aws_access_key_id=self.credentials["AccessKeyId"],
+                aws_secret_access_key=self.credentials["SecretAccessKey"],
+                aws_session_token=self.credentials["SessionToken"],
+                config=BOTO3_CLIENT_CONFIG,
+            ),
+            self.account_id,
         )
 
     def _get_sts_client(self):
-        return boto3.client(
-            "sts",
-            aws_access_key_id=self.credentials["AccessKeyId"],
-            aws_secret_access_key=self.credentials["SecretAccessKey"],
-            aws_session_token=self.credentials["SessionToken"],
-            config=BOTO3_CLIENT_CONFIG,
+        return register_call_metrics(
+            boto3.client(
+                "sts",
+                aws_access_key_id=self.credentials["AccessKeyId"],
+                aws_secret_access_key=self.credentials["SecretAccessKey"],
+                aws_session_token=self.credentials["SessionToken"],
+                config=BOTO3_CLIENT_CONFIG,
+            ),
+            self.account_id,
         )
 
     def _get_cost_explorer_client(self):
@@ -502,13 +523,16 @@ class AWSClient:
         Returns:
             The Cost Explorer client.
         """
-        return boto3.client(
-            "ce",
-            aws_access_key_id=self.credentials["AccessKeyId"],
-            aws_secret_access_key=self.credentials["SecretAccessKey"],
-            aws_session_token=self.credentials["SessionToken"],
-            config=BOTO3_CLIENT_CONFIG,
-            region_name="us-east-1",
+        return register_call_metrics(
+            boto3.client(
+                "ce",
+                aws_access_key_id=self.credentials["AccessKeyId"],
+                aws_secret_access_key=self.credentials["SecretAccessKey"],
+                aws_session_token=self.credentials["SessionToken"],
+                config=BOTO3_CLIENT_CONFIG,
+                region_name="us-east-1",
+            ),
+            self.account_id,
         )
 
     def _get_billing_client(self):
@@ -518,13 +542,16 @@ class AWSClient:
         Returns:
             The Billing client.
         """
-        return boto3.client(
-            "billing",
-            aws_access_key_id=self.credentials["AccessKeyId"],
-            aws_secret_access_key=self.credentials["SecretAccessKey"],
-            aws_session_token=self.credentials["SessionToken"],
-            config=BOTO3_CLIENT_CONFIG,
-            region_name="us-east-1",
+        return register_call_metrics(
+            boto3.client(
+                "billing",
+                aws_access_key_id=self.credentials["AccessKeyId"],
+                aws_secret_access_key=self.credentials["SecretAccessKey"],
+                aws_session_token=self.credentials["SessionToken"],
+                config=BOTO3_CLIENT_CONFIG,
+                region_name="us-east-1",
+            ),
+            self.account_id,
         )
 
     def _get_billing_conductor_client(self):
@@ -534,12 +561,15 @@ class AWSClient:
         Returns:
             The Billing Conductor client.
         """
-        return boto3.client(
-            "billingconductor",
-            aws_access_key_id=self.credentials["AccessKeyId"],
-            aws_secret_access_key=self.credentials["SecretAccessKey"],
-            aws_session_token=self.credentials["SessionToken"],
-            config=BOTO3_CLIENT_CONFIG,
+        return register_call_metrics(
+            boto3.client(
+                "billingconductor",
+                aws_access_key_id=self.credentials["AccessKeyId"],
+                aws_secret_access_key=self.credentials["SecretAccessKey"],
+                aws_session_token=self.credentials["SessionToken"],
+                config=BOTO3_CLIENT_CONFIG,
+            ),
+            self.account_id,
         )
 
     def _get_partner_central_client(self):
@@ -549,13 +579,16 @@ class AWSClient:
         Returns:
             The Partner Central Channel client.
         """
-        return boto3.client(
-            "partnercentral-channel",
-            aws_access_key_id=self.credentials["AccessKeyId"],
-            aws_secret_access_key=self.credentials["SecretAccessKey"],
-            aws_session_token=self.credentials["SessionToken"],
-            config=BOTO3_CLIENT_CONFIG,
-            region_name="us-east-1",
+        return register_call_metrics(
+            boto3.client(
+                "partnercentral-channel",
+                aws_access_key_id=self.credentials["AccessKeyId"],
+                aws_secret_access_key=self.credentials["SecretAccessKey"],
+                aws_session_token=self.credentials["SessionToken"],
+                config=BOTO3_CLIENT_CONFIG,
+                region_name="us-east-1",
+            ),
+            self.account_id,
         )
 
     def _get_invoicing_client(self):
@@ -565,14 +598,18 @@ class AWSClient:
         Returns:
             The Invoicing client.
         """
-        return boto3.client(
-            "invoicing",
-            aws_access_key_id=self.credentials["AccessKeyId"],
-            aws_secret_access_key=self.credentials["SecretAccessKey"],
-            aws_session_token=self.credentials["SessionToken"],
-            config=BOTO3_CLIENT_CONFIG,
-            region_name="us-east-1",
-        )
+        with _INVOICING_CLIENT_LOCK:
+            return register_call_metrics(
+                boto3.client(
+                    "invoicing",
+                    aws_access_key_id=self.credentials["AccessKeyId"],
+                    aws_secret_access_key=self.credentials["SecretAccessKey"],
+                    aws_session_token=self.credentials["SessionToken"],
+                    config=BOTO3_CLIENT_CONFIG,
+                    region_name="us-east-1",
+                ),
+                self.account_id,
+            )
 
 
 def _extract_linked_account_keys(cost_and_usage: list[dict]) -> list[str]:
@@ -45,6 +45,10 @@ class AWSOpenIdError(AWSHttpError):
         return message
 
 
+class InvoicePDFNotReadyError(AWSError):
+    """Raised when the AWS invoice PDF has not been generated yet."""
+
+
 class InvalidDateInTerminateResponsibilityError(AWSError):
     """Raised when date in terminate responsibility is invalid."""
 
@@ -0,0 +1,147 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Self
+
+from swo_aws_extension.aws.fake.cost_explorer import FakeCostExplorerService
+from swo_aws_extension.aws.fake.organizations import (
+    FAKE_PMA_ACCOUNT_ID,
+    FakeOrganization,
+    build_fake_organizations,
+)
+from swo_aws_extension.aws.fake.services import (
+    FakeAWSError,
+    FakeBillingService,
+    FakeInvoicingService,
+    FakeOperation,
+    FakeOrganizationsService,
+    FakePartnerCentralService,
+)
+from swo_aws_extension.config import Config
+
+MILLISECONDS_PER_SECOND = 1000
+
+
+@dataclass(frozen=True)
+class FaultInjection:
+    """Latency added to every fake AWS call and the share of calls throttled."""
+
+    latency_seconds: float = 0
+    throttle_rate: float = 0
+    seed: int = 0
+
+
+class FakeSTSService:
+    """Role credentials for any account, as served by AWS STS."""
+
+    @property
+    def operations(self) -> dict[str, FakeOperation]:
+        """The operations served, by name."""
+        return {
+            "AssumeRoleWithWebIdentity": self.assume_role_with_web_identity,
+            "GetCallerIdentity": lambda api_params: {
+                "UserId": "FAKEUSERID",
+                "Account": FAKE_PMA_ACCOUNT_ID,
+                "Arn": f"arn:aws:sts::{FAKE_PMA_ACCOUNT_ID}:assumed-role/FakeRole/FakeSession",
+            },
+        }
+
+    def assume_role_with_web_identity(self, api_params: dict[str, Any]) -> dict[str, Any]:
+        """Issue fake temporary credentials for the requested role."""
+        account_id = api_params["RoleArn"].split(":")[4]
+        return {
+            "Credentials": {
+                "AccessKeyId": f"ASIAFAKE{account_id}",
+                "SecretAccessKey": "fake-secret-access-key",
+                "SessionToken": "fake-session-token",
+                "Expiration": "2099-01-01T00:00:00Z",
+            }
+        }
+
+
+class FakeBillingConductorService:
+    """Billing groups, as served by AWS Billing Conductor."""
+
+    @property
+    def operations(self) -> dict[str, FakeOperation]:
+        """The operations served, by name."""
+        return {
+            "CreateBillingGroup": self.create_billing_group,
+            "DeleteBillingGroup": lambda api_params: {"Arn": api_params["Arn"]},
+        }
+
+    def create_billing_group(self, api_params: dict[str, Any]) -> dict[str, Any]:
+        """Create a billing group named after the request."""
+        billing_group_name = api_params["Name"]
+        return {
+            "Arn": (
+                f"arn:aws:billingconductor::{FAKE_PMA_ACCOUNT_ID}:billinggroup/{billing_group_name}"
+            )
+        }
+
+
+class FakeAWSBackend:
+    """In-process stand-in for the AWS APIs the extension calls.
+
+    Serves synthetic organizations to ``AWSClient`` without any AWS account, adding
+    latency and throttling errors on request, so the billing and sync pipelines can
+    be benchmarked and load-tested offline. Install it with ``fake_aws_backend``.
+    """
+
+    def __init__(
+        self, organizations: list[FakeOrganization], faults: FaultInjection | None = None
+    ) -> None:
+        self.organizations = organizations
+        self._faults = faults or FaultInjection()
+        self._rng = random.Random(self._faults.seed)  # ruff:ignore[suspicious-non-cryptographic-random-usage]
+        self._lock = threading.Lock()
+        services = {
+            "organizations": FakeOrganizationsService(organizations),
+            "cost-explorer": FakeCostExplorerService(organizations),
+            "billing": FakeBillingService(organizations),
+            "invoicing": FakeInvoicingService(organizations),
+            "partnercentral-channel": FakePartnerCentralService(),
+            "billingconductor": FakeBillingConductorService(),
+            "sts": FakeSTSService(),
+        }
+        self._operations: dict[tuple[str, str], FakeOperation] = {
+            (service_id, operation_name): operation
+            for service_id, service in services.items()
+            for operation_name, operation in service.operations.items()
+        }
+
+    @classmethod
+    def from_config(cls, config: Config) -> Self:
+        """Build the backend configured with the ``AWS_FAKE_BACKEND_*`` settings."""
+        organizations = build_fake_organizations(
+            config.aws_fake_backend_organizations, config.aws_fake_backend_accounts
+        )
+        faults = FaultInjection(
+            latency_seconds=config.aws_fake_backend_latency_ms / MILLISECONDS_PER_SECOND,
+            throttle_rate=config.aws_fake_backend_throttle_rate,
+        )
+        return cls(organizations, faults)
+
+    def answer(self, service_id: str, operation_name: str, api_params: dict[str, Any]) -> dict:
+        """Answer a call of an operation.
+
+        Raises:
+            FakeAWSError: if the call is throttled or fails, or the operation is not served.
+        """
+        self._inject_faults()
+        operation = self._operations.get((service_id, operation_name))
+        if operation is None:
+            raise FakeAWSError(
+                "UnsupportedOperation",
+                f"{service_id} {operation_name} is not served by the fake AWS backend",
+            )
+        return operation(api_params)
+
+    def _inject_faults(self) -> None:
+        if self._faults.latency_seconds:
+            time.sleep(self._faults.latency_seconds)
+        with self._lock:
+            is_throttled = self._rng.random() < self._faults.throttle_rate
+        if is_throttled:
+            raise FakeAWSError("ThrottlingException", "Rate exceeded")
@@ -0,0 +1,176 @@
+import calendar
+import datetime as dt
+import itertools
+import operator
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any
+
+from swo_aws_extension.aws.fake.organizations import FakeCostItem, FakeOrganization
+from swo_aws_extension.aws.fake.services import FakeOperation
+
+COST_AND_USAGE_PAGE_SIZE = 500
+METRIC_NAME = "UnblendedCost"
+
+DatePeriod = tuple[dt.date, dt.date]
+
+
+def _format_metric(amount: Decimal) -> dict[str, dict[str, str]]:
+    return {METRIC_NAME: {"Amount": f"{amount:.10f}", "Unit": "USD"}}
+
+
+def _get_next_period_start(period_start: dt.date, granularity: str) -> dt.date:
+    if granularity == "DAILY":
+        return period_start + dt.timedelta(days=1)
+    last_day = calendar.monthrange(period_start.year, period_start.month)[1]
+    return period_start.replace(day=last_day) + dt.timedelta(days=1)
+
+
+def _split_time_period(start: str, end: str, granularity: str) -> list[DatePeriod]:
+    """Split a time period into the days or months Cost Explorer reports separately."""
+    period_start = dt.date.fromisoformat(start)
+    period_end = dt.date.fromisoformat(end)
+    time_periods = []
+    while period_start < period_end:
+        next_start = _get_next_period_start(period_start, granularity)
+        time_periods.append((period_start, min(next_start, period_end)))
+        period_start = next_start
+    return time_periods
+
+
+def _matches(cost_item: FakeCostItem, expression: dict[str, Any] | None) -> bool:
+    """Evaluate the subset of Cost Explorer filter expressions the extension uses."""
+    if not expression:
+        return True
+    expression_type, operand = next(iter(expression.items()))
+    if expression_type == "And":
+        return all(_matches(cost_item, and_operand) for and_operand in operand)
+    if expression_type == "Or":
+        return any(_matches(cost_item, or_operand) for or_operand in operand)
+    if expression_type == "Not":
+        return not _matches(cost_item, operand)
+    return cost_item.get_dimension(operand["Key"]) in operand["Values"]
+
+
+def _number_groups(results_by_time: list[dict]) -> list[tuple[int, dict]]:
+    return [
+        (index, group)
+        for index, result_by_time in enumerate(results_by_time)
+        for group in result_by_time["Groups"]
+    ]
+
+
+def _paginate_groups(results_by_time: list[dict], page_token: str | None) -> dict[str, Any]:
+    """Cut a page of groups, keeping the time period of each group."""
+    page_start = int(page_token or 0)
+    groups = _number_groups(results_by_time)
+    page_results = [
+        {**results_by_time[index], "Groups": list(map(operator.itemgetter(1), period_groups))}
+        for index, period_groups in itertools.groupby(
+            groups[page_start : page_start + COST_AND_USAGE_PAGE_SIZE],
+            key=operator.itemgetter(0),
+        )
+    ]
+    if page_start + COST_AND_USAGE_PAGE_SIZE < len(groups):
+        return {
+            "ResultsByTime": page_results,
+            "NextPageToken": str(page_start + COST_AND_USAGE_PAGE_SIZE),
+        }
+    return {"ResultsByTime": page_results}
+
+
+class FakeCostExplorerService:
+    """Daily costs of the fake organizations, as served by AWS Cost Explorer.
+
+    Costs are grouped, filtered and split by day or month like Cost Explorer does,
+    and grouped reports are paginated, so large organizations need several pages.
+    """
+
+    def __init__(self, organizations: list[FakeOrganization]) -> None:
+        self._organizations = organizations
+        self._organizations_by_view = {
+            organization.billing_view_arn: organization for organization in organizations
+        }
+
+    @property
+    def operations(self) -> dict[str, FakeOperation]:
+        """The operations served, by name."""
+        return {"GetCostAndUsage": self.get_cost_and_usage}
+
+    def get_cost_and_usage(self, api_params: dict[str, Any]) -> dict[str, Any]:
+        """Report the costs of a billing view, or of every organization without one."""
+        dimension_keys = [group["Key"] for group in api_params.get("GroupBy", [])]
+        cost_items = [
+            cost_item
+            for cost_item in self._get_cost_items(api_params.get("BillingViewArn"))
+            if _matches(cost_item, api_params.get("Filter"))
+        ]
+        results_by_time = [
+            self._build_result_by_time(cost_items, time_period, dimension_keys)
+            for time_period in _split_time_period(
+                api_params["TimePeriod"]["Start"],
+                api_params["TimePeriod"]["End"],
+                api_params["Granularity"],
+            )
+        ]
+        if not dimension_keys:
+            return {"ResultsByTime": results_by_time}
+        response = _paginate_groups(results_by_time, api_params.get("NextPageToken"))
+        if "LINKED_ACCOUNT" in dimension_keys:
+            response["DimensionValueAttributes"] = self._describe_accounts(cost_items)
+        return response
+
+    def _get_cost_items(self, billing_view_arn: str | None) -> list[FakeCostItem]:
+        if billing_view_arn is None:
+            return [
+                cost_item
+                for organization in self._organizations
+                for cost_item in organization.cost_items
+            ]
+        organization = self._organizations_by_view.get(billing_view_arn)
+        return organization.cost_items if organization else []
+
+    def _build_result_by_time(
+        self,
+        cost_items: list[FakeCostItem],
+        time_period: DatePeriod,
+        dimension_keys: list[str],
+    ) -> dict[str, Any]:
+        amounts = self._sum_by_group(
+            cost_items, dimension_keys, (time_period[1] - time_period[0]).days
+        )
+        result_by_time: dict[str, Any] = {
+            "TimePeriod": {"Start": time_period[0].isoformat(), "End": time_period[1].isoformat()},
+            "Total": {},
+            "Groups": [],
+            "Estimated": False,
+        }
+        if dimension_keys:
+            result_by_time["Groups"] = [
+                {"Keys": list(group_keys), "Metrics": _format_metric(amount)}
+                for group_keys, amount in amounts.items()
+            ]
+        else:
+            result_by_time["Total"] = _format_metric(amounts[()])
+        return result_by_time
+
+    def _sum_by_group(
+        self, cost_items: list[FakeCostItem], dimension_keys: list[str], days: int
+    ) -> dict[tuple[str, ...], Decimal]:
+        amounts: dict[tuple[str, ...], Decimal] = defaultdict(Decimal)
+        for cost_item in cost_items:
+            group_keys = tuple(cost_item.get_dimension(key) for key in dimension_keys)
+            amounts[group_keys] += cost_item.daily_amount * days
+        return amounts
+
+    def _describe_accounts(self, cost_items: list[FakeCostItem]) -> list[dict[str, Any]]:
+        account_names = {
+            account_id: name
+            for organization in self._organizations
+            for account_id, name in organization.accounts.items()
+        }
+        account_ids = dict.fromkeys(cost_item.account_id for cost_item in cost_items)
+        return [
+            {"Value": account_id, "Attributes": {"description": account_names[account_id]}}
+            for account_id in account_ids
+        ]
@@ -0,0 +1,202 @@
+import random
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from swo_aws_extension.constants import AWS_MARKETPLACE, AWSRecordTypeEnum
+
+FAKE_PMA_ACCOUNT_ID = "999900000000"
+FAKE_MPA_ACCOUNT_ID_BASE = 100000000000
+FAKE_LINKED_ACCOUNT_ID_BASE = 200000000000
+MAX_LINKED_ACCOUNTS_PER_ORGANIZATION = 10000
+FAKE_INVOICING_ENTITY = "Amazon Web Services, Inc."
+FAKE_BILLING_ENTITY = "AWS"
+FAKE_MARKETPLACE_SERVICE = "Fake Marketplace Product"
+FAKE_SERVICES = (
+    "Amazon Elastic Compute Cloud - Compute",
+    "Amazon Simple Storage Service",
+    "Amazon Relational Database Service",
+    "Amazon DynamoDB",
+    "Amazon CloudFront",
+    "AWS Lambda",
+    "Amazon Virtual Private Cloud",
+    "AmazonCloudWatch",
+)
+DEFAULT_SERVICES_PER_ACCOUNT = 5
+MAX_DAILY_USAGE_CENTS = 50000
+MAX_DAILY_MARKETPLACE_CENTS = 5000
+SPP_DISCOUNT_RATE = Decimal("-0.03")
+TAX_RATE = Decimal("0.2")
+CENTS = Decimal("0.01")
+
+
+@dataclass(frozen=True)
+class FakeCostItem:
+    """A cost accrued every day of a billing period by a linked account."""
+
+    account_id: str
+    service: str
+    record_type: str
+    daily_amount: Decimal
+    billing_entity: str = FAKE_BILLING_ENTITY
+    invoicing_entity: str = FAKE_INVOICING_ENTITY
+
+    def get_dimension(self, dimension_key: str) -> str:
+        """Get the value of a Cost Explorer dimension, e.g. to group or filter by it."""
+        dimensions = {
+            "LINKED_ACCOUNT": self.account_id,
+            "SERVICE": self.service,
+            "RECORD_TYPE": self.record_type,
+            "BILLING_ENTITY": self.billing_entity,
+            "INVOICING_ENTITY": self.invoicing_entity,
+        }
+        return dimensions.get(dimension_key, "")
+
+
+@dataclass
+class FakeOrganization:
+    """A synthetic AWS organization billed through a responsibility transfer."""
+
+    mpa_account_id: str
+    name: str
+    accounts: dict[str, str]
+    cost_items: list[FakeCostItem] = field(default_factory=list)
+    transfer_status: str = "ACCEPTED"
+
+    @property
+    def transfer_id(self) -> str:
+        """Id of the responsibility transfer of the organization billing."""
+        return f"rt-{self.mpa_account_id}"
+
+    @property
+    def transfer_arn(self) -> str:
+        """ARN of the responsibility transfer of the organization billing."""
+        return (
+            f"arn:aws:organizations::{FAKE_PMA_ACCOUNT_ID}:transfer/"
+            f"o-{self.mpa_account_id}/billing/inbound/{self.transfer_id}"
+        )
+
+    @property
+    def billing_view_arn(self) -> str:
+        """ARN of the billing transfer view of the organization."""
+        return (
+            f"arn:aws:billing::{FAKE_PMA_ACCOUNT_ID}:billingview/"
+            f"billing-transfer-{self.mpa_account_id}"
+        )
+
+    @property
+    def invoicing_entities(self) -> list[str]:
+        """Entities invoicing the costs of the organization, in order of appearance."""
+        return list(dict.fromkeys(cost_item.invoicing_entity for cost_item in self.cost_items))
+
+    def get_daily_total(self, invoicing_entity: str | None = None) -> Decimal:
+        """Sum the daily cost of every linked account, or only of an invoicing entity."""
+        return sum(
+            (
+                cost_item.daily_amount
+                for cost_item in self.cost_items
+                if invoicing_entity in {None, cost_item.invoicing_entity}
+            ),
+            Decimal(0),
+        )
+
+
+def get_fake_service_names(service_count: int) -> list[str]:
+    """Name the services billed to each account, inventing names past the known ones."""
+    extra_services = (
+        f"Fake Service {number}" for number in range(len(FAKE_SERVICES), service_count)
+    )
+    return [*FAKE_SERVICES[:service_count], *extra_services]
+
+
+def get_fake_invoicing_entity(service_index: int, invoicing_entity_count: int) -> str:
+    """Spread the services across the invoicing entities, the first being AWS Inc."""
+    entity_number = service_index % max(invoicing_entity_count, 1)
+    if not entity_number:
+        return FAKE_INVOICING_ENTITY
+    return f"Fake Invoicing Entity {entity_number}"
+
+
+def _build_account_cost_items(
+    rng: random.Random, account_id: str, service_names: list[str], invoicing_entity_count: int
+) -> list[FakeCostItem]:
+    cost_items = [
+        FakeCostItem(
+            account_id=account_id,
+            service=service,
+            record_type=AWSRecordTypeEnum.USAGE,
+            daily_amount=rng.randint(1, MAX_DAILY_USAGE_CENTS) * CENTS,
+            invoicing_entity=get_fake_invoicing_entity(service_index, invoicing_entity_count),
+        )
+        for service_index, service in enumerate(service_names)
+    ]
+    usage_amount = sum((cost_item.daily_amount for cost_item in cost_items), Decimal(0))
+    cost_items.extend((
+        FakeCostItem(
+            account_id=account_id,
+            service=cost_items[0].service,
+            record_type=AWSRecordTypeEnum.SOLUTION_PROVIDER_PROGRAM_DISCOUNT,
+            daily_amount=(usage_amount * SPP_DISCOUNT_RATE).quantize(CENTS),
+        ),
+        FakeCostItem(
+            account_id=account_id,
+            service="Tax",
+            record_type=AWSRecordTypeEnum.TAX,
+            daily_amount=(usage_amount * TAX_RATE).quantize(CENTS),
+        ),
+        FakeCostItem(
+            account_id=account_id,
+            service=FAKE_MARKETPLACE_SERVICE,
+            record_type=AWSRecordTypeEnum.USAGE,
+            daily_amount=rng.randint(1, MAX_DAILY_MARKETPLACE_CENTS) * CENTS,
+            billing_entity=AWS_MARKETPLACE,
+        ),
+    ))
+    return cost_items
+
+
+def _build_organization(
+    rng: random.Random,
+    index: int,
+    accounts_per_organization: int,
+    service_names: list[str],
+    invoicing_entity_count: int,
+) -> FakeOrganization:
+    mpa_account_id = str(FAKE_MPA_ACCOUNT_ID_BASE + index)
+    first_account_id = FAKE_LINKED_ACCOUNT_ID_BASE + index * MAX_LINKED_ACCOUNTS_PER_ORGANIZATION
+    accounts = {mpa_account_id: f"Fake Organization {index} Management"}
+    accounts.update(
+        (str(first_account_id + number), f"Fake Organization {index} Account {number}")
+        for number in range(1, accounts_per_organization + 1)
+    )
+    organization = FakeOrganization(mpa_account_id, f"Fake Organization {index}", accounts)
+    for account_id in accounts:
+        organization.cost_items.extend(
+            _build_account_cost_items(rng, account_id, service_names, invoicing_entity_count)
+        )
+    return organization
+
+
+def build_fake_organizations(
+    organization_count: int,
+    accounts_per_organization: int,
+    services_per_account: int = DEFAULT_SERVICES_PER_ACCOUNT,
+    invoicing_entity_count: int = 1,
+    seed: int = 0,
+) -> list[FakeOrganization]:
+    """Build synthetic organizations with linked accounts and their daily costs.
+
+    The same arguments always build the same organizations, so benchmark runs can be
+    compared. The MPA of the n-th organization, counting from 0, is ``100000000000 + n``.
+    Every account uses the same services, spread across the invoicing entities.
+    """
+    rng = random.Random(seed)  # ruff:ignore[suspicious-non-cryptographic-random-usage]
+    accounts_per_organization = min(
+        accounts_per_organization, MAX_LINKED_ACCOUNTS_PER_ORGANIZATION - 1
+    )
+    service_names = get_fake_service_names(services_per_account)
+    return [
+        _build_organization(
+            rng, index, accounts_per_organization, service_names, invoicing_entity_count
+        )
+        for index in range(organization_count)
+    ]
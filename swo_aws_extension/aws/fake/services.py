@@ -0,0 +1,301 @@
+import datetime as dt
+import itertools
+import threading
+from collections.abc import Callable
+from http import HTTPStatus
+from typing import Any
+
+from swo_aws_extension.aws.fake.organizations import FAKE_PMA_ACCOUNT_ID, FakeOrganization
+from swo_aws_extension.billing.generators.invoice import SPP_DISCOUNT_DESCRIPTION
+from swo_aws_extension.models import BillingPeriod
+
+DEFAULT_PAGE_SIZE = 20
+ID_DIGITS = 12
+FAKE_INVOICE_PDF_URL = "https://fake-aws-invoices.invalid/{invoice_id}.pdf"
+
+FakeOperation = Callable[[dict], dict]
+
+
+class FakeAWSError(Exception):
+    """An AWS error response returned by the fake backend."""
+
+    def __init__(self, code: str, message: str, status_code: int = HTTPStatus.BAD_REQUEST) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status_code = status_code
+
+
+def paginate(
+    entries: list[dict], api_params: dict[str, Any], token_key: str, max_results_key: str
+) -> dict[str, Any]:
+    """Cut the page of entries a paginated request asks for.
+
+    Returns the page as ``items`` and, if more entries are left, the token of the next
+    page under ``token_key``.
+    """
+    offset = int(api_params.get(token_key) or 0)
+    page_size = int(api_params.get(max_results_key) or DEFAULT_PAGE_SIZE)
+    page: dict[str, Any] = {"items": entries[offset : offset + page_size]}
+    if offset + page_size < len(entries):
+        page[token_key] = str(offset + page_size)
+    return page
+
+
+def _describe_transfer(organization: FakeOrganization) -> dict[str, Any]:
+    return {
+        "Arn": organization.transfer_arn,
+        "Name": organization.name,
+        "Id": organization.transfer_id,
+        "Type": "BILLING",
+        "Status": organization.transfer_status,
+        "Source": {"ManagementAccountId": organization.mpa_account_id},
+        "Target": {"ManagementAccountId": FAKE_PMA_ACCOUNT_ID},
+        "StartTimestamp": "2025-01-01T00:00:00+00:00",
+    }
+
+
+class FakeOrganizationsService:
+    """Responsibility transfers of the fake organizations, as served by AWS Organizations."""
+
+    def __init__(self, organizations: list[FakeOrganization]) -> None:
+        self._organizations = {
+            organization.transfer_id: organization for organization in organizations
+        }
+
+    @property
+    def operations(self) -> dict[str, FakeOperation]:
+        """The operations served, by name."""
+        return {
+            "ListInboundResponsibilityTransfers": self.list_inbound_responsibility_transfers,
+            "DescribeResponsibilityTransfer": self.describe_responsibility_transfer,
+            "InviteOrganizationToTransferResponsibility": self.invite_organization,
+            "TerminateResponsibilityTransfer": self.terminate_responsibility_transfer,
+        }
+
+    def list_inbound_responsibility_transfers(self, api_params: dict[str, Any]) -> dict[str, Any]:
+        """List the transfers of every organization."""
+        transfers = [
+            _describe_transfer(organization) for organization in self._organizations.values()
+        ]
+        page = paginate(transfers, api_params, "NextToken", "MaxResults")
+        page["ResponsibilityTransfers"] = page.pop("items")
+        return page
+
+    def describe_responsibility_transfer(self, api_params: dict[str, Any]) -> dict[str, Any]:
+        """Describe the transfer of an organization."""
+        return {
+            "ResponsibilityTransfer": _describe_transfer(self._get_organization(api_params["Id"]))
+        }
+
+    def invite_organization(self, api_params: dict[str, Any]) -> dict[str, Any]:
+        """Invite an account to transfer its billing, creating an organization for it."""
+        mpa_account_id = api_params["Target"]["Id"]
+        organization = FakeOrganization(
+            mpa_account_id, api_params["SourceName"], {mpa_account_id: api_params["SourceName"]}
+        )
+        organization.transfer_status = "REQUESTED"
+        self._organizations[organization.transfer_id] = organization
+        handshake_id = f"h-{mpa_account_id}"
+        return {
+            "Handshake": {
+                "Id": handshake_id,
+                "Arn": f"arn:aws:organizations::{FAKE_PMA_ACCOUNT_ID}:handshake/{handshake_id}",
+                "State": "OPEN",
+                "RequestedTimestamp": dt.datetime.now(dt.UTC).isoformat(),
+            }
+        }
+
+    def terminate_responsibility_transfer(self, api_params: dict[str, Any]) -> dict[str, Any]:
+        """Withdraw the transfer of an organization."""
+        organization = self._get_organization(api_params["Id"])
+        organization.transfer_status = "WITHDRAWN"
+        return {"ResponsibilityTransfer": _describe_transfer(organization)}
+
+    def _get_organization(self, transfer_id: str) -> FakeOrganization:
+        try:
+            return self._organizations[transfer_id]
+        except KeyError:
+            raise FakeAWSError(
+                "ResponsibilityTransferNotFoundException",
+                f"Responsibility transfer {transfer_id} not found",
+            ) from None
+
+
+class FakeBillingService:
+    """Billing transfer views of the fake organizations, as served by AWS Billing."""
+
+    def __init__(self, organizations: list[FakeOrganization]) -> None:
+        self._organizations = organizations
+
+    @property
+    def operations(self) -> dict[str, FakeOperation]:
+        """The operations served, by name."""
+        return {"ListBillingViews": self.list_billing_views}
+
+    def list_billing_views(self, api_params: dict[str, Any]) -> dict[str, Any]:
+        """List the billing transfer views, of one source account if given."""
+        source_account_id = api_params.get("sourceAccountId")
+        billing_views = [
+            {
+                "arn": organization.billing_view_arn,
+                "name": f"Billing transfer view of {organization.name}",
+                "ownerAccountId": FAKE_PMA_ACCOUNT_ID,
+                "sourceAccountId": organization.mpa_account_id,
+                "billingViewType": "BILLING_TRANSFER",
+            }
+            for organization in self._organizations
+            if source_account_id in {None, organization.mpa_account_id}
+        ]
+        page = paginate(billing_views, api_params, "nextToken", "maxResults")
+        page["billingViews"] = page.pop("items")
+        return page
+
+
+class FakeInvoicingService:
+    """Monthly invoices of the fake organizations, as served by AWS Invoicing."""
+
+    def __init__(self, organizations: list[FakeOrganization]) -> None:
+        self._organizations = organizations
+
+    @property
+    def operations(self) -> dict[str, FakeOperation]:
+        """The operations served, by name."""
+        return {
+            "ListInvoiceSummaries": self.list_invoice_summaries,
+            "GetInvoicePDF": self.get_invoice_pdf,
+        }
+
+    def list_invoice_summaries(self, api_params: dict[str, Any]) -> dict[str, Any]:
+        """List the invoices of a month, of every organization when selecting the PMA."""
+        account_id = api_params["Selector"]["Value"]
+        billing_period = BillingPeriod.from_year_month(
+            api_params["Filter"]["BillingPeriod"]["Year"],
+            api_params["Filter"]["BillingPeriod"]["Month"],
+        )
+        invoices = [
+            self._build_invoice(organization, invoicing_entity, billing_period)
+            for organization in self._organizations
+            if account_id in {FAKE_PMA_ACCOUNT_ID, organization.mpa_account_id}
+            for invoicing_entity in organization.invoicing_entities
+        ]
+        page = paginate(invoices, api_params, "NextToken", "MaxResults")
+        page["InvoiceSummaries"] = page.pop("items")
+        return page
+
+    def get_invoice_pdf(self, api_params: dict[str, Any]) -> dict[str, Any]:
+        """Get the URL of an invoice document, downloaded through the fake transport."""
+        invoice_id = api_params["InvoiceId"]
+        return {
+            "InvoicePDF": {
+                "InvoiceId": invoice_id,
+                "DocumentUrl": FAKE_INVOICE_PDF_URL.format(invoice_id=invoice_id),
+            }
+        }
+
+    def _build_invoice(
+        self, organization: FakeOrganization, invoicing_entity: str, billing_period: BillingPeriod
+    ) -> dict[str, Any]:
+        days = (
+            dt.date.fromisoformat(billing_period.end_date)
+            - dt.date.fromisoformat(billing_period.start_date)
+        ).days
+        total_amount = str(organization.get_daily_total(invoicing_entity) * days)
+        entity_number = organization.invoicing_entities.index(invoicing_entity)
+        # Only the invoice of AWS Inc. carries the SPP discount, like the real primary invoice
+        discounts = [] if entity_number else [{"Description": SPP_DISCOUNT_DESCRIPTION}]
+        currency_amount = {
+            "TotalAmount": total_amount,
+            "TotalAmountBeforeTax": total_amount,
+            "CurrencyCode": "USD",
+            "AmountBreakdown": {"Discounts": {"Breakdown": discounts}},
+            "CurrencyExchangeDetails": {"Rate": "1"},
+        }
+        return {
+            "AccountId": FAKE_PMA_ACCOUNT_ID,
+            "InvoiceId": "".join((
+                "FAKE",
+                str(billing_period.year),
+                str(billing_period.month).zfill(2),
+                organization.mpa_account_id[-6:],
+                str(entity_number),
+            )),
+            "BillSourceAccounts": [organization.mpa_account_id],
+            "Entity": {"InvoicingEntity": invoicing_entity},
+            "BillingPeriod": {"Month": billing_period.month, "Year": billing_period.year},
+            "BaseCurrencyAmount": currency_amount,
+            "PaymentCurrencyAmount": currency_amount,
+        }
+
+
+class FakePartnerCentralService:
+    """Relationships and channel handshakes, as served by Partner Central Channel."""
+
+    def __init__(self) -> None:
+        self._handshakes_by_resource: dict[str, list[dict]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def operations(self) -> dict[str, FakeOperation]:
+        """The operations served, by name."""
+        return {
+            "ListProgramManagementAccounts": self.list_program_management_accounts,
+            "CreateRelationship": self.create_relationship,
+            "DeleteRelationship": lambda api_params: {},
+            "CreateChannelHandshake": self.create_channel_handshake,
+            "ListChannelHandshakes": self.list_channel_handshakes,
+        }
+
+    def list_program_management_accounts(self, api_params: dict[str, Any]) -> dict[str, Any]:
+        """List one program management account for each requested account."""
+        return {
+            "items": [
+                {
+                    "id": f"pma-{account_id}",
+                    "catalog": api_params["catalog"],
+                    "accountId": account_id,
+                    "status": "ACTIVE",
+                }
+                for account_id in api_params.get("accountIds", [])
+            ]
+        }
+
+    def create_relationship(self, api_params: dict[str, Any]) -> dict[str, Any]:
+        """Create a relationship with an end customer account."""
+        relationship_number = str(next(self._ids)).zfill(ID_DIGITS)
+        relationship_id = f"rs-{relationship_number}"
+        return {
+            "relationshipDetail": {
+                "id": relationship_id,
+                "arn": f"arn:aws:partnercentral:us-east-1::relationship/{relationship_id}",
+                "displayName": api_params["displayName"],
+            }
+        }
+
+    def create_channel_handshake(self, api_params: dict[str, Any]) -> dict[str, Any]:
+        """Create a handshake, accepted right away, for a relationship."""
+        handshake_number = str(next(self._ids)).zfill(ID_DIGITS)
+        handshake_id = f"hs-{handshake_number}"
+        resource_id = api_params["associatedResourceIdentifier"]
+        handshake = {
+            "id": handshake_id,
+            "arn": f"arn:aws:partnercentral:us-east-1::channel-handshake/{handshake_id}",
+            "catalog": api_params["catalog"],
+            "handshakeType": api_params["handshakeType"],
+            "associatedResourceId": resource_id,
+            "status": "ACCEPTED",
+        }
+        with self._lock:
+            self._handshakes_by_resource.setdefault(resource_id, []).append(handshake)
+        return {"channelHandshakeDetail": {"id": handshake_id, "arn": handshake["arn"]}}
+
+    def list_channel_handshakes(self, api_params: dict[str, Any]) -> dict[str, Any]:
+        """List the handshakes of the requested resources."""
+        with self._lock:
+            handshakes = [
+                handshake
+                for resource_id in api_params.get("associatedResourceIdentifiers", [])
+                for handshake in self._handshakes_by_resource.get(resource_id, [])
+            ]
+        return paginate(handshakes, api_params, "nextToken", "maxResults")
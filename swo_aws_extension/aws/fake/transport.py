@@ -0,0 +1,116 @@
+import contextlib
+import io
+import json
+from collections.abc import Iterator
+from http import HTTPStatus
+from typing import Any
+from unittest import mock
+from urllib.parse import parse_qsl
+from xml.etree import ElementTree  # ruff:ignore[suspicious-xml-etree-import]
+
+import boto3
+from botocore.awsrequest import AWSPreparedRequest, AWSResponse, HeadersDict
+from urllib3 import HTTPResponse
+
+from swo_aws_extension.aws.client import AWSClient
+from swo_aws_extension.aws.fake.backend import FakeAWSBackend
+from swo_aws_extension.aws.fake.services import FakeAWSError
+from swo_aws_extension.swo.openid.client import OpenIDClient
+
+FAKE_TRANSPORT_ID = "swo-fake-aws-transport"
+FAKE_WEB_IDENTITY_TOKEN = "fake-web-identity-token"  # ruff:ignore[hardcoded-password-string]
+# STS speaks the query protocol and answers in XML, every other service used speaks JSON.
+QUERY_PROTOCOL_SERVICE_IDS = frozenset(("sts",))
+
+
+def _build_http_response(status_code: int, body: bytes, content_type: str) -> AWSResponse:
+    headers = HeadersDict({"Content-Type": content_type, "Content-Length": str(len(body))})
+    raw = HTTPResponse(body=io.BytesIO(body), status=status_code, preload_content=False)
+    return AWSResponse("", status_code, headers, raw)
+
+
+def _append_xml(parent: ElementTree.Element, output: dict[str, Any]) -> None:
+    for key, member in output.items():
+        child = ElementTree.SubElement(parent, key)
+        if isinstance(member, dict):
+            _append_xml(child, member)
+        else:
+            child.text = str(member)
+
+
+def _parse_api_params(request: AWSPreparedRequest, *, is_query_protocol: bool) -> dict:
+    body = request.body or b""
+    if isinstance(body, bytes):
+        body = body.decode()
+    if is_query_protocol:
+        return dict(parse_qsl(body))
+    return json.loads(body or "{}")
+
+
+def _download_fake_document(aws_client: AWSClient, document_url: str) -> bytes:
+    return f"%PDF-1.4\n% Fake AWS invoice {document_url}\n%%EOF\n".encode()
+
+
+class FakeAWSTransport:
+    """Botocore ``before-send`` handler answering requests from a fake backend.
+
+    Requests are still built, signed, parsed and retried by botocore, only the HTTP
+    round trip to AWS is replaced, so throttling goes through the real retry mode.
+    """
+
+    def __init__(self, backend: FakeAWSBackend) -> None:
+        self._backend = backend
+
+    def __call__(self, request: AWSPreparedRequest, event_name: str, **kwargs: Any) -> AWSResponse:
+        """Answer a request instead of sending it."""
+        service_id, operation_name = event_name.split(".")[1:]
+        is_query_protocol = service_id in QUERY_PROTOCOL_SERVICE_IDS
+        api_params = _parse_api_params(request, is_query_protocol=is_query_protocol)
+        try:
+            output = self._backend.answer(service_id, operation_name, api_params)
+        except FakeAWSError as error:
+            return self._build_error_response(error, is_query_protocol=is_query_protocol)
+        return self._build_response(operation_name, output, is_query_protocol=is_query_protocol)
+
+    def _build_response(
+        self, operation_name: str, output: dict[str, Any], *, is_query_protocol: bool
+    ) -> AWSResponse:
+        if is_query_protocol:
+            response = ElementTree.Element(f"{operation_name}Response")
+            _append_xml(response, {f"{operation_name}Result": output})
+            return _build_http_response(HTTPStatus.OK, ElementTree.tostring(response), "text/xml")
+        body = json.dumps(output).encode()
+        return _build_http_response(HTTPStatus.OK, body, "application/json")
+
+    def _build_error_response(self, error: FakeAWSError, *, is_query_protocol: bool) -> AWSResponse:
+        if is_query_protocol:
+            response = ElementTree.Element("ErrorResponse")
+            _append_xml(response, {"Error": {"Code": error.code, "Message": error.message}})
+            return _build_http_response(
+                error.status_code, ElementTree.tostring(response), "text/xml"
+            )
+        body = json.dumps({"__type": error.code, "message": error.message}).encode()
+        return _build_http_response(error.status_code, body, "application/json")
+
+
+@contextlib.contextmanager
+def fake_aws_backend(backend: FakeAWSBackend) -> Iterator[FakeAWSBackend]:
+    """Serve the AWS calls of the clients created in the block from a fake backend.
+
+    The web identity token used to assume roles and the download of invoice
+    documents are faked as well, so no CCP or AWS credentials are needed.
+    """
+    if boto3.DEFAULT_SESSION is None:
+        boto3.setup_default_session()
+    events = boto3.DEFAULT_SESSION.events
+    events.register_first("before-send", FakeAWSTransport(backend), unique_id=FAKE_TRANSPORT_ID)
+    try:
+        with (
+            mock.patch.object(
+                OpenIDClient, "fetch_access_token", return_value=FAKE_WEB_IDENTITY_TOKEN
+            ),
+            mock.patch.object(AWSClient, "_download_document", _download_fake_document),
+        ):
+            yield backend
+    finally:
+        events.unregister("before-send", unique_id=FAKE_TRANSPORT_ID)
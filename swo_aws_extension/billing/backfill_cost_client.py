@@ -0,0 +1,109 @@
+import datetime as dt
+import json
+from collections import defaultdict
+
+from swo_aws_extension.aws.client import AWSClient
+from swo_aws_extension.aws.errors import AWSError
+from swo_aws_extension.logger import get_logger
+from swo_aws_extension.models import BillingPeriod
+
+logger = get_logger(__name__)
+
+type QueryKeyAlias = tuple[str | None, str, str]
+type ResultsByMonthAlias = dict[str, list[dict]]
+
+
+def _build_query_key(
+    group_by: list[dict] | None,
+    filter_by: dict | None,
+    view_arn: str | None,
+    granularity: str,
+) -> QueryKeyAlias:
+    return view_arn, granularity, json.dumps([group_by, filter_by], sort_keys=True)
+
+
+def _split_by_month(results_by_time: list[dict]) -> ResultsByMonthAlias:
+    results_by_month: ResultsByMonthAlias = defaultdict(list)
+    for result_by_time in results_by_time:
+        time_period_start = dt.date.fromisoformat(result_by_time["TimePeriod"]["Start"])
+        month_start = time_period_start.replace(day=1).isoformat()
+        results_by_month[month_start].append(result_by_time)
+    return results_by_month
+
+
+class BackfillCostClient:
+    """Answers the Cost Explorer queries of a backfill run with one query for all its months.
+
+    It stands in for the billing ``AWSClient`` of an authorization when several billing
+    periods are generated in the same run. The first ``get_cost_and_usage`` call for a
+    month fetches the same query over the whole backfill range, and its ``ResultsByTime``
+    are split by month and kept until each month asks for them. A month is fetched on its
+    own when the wide query is refused, e.g. when a billing view is not active during the
+    whole range. Billing views and invoice summaries can't be split by month, so they are
+    still requested month by month.
+    """
+
+    def __init__(self, aws_client: AWSClient, billing_periods: list[BillingPeriod]) -> None:
+        self._aws_client = aws_client
+        self._month_starts = {billing_period.start_date for billing_period in billing_periods}
+        self._range_period = BillingPeriod(
+            start_date=billing_periods[0].start_date,
+            end_date=billing_periods[-1].end_date,
+        )
+        self._results_by_query: dict[QueryKeyAlias, ResultsByMonthAlias | None] = {}
+
+    def get_billing_views_by_account_id(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+    ) -> list[dict]:
+        """Get the billing views of an account for a date range."""
+        return self._aws_client.get_billing_views_by_account_id(account_id, start_date, end_date)
+
+    def list_invoice_summaries_by_account_id(
+        self, account_id: str, year: int, month: int
+    ) -> list[dict]:
+        """List the invoice summaries of an account for a billing period."""
+        return self._aws_client.list_invoice_summaries_by_account_id(account_id, year, month)
+
+    def get_cost_and_usage(
+        self,
+        billing_period: BillingPeriod,
+        group_by: list[dict] | None = None,
+        filter_by: dict | None = None,
+        view_arn: str | None = None,
+        granularity: str = "MONTHLY",
+    ) -> list[dict]:
+        """Get cost and usage data of a month, served from the query over the whole range."""
+        query_key = _build_query_key(group_by, filter_by, view_arn, granularity)
+        if billing_period.start_date in self._month_starts:
+            if query_key not in self._results_by_query:
+                self._results_by_query[query_key] = self._fetch_range(
+                    group_by, filter_by, view_arn, granularity
+                )
+            results_by_month = self._results_by_query[query_key]
+            if results_by_month is not None and billing_period.start_date in results_by_month:
+                return results_by_month.pop(billing_period.start_date)
+        return self._aws_client.get_cost_and_usage(
+            billing_period, group_by, filter_by, view_arn, granularity
+        )
+
+    def _fetch_range(
+        self,
+        group_by: list[dict] | None,
+        filter_by: dict | None,
+        view_arn: str | None,
+        granularity: str,
+    ) -> ResultsByMonthAlias | None:
+        try:
+            results_by_time = self._aws_client.get_cost_and_usage(
+                self._range_period, group_by, filter_by, view_arn, granularity
+            )
+        except AWSError as error:
+            logger.info("Fetching the cost and usage month by month: %s", error)
+            return None
+        results_by_month = _split_by_month(results_by_time)
+        for month_start in self._month_starts:
+            results_by_month.setdefault(month_start, [])
+        return results_by_month
@@ -0,0 +1,71 @@
+import datetime as dt
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable, Sized
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from swo_aws_extension.billing.benchmarks.payloads import BenchmarkScenario
+
+RESULTS_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timings and peak memory of a benchmarked billing step."""
+
+    name: str
+    repeat: int
+    min_seconds: float
+    median_seconds: float
+    peak_memory_bytes: int
+    output_count: int
+
+
+def measure(name: str, benchmarked: Callable[[], Sized], repeat: int) -> BenchmarkResult:
+    """Time a step ``repeat`` times, then run it once more tracing its peak memory.
+
+    Memory is traced in a separate run because tracing slows the traced code down.
+    The output count is the length of what the step returns, e.g. its journal lines.
+
+    Raises:
+        ValueError: If ``repeat`` is lower than 1, as there would be no timing to report.
+    """
+    if repeat < 1:
+        raise ValueError(f"A benchmark must be repeated at least once, got {repeat}")
+    timings: list[float] = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        output_count = len(benchmarked())
+        timings.append(time.perf_counter() - started_at)
+    gc.collect()
+    tracemalloc.start()
+    benchmarked()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return BenchmarkResult(
+        name=name,
+        repeat=repeat,
+        min_seconds=min(timings),
+        median_seconds=statistics.median(timings),
+        peak_memory_bytes=peak_memory,
+        output_count=output_count,
+    )
+
+
+def write_benchmark_results(
+    output_path: Path, scenario: BenchmarkScenario, benchmark_results: list[BenchmarkResult]
+) -> None:
+    """Write the results of a benchmark run as JSON, to compare them across releases."""
+    benchmark_run = {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "created_at": dt.datetime.now(dt.UTC).isoformat(),
+        "python_version": platform.python_version(),
+        "scenario": asdict(scenario),
+        "results": [asdict(benchmark_result) for benchmark_result in benchmark_results],
+    }
+    output_path.write_text(json.dumps(benchmark_run, indent=2), encoding="utf-8")
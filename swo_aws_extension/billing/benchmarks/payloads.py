@@ -0,0 +1,152 @@
+import datetime as dt
+import json
+from dataclasses import dataclass
+
+from swo_aws_extension.aws.fake.backend import FakeAWSBackend
+from swo_aws_extension.aws.fake.organizations import build_fake_organizations
+from swo_aws_extension.constants import (
+    ChannelHandshakeDeployed,
+    FulfillmentParametersEnum,
+    OrderParametersEnum,
+    SupportTypesEnum,
+)
+from swo_aws_extension.models import BillingPeriod
+
+BENCHMARK_START_DATE = dt.date.fromisoformat("2025-01-01")
+BENCHMARK_AGREEMENT_ID = "AGR-0000-0000-0000"
+BENCHMARK_DISCOUNT_PERCENTAGE = "2"
+COST_METRIC = "UnblendedCost"
+
+
+@dataclass(frozen=True)
+class BenchmarkScenario:
+    """Size of the synthetic organization billed by a benchmark run."""
+
+    accounts: int = 50
+    services: int = 8
+    days: int = 31
+    invoice_entities: int = 2
+    seed: int = 0
+
+    @property
+    def billing_period(self) -> BillingPeriod:
+        """The billing period of ``days`` days starting on the first of a month."""
+        end_date = BENCHMARK_START_DATE + dt.timedelta(days=self.days)
+        return BillingPeriod(BENCHMARK_START_DATE.isoformat(), end_date.isoformat())
+
+
+def build_benchmark_agreement(mpa_account_id: str) -> dict:
+    """Build an agreement with PLS and every extra discount enabled."""
+    fulfillment_parameters = [
+        {
+            "externalId": FulfillmentParametersEnum.CHANNEL_HANDSHAKE_APPROVED,
+            "value": ChannelHandshakeDeployed.YES,
+        },
+        *(
+            {"externalId": discount_parameter, "value": BENCHMARK_DISCOUNT_PERCENTAGE}
+            for discount_parameter in (
+                FulfillmentParametersEnum.SERVICE_DISCOUNT,
+                FulfillmentParametersEnum.SUPPORT_DISCOUNT,
+                FulfillmentParametersEnum.PLS_DISCOUNT,
+            )
+        ),
+    ]
+    ordering_parameters = [
+        {
+            "externalId": OrderParametersEnum.SUPPORT_TYPE,
+            "value": SupportTypesEnum.PARTNER_LED_SUPPORT,
+        },
+    ]
+    return {
+        "id": BENCHMARK_AGREEMENT_ID,
+        "externalIds": {"vendor": mpa_account_id},
+        "parameters": {"ordering": ordering_parameters, "fulfillment": fulfillment_parameters},
+    }
+
+
+class SyntheticAWSClient:
+    """Serves the payloads of a synthetic organization to the billing generators.
+
+    Stands in for ``AWSClient`` like ``DataExportsCostClient`` does. The Cost
+    Explorer, billing view and invoice payloads are built by the fake AWS backend the
+    first time they are requested and replayed afterwards, so benchmarks time the
+    generators and not the building of their input.
+    """
+
+    def __init__(self, scenario: BenchmarkScenario) -> None:
+        organizations = build_fake_organizations(
+            organization_count=1,
+            accounts_per_organization=scenario.accounts - 1,
+            services_per_account=scenario.services,
+            invoicing_entity_count=scenario.invoice_entities,
+            seed=scenario.seed,
+        )
+        self.mpa_account_id = organizations[0].mpa_account_id
+        self._backend = FakeAWSBackend(organizations)
+        self._payloads: dict[str, list[dict]] = {}
+
+    def get_billing_views_by_account_id(
+        self, account_id: str, start_date: str, end_date: str
+    ) -> list[dict]:
+        """Get the billing transfer views of an account."""
+        return self._get_pages(
+            ("billing", "ListBillingViews"),
+            {"sourceAccountId": account_id},
+            "billingViews",
+            "nextToken",
+        )
+
+    def get_cost_and_usage(
+        self,
+        billing_period: BillingPeriod,
+        group_by: list[dict] | None = None,
+        filter_by: dict | None = None,
+        view_arn: str | None = None,
+        granularity: str = "MONTHLY",
+    ) -> list[dict]:
+        """Get cost and usage data for the billing period, like ``AWSClient`` does."""
+        api_params: dict = {
+            "TimePeriod": {"Start": billing_period.start_date, "End": billing_period.end_date},
+            "Granularity": granularity,
+            "Metrics": [COST_METRIC],
+            "GroupBy": group_by or [],
+            "Filter": filter_by,
+            "BillingViewArn": view_arn,
+        }
+        return self._get_pages(
+            ("cost-explorer", "GetCostAndUsage"), api_params, "ResultsByTime", "NextPageToken"
+        )
+
+    def list_invoice_summaries_by_account_id(
+        self, account_id: str, year: int, month: int
+    ) -> list[dict]:
+        """List the invoice summaries of a month."""
+        api_params = {
+            "Selector": {"ResourceType": "ACCOUNT_ID", "Value": account_id},
+            "Filter": {"BillingPeriod": {"Month": month, "Year": year}},
+        }
+        return self._get_pages(
+            ("invoicing", "ListInvoiceSummaries"), api_params, "InvoiceSummaries", "NextToken"
+        )
+
+    def _get_pages(
+        self, operation: tuple[str, str], api_params: dict, data_key: str, token_key: str
+    ) -> list[dict]:
+        payload_key = json.dumps([operation, api_params], sort_keys=True)
+        if payload_key not in self._payloads:
+            self._payloads[payload_key] = self._fetch_pages(
+                operation, api_params, data_key, token_key
+            )
+        return list(self._payloads[payload_key])
+
+    def _fetch_pages(
+        self, operation: tuple[str, str], api_params: dict, data_key: str, token_key: str
+    ) -> list[dict]:
+        pages: list[dict] = []
+        page_params = dict(api_params)
+        while True:
+            response = self._backend.answer(*operation, page_params)
+            pages.extend(response.get(data_key, []))
+            if not response.get(token_key):
+                return pages
+            page_params[token_key] = response[token_key]
@@ -0,0 +1,135 @@
+import functools
+from collections.abc import Callable, Sized
+from decimal import Decimal
+
+from swo_aws_extension.billing.benchmarks.measurement import BenchmarkResult, measure
+from swo_aws_extension.billing.benchmarks.payloads import (
+    BENCHMARK_AGREEMENT_ID,
+    BenchmarkScenario,
+    SyntheticAWSClient,
+    build_benchmark_agreement,
+)
+from swo_aws_extension.billing.generators.agreement import build_additional_processors
+from swo_aws_extension.billing.generators.billing_report_rows import (
+    BillingReportRowsBuilder,
+    ReportContext,
+)
+from swo_aws_extension.billing.generators.invoice import InvoiceGenerator
+from swo_aws_extension.billing.generators.journal_line import JournalLineGenerator
+from swo_aws_extension.billing.generators.usage import CostExplorerUsageGenerator
+from swo_aws_extension.billing.models.invoice import OrganizationInvoice
+from swo_aws_extension.billing.models.journal_line import JournalDetails, JournalLine
+from swo_aws_extension.billing.models.usage import OrganizationUsageResult
+
+BENCHMARK_AUTHORIZATION_ID = "AUT-0000-0000"
+BENCHMARK_CURRENCY = "USD"
+BENCHMARK_PLS_CHARGE_PERCENTAGE = Decimal(5)
+DEFAULT_REPEAT = 5
+
+
+class BillingBenchmark:
+    """Benchmarks the hot paths of the billing generators on a synthetic organization.
+
+    Each step runs on the output of the previous one, in the order the billing journal
+    generation runs them, once as a warm-up and then ``repeat`` times.
+    """
+
+    def __init__(self, scenario: BenchmarkScenario, repeat: int = DEFAULT_REPEAT) -> None:
+        self._scenario = scenario
+        self._repeat = repeat
+        self._aws_client = SyntheticAWSClient(scenario)
+        self._journal_details = JournalDetails(
+            agreement_id=BENCHMARK_AGREEMENT_ID,
+            mpa_id=self._aws_client.mpa_account_id,
+            start_date=scenario.billing_period.start_date,
+            end_date=scenario.billing_period.last_day,
+        )
+
+    def run(self) -> list[BenchmarkResult]:
+        """Benchmark every step and return their results in pipeline order."""
+        mpa_account_id = self._aws_client.mpa_account_id
+        organization_invoice = (
+            InvoiceGenerator(self._aws_client)
+            .run(mpa_account_id, mpa_account_id, self._scenario.billing_period, BENCHMARK_CURRENCY)
+            .invoice
+        )
+        usage_result = self._generate_usage(organization_invoice)
+        journal_lines = self._generate_journal_lines(usage_result, organization_invoice)
+        return [
+            self._measure(
+                "CostExplorerUsageGenerator.run",
+                lambda: self._generate_usage(organization_invoice).usage_by_account,
+            ),
+            self._measure(
+                "JournalLineGenerator.generate",
+                functools.partial(self._generate_journal_lines, usage_result, organization_invoice),
+            ),
+            *self._measure_additional_processors(usage_result, organization_invoice),
+            *self._measure_report_rows(usage_result, organization_invoice),
+            self._measure(
+                "JournalLine.to_jsonl",
+                lambda: [journal_line.to_jsonl() for journal_line in journal_lines],
+            ),
+        ]
+
+    def _generate_usage(self, organization_invoice: OrganizationInvoice) -> OrganizationUsageResult:
+        return CostExplorerUsageGenerator(self._aws_client).run(
+            BENCHMARK_CURRENCY,
+            self._aws_client.mpa_account_id,
+            self._scenario.billing_period,
+            organization_invoice,
+        )
+
+    def _generate_journal_lines(
+        self, usage_result: OrganizationUsageResult, organization_invoice: OrganizationInvoice
+    ) -> list[JournalLine]:
+        line_generator = JournalLineGenerator()
+        return [
+            journal_line
+            for account_id, account_usage in usage_result.usage_by_account.items()
+            for journal_line in line_generator.generate(
+                account_id, account_usage, self._journal_details, organization_invoice
+            )
+        ]
+
+    def _measure_additional_processors(
+        self, usage_result: OrganizationUsageResult, organization_invoice: OrganizationInvoice
+    ) -> list[BenchmarkResult]:
+        agreement = build_benchmark_agreement(self._aws_client.mpa_account_id)
+        return [
+            self._measure(
+                f"{type(processor).__name__}.process",
+                functools.partial(
+                    processor.process,
+                    agreement,
+                    usage_result,
+                    self._journal_details,
+                    organization_invoice,
+                ),
+            )
+            for processor in build_additional_processors(BENCHMARK_PLS_CHARGE_PERCENTAGE)
+        ]
+
+    def _measure_report_rows(
+        self, usage_result: OrganizationUsageResult, organization_invoice: OrganizationInvoice
+    ) -> list[BenchmarkResult]:
+        report_context = ReportContext(
+            authorization_id=BENCHMARK_AUTHORIZATION_ID,
+            pma=self._aws_client.mpa_account_id,
+            agreement_id=BENCHMARK_AGREEMENT_ID,
+            mpa=self._aws_client.mpa_account_id,
+            currency=BENCHMARK_CURRENCY,
+        )
+        report_builder = BillingReportRowsBuilder(
+            report_context, usage_result, organization_invoice
+        )
+        return [
+            self._measure("BillingReportRowsBuilder.build", report_builder.build),
+            self._measure(
+                "BillingReportRowsBuilder.build_by_account", report_builder.build_by_account
+            ),
+        ]
+
+    def _measure(self, name: str, benchmarked: Callable[[], Sized]) -> BenchmarkResult:
+        benchmarked()
+        return measure(name, benchmarked, self._repeat)
@@ -1,23 +1,45 @@
+import contextvars
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
 from io import BytesIO
 
 import requests
 
-from swo_aws_extension.aws.client import AWSClient
-from swo_aws_extension.aws.errors import AWSError
+from swo_aws_extension.aws.client import INVOICE_PDF_MAX_ATTEMPTS, AWSClient
+from swo_aws_extension.aws.errors import AWSError, InvoicePDFNotReadyError
+from swo_aws_extension.billing.invoice_pdf_cache import InvoicePDFCache
 from swo_aws_extension.billing.models.journal_result import InvoiceAttachmentResult
+from swo_aws_extension.billing.stage_metrics import measure_stage
+from swo_aws_extension.constants import BillingStageEnum
 from swo_aws_extension.logger import get_logger
 from swo_aws_extension.swo.mpt.billing.billing_client import BillingClient
 from swo_aws_extension.swo.mpt.billing.models.hints import JournalAttachment
 
+INVOICE_DOWNLOAD_MAX_WORKERS = 4
+
 logger = get_logger(__name__)
 
 
 class BillingInvoiceAttachmentCreator:
-    """Creates AWS invoice attachments for a billing journal."""
+    """Creates AWS invoice attachments for a billing journal.
+
+    Invoice PDFs are downloaded concurrently and each one is uploaded as soon as its
+    download completes. Invoices whose PDF is not generated yet are collected in a
+    retry queue that is revisited, with backoff, once the rest have been processed.
+    When a PDF cache is given, cached invoices are not downloaded again.
+    """
 
-    def __init__(self, aws_client: AWSClient, billing_api_client: BillingClient) -> None:
+    def __init__(
+        self,
+        aws_client: AWSClient,
+        billing_api_client: BillingClient,
+        max_workers: int = INVOICE_DOWNLOAD_MAX_WORKERS,
+        pdf_cache: InvoicePDFCache | None = None,
+    ) -> None:
         self._aws_client = aws_client
         self._billing_api_client = billing_api_client
+        self._pdf_cache = pdf_cache
+        self._max_workers = max_workers
 
     def create_for_journal(
         self,
@@ -26,9 +48,44 @@ class BillingInvoiceAttachmentCreator:
     ) -> InvoiceAttachmentResult:
         """Retrieve and attach AWS invoices to a journal."""
         result = InvoiceAttachmentResult()
-        for invoice_id in sorted(invoice_ids):
+        if not invoice_ids:
+            return result
+
+        pending_invoice_ids = sorted(invoice_ids)
+        attempt = 1
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            while pending_invoice_ids:
+                pending_invoice_ids = self._process_batch(
+                    executor, journal_id, pending_invoice_ids, result
+                )
+                if not pending_invoice_ids:
+                    break
+                if attempt >= INVOICE_PDF_MAX_ATTEMPTS:
+                    self._record_not_ready(journal_id, pending_invoice_ids, result)
+                    break
+                time.sleep(2 ** (attempt - 1))
+                attempt += 1
+        return result
+
+    def _process_batch(
+        self,
+        executor: Executor,
+        journal_id: str,
+        invoice_ids: list[str],
+        result: InvoiceAttachmentResult,
+    ) -> list[str]:
+        """Download a batch of invoices and upload them, returning the not-ready ones."""
+        futures = {
+            executor.submit(contextvars.copy_context().run, self._download, invoice_id): invoice_id
+            for invoice_id in invoice_ids
+        }
+        not_ready_invoice_ids: list[str] = []
+        for future in as_completed(futures):
+            invoice_id = futures[future]
             try:
-                self._create_attachment(journal_id, invoice_id)
+                self._upload(journal_id, invoice_id, future.result())
+            except InvoicePDFNotReadyError:
+                not_ready_invoice_ids.append(invoice_id)
             except (AWSError, requests.RequestException):
                 logger.exception(
                     "Failed to attach AWS invoice %s to journal %s",
@@ -36,21 +93,50 @@ class BillingInvoiceAttachmentCreator:
                     journal_id,
                 )
                 result.failed_invoice_ids.add(invoice_id)
-                continue
-            result.uploaded_invoice_ids.add(invoice_id)
-        return result
+            else:
+                result.uploaded_invoice_ids.add(invoice_id)
+        return sorted(not_ready_invoice_ids)
+
+    def _download(self, invoice_id: str) -> bytes:
+        if self._pdf_cache is not None:
+            cached_content = self._pdf_cache.get(invoice_id)
+            if cached_content is not None:
+                logger.info("Using cached AWS invoice %s", invoice_id)
+                return cached_content
 
-    def _create_attachment(self, journal_id: str, invoice_id: str) -> None:
-        invoice_file = BytesIO(self._aws_client.download_invoice_pdf(invoice_id))
+        # A single attempt per pass: not-ready PDFs go back to the retry queue
+        # instead of blocking a worker with backoff sleeps.
+        with measure_stage(BillingStageEnum.INVOICE_PDFS) as stage_counts:
+            invoice_content = self._aws_client.download_invoice_pdf(invoice_id, max_attempts=1)
+            stage_counts.byte_count = len(invoice_content)
+        if self._pdf_cache is not None:
+            self._pdf_cache.put(invoice_id, invoice_content)
+        return invoice_content
+
+    def _upload(self, journal_id: str, invoice_id: str, invoice_content: bytes) -> None:
         filename = f"AWS-Invoice-{invoice_id}.pdf"
         attachment = JournalAttachment(
             name=filename,
             description=f"AWS invoice {invoice_id}",
         )
-        self._billing_api_client.journal.attachments(journal_id).upload(
-            filename=filename,
-            mimetype="application/pdf",
-            file=invoice_file,
-            attachment=attachment,
-        )
+        with measure_stage(BillingStageEnum.ATTACHMENT_UPLOAD) as stage_counts:
+            self._billing_api_client.journal.attachments(journal_id).upload(
+                filename=filename,
+                mimetype="application/pdf",
+                file=BytesIO(invoice_content),
+                attachment=attachment,
+            )
+            stage_counts.byte_count = len(invoice_content)
         logger.info("Uploaded AWS invoice %s to journal %s", invoice_id, journal_id)
+
+    def _record_not_ready(
+        self, journal_id: str, invoice_ids: list[str], result: InvoiceAttachmentResult
+    ) -> None:
+        for invoice_id in invoice_ids:
+            logger.error(
+                "AWS invoice %s PDF is not generated after %d attempts, not attached to journal %s",
+                invoice_id,
+                INVOICE_PDF_MAX_ATTEMPTS,
+                journal_id,
+            )
+            result.failed_invoice_ids.add(invoice_id)
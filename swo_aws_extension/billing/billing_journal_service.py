@@ -1,30 +1,32 @@
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
 from decimal import Decimal
 
 from swo_aws_extension.billing.billing_invoice_attachment_creator import (
     BillingInvoiceAttachmentCreator,
 )
-from swo_aws_extension.billing.billing_report_creator import (
-    BillingReportCreator,
-)
 from swo_aws_extension.billing.generators.authorization import (
     AuthorizationJournalGenerator,
 )
+from swo_aws_extension.billing.invoice_pdf_cache import build_invoice_pdf_cache
 from swo_aws_extension.billing.journal_manager import JournalManager
-from swo_aws_extension.billing.models.context import BillingJournalContext
-from swo_aws_extension.billing.models.journal_result import (
-    AuthorizationJournalResult,
-)
+from swo_aws_extension.billing.models.context import BillingJournalContext, BillingPeriodRun
+from swo_aws_extension.billing.models.journal_result import AuthorizationJournalResult
+from swo_aws_extension.billing.period_report import merge_shard_reports, send_period_report
 from swo_aws_extension.billing.providers import BillingAWSClientProvider
+from swo_aws_extension.billing.stage_metrics import StageMetrics, collect_stage_metrics
 from swo_aws_extension.config import Config
 from swo_aws_extension.constants import (
     BILLING_INVOICE_ATTACHMENT_WARNING_TITLE,
     BILLING_JOURNAL_ERROR_TITLE,
+    BILLING_JOURNAL_METRICS_TITLE,
 )
 from swo_aws_extension.logger import get_logger
-from swo_aws_extension.swo.mpt.authorization import get_authorizations
-from swo_aws_extension.swo.rql.query_builder import RQLQuery
+from swo_aws_extension.swo.mpt.authorization import (
+    build_authorizations_query,
+    get_authorizations,
+)
 
 logger = get_logger(__name__)
 
@@ -57,7 +59,7 @@ def _log_dry_run_results(
     attachments = [
         f"{agr}.json"
         for agr, rep in generator_result.reports_by_agreement.items()
-        if rep.organization_data or rep.accounts_data
+        if rep.has_data()
     ]
     if attachments:
         logger.info("%s - [DRY-RUN] Attachments: %s", authorization_id, attachments)
@@ -69,7 +71,71 @@ def _log_dry_run_results(
         )
 
 
-class BillingJournalService:
+def _release_reports(
+    context: BillingJournalContext, generator_result: AuthorizationJournalResult
+) -> None:
+    """Drop the usage reports of an authorization once its attachments are handled."""
+    if context.report_store is not None:
+        for report in generator_result.reports_by_agreement.values():
+            context.report_store.discard(report)
+    generator_result.reports_by_agreement = {}
+
+
+def _upload_report_attachments(
+    journal_manager: JournalManager,
+    journal_id: str,
+    generator_result: AuthorizationJournalResult,
+    context: BillingJournalContext,
+) -> None:
+    if generator_result.reports_by_agreement:
+        journal_manager.upload_attachments(journal_id, generator_result.reports_by_agreement)
+    _release_reports(context, generator_result)
+
+
+def _log_stage_metrics(
+    context: BillingJournalContext, stage_metrics: StageMetrics, *, is_failed: bool
+) -> None:
+    """Log the per-stage totals of a run and send them to Teams unless it is a dry run.
+
+    The totals of a failed run are sent as a warning, those of a completed run as a success.
+    """
+    if not stage_metrics.totals:
+        return
+    if context.dry_run:
+        logger.info("[DRY-RUN] Billing pipeline stages:\n%s", stage_metrics.format_summary())
+        return
+    logger.info("Billing pipeline stages:\n%s", stage_metrics.format_summary())
+    billing_period = context.billing_period
+    run_description = (
+        f"Billing journal run from {billing_period.start_date} to {billing_period.end_date}"
+    )
+    if is_failed:
+        context.notifier.send_warning(
+            BILLING_JOURNAL_METRICS_TITLE,
+            f"{run_description} failed.",
+            facts=stage_metrics.to_facts_section(),
+        )
+        return
+    context.notifier.send_success(
+        BILLING_JOURNAL_METRICS_TITLE,
+        f"{run_description}.",
+        facts=stage_metrics.to_facts_section(),
+    )
+
+
+@contextmanager
+def _report_stage_metrics(context: BillingJournalContext) -> Iterator[None]:
+    """Collect the per-stage metrics of a run and report them, even when it fails."""
+    with collect_stage_metrics() as stage_metrics:
+        try:
+            yield
+        except Exception:
+            _log_stage_metrics(context, stage_metrics, is_failed=True)
+            raise
+        _log_stage_metrics(context, stage_metrics, is_failed=False)
+
+
+class BillingJournalService:  # noqa: WPS214
     """Generate billing journals for authorizations."""
 
     def __init__(
@@ -86,6 +152,7 @@ class BillingJournalService:
         self._notifier = job_context.notifier
         self._generator = AuthorizationJournalGenerator(job_context)
         self._billing_aws_client_provider_factory = billing_aws_client_provider_factory
+        self._invoice_pdf_cache = build_invoice_pdf_cache(job_context.config)
 
     def run(self) -> None:
         """Entry point for generating billing journals for all selected authorizations."""
@@ -96,62 +163,121 @@ class BillingJournalService:
 
         logger.info("Generating billing journals for %s", self._context.billing_period)
 
-        authorizations = get_authorizations(self._mpt_client, self._build_rql_query())
-        if not authorizations:
+        authorizations = get_authorizations(
+            self._mpt_client, build_authorizations_query(self._product_ids, self._authorizations)
+        )
+        if self._context.shard is not None:
+            # A shard without authorizations still writes its outputs for the merge step.
+            authorizations = self._context.shard.select_authorizations(authorizations or [])
+        elif not authorizations:
             logger.info("No authorizations found")
             return
 
-        journal_results = [
-            auth_result
-            for auth in authorizations
-            if (auth_result := self._process_authorization(auth)) is not None
-        ]
+        with _report_stage_metrics(self._context), ExitStack() as exit_stack:
+            period_runs = [
+                BillingPeriodRun.start(period_context, exit_stack)
+                for period_context in self._context.split_by_month()
+            ]
+            queue_worker = self._context.queue_worker
+            if queue_worker is not None:
+                queue_worker.run(
+                    authorizations,
+                    lambda authorization: self._process_queued_authorization(
+                        period_runs, authorization
+                    ),
+                )
+                return
 
-        self._process_journal_results(journal_results)
+            for auth in authorizations:
+                self._process_authorization(auth, period_runs)
+            self._process_journal_results(period_runs)
 
-    def _process_journal_results(self, journal_results: list[AuthorizationJournalResult]) -> None:
-        pls_mismatches = [
-            mismatch for auth_result in journal_results for mismatch in auth_result.pls_mismatches
-        ]
-        if pls_mismatches:
-            details = "\n\n".join(f"• {mismatch.description}" for mismatch in pls_mismatches)
-            self._notifier.send_warning(
-                title="PLS Mismatch Summary",
-                text=f"{len(pls_mismatches)} agreement(s) with PLS mismatch:\n\n{details}",
-            )
+    def merge_shard_reports(self) -> None:
+        """Send the billing report and PLS mismatch summary merged from every shard."""
+        shard_outputs = self._context.shard_outputs
+        if shard_outputs is None:
+            raise ValueError("A shard output directory is required to merge shard reports")
+        merge_shard_reports(self._context, shard_outputs, self._context.shard_output_names)
 
-        report_rows = [
-            row for auth_result in journal_results for row in auth_result.billing_report_rows
-        ]
-        report_rows_by_account = [
-            row
-            for auth_result in journal_results
-            for row in auth_result.billing_report_rows_by_account
-        ]
-        if report_rows and not self._context.dry_run:
-            report_creator = BillingReportCreator(self._context.config, self._context.notifier)
-            report_creator.create_and_notify_teams(
-                str(self._context.billing_period), report_rows, report_rows_by_account
+    def _process_journal_results(self, period_runs: list[BillingPeriodRun]) -> None:
+        shard = self._context.shard
+        shard_outputs = self._context.shard_outputs
+        for period_run in period_runs:
+            if shard is None or shard_outputs is None:
+                send_period_report(
+                    period_run.context, period_run.row_sink, period_run.pls_mismatches
+                )
+                continue
+
+            shard_outputs.write(
+                str(shard),
+                period_run.context.billing_period,
+                period_run.row_sink,
+                period_run.pls_mismatches,
             )
+            logger.info(
+                "%s wrote %d report rows for %s to be merged",
+                shard,
+                period_run.row_sink.row_count,
+                period_run.context.billing_period,
+            )
+
+    def _process_queued_authorization(
+        self, period_runs: list[BillingPeriodRun], authorization: dict
+    ) -> None:
+        """Process an authorization leased from the work queue and write its report outputs."""
+        shard_outputs = self._context.shard_outputs
+        if shard_outputs is None:
+            raise ValueError("A shard output directory is required to use a work queue")
+        with ExitStack() as exit_stack:
+            task_runs = [period_run.start_task(exit_stack) for period_run in period_runs]
+            self._process_authorization(authorization, task_runs)
+            for task_run in task_runs:
+                shard_outputs.write(
+                    authorization["id"],
+                    task_run.context.billing_period,
+                    task_run.row_sink,
+                    task_run.pls_mismatches,
+                )
 
-    def _process_authorization(self, authorization: dict) -> AuthorizationJournalResult | None:
+    def _process_authorization(
+        self, authorization: dict, period_runs: list[BillingPeriodRun]
+    ) -> None:
         authorization_id = authorization.get("id", "")
         billing_aws_client_provider = self._billing_aws_client_provider_factory(
             self._context.config,
             authorization.get("externalIds", {}).get("operations", ""),
         )
 
-        generator_result = self._generate_journal_lines(
+        generator_results = self._generate_journal_lines(
             authorization,
             authorization_id,
             billing_aws_client_provider,
+            [period_run.context for period_run in period_runs],
         )
-        if not generator_result or not generator_result.lines:
+        for period_run, generator_result in zip(period_runs, generator_results, strict=False):
+            if self._publish_journal(
+                period_run,
+                authorization_id,
+                generator_result,
+                billing_aws_client_provider,
+            ):
+                period_run.add_result(generator_result)
+
+    def _publish_journal(
+        self,
+        period_run: BillingPeriodRun,
+        authorization_id: str,
+        generator_result: AuthorizationJournalResult,
+        billing_aws_client_provider: BillingAWSClientProvider,
+    ) -> bool:
+        context = period_run.context
+        if not generator_result.lines:
             logger.info(
                 "No journal lines generated for authorization %s",
                 authorization_id,
             )
-            return None
+            return False
 
         logger.info(
             "Generated %d journal lines for authorization %s",
@@ -159,23 +285,20 @@ class BillingJournalService:
             authorization_id,
         )
 
-        if self._context.dry_run:
+        if context.dry_run:
             _log_dry_run_results(authorization_id, generator_result)
-            return None
+            _release_reports(context, generator_result)
+            return False
 
-        journal_manager = JournalManager(self._context, authorization_id)
+        journal_manager = JournalManager(context, authorization_id, period_run.journal_index)
 
         journal = journal_manager.get_pending_journal()
         if not journal:
             journal = journal_manager.create_new_journal()
             logger.info("Created new journal: %s", journal.name)
 
-        journal_manager.upload_journal(journal.id, generator_result.lines)
-        if generator_result.reports_by_agreement:
-            journal_manager.upload_attachments(
-                journal.id,
-                generator_result.reports_by_agreement,
-            )
+        journal_manager.upload_journal(journal, generator_result.lines)
+        _upload_report_attachments(journal_manager, journal.id, generator_result, context)
         self._create_invoice_attachments(
             journal.id,
             generator_result.invoice_ids,
@@ -183,16 +306,19 @@ class BillingJournalService:
         )
         journal_manager.notify_success(journal.id, len(generator_result.lines))
 
-        return generator_result
+        return True
 
     def _generate_journal_lines(
         self,
         authorization: dict,
         authorization_id: str,
         billing_aws_client_provider: BillingAWSClientProvider,
-    ) -> AuthorizationJournalResult | None:
+        period_contexts: list[BillingJournalContext],
+    ) -> list[AuthorizationJournalResult]:
         try:
-            return self._generator.run(authorization, billing_aws_client_provider)
+            return self._generator.run_periods(
+                authorization, billing_aws_client_provider, period_contexts
+            )
         except Exception:  # TODO: Catch specific exceptions and handle them accordingly
             logger.exception(
                 "Failed to generate billing journals for authorization %s",
@@ -202,7 +328,10 @@ class BillingJournalService:
                 BILLING_JOURNAL_ERROR_TITLE,
                 f"Failed to generate billing journals for authorization {authorization_id}",
             )
-            return None
+            if self._context.work_queue_name:
+                # The work queue retries the authorization, until its last attempt fails it.
+                raise
+            return []
 
     def _create_invoice_attachments(
         self,
@@ -216,6 +345,7 @@ class BillingJournalService:
         creator = BillingInvoiceAttachmentCreator(
             billing_aws_client_provider(),
             self._context.billing_api_client,
+            pdf_cache=self._invoice_pdf_cache,
         )
         result = creator.create_for_journal(journal_id, invoice_ids)
         if result.failed_invoice_ids:
@@ -226,10 +356,3 @@ class BillingJournalService:
                     f"Failed to attach AWS invoices to journal {journal_id}: {failed_invoice_ids}"
                 ),
             )
-
-    def _build_rql_query(self) -> RQLQuery:
-        rql_query = RQLQuery(product__id__in=self._product_ids)
-        if self._authorizations:
-            unique_ids = list(set(self._authorizations))
-            rql_query = RQLQuery(id__in=unique_ids) & rql_query
-        return rql_query
@@ -1,11 +1,21 @@
+from collections.abc import Iterable, Iterator, Sequence
 from decimal import Decimal
+from typing import IO
 
 from swo_aws_extension.billing.models.journal_result import BillingReportRow
+from swo_aws_extension.billing.models.report_file import ReportFile, UploadedReportFile
+from swo_aws_extension.billing.report_row_sink import BillingReportRowSink
 from swo_aws_extension.config import Config
+from swo_aws_extension.file_builder.csv_stream import write_csv_stream
+from swo_aws_extension.file_builder.gzip_builder import SpooledGzipBuilder
 from swo_aws_extension.logger import get_logger
 from swo_aws_extension.swo.azure_blob_uploader import AzureBlobUploader
 from swo_aws_extension.swo.excel_report_builder import ExcelReportBuilder
-from swo_aws_extension.swo.notifications.teams import Button, TeamsNotificationManager
+from swo_aws_extension.swo.notifications.teams import (
+    Button,
+    FactsSection,
+    TeamsNotificationManager,
+)
 
 logger = get_logger(__name__)
 
@@ -51,8 +61,58 @@ BILLING_REPORT_BY_ACCOUNT_HEADERS = (
 )
 
 
+def _build_rows_data(report_rows: Iterable[BillingReportRow]) -> Iterator[list[str]]:
+    return (
+        [
+            row.authorization_id,
+            row.pma,
+            row.agreement_id,
+            row.mpa,
+            row.service_name,
+            str(row.pp),
+            str(row.sp),
+            row.currency,
+            row.invoice_id,
+            row.invoice_entity,
+            str(row.exchange_rate),
+            str(row.spp_discount),
+            _format_spp_discount_pct(row.spp_discount_pct),
+        ]
+        for row in report_rows
+    )
+
+
+def _build_rows_by_account_data(rows: Iterable[BillingReportRow]) -> Iterator[list[str]]:
+    return (
+        [
+            row.authorization_id,
+            row.pma,
+            row.agreement_id,
+            row.mpa,
+            row.linked_account,
+            row.service_name,
+            str(row.pp),
+            str(row.sp),
+            row.currency,
+            row.invoice_id,
+            row.invoice_entity,
+            str(row.exchange_rate),
+            str(row.spp_discount),
+            _format_spp_discount_pct(row.spp_discount_pct),
+        ]
+        for row in rows
+    )
+
+
+def _build_csv_gzip(headers: Sequence[str], rows: Iterable[list[str]]) -> IO[bytes]:
+    gzip_builder = SpooledGzipBuilder()
+    with gzip_builder.open() as gzip_stream:
+        write_csv_stream(headers, rows, gzip_stream)
+    return gzip_builder.get_file_content()
+
+
 class BillingReportCreator:
-    """Creates a unified Excel billing report."""
+    """Creates a unified billing report as an Excel workbook and compressed CSV files."""
 
     def __init__(self, config: Config, notifier: TeamsNotificationManager) -> None:
         self._config = config
@@ -62,29 +122,23 @@ class BillingReportCreator:
             connection_string=self._config.azure_storage_connection_string,
             container_name=self._config.azure_storage_container,
             sas_expiry_days=self._config.azure_storage_sas_expiry_days,
+            block_size=self._config.azure_storage_upload_block_size_bytes,
+            max_concurrency=self._config.azure_storage_upload_max_concurrency,
         )
 
     def create_and_notify_teams(
         self,
         billing_period_str: str,
-        report_rows: list[BillingReportRow],
-        rows_by_account: list[BillingReportRow] | None = None,
+        row_sink: BillingReportRowSink,
     ) -> None:
-        """Create the report, upload to Azure, and notify teams."""
-        if not report_rows:
-            logger.info("No billing report rows. Skipping Excel report creation.")
+        """Create the report from the rows in the sink, upload to Azure, and notify teams."""
+        if not row_sink.row_count:
+            logger.info("No billing report rows. Skipping billing report creation.")
             return
 
-        logger.info("Creating billing report Excel file...")
-        rows_data = self._build_rows_data(report_rows)
-        excel_bytes = self._generate_excel(
-            rows_data, self._build_rows_by_account_data(rows_by_account or [])
-        )
-        folder = self._config.report_billing_folder
-        blob_name = f"{folder}{billing_period_str}.xlsx"
-
+        logger.info("Creating billing report files...")
         try:
-            download_url = self._upload(excel_bytes, blob_name)
+            uploaded_files = self._upload_report_files(billing_period_str, row_sink)
         except Exception as exc:
             logger.exception("Failed to upload billing report to Azure Blob Storage.")
             self._notifier.send_error(
@@ -97,60 +151,63 @@ class BillingReportCreator:
             "AWS Monthly Billing Report",
             (
                 f"The billing report for **{billing_period_str}** has been generated "
-                f"containing **{len(rows_data)}** rows."
+                f"containing **{row_sink.row_count}** rows."
+            ),
+            button=Button(label="Download report", url=uploaded_files[0].url),
+            facts=FactsSection(
+                title="Report files",
+                data={uploaded.label: uploaded.summary for uploaded in uploaded_files},
             ),
-            button=Button(label="Download report", url=download_url),
         )
         logger.info("Billing report uploaded and Teams notification sent.")
 
+    def _upload_report_files(
+        self, billing_period_str: str, row_sink: BillingReportRowSink
+    ) -> list[UploadedReportFile]:
+        return [
+            self._upload(report_file, billing_period_str)
+            for report_file in self._iter_report_files(row_sink)
+        ]
+
+    def _iter_report_files(self, row_sink: BillingReportRowSink) -> Iterator[ReportFile]:
+        # Files are built lazily, so only one of them is held at a time.
+        yield ReportFile(
+            "Excel workbook",
+            ".xlsx",
+            row_sink.row_count + row_sink.row_by_account_count,
+            self._generate_excel(
+                _build_rows_data(row_sink.iter_rows()),
+                _build_rows_by_account_data(row_sink.iter_rows_by_account()),
+            ),
+        )
+        yield ReportFile(
+            "Billing Report CSV",
+            ".csv.gz",
+            row_sink.row_count,
+            _build_csv_gzip(BILLING_REPORT_HEADERS, _build_rows_data(row_sink.iter_rows())),
+        )
+        yield ReportFile(
+            "By Linked Account CSV",
+            "-by-account.csv.gz",
+            row_sink.row_by_account_count,
+            _build_csv_gzip(
+                BILLING_REPORT_BY_ACCOUNT_HEADERS,
+                _build_rows_by_account_data(row_sink.iter_rows_by_account()),
+            ),
+        )
+
     def _generate_excel(
-        self, rows_data: list[list[str]], by_account_data: list[list[str]]
-    ) -> bytes:
-        return self._excel_builder.build_multi_sheet([
+        self, rows_data: Iterable[list[str]], by_account_data: Iterable[list[str]]
+    ) -> IO[bytes]:
+        return self._excel_builder.stream_multi_sheet([
             ("Billing Report", list(BILLING_REPORT_HEADERS), rows_data),
             ("By Linked Account", list(BILLING_REPORT_BY_ACCOUNT_HEADERS), by_account_data),
         ])
 
-    def _upload(self, excel_bytes: bytes, blob_name: str) -> str:
-        return self._blob_uploader.upload_and_get_sas_url(excel_bytes, blob_name)
-
-    def _build_rows_data(self, report_rows: list[BillingReportRow]) -> list[list[str]]:
-        return [
-            [
-                row.authorization_id,
-                row.pma,
-                row.agreement_id,
-                row.mpa,
-                row.service_name,
-                str(row.pp),
-                str(row.sp),
-                row.currency,
-                row.invoice_id,
-                row.invoice_entity,
-                str(row.exchange_rate),
-                str(row.spp_discount),
-                _format_spp_discount_pct(row.spp_discount_pct),
-            ]
-            for row in report_rows
-        ]
-
-    def _build_rows_by_account_data(self, rows: list[BillingReportRow]) -> list[list[str]]:
-        return [
-            [
-                row.authorization_id,
-                row.pma,
-                row.agreement_id,
-                row.mpa,
-                row.linked_account,
-                row.service_name,
-                str(row.pp),
-                str(row.sp),
-                row.currency,
-                row.invoice_id,
-                row.invoice_entity,
-                str(row.exchange_rate),
-                str(row.spp_discount),
-                _format_spp_discount_pct(row.spp_discount_pct),
-            ]
-            for row in rows
-        ]
+    def _upload(self, report_file: ReportFile, billing_period_str: str) -> UploadedReportFile:
+        folder = self._config.report_billing_folder
+        blob_name = f"{folder}{billing_period_str}{report_file.blob_suffix}"
+        size_bytes = report_file.size_bytes
+        with report_file.stream:
+            url = self._blob_uploader.upload_stream_and_get_sas_url(report_file.stream, blob_name)
+        return UploadedReportFile(report_file.label, report_file.row_count, size_bytes, url)
@@ -0,0 +1,166 @@
+import datetime as dt
+from collections import defaultdict
+from decimal import Decimal
+from types import MappingProxyType
+
+from swo_aws_extension.billing.data_exports_store import (
+    DataExportsStore,
+    PayerUsageAlias,
+    UsageKey,
+)
+from swo_aws_extension.models import BillingPeriod
+
+DATA_EXPORTS_VIEW_ARN_PREFIX = "arn:aws:billing::data-exports:billingview/"
+COST_UNIT = "USD"
+DAILY_GRANULARITY = "DAILY"
+# Cost Explorer dimensions supported in ``GroupBy`` and ``Filter``.
+DIMENSION_FIELDS = MappingProxyType({
+    "LINKED_ACCOUNT": "linked_account",
+    "SERVICE": "service",
+    "RECORD_TYPE": "record_type",
+    "INVOICING_ENTITY": "invoicing_entity",
+    "BILLING_ENTITY": "billing_entity",
+})
+
+type TimePeriodAlias = tuple[str, str]
+type GroupsAlias = dict[tuple[str, ...], Decimal]
+
+
+def _matches_filter(usage_key: UsageKey, filter_by: dict | None) -> bool:
+    if not filter_by:
+        return True
+    operator, operand = next(iter(filter_by.items()))
+    if operator == "And":
+        return all(_matches_filter(usage_key, expression) for expression in operand)
+    if operator == "Or":
+        return any(_matches_filter(usage_key, expression) for expression in operand)
+    if operator == "Not":
+        return not _matches_filter(usage_key, operand)
+    return getattr(usage_key, DIMENSION_FIELDS[operand["Key"]]) in operand["Values"]
+
+
+def _get_filtered_linked_accounts(filter_by: dict | None) -> list[str] | None:
+    """Linked accounts a filter restricts the usage to, None when it does not restrict them."""
+    if not filter_by:
+        return None
+    operator, operand = next(iter(filter_by.items()))
+    if operator == "And":
+        restricted_accounts = (_get_filtered_linked_accounts(expression) for expression in operand)
+        return next((accounts for accounts in restricted_accounts if accounts is not None), None)
+    if operator == "Dimensions" and operand["Key"] == "LINKED_ACCOUNT":
+        return operand["Values"]
+    return None
+
+
+def _get_time_period(
+    usage_key: UsageKey, billing_period: BillingPeriod, granularity: str
+) -> TimePeriodAlias:
+    if granularity != DAILY_GRANULARITY:
+        return billing_period.start_date, billing_period.end_date
+    next_day = dt.date.fromisoformat(usage_key.usage_date) + dt.timedelta(days=1)
+    return usage_key.usage_date, next_day.isoformat()
+
+
+def _group_usage(
+    payer_usage: PayerUsageAlias,
+    dimensions: list[str],
+    filter_by: dict | None,
+    billing_period: BillingPeriod,
+    granularity: str,
+) -> dict[TimePeriodAlias, GroupsAlias]:
+    grouped_usage: dict[TimePeriodAlias, GroupsAlias] = defaultdict(lambda: defaultdict(Decimal))
+    for usage_key, amount in payer_usage.items():
+        if _matches_filter(usage_key, filter_by):
+            time_period = _get_time_period(usage_key, billing_period, granularity)
+            group_keys = tuple(
+                getattr(usage_key, DIMENSION_FIELDS[dimension]) for dimension in dimensions
+            )
+            grouped_usage[time_period][group_keys] += amount
+    return grouped_usage
+
+
+def _build_result_by_time(time_period: TimePeriodAlias, groups: GroupsAlias) -> dict:
+    return {
+        "TimePeriod": {"Start": time_period[0], "End": time_period[1]},
+        "Total": {},
+        "Groups": [
+            {
+                "Keys": list(group_keys),
+                "Metrics": {"UnblendedCost": {"Amount": str(amount), "Unit": COST_UNIT}},
+            }
+            for group_keys, amount in groups.items()
+        ],
+        "Estimated": False,
+    }
+
+
+class DataExportsCostClient:
+    """Answers the Cost Explorer queries of the usage generators from AWS Data Exports files.
+
+    It stands in for ``AWSClient`` in ``CostExplorerUsageGenerator``: billing views and
+    ``get_cost_and_usage`` responses are built from the aggregated export rows instead of
+    calling the AWS APIs. Queries without a billing view are answered for the payer
+    account the client was created for, like Cost Explorer does for the caller account.
+    """
+
+    def __init__(self, data_exports: DataExportsStore, payer_account_id: str) -> None:
+        self._data_exports = data_exports
+        self._payer_account_id = payer_account_id
+
+    def get_billing_views_by_account_id(
+        self,
+        account_id: str,
+        start_date: str,
+        end_date: str,
+    ) -> list[dict]:
+        """Get a billing view for the account when its organization has exported usage."""
+        billing_period = BillingPeriod(start_date=start_date, end_date=end_date)
+        if not self._data_exports.get_payer_usage(account_id, billing_period):
+            return []
+        return [
+            {
+                "arn": f"{DATA_EXPORTS_VIEW_ARN_PREFIX}{account_id}",
+                "name": f"Data Exports {account_id}",
+                "billingViewType": "BILLING_TRANSFER",
+                "sourceAccountId": account_id,
+            }
+        ]
+
+    def get_cost_and_usage(
+        self,
+        billing_period: BillingPeriod,
+        group_by: list[dict] | None = None,
+        filter_by: dict | None = None,
+        view_arn: str | None = None,
+        granularity: str = "MONTHLY",
+    ) -> list[dict]:
+        """Get the unblended cost grouped by dimensions, as Cost Explorer ``ResultsByTime``.
+
+        Queries filtered by linked account only scan the usage of those accounts.
+        """
+        grouped_usage = _group_usage(
+            self._get_usage(self._get_payer_account_id(view_arn), filter_by, billing_period),
+            [group["Key"] for group in group_by or []],
+            filter_by,
+            billing_period,
+            granularity,
+        )
+        return [
+            _build_result_by_time(time_period, grouped_usage[time_period])
+            for time_period in sorted(grouped_usage)
+        ]
+
+    def _get_usage(
+        self, payer_account_id: str, filter_by: dict | None, billing_period: BillingPeriod
+    ) -> PayerUsageAlias:
+        linked_account_ids = _get_filtered_linked_accounts(filter_by)
+        if linked_account_ids is None:
+            return self._data_exports.get_payer_usage(payer_account_id, billing_period)
+        return self._data_exports.get_account_usage(
+            payer_account_id, linked_account_ids, billing_period
+        )
+
+    def _get_payer_account_id(self, view_arn: str | None) -> str:
+        if view_arn and view_arn.startswith(DATA_EXPORTS_VIEW_ARN_PREFIX):
+            return view_arn.removeprefix(DATA_EXPORTS_VIEW_ARN_PREFIX)
+        return self._payer_account_id
@@ -0,0 +1,160 @@
+import csv
+import gzip
+import itertools
+from collections import defaultdict
+from collections.abc import Iterator
+from decimal import Decimal
+from pathlib import Path
+from types import MappingProxyType
+from typing import IO, NamedTuple, Self
+
+from swo_aws_extension.constants import AWSRecordTypeEnum
+from swo_aws_extension.logger import get_logger
+from swo_aws_extension.models import BillingPeriod
+
+logger = get_logger(__name__)
+
+DATA_EXPORTS_FILE_PATTERN = "*.csv*"
+GZIP_SUFFIX = ".gz"
+SUPPORT_PRODUCT_PREFIX = "AWS Support"
+# Columns read from the export files, every other column is skipped.
+DATA_EXPORTS_COLUMNS = (
+    "bill_payer_account_id",
+    "bill_billing_entity",
+    "bill_invoicing_entity",
+    "line_item_usage_account_id",
+    "line_item_line_item_type",
+    "line_item_usage_start_date",
+    "line_item_unblended_cost",
+    "line_item_product_code",
+    "product_product_name",
+)
+# Line item types named differently by the Cost Explorer RECORD_TYPE dimension.
+LINE_ITEM_RECORD_TYPES = MappingProxyType({
+    "SppDiscount": AWSRecordTypeEnum.SOLUTION_PROVIDER_PROGRAM_DISCOUNT,
+    "BundledDiscount": AWSRecordTypeEnum.BUNDLE_DISCOUNT,
+    "RIFee": AWSRecordTypeEnum.RECURRING,
+})
+
+type PayerUsageAlias = dict["UsageKey", Decimal]
+
+
+def _get_record_type(row: dict[str, str]) -> str:
+    line_item_type = row.get("line_item_line_item_type", "")
+    if line_item_type == "Fee" and row.get("product_product_name", "").startswith(
+        SUPPORT_PRODUCT_PREFIX
+    ):
+        return AWSRecordTypeEnum.SUPPORT
+    return LINE_ITEM_RECORD_TYPES.get(line_item_type, line_item_type)
+
+
+class UsageKey(NamedTuple):
+    """Cost Explorer dimensions of an aggregated Data Exports amount."""
+
+    usage_date: str
+    linked_account: str
+    service: str
+    record_type: str
+    invoicing_entity: str
+    billing_entity: str
+
+    @classmethod
+    def from_row(cls, row: dict[str, str]) -> Self:
+        """Build the key of an export row."""
+        return cls(
+            usage_date=row.get("line_item_usage_start_date", "")[:10],
+            linked_account=row.get("line_item_usage_account_id", ""),
+            service=row.get("product_product_name") or row.get("line_item_product_code", ""),
+            record_type=_get_record_type(row),
+            invoicing_entity=row.get("bill_invoicing_entity", ""),
+            billing_entity=row.get("bill_billing_entity", ""),
+        )
+
+
+def _open_export_file(export_file: Path) -> IO[str]:
+    if export_file.suffix == GZIP_SUFFIX:
+        return gzip.open(export_file, "rt", encoding="utf-8", newline="")
+    return export_file.open(encoding="utf-8", newline="")
+
+
+def _get_column_indexes(header: list[str]) -> dict[str, int]:
+    return {column: header.index(column) for column in DATA_EXPORTS_COLUMNS if column in header}
+
+
+def _project_row(
+    row: list[str],
+    column_indexes: dict[str, int],
+) -> dict[str, str]:
+    return {column: row[index] for column, index in column_indexes.items()}
+
+
+def _read_export_file(export_file: Path) -> Iterator[dict[str, str]]:
+    """Stream the rows of an export file, keeping only the ``DATA_EXPORTS_COLUMNS``."""
+    with _open_export_file(export_file) as text_file:
+        reader = csv.reader(text_file)
+        column_indexes = _get_column_indexes(next(reader, []))
+        for row in reader:
+            yield _project_row(row, column_indexes)
+
+
+class DataExportsStore:
+    """AWS Data Exports (CUR 2.0) files of a billing run, aggregated by payer account.
+
+    Exports are read from ``<directory>/BILLING_PERIOD=<YYYY-MM>/``, the layout used by
+    Data Exports deliveries, as plain or gzip compressed CSV. The files of a billing
+    period are streamed once, and their unblended costs are summed up by day and by the
+    Cost Explorer dimensions used by the usage generators. The usage of a payer is
+    indexed by linked account the first time the usage of some of its accounts is asked
+    for, so per-account queries do not scan the usage of the whole organization.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._usage_by_period: dict[str, dict[str, PayerUsageAlias]] = {}
+        self._usage_by_account: dict[tuple[str, str], dict[str, PayerUsageAlias]] = {}
+
+    def get_payer_usage(
+        self, payer_account_id: str, billing_period: BillingPeriod
+    ) -> PayerUsageAlias:
+        """Get the aggregated usage of the organization of a payer account."""
+        period_key = billing_period.start_date[:7]
+        if period_key not in self._usage_by_period:
+            self._usage_by_period[period_key] = self._load_period(period_key)
+        return self._usage_by_period[period_key].get(payer_account_id, {})
+
+    def get_account_usage(
+        self,
+        payer_account_id: str,
+        linked_account_ids: list[str],
+        billing_period: BillingPeriod,
+    ) -> PayerUsageAlias:
+        """Get the aggregated usage of some linked accounts of the organization of a payer."""
+        index_key = (billing_period.start_date[:7], payer_account_id)
+        if index_key not in self._usage_by_account:
+            self._usage_by_account[index_key] = self._index_by_account(
+                self.get_payer_usage(payer_account_id, billing_period)
+            )
+        usage_by_account = self._usage_by_account[index_key]
+        return {
+            usage_key: amount
+            for linked_account_id in linked_account_ids
+            for usage_key, amount in usage_by_account.get(linked_account_id, {}).items()
+        }
+
+    def _index_by_account(self, payer_usage: PayerUsageAlias) -> dict[str, PayerUsageAlias]:
+        usage_by_account: dict[str, PayerUsageAlias] = defaultdict(dict)
+        for usage_key, amount in payer_usage.items():
+            usage_by_account[usage_key.linked_account][usage_key] = amount
+        return usage_by_account
+
+    def _load_period(self, period_key: str) -> dict[str, PayerUsageAlias]:
+        usage_by_payer: dict[str, PayerUsageAlias] = defaultdict(lambda: defaultdict(Decimal))
+        period_directory = self._directory / f"BILLING_PERIOD={period_key}"
+        export_files = sorted(period_directory.rglob(DATA_EXPORTS_FILE_PATTERN))
+        logger.info("Reading %d Data Exports files from %s", len(export_files), period_directory)
+        for row in itertools.chain.from_iterable(map(_read_export_file, export_files)):
+            payer_usage = usage_by_payer[row.get("bill_payer_account_id", "")]
+            payer_usage[UsageKey.from_row(row)] += Decimal(
+                row.get("line_item_unblended_cost") or "0"
+            )
+        return usage_by_payer
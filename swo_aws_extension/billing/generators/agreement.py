@@ -1,7 +1,11 @@
 import datetime as dt
+from decimal import Decimal
 
 from mpt_extension_sdk.runtime.tracer import dynamic_trace_span
 
+from swo_aws_extension.billing.generators.additional_line_processors.base import (
+    AdditionalLineProcessor,
+)
 from swo_aws_extension.billing.generators.additional_line_processors.extra_discounts import (
     PlSDiscountProcessor,
     ServiceDiscountProcessor,
@@ -24,7 +28,9 @@ from swo_aws_extension.billing.models.context import AuthorizationContext, Billi
 from swo_aws_extension.billing.models.journal_line import JournalDetails, JournalLine
 from swo_aws_extension.billing.models.journal_result import AgreementJournalResult, PlsMismatch
 from swo_aws_extension.billing.models.usage import OrganizationUsageResult
+from swo_aws_extension.billing.stage_metrics import measure_stage
 from swo_aws_extension.constants import (
+    BillingStageEnum,
     ResponsibilityTransferStatus,
     SplitBillingPolicyEnum,
     SupportTypesEnum,
@@ -40,6 +46,17 @@ from swo_aws_extension.utils.decorators import with_log_context
 logger = get_logger(__name__)
 
 
+def build_additional_processors(pls_charge_percentage: Decimal) -> list[AdditionalLineProcessor]:
+    """Build the processors adding journal lines after the per-account usage pass."""
+    return [
+        ServiceDiscountProcessor(),
+        SupportDiscountProcessor(),
+        PlSDiscountProcessor(pls_charge_percentage),
+        PlSChargeProcessor(pls_charge_percentage),
+        SavingPlansDistributionProcessor(),
+    ]
+
+
 class AgreementJournalGenerator:
     """Generates journal lines and attachments for Agreements."""
 
@@ -56,13 +73,7 @@ class AgreementJournalGenerator:
         self._billing_period = context.billing_period
         self._usage_generator = usage_generator
         self._invoice_generator = invoice_generator
-        self._additional_processors = [
-            ServiceDiscountProcessor(),
-            SupportDiscountProcessor(),
-            PlSDiscountProcessor(context.pls_charge_percentage),
-            PlSChargeProcessor(context.pls_charge_percentage),
-            SavingPlansDistributionProcessor(),
-        ]
+        self._additional_processors = build_additional_processors(context.pls_charge_percentage)
 
     @with_log_context(lambda _, agreement, **kwargs: agreement.get("id"))
     @dynamic_trace_span(lambda _, agreement, **kwargs: f"Agreement {agreement.get('id')}")
@@ -94,7 +105,7 @@ class AgreementJournalGenerator:
             self._billing_period,
             organization_invoice=invoice_result.invoice,
         )
-        usage_result.reports.organization_data["INVOICES"] = invoice_result.raw_data
+        usage_result.reports.add_organization_data("INVOICES", invoice_result.raw_data)
         logger.info("Usage generation completed for MPA account %s", mpa_account)
 
         journal_details = JournalDetails(
@@ -134,11 +145,10 @@ class AgreementJournalGenerator:
             journal_details=journal_details,
             organization_invoice=organization_invoice,
         )
-        # Generate additional lines from custom processors
         all_lines.extend(
-            line
-            for proc in self._additional_processors
-            for line in proc.process(agreement, usage_result, journal_details, organization_invoice)
+            self._generate_additional_lines(
+                agreement, usage_result, journal_details, organization_invoice
+            )
         )
 
         pls_mismatches: list[PlsMismatch] = []
@@ -177,15 +187,36 @@ class AgreementJournalGenerator:
         line_generator = JournalLineGenerator(is_pls=is_pls)
 
         lines: list[JournalLine] = []
-        for account_id, account_usage in usage_result.usage_by_account.items():
-            lines.extend(
-                line_generator.generate(
-                    account_id,
-                    account_usage,
-                    journal_details,
-                    organization_invoice,
+        with measure_stage(BillingStageEnum.LINE_GENERATION) as stage_counts:
+            for account_id, account_usage in usage_result.usage_by_account.items():
+                lines.extend(
+                    line_generator.generate(
+                        account_id,
+                        account_usage,
+                        journal_details,
+                        organization_invoice,
+                    )
                 )
-            )
+            stage_counts.line_count = len(lines)
+        return lines
+
+    def _generate_additional_lines(
+        self,
+        agreement: dict,
+        usage_result: OrganizationUsageResult,
+        journal_details: JournalDetails,
+        organization_invoice,
+    ) -> list[JournalLine]:
+        """Generate the additional lines of the custom processors."""
+        with measure_stage(BillingStageEnum.ADDITIONAL_PROCESSORS) as stage_counts:
+            lines = [
+                line
+                for proc in self._additional_processors
+                for line in proc.process(
+                    agreement, usage_result, journal_details, organization_invoice
+                )
+            ]
+            stage_counts.line_count = len(lines)
         return lines
 
     def _validate_agreement(self, agreement, mpa_account):
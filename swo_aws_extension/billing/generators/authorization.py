@@ -1,10 +1,10 @@
 from collections.abc import Callable
 
-from mpt_extension_sdk.mpt_http.mpt import get_agreements_by_query
 from mpt_extension_sdk.runtime.tracer import dynamic_trace_span
 
 from swo_aws_extension.aws.client import AWSClient
 from swo_aws_extension.aws.errors import AWSError
+from swo_aws_extension.billing.backfill_cost_client import BackfillCostClient
 from swo_aws_extension.billing.generators.agreement import (
     AgreementJournalGenerator,
 )
@@ -13,7 +13,10 @@ from swo_aws_extension.billing.generators.billing_report_rows import (
     ReportContext,
 )
 from swo_aws_extension.billing.generators.invoice import InvoiceGenerator
-from swo_aws_extension.billing.generators.usage import CostExplorerUsageGenerator
+from swo_aws_extension.billing.generators.usage import (
+    CostExplorerUsageGenerator,
+    DataExportsUsageGenerator,
+)
 from swo_aws_extension.billing.models.context import (
     AuthorizationContext,
     BillingJournalContext,
@@ -22,30 +25,56 @@ from swo_aws_extension.billing.models.invoice import OrganizationInvoice
 from swo_aws_extension.billing.models.journal_result import (
     AuthorizationJournalResult,
 )
-from swo_aws_extension.billing.models.usage import OrganizationUsageResult
-from swo_aws_extension.constants import BILLING_JOURNAL_ERROR_TITLE, AgreementStatusEnum
+from swo_aws_extension.billing.models.usage import (
+    OrganizationReport,
+    OrganizationUsageResult,
+    UsageReportAlias,
+)
+from swo_aws_extension.constants import BILLING_JOURNAL_ERROR_TITLE
 from swo_aws_extension.logger import get_logger
-from swo_aws_extension.swo.rql.query_builder import RQLQuery
+from swo_aws_extension.swo.mpt.authorization import get_authorization_agreements
 from swo_aws_extension.utils.decorators import with_log_context
 
 logger = get_logger(__name__)
 
 
+def _get_report_factory(context: BillingJournalContext) -> Callable[[], UsageReportAlias]:
+    """Spill usage reports to the run's report store when one is configured."""
+    if context.report_store is None:
+        return OrganizationReport
+    return context.report_store.create_report
+
+
+def _build_usage_generator(
+    context: BillingJournalContext, aws_client: AWSClient, pma_account: str
+) -> CostExplorerUsageGenerator:
+    """Read the usage from the run's Data Exports files when they are configured."""
+    if context.data_exports is None:
+        return CostExplorerUsageGenerator(aws_client, _get_report_factory(context))
+    return DataExportsUsageGenerator(
+        context.data_exports, pma_account, _get_report_factory(context)
+    )
+
+
+def _build_billing_client(
+    aws_client: AWSClient, period_contexts: list[BillingJournalContext]
+) -> AWSClient:
+    """Share the Cost Explorer queries of a backfill between its billing periods."""
+    if len(period_contexts) == 1:
+        return aws_client
+    return BackfillCostClient(
+        aws_client, [period_context.billing_period for period_context in period_contexts]
+    )
+
+
 class AuthorizationJournalGenerator:
     """Generates a billing journal for Authorizations."""
 
     def __init__(self, context: BillingJournalContext) -> None:
         self._context = context
-        self._mpt_client = context.mpt_client
         self._config = context.config
-        self._product_ids = context.product_ids
-        self._billing_period = context.billing_period
         self._notifier = context.notifier
 
-    @with_log_context(lambda _, authorization, *args, **kwargs: authorization.get("id"))
-    @dynamic_trace_span(
-        lambda _, authorization, *args, **kwargs: f"Authorization {authorization.get('id')}",
-    )
     def run(
         self,
         authorization: dict,
@@ -60,49 +89,76 @@ class AuthorizationJournalGenerator:
         Returns:
             AuthorizationJournalResult containing lines and generated reports.
         """
-        auth_id = authorization.get("id")
+        return self.run_periods(authorization, billing_aws_client_provider, [self._context])[0]
+
+    @with_log_context(lambda _, authorization, *args, **kwargs: authorization.get("id"))
+    @dynamic_trace_span(
+        lambda _, authorization, *args, **kwargs: f"Authorization {authorization.get('id')}",
+    )
+    def run_periods(
+        self,
+        authorization: dict,
+        billing_aws_client_provider: Callable[[], AWSClient],
+        period_contexts: list[BillingJournalContext],
+    ) -> list[AuthorizationJournalResult]:
+        """Generate the billing journals of an authorization for several billing periods.
+
+        Agreements, AWS credentials and Cost Explorer queries are shared between the
+        billing periods, so a backfill doesn't repeat them month by month.
+
+        Args:
+            authorization: The authorization data to process.
+            billing_aws_client_provider: Provider for the billing AWS client.
+            period_contexts: The contexts of the billing periods to generate, in order.
+
+        Returns:
+            An AuthorizationJournalResult for each billing period.
+        """
         pma_account = authorization.get("externalIds", {}).get("operations", "")
 
         logger.info(
             "Generating billing journals for %s and PMA account %s",
-            auth_id,
+            authorization.get("id"),
             pma_account,
         )
-        agreements = self._get_authorization_agreements(authorization)
+        agreements = get_authorization_agreements(
+            self._context.mpt_client, authorization.get("id", ""), self._context.product_ids
+        )
 
         if not agreements:
             logger.info("No agreements found")
-            return AuthorizationJournalResult()
+            return [AuthorizationJournalResult() for _ in period_contexts]
         logger.info("Found %d agreements", len(agreements))
 
         # TODO update billing role to check responsibility transfers
         auth_context = AuthorizationContext(
-            id=auth_id or "",
+            id=authorization.get("id") or "",
             pma_account=pma_account,
             currency=authorization.get("currency", ""),
             aws_client=AWSClient(self._config, pma_account, self._config.management_role_name),
         )
 
-        aws_client = billing_aws_client_provider()
-
-        return self._process_agreements(
-            auth_context,
-            agreements,
-            CostExplorerUsageGenerator(aws_client),
-            InvoiceGenerator(aws_client),
-        )
+        aws_client = _build_billing_client(billing_aws_client_provider(), period_contexts)
+        return [
+            self._process_agreements(auth_context, agreements, aws_client, period_context)
+            for period_context in period_contexts
+        ]
 
     def _process_agreements(
         self,
         auth_context: AuthorizationContext,
         agreements: list[dict],
-        cost_explorer_usage_generator: CostExplorerUsageGenerator,
-        invoice_generator: InvoiceGenerator,
+        aws_client: AWSClient,
+        period_context: BillingJournalContext,
     ) -> AuthorizationJournalResult:
+        cost_explorer_usage_generator = _build_usage_generator(
+            self._context, aws_client, auth_context.pma_account
+        )
+        invoice_generator = InvoiceGenerator(aws_client)
         result = AuthorizationJournalResult()
         generator = AgreementJournalGenerator(
             auth_context,
-            self._context,
+            period_context,
             cost_explorer_usage_generator,
             invoice_generator,
         )
@@ -114,6 +170,7 @@ class AuthorizationJournalGenerator:
             cost_explorer_usage_generator,
             invoice_generator,
             result,
+            period_context,
         )
 
         return result
@@ -154,10 +211,11 @@ class AuthorizationJournalGenerator:
         cost_explorer_usage_generator: CostExplorerUsageGenerator,
         invoice_generator: InvoiceGenerator,
         result: AuthorizationJournalResult,
+        period_context: BillingJournalContext,
     ) -> None:
         try:
             pma_invoice, pma_usage = self._fetch_raw_pma_usage(
-                auth_context, cost_explorer_usage_generator, invoice_generator
+                auth_context, cost_explorer_usage_generator, invoice_generator, period_context
             )
         except AWSError:
             logger.exception(
@@ -186,28 +244,19 @@ class AuthorizationJournalGenerator:
         auth_context: AuthorizationContext,
         cost_explorer_usage_generator: CostExplorerUsageGenerator,
         invoice_generator: InvoiceGenerator,
+        period_context: BillingJournalContext,
     ) -> tuple[OrganizationInvoice, OrganizationUsageResult]:
         logger.info("Generating raw usage for PMA account to include in billing report")
         pma_invoice_result = invoice_generator.run(
             auth_context.pma_account,
             auth_context.pma_account,
-            self._billing_period,
+            period_context.billing_period,
             auth_context.currency,
         )
         pma_usage_result = cost_explorer_usage_generator.run_for_pma(
             auth_context.pma_account,
-            self._billing_period,
+            period_context.billing_period,
             organization_invoice=pma_invoice_result.invoice,
             granularity="MONTHLY",
         )
         return pma_invoice_result.invoice, pma_usage_result
-
-    def _get_authorization_agreements(self, authorization: dict) -> list[dict]:
-        select = "&select=subscriptions,subscriptions.lines,parameters"
-        rql_filter = (
-            RQLQuery(authorization__id=authorization.get("id"))
-            & RQLQuery(status__in=[AgreementStatusEnum.ACTIVE, AgreementStatusEnum.UPDATING])
-            & RQLQuery(product__id__in=self._product_ids)
-        )
-        rql_query = f"{rql_filter}{select}"
-        return get_agreements_by_query(self._mpt_client, rql_query)
@@ -6,7 +6,8 @@ from swo_aws_extension.billing.models.invoice import (
     OrganizationInvoice,
     OrganizationInvoiceResult,
 )
-from swo_aws_extension.constants import DEC_ZERO
+from swo_aws_extension.billing.stage_metrics import measure_stage
+from swo_aws_extension.constants import DEC_ZERO, BillingStageEnum
 from swo_aws_extension.logger import get_logger
 from swo_aws_extension.models import BillingPeriod
 
@@ -59,6 +60,17 @@ def _is_primary_invoice(invoice: dict) -> bool:
     return any(breakdown.get("Description") == SPP_DISCOUNT_DESCRIPTION for breakdown in breakdowns)
 
 
+def _list_invoice_summaries(
+    aws_client: AWSClient, pma_account: str, billing_period: BillingPeriod
+) -> list[dict]:
+    with measure_stage(BillingStageEnum.INVOICES) as stage_counts:
+        invoice_summaries = aws_client.list_invoice_summaries_by_account_id(
+            pma_account, billing_period.year, billing_period.month
+        )
+        stage_counts.row_count = len(invoice_summaries)
+    return invoice_summaries
+
+
 class ExchangeRateResolver:
     """Resolves exchange rates and payment currencies from invoices."""
 
@@ -123,10 +135,11 @@ class InvoiceGenerator:
         Returns:
             OrganizationInvoiceResult containing raw data and processed invoice.
         """
-        invoice_summaries = self._aws_client.list_invoice_summaries_by_account_id(
-            pma_account, billing_period.year, billing_period.month
-        )
-        raw_invoices = [inv for inv in invoice_summaries if _belongs_to_mpa(inv, mpa_account)]
+        raw_invoices = [
+            inv
+            for inv in _list_invoice_summaries(self._aws_client, pma_account, billing_period)
+            if _belongs_to_mpa(inv, mpa_account)
+        ]
         invoice = self._build_organization_invoice(raw_invoices, authorization_currency)
 
         for entity_name, entity in invoice.entities.items():
@@ -1,8 +1,11 @@
 import datetime as dt
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 
 from swo_aws_extension.aws.client import AWSClient
 from swo_aws_extension.aws.errors import AWSError
+from swo_aws_extension.billing.data_exports_client import DataExportsCostClient
+from swo_aws_extension.billing.data_exports_store import DataExportsStore
 from swo_aws_extension.billing.generators.report_processor import (
     ReportProcessor,
 )
@@ -13,8 +16,10 @@ from swo_aws_extension.billing.models.usage import (
     OrganizationReport,
     OrganizationUsageResult,
     ServiceMetric,
+    UsageReportAlias,
 )
-from swo_aws_extension.constants import AWS_MARKETPLACE
+from swo_aws_extension.billing.stage_metrics import measure_stage
+from swo_aws_extension.constants import AWS_MARKETPLACE, BillingStageEnum
 from swo_aws_extension.logger import get_logger
 from swo_aws_extension.models import BillingPeriod
 
@@ -25,6 +30,10 @@ def _marketplace_billing_entity_filter() -> dict:
     return {"Dimensions": {"Key": "BILLING_ENTITY", "Values": [AWS_MARKETPLACE]}}
 
 
+def _count_groups(cost_and_usage: list[dict]) -> int:
+    return sum(len(result_by_time.get("Groups", [])) for result_by_time in cost_and_usage)
+
+
 class CostExplorerReportFetcher:
     """Fetches cost and usage reports from AWS Cost Explorer."""
 
@@ -37,10 +46,12 @@ class CostExplorerReportFetcher:
         billing_period: BillingPeriod,
     ) -> list[str]:
         """Get list of accounts with usage for a billing view."""
-        cost_and_usage = self._aws_client.get_cost_and_usage(
-            billing_period=billing_period,
-            view_arn=billing_view_arn,
-            group_by=[{"Type": "DIMENSION", "Key": "LINKED_ACCOUNT"}],
+        cost_and_usage = self._get_cost_and_usage(
+            billing_period,
+            [{"Type": "DIMENSION", "Key": "LINKED_ACCOUNT"}],
+            None,
+            billing_view_arn,
+            "MONTHLY",
         )
         return self._extract_account_keys(cost_and_usage)
 
@@ -53,12 +64,8 @@ class CostExplorerReportFetcher:
             {"Type": "DIMENSION", "Key": "SERVICE"},
         ]
         filter_by = _marketplace_billing_entity_filter()
-        return self._aws_client.get_cost_and_usage(
-            billing_period,
-            group_by,
-            filter_by,
-            view_arn=billing_view_arn,
-            granularity=granularity,
+        return self._get_cost_and_usage(
+            billing_period, group_by, filter_by, billing_view_arn, granularity
         )
 
     def get_record_type_and_service_cost_report(
@@ -79,12 +86,8 @@ class CostExplorerReportFetcher:
                 {"Not": _marketplace_billing_entity_filter()},
             ]
         }
-        return self._aws_client.get_cost_and_usage(
-            billing_period,
-            group_by,
-            filter_by,
-            view_arn=billing_view_arn,
-            granularity=granularity,
+        return self._get_cost_and_usage(
+            billing_period, group_by, filter_by, billing_view_arn, granularity
         )
 
     def get_service_invoice_entity_report(
@@ -100,14 +103,29 @@ class CostExplorerReportFetcher:
             {"Type": "DIMENSION", "Key": "INVOICING_ENTITY"},
         ]
         filter_by = {"Dimensions": {"Key": "LINKED_ACCOUNT", "Values": [account_id]}}
-        return self._aws_client.get_cost_and_usage(
-            billing_period,
-            group_by,
-            filter_by,
-            view_arn=billing_view_arn,
-            granularity=granularity,
+        return self._get_cost_and_usage(
+            billing_period, group_by, filter_by, billing_view_arn, granularity
         )
 
+    def _get_cost_and_usage(
+        self,
+        billing_period: BillingPeriod,
+        group_by: list[dict],
+        filter_by: dict | None,
+        billing_view_arn: str,
+        granularity: str,
+    ) -> list[dict]:
+        with measure_stage(BillingStageEnum.COST_EXPLORER) as stage_counts:
+            cost_and_usage = self._aws_client.get_cost_and_usage(
+                billing_period,
+                group_by,
+                filter_by,
+                view_arn=billing_view_arn,
+                granularity=granularity,
+            )
+            stage_counts.row_count = _count_groups(cost_and_usage)
+        return cost_and_usage
+
     def _extract_account_keys(self, cost_and_usage: list[dict]) -> list[str]:
         keys: list[str] = []
         for period in cost_and_usage:
@@ -119,9 +137,14 @@ class CostExplorerReportFetcher:
 class BaseOrganizationUsageGenerator(ABC):
     """Base interface for extracting organization usage (Cost Explorer, CUR, etc.)."""
 
-    def __init__(self, aws_client) -> None:
+    def __init__(
+        self,
+        aws_client,
+        report_factory: Callable[[], UsageReportAlias] = OrganizationReport,
+    ) -> None:
         self._aws_client = aws_client
-        self._reports = OrganizationReport()
+        self._report_factory = report_factory
+        self._reports: UsageReportAlias = OrganizationReport()
         self._usage_by_account: dict[str, AccountUsage] = {}
 
     @abstractmethod
@@ -149,8 +172,12 @@ class BaseOrganizationUsageGenerator(ABC):
 class CostExplorerUsageGenerator(BaseOrganizationUsageGenerator):
     """Implementation for extracting usage using Cost Explorer."""
 
-    def __init__(self, aws_client):
-        super().__init__(aws_client)
+    def __init__(
+        self,
+        aws_client,
+        report_factory: Callable[[], UsageReportAlias] = OrganizationReport,
+    ):
+        super().__init__(aws_client, report_factory)
         self._organization_invoice: OrganizationInvoice | None = None
         self._report_fetcher = None
         self._processor = ReportProcessor()
@@ -165,17 +192,19 @@ class CostExplorerUsageGenerator(BaseOrganizationUsageGenerator):
     ) -> OrganizationUsageResult:
         """Extract usage from Cost Explorer and process it."""
         self._usage_by_account = {}
-        self._reports = OrganizationReport()
+        self._reports = self._report_factory()
         self._organization_invoice = organization_invoice
 
         logger.info("Generating usage report for MPA account %s", mpa_account)
         self._report_fetcher = CostExplorerReportFetcher(self._aws_client)
 
-        billing_views = self._aws_client.get_billing_views_by_account_id(
-            mpa_account,
-            start_date=billing_period.start_date,
-            end_date=billing_period.last_day,
-        )
+        with measure_stage(BillingStageEnum.BILLING_VIEWS) as stage_counts:
+            billing_views = self._aws_client.get_billing_views_by_account_id(
+                mpa_account,
+                start_date=billing_period.start_date,
+                end_date=billing_period.last_day,
+            )
+            stage_counts.row_count = len(billing_views)
         logger.info("Found %d billing views", len(billing_views))
 
         for billing_view in billing_views:
@@ -194,7 +223,7 @@ class CostExplorerUsageGenerator(BaseOrganizationUsageGenerator):
     ) -> OrganizationUsageResult:
         """Extract usage from Cost Explorer for the PMA account and process it."""
         self._usage_by_account = {}
-        self._reports = OrganizationReport()
+        self._reports = self._report_factory()
         self._organization_invoice = organization_invoice
 
         logger.info("Generating usage report for PMA account %s", pma_account)
@@ -203,7 +232,7 @@ class CostExplorerUsageGenerator(BaseOrganizationUsageGenerator):
         marketplace_report = self._report_fetcher.get_marketplace_usage_report(
             "", billing_period, granularity
         )
-        self._reports.organization_data["MARKETPLACE"] = marketplace_report
+        self._reports.add_organization_data("MARKETPLACE", marketplace_report)
 
         self._process_accounts_for_billing_view(
             [pma_account], {"arn": None}, billing_period, marketplace_report, granularity
@@ -238,7 +267,7 @@ class CostExplorerUsageGenerator(BaseOrganizationUsageGenerator):
         marketplace_report = self._report_fetcher.get_marketplace_usage_report(
             billing_view.get("arn"), billing_period, granularity
         )
-        self._reports.organization_data["MARKETPLACE"] = marketplace_report
+        self._reports.add_organization_data("MARKETPLACE", marketplace_report)
 
         self._process_accounts_for_billing_view(
             accounts, billing_view, billing_period, marketplace_report, granularity
@@ -254,21 +283,18 @@ class CostExplorerUsageGenerator(BaseOrganizationUsageGenerator):
     ) -> None:
         for account_id in accounts:
             logger.info("Getting usage for account: %s", account_id)
-            if account_id not in self._reports.accounts_data:
-                self._reports.accounts_data[account_id] = {}
-
             service_invoice_entity = self._report_fetcher.get_service_invoice_entity_report(
                 account_id, billing_view.get("arn"), billing_period, granularity
             )
-            self._reports.accounts_data[account_id]["SERVICE_INVOICE_ENTITY"] = (
-                service_invoice_entity
+            self._reports.add_account_data(
+                account_id, "SERVICE_INVOICE_ENTITY", service_invoice_entity
             )
 
             record_type_report = self._report_fetcher.get_record_type_and_service_cost_report(
                 account_id, billing_view.get("arn"), billing_period, granularity
             )
-            self._reports.accounts_data[account_id]["RECORD_TYPE_AND_SERVICE_COST"] = (
-                record_type_report
+            self._reports.add_account_data(
+                account_id, "RECORD_TYPE_AND_SERVICE_COST", record_type_report
             )
             self._usage_by_account[account_id] = self._build_account_usage(
                 account_id,
@@ -325,3 +351,20 @@ class CostExplorerUsageGenerator(BaseOrganizationUsageGenerator):
                 dt.date.fromisoformat(metric_data.end_date) - dt.timedelta(days=1)
             ).isoformat(),
         )
+
+
+class DataExportsUsageGenerator(CostExplorerUsageGenerator):
+    """Implementation for extracting usage from AWS Data Exports (CUR 2.0) files.
+
+    The exported rows are queried through ``DataExportsCostClient`` like Cost Explorer,
+    so the processed usage and the raw reports match the Cost Explorer implementation
+    without calling the Cost Explorer API.
+    """
+
+    def __init__(
+        self,
+        data_exports: DataExportsStore,
+        payer_account_id: str,
+        report_factory: Callable[[], UsageReportAlias] = OrganizationReport,
+    ):
+        super().__init__(DataExportsCostClient(data_exports, payer_account_id), report_factory)
@@ -0,0 +1,92 @@
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from swo_aws_extension.config import Config
+from swo_aws_extension.logger import get_logger
+
+PDF_SUFFIX = ".pdf"
+CHECKSUM_SUFFIX = ".sha256"
+BYTES_PER_MB = 1024 * 1024
+
+logger = get_logger(__name__)
+
+
+class InvoicePDFCache:
+    """On-disk cache of AWS invoice PDFs keyed by invoice id.
+
+    An issued invoice's PDF never changes, so entries do not expire. Each entry is
+    stored with its SHA-256 checksum and is discarded on read if the content no
+    longer matches. Once the cache grows over ``max_size_bytes`` the least
+    recently used entries are evicted.
+    """
+
+    def __init__(self, directory: Path, max_size_bytes: int) -> None:
+        self._directory = directory
+        self._max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, invoice_id: str) -> bytes | None:
+        """Return the cached PDF content for an invoice, or None on a miss."""
+        pdf_path, checksum_path = self._entry_paths(invoice_id)
+        with self._lock:
+            if not pdf_path.exists() or not checksum_path.exists():
+                return None
+            pdf_content = pdf_path.read_bytes()
+            if hashlib.sha256(pdf_content).hexdigest() != checksum_path.read_text("utf-8"):
+                logger.warning("Discarding corrupted cached invoice PDF %s", invoice_id)
+                self._remove_entry(pdf_path)
+                return None
+            pdf_path.touch()
+        return pdf_content
+
+    def put(self, invoice_id: str, pdf_content: bytes) -> None:
+        """Store the PDF content for an invoice and evict entries over the size limit."""
+        pdf_path, checksum_path = self._entry_paths(invoice_id)
+        with self._lock:
+            self._write_atomic(checksum_path, hashlib.sha256(pdf_content).hexdigest().encode())
+            self._write_atomic(pdf_path, pdf_content)
+            self._evict()
+
+    def _entry_paths(self, invoice_id: str) -> tuple[Path, Path]:
+        # Hash the invoice id so it can never escape the cache directory.
+        entry_name = hashlib.sha256(invoice_id.encode()).hexdigest()
+        return (
+            self._directory / f"{entry_name}{PDF_SUFFIX}",
+            self._directory / f"{entry_name}{CHECKSUM_SUFFIX}",
+        )
+
+    def _write_atomic(self, path: Path, file_bytes: bytes) -> None:
+        file_descriptor, tmp_name = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "wb") as tmp_file:
+            tmp_file.write(file_bytes)
+        Path(tmp_name).replace(path)
+
+    def _evict(self) -> None:
+        entries = sorted(
+            self._directory.glob(f"*{PDF_SUFFIX}"),
+            key=lambda pdf_path: pdf_path.stat().st_mtime,
+        )
+        total_size = sum(pdf_path.stat().st_size for pdf_path in entries)
+        for pdf_path in entries:
+            if total_size <= self._max_size_bytes:
+                break
+            total_size -= pdf_path.stat().st_size
+            self._remove_entry(pdf_path)
+
+    def _remove_entry(self, pdf_path: Path) -> None:
+        pdf_path.unlink(missing_ok=True)
+        pdf_path.with_suffix(CHECKSUM_SUFFIX).unlink(missing_ok=True)
+
+
+def build_invoice_pdf_cache(config: Config) -> InvoicePDFCache | None:
+    """Return the invoice PDF cache configured for the extension, if enabled."""
+    if not config.invoice_pdf_cache_dir:
+        return None
+    return InvoicePDFCache(
+        Path(config.invoice_pdf_cache_dir),
+        config.invoice_pdf_cache_max_size_mb * BYTES_PER_MB,
+    )
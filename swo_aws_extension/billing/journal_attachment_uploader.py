@@ -0,0 +1,231 @@
+import contextvars
+import os
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+import requests
+
+from swo_aws_extension.billing.journal_digests import (
+    UploadedFiles,
+    compute_digest,
+    delete_attachments,
+    describe_with_digest,
+)
+from swo_aws_extension.billing.models.journal import JournalAttachmentFile
+from swo_aws_extension.billing.models.usage import UsageReportAlias
+from swo_aws_extension.billing.stage_metrics import measure_stage
+from swo_aws_extension.constants import AttachmentFormatEnum, BillingStageEnum
+from swo_aws_extension.file_builder.gzip_builder import SpooledGzipBuilder
+from swo_aws_extension.file_builder.zip_builder import (
+    SPOOL_MAX_MEMORY_BYTES,
+    SpooledZipBuilder,
+)
+from swo_aws_extension.logger import get_logger
+from swo_aws_extension.swo.mpt.billing.billing_client import BillingClient
+from swo_aws_extension.swo.mpt.billing.models.hints import JournalAttachment
+
+ATTACHMENT_UPLOAD_MAX_WORKERS = 4
+ATTACHMENT_UPLOAD_MAX_ATTEMPTS = 3
+
+logger = get_logger(__name__)
+
+
+def build_report_attachment(
+    agreement_id: str,
+    report: UsageReportAlias,
+    attachment_format: AttachmentFormatEnum,
+) -> JournalAttachmentFile:
+    """Encode an agreement usage report as an attachment file in the given format.
+
+    Every format stream-encodes compact JSON into a spooled temporary file, so
+    reports spilled to disk are never loaded back into memory.
+    """
+    if attachment_format == AttachmentFormatEnum.ZIP:
+        zip_builder = SpooledZipBuilder()
+        with zip_builder.open(f"{agreement_id}.json") as entry_stream:
+            report.write_json(entry_stream)
+        return JournalAttachmentFile(
+            f"{agreement_id}.zip", "application/zip", zip_builder.get_file_content()
+        )
+    if attachment_format == AttachmentFormatEnum.JSON_GZIP:
+        gzip_builder = SpooledGzipBuilder()
+        with gzip_builder.open() as gzip_stream:
+            report.write_json(gzip_stream)
+        return JournalAttachmentFile(
+            f"{agreement_id}.json.gz", "application/gzip", gzip_builder.get_file_content()
+        )
+    json_stream = tempfile.SpooledTemporaryFile(  # ruff:ignore[open-file-with-context-handler]
+        max_size=SPOOL_MAX_MEMORY_BYTES
+    )
+    report.write_json(json_stream)
+    json_stream.seek(0)
+    return JournalAttachmentFile(f"{agreement_id}.json", "application/json", json_stream)
+
+
+def _is_retryable_upload_error(error: requests.RequestException) -> bool:
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status_code = error.response.status_code
+        return (
+            status_code == requests.codes.too_many_requests
+            or status_code >= requests.codes.internal_server_error
+        )
+    return False
+
+
+class JournalAttachmentUploader:
+    """Uploads the usage report attachments of a billing journal.
+
+    Attachments are uploaded concurrently with bounded parallelism. Transient
+    failures are retried, and a failed upload never affects other agreements.
+    Each attachment records the SHA-256 digest of its file: an unchanged report is
+    not uploaded again on a rerun, and a changed one replaces its previous upload.
+    """
+
+    def __init__(
+        self,
+        billing_api_client: BillingClient,
+        attachment_format: AttachmentFormatEnum = AttachmentFormatEnum.JSON,
+        max_workers: int = ATTACHMENT_UPLOAD_MAX_WORKERS,
+    ) -> None:
+        self._billing_api_client = billing_api_client
+        self._attachment_format = attachment_format
+        self._max_workers = max_workers
+
+    def upload_reports(
+        self,
+        journal_id: str,
+        reports_by_agreement: dict[str, UsageReportAlias],
+        uploaded_files: UploadedFiles | None = None,
+    ) -> None:
+        """Upload the non-empty usage reports of each agreement to the journal.
+
+        ``uploaded_files`` are listed from the journal attachments when not given.
+        """
+        reports_with_data = {
+            agreement_id: report
+            for agreement_id, report in reports_by_agreement.items()
+            if report.has_data()
+        }
+        if not reports_with_data:
+            return
+        if uploaded_files is None:
+            uploaded_files = UploadedFiles.from_journal(self._billing_api_client, journal_id)
+        self._upload_concurrently(journal_id, reports_with_data, uploaded_files)
+
+    def _upload_concurrently(
+        self,
+        journal_id: str,
+        reports_by_agreement: dict[str, UsageReportAlias],
+        uploaded_files: UploadedFiles,
+    ) -> None:
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._upload_report,
+                    journal_id,
+                    agreement_id,
+                    report,
+                    uploaded_files,
+                ): agreement_id
+                for agreement_id, report in reports_by_agreement.items()
+            }
+            self._wait_for_uploads(journal_id, futures)
+
+    def _wait_for_uploads(self, journal_id: str, futures: dict[Future[None], str]) -> None:
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except requests.RequestException:
+                logger.exception(
+                    "Failed to upload attachment for agreement %s on journal %s",
+                    futures[future],
+                    journal_id,
+                )
+
+    def _upload_report(
+        self,
+        journal_id: str,
+        agreement_id: str,
+        report: UsageReportAlias,
+        uploaded_files: UploadedFiles,
+    ) -> None:
+        with measure_stage(BillingStageEnum.SERIALIZATION) as stage_counts:
+            attachment_file = build_report_attachment(agreement_id, report, self._attachment_format)
+            stage_counts.byte_count = attachment_file.stream.seek(0, os.SEEK_END)
+        with attachment_file.stream:
+            digest = compute_digest(attachment_file.stream)
+            if uploaded_files.is_uploaded(attachment_file.filename, digest):
+                logger.info(
+                    "Journal attachment %s for journal ID %s is unchanged, skipping upload",
+                    attachment_file.filename,
+                    journal_id,
+                )
+                return
+            self._upload_with_retry(journal_id, agreement_id, attachment_file, digest)
+        delete_attachments(
+            self._billing_api_client,
+            journal_id,
+            uploaded_files.get_attachment_ids(attachment_file.filename),
+        )
+
+    def _upload_with_retry(
+        self,
+        journal_id: str,
+        agreement_id: str,
+        attachment_file: JournalAttachmentFile,
+        digest: str,
+    ) -> None:
+        attempt = 1
+        while True:
+            try:
+                return self._upload(journal_id, agreement_id, attachment_file, digest)
+            except requests.RequestException as error:
+                can_retry = attempt < ATTACHMENT_UPLOAD_MAX_ATTEMPTS
+                if not can_retry or not _is_retryable_upload_error(error):
+                    raise
+                logger.warning(
+                    "Retrying attachment upload for agreement %s on journal %s (attempt %d): %s",
+                    agreement_id,
+                    journal_id,
+                    attempt,
+                    error,
+                )
+                time.sleep(2 ** (attempt - 1))
+                attempt += 1
+
+    def _upload(
+        self,
+        journal_id: str,
+        agreement_id: str,
+        attachment_file: JournalAttachmentFile,
+        digest: str,
+    ) -> None:
+        start_time = time.perf_counter()
+        attachment_size = attachment_file.stream.seek(0, os.SEEK_END)
+        attachment_file.stream.seek(0)
+        attachment = JournalAttachment(
+            name=attachment_file.filename,
+            description=describe_with_digest(
+                f"Usage reports for AWS agreement {agreement_id}", digest
+            ),
+        )
+
+        with measure_stage(BillingStageEnum.ATTACHMENT_UPLOAD) as stage_counts:
+            self._billing_api_client.journal.attachments(journal_id).upload(
+                filename=attachment_file.filename,
+                mimetype=attachment_file.mimetype,
+                file=attachment_file.stream,
+                attachment=attachment,
+            )
+            stage_counts.byte_count = attachment_size
+        logger.info(
+            "Uploaded journal attachment %s for journal ID %s (%d bytes in %.2fs)",
+            attachment_file.filename,
+            journal_id,
+            attachment_size,
+            time.perf_counter() - start_time,
+        )
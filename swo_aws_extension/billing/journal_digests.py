@@ -0,0 +1,82 @@
+import functools
+import hashlib
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import IO, Self
+
+import requests
+
+from swo_aws_extension.logger import get_logger
+from swo_aws_extension.swo.mpt.billing.billing_client import BillingClient
+from swo_aws_extension.swo.mpt.billing.models.hints import JournalAttachment
+
+logger = get_logger(__name__)
+
+DIGEST_CHUNK_SIZE = 1024 * 1024
+DIGEST_PATTERN = re.compile(r"\(sha256:(?P<digest>[0-9a-f]{64})\)$")
+
+
+def compute_digest(stream: IO[bytes]) -> str:
+    """Compute the SHA-256 digest of a binary stream and rewind it for the upload."""
+    stream.seek(0)
+    sha256 = hashlib.sha256()
+    for chunk in iter(functools.partial(stream.read, DIGEST_CHUNK_SIZE), b""):
+        sha256.update(chunk)
+    stream.seek(0)
+    return sha256.hexdigest()
+
+
+def describe_with_digest(description: str, digest: str) -> str:
+    """Append the digest of an uploaded file to its attachment description."""
+    return f"{description} (sha256:{digest})"
+
+
+def delete_attachments(
+    billing_api_client: BillingClient, journal_id: str, attachment_ids: list[str]
+) -> None:
+    """Delete the outdated uploads of a replaced file, logging the attachments left behind."""
+    attachments_client = billing_api_client.journal.attachments(journal_id)
+    for attachment_id in attachment_ids:
+        try:
+            attachments_client.delete(attachment_id)
+        except requests.RequestException as error:
+            logger.warning(
+                "Failed to delete outdated attachment %s on journal %s: %s",
+                attachment_id,
+                journal_id,
+                error,
+            )
+
+
+def _get_digest(attachment: JournalAttachment) -> str | None:
+    match = DIGEST_PATTERN.search(attachment.get("description") or "")
+    return match.group("digest") if match else None
+
+
+class UploadedFiles:
+    """Digests of the files already uploaded to a journal.
+
+    Digests are recorded in the attachment descriptions, so a rerun of the same
+    billing period can tell which files are unchanged and skip their upload.
+    """
+
+    def __init__(self, attachments: Iterable[JournalAttachment]) -> None:
+        self._attachments_by_name: dict[str, list[JournalAttachment]] = defaultdict(list)
+        for attachment in attachments:
+            self._attachments_by_name[attachment.get("name", "")].append(attachment)
+
+    @classmethod
+    def from_journal(cls, billing_api_client: BillingClient, journal_id: str) -> Self:
+        """List the attachments of a journal."""
+        return cls(billing_api_client.journal.attachments(journal_id).all())
+
+    def is_uploaded(self, name: str, digest: str) -> bool:
+        """Whether a file with the same name and digest is attached to the journal."""
+        return any(
+            _get_digest(attachment) == digest for attachment in self._attachments_by_name[name]
+        )
+
+    def get_attachment_ids(self, name: str) -> list[str]:
+        """Get the ids of the attachments with a name, e.g. to replace them."""
+        return [attachment["id"] for attachment in self._attachments_by_name[name]]
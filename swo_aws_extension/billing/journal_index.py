@@ -0,0 +1,64 @@
+import calendar
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any, Self
+
+from swo_aws_extension.billing.models.journal import Journal
+from swo_aws_extension.logger import get_logger
+from swo_aws_extension.models import BillingPeriod
+from swo_aws_extension.swo.mpt.billing.billing_client import BillingClient
+from swo_aws_extension.swo.rql.query_builder import RQLQuery
+
+logger = get_logger(__name__)
+
+PENDING_JOURNAL_STATUSES = ("Error", "Draft", "Validated")
+
+
+def build_external_id(billing_period: BillingPeriod) -> str:
+    """Build the vendor external id shared by the journals of a billing period."""
+    month_name = calendar.month_name[billing_period.month]
+    return f"AWS-{billing_period.year}-{month_name}-BT"
+
+
+class JournalIndex:
+    """Journals of a billing period, indexed by authorization id.
+
+    The journals of every authorization are fetched with a single paginated query,
+    so finding the pending journal of an authorization or numbering its next
+    journal doesn't need a request per authorization.
+    """
+
+    def __init__(self, journals: Iterable[dict[str, Any]]) -> None:
+        self._journals_by_authorization: dict[str, list[Journal]] = defaultdict(list)
+        for journal in journals:
+            authorization_id = journal.get("authorization", {}).get("id", "")
+            self._journals_by_authorization[authorization_id].append(Journal.from_dict(journal))
+
+    @classmethod
+    def from_billing_period(
+        cls, billing_api_client: BillingClient, billing_period: BillingPeriod
+    ) -> Self:
+        """Fetch the journals of every authorization for a billing period."""
+        external_id = build_external_id(billing_period)
+        journals = billing_api_client.journal.query(RQLQuery(externalIds__vendor=external_id)).all()
+        logger.info("Found %d existing journals for %s", len(journals), external_id)
+        return cls(journals)
+
+    def get_pending_journal(self, authorization_id: str) -> Journal | None:
+        """Get the first journal of an authorization that can still be uploaded to."""
+        return next(
+            (
+                journal
+                for journal in self._journals_by_authorization[authorization_id]
+                if journal.status in PENDING_JOURNAL_STATUSES
+            ),
+            None,
+        )
+
+    def count_journals(self, authorization_id: str) -> int:
+        """Count the journals of an authorization, whatever their status."""
+        return len(self._journals_by_authorization[authorization_id])
+
+    def add_journal(self, authorization_id: str, journal: Journal) -> None:
+        """Register a journal created after the index was fetched."""
+        self._journals_by_authorization[authorization_id].append(journal)
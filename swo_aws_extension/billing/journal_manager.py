@@ -1,15 +1,24 @@
 import calendar
-import datetime as dt
-import json
 from io import BytesIO
 from urllib.parse import urljoin
 
-from requests import HTTPError
-
+from swo_aws_extension.billing.journal_attachment_uploader import JournalAttachmentUploader
+from swo_aws_extension.billing.journal_digests import (
+    UploadedFiles,
+    compute_digest,
+    delete_attachments,
+    describe_with_digest,
+)
+from swo_aws_extension.billing.journal_index import (
+    PENDING_JOURNAL_STATUSES,
+    JournalIndex,
+    build_external_id,
+)
 from swo_aws_extension.billing.models.context import BillingJournalContext
 from swo_aws_extension.billing.models.journal import Journal
-from swo_aws_extension.billing.models.usage import OrganizationReport
-from swo_aws_extension.constants import BILLING_JOURNAL_SUCCESS_TITLE
+from swo_aws_extension.billing.models.usage import UsageReportAlias
+from swo_aws_extension.billing.stage_metrics import measure_stage
+from swo_aws_extension.constants import BILLING_JOURNAL_SUCCESS_TITLE, BillingStageEnum
 from swo_aws_extension.logger import get_logger
 from swo_aws_extension.swo.mpt.billing.models.hints import JournalAttachment
 from swo_aws_extension.swo.notifications.teams import Button
@@ -17,21 +26,24 @@ from swo_aws_extension.swo.rql.query_builder import RQLQuery
 
 logger = get_logger(__name__)
 
-
-def serialize_default(unserializable):
-    """JSON serializer for objects not serializable by default."""
-    if isinstance(unserializable, dt.datetime):
-        return unserializable.isoformat()
-    return str(unserializable)
+JOURNAL_FILENAME = "journal.jsonl"
+JOURNAL_DIGEST_FILENAME = f"{JOURNAL_FILENAME}.sha256"
+# Journals in Error failed to process their file, so it is uploaded again even if unchanged
+UPLOAD_SKIPPABLE_JOURNAL_STATUSES = frozenset(("Draft", "Validated"))
 
 
 class JournalManager:  # noqa: WPS214
-    """Manages the creation, retrieval and upload of billing journals via MPT API."""
+    """Manages the creation, retrieval and upload of billing journals via MPT API.
+
+    Existing journals are looked up in ``journal_index`` when given, and queried for
+    the authorization otherwise.
+    """
 
     def __init__(
         self,
         context: BillingJournalContext,
         authorization_id: str,
+        journal_index: JournalIndex | None = None,
     ) -> None:
         self._context = context
         self._billing_api_client = context.billing_api_client
@@ -39,19 +51,26 @@ class JournalManager:  # noqa: WPS214
         self._billing_period = context.billing_period
         self._config = context.config
         self._notifier = context.notifier
+        self._journal_index = journal_index
+        self._uploaded_files_by_journal: dict[str, UploadedFiles] = {}
 
     def get_pending_journal(self) -> Journal | None:
         """Obtain an existing pending journal or return None."""
-        external_id = self._build_external_id()
-        journal = self._query_pending_journal(external_id)
+        if self._journal_index is None:
+            journal = self._query_pending_journal(build_external_id(self._billing_period))
+        else:
+            journal = self._journal_index.get_pending_journal(self._authorization_id)
         if journal:
             logger.info("Found pending journal for %s: %s", self._authorization_id, journal.name)
         return journal
 
     def create_new_journal(self) -> Journal:
         """Create a new journal for the current billing period."""
-        external_id = self._build_external_id()
-        total_journals = self._query_count_journals(external_id)
+        external_id = build_external_id(self._billing_period)
+        if self._journal_index is None:
+            total_journals = self._query_count_journals(external_id)
+        else:
+            total_journals = self._journal_index.count_journals(self._authorization_id)
         index = total_journals + 1
 
         journal_payload = {
@@ -60,20 +79,41 @@ class JournalManager:  # noqa: WPS214
             "dueDate": self._billing_period.start_date,
             "externalIds": {"vendor": external_id},
         }
-        return Journal.from_dict(
+        journal = Journal.from_dict(
             self._billing_api_client.journal.create(journal_payload),
         )
+        if self._journal_index is not None:
+            self._journal_index.add_journal(self._authorization_id, journal)
+        return journal
 
-    def upload_journal(self, journal_id: str, journal_file_lines: list) -> None:
-        """Upload the journal lines as a file to the MPT API."""
-        journal_file = "".join(entry.to_jsonl() for entry in journal_file_lines)
-        final_file = BytesIO(journal_file.encode("utf-8"))
-
-        self._billing_api_client.journal.upload(journal_id, final_file, "journal.jsonl")
+    def upload_journal(self, journal: Journal, journal_file_lines: list) -> None:
+        """Upload the journal lines as a file to the MPT API.
+
+        The digest of the file is recorded in a ``journal.jsonl.sha256`` attachment,
+        and the upload is skipped when a Draft or Validated journal already has the
+        same file.
+        """
+        with measure_stage(BillingStageEnum.SERIALIZATION) as stage_counts:
+            journal_file = "".join(entry.to_jsonl() for entry in journal_file_lines)
+            final_file = BytesIO(journal_file.encode("utf-8"))
+            stage_counts.line_count = len(journal_file_lines)
+            stage_counts.byte_count = final_file.getbuffer().nbytes
+        digest = compute_digest(final_file)
+        uploaded_files = self._get_uploaded_files(journal.id)
+        if journal.status in UPLOAD_SKIPPABLE_JOURNAL_STATUSES and uploaded_files.is_uploaded(
+            JOURNAL_DIGEST_FILENAME, digest
+        ):
+            logger.info("Journal file for journal ID %s is unchanged, skipping upload", journal.id)
+            return
+
+        with measure_stage(BillingStageEnum.JOURNAL_UPLOAD) as stage_counts:
+            self._billing_api_client.journal.upload(journal.id, final_file, JOURNAL_FILENAME)
+            stage_counts.byte_count = final_file.getbuffer().nbytes
+        self._record_journal_digest(journal.id, digest, uploaded_files)
 
         logger.info(
             "Uploaded journal file for journal ID %s with %d lines",
-            journal_id,
+            journal.id,
             len(journal_file_lines),
         )
 
@@ -93,55 +133,41 @@ class JournalManager:  # noqa: WPS214
     def upload_attachments(
         self,
         journal_id: str,
-        reports_by_agreement: dict[str, OrganizationReport],
-    ) -> None:
-        """Upload raw usage reports as JSON attachments to the journal."""
-        for agreement_id, report in reports_by_agreement.items():
-            if not report.organization_data and not report.accounts_data:
-                continue
-            try:
-                self._upload_single_attachment(journal_id, agreement_id, report)
-            except HTTPError:
-                logger.exception(
-                    "Failed to upload attachment for agreement %s on journal %s",
-                    agreement_id,
-                    journal_id,
-                )
-
-    def _upload_single_attachment(
-        self,
-        journal_id: str,
-        agreement_id: str,
-        report: OrganizationReport,
+        reports_by_agreement: dict[str, UsageReportAlias],
     ) -> None:
-        filename = f"{agreement_id}.json"
-
-        report_data = report.to_dict()
-        json_bytes = BytesIO(
-            json.dumps(
-                report_data,
-                indent=2,
-                default=serialize_default,
-            ).encode("utf-8")
+        """Upload raw usage reports as attachments to the journal."""
+        uploader = JournalAttachmentUploader(
+            self._billing_api_client,
+            self._config.billing_attachment_format,
         )
-
-        attachment = JournalAttachment(
-            name=filename,
-            description=f"Usage reports for AWS agreement {agreement_id}",
+        uploader.upload_reports(
+            journal_id, reports_by_agreement, self._uploaded_files_by_journal.get(journal_id)
         )
 
+    def _get_uploaded_files(self, journal_id: str) -> UploadedFiles:
+        if journal_id not in self._uploaded_files_by_journal:
+            self._uploaded_files_by_journal[journal_id] = UploadedFiles.from_journal(
+                self._billing_api_client, journal_id
+            )
+        return self._uploaded_files_by_journal[journal_id]
+
+    def _record_journal_digest(
+        self, journal_id: str, digest: str, uploaded_files: UploadedFiles
+    ) -> None:
         self._billing_api_client.journal.attachments(journal_id).upload(
-            filename=filename,
-            mimetype="application/json",
-            file=json_bytes,
-            attachment=attachment,
+            filename=JOURNAL_DIGEST_FILENAME,
+            mimetype="text/plain",
+            file=BytesIO(f"{digest}  {JOURNAL_FILENAME}\n".encode()),
+            attachment=JournalAttachment(
+                name=JOURNAL_DIGEST_FILENAME,
+                description=describe_with_digest("Digest of the journal file", digest),
+            ),
+        )
+        delete_attachments(
+            self._billing_api_client,
+            journal_id,
+            uploaded_files.get_attachment_ids(JOURNAL_DIGEST_FILENAME),
         )
-        logger.info("Uploaded journal attachment %s for journal ID %s", filename, journal_id)
-
-    def _build_external_id(self) -> str:
-        year = self._billing_period.year
-        month_name = calendar.month_name[self._billing_period.month]
-        return f"AWS-{year}-{month_name}-BT"
 
     def _build_journal_name(self, index: int) -> str:
         year = self._billing_period.year
@@ -152,7 +178,7 @@ class JournalManager:  # noqa: WPS214
         rql_query = (
             RQLQuery(externalIds__vendor=external_id)
             & RQLQuery(authorization__id=self._authorization_id)
-            & RQLQuery(status__in=["Error", "Draft", "Validated"])
+            & RQLQuery(status__in=list(PENDING_JOURNAL_STATUSES))
         )
         journals_raw = self._billing_api_client.journal.query(rql_query).page(limit=1)
         return Journal.from_dict(journals_raw["data"][0]) if journals_raw["data"] else None
@@ -1,12 +1,24 @@
-from dataclasses import dataclass
+from contextlib import ExitStack
+from dataclasses import dataclass, field, replace
 from decimal import Decimal
-from typing import Any
+from pathlib import Path
+from typing import Any, Self
 
 from swo_aws_extension.aws.client import AWSClient
+from swo_aws_extension.billing.data_exports_store import DataExportsStore
+from swo_aws_extension.billing.journal_index import JournalIndex
 from swo_aws_extension.billing.models.invoice import OrganizationInvoice
 from swo_aws_extension.billing.models.journal_line import JournalDetails
+from swo_aws_extension.billing.models.journal_result import (
+    AuthorizationJournalResult,
+    PlsMismatch,
+)
 from swo_aws_extension.billing.models.usage import AccountUsage
+from swo_aws_extension.billing.report_row_sink import BillingReportRowSink
+from swo_aws_extension.billing.report_store import ReportStore
+from swo_aws_extension.billing.shards import BillingShard, ShardOutputStore
 from swo_aws_extension.models import BillingPeriod
+from swo_aws_extension.work_queue.worker import QueueWorker, build_queue_worker
 
 
 @dataclass
@@ -32,6 +44,89 @@ class BillingJournalContext:
     authorizations: list[str] | None = None
     pls_charge_percentage: Decimal = Decimal("5.0")
     dry_run: bool = False
+    report_store: ReportStore | None = None
+    data_exports: DataExportsStore | None = None
+    shard_index: int = 0
+    shard_count: int = 1
+    work_queue_name: str = ""
+    run_id: str = ""
+
+    @property
+    def shard(self) -> BillingShard | None:
+        """The shard of the authorizations billed by the run, None when it is not sharded."""
+        if self.shard_count <= 1:
+            return None
+        return BillingShard(self.shard_index, self.shard_count)
+
+    @property
+    def shard_outputs(self) -> ShardOutputStore | None:
+        """The store of the shard outputs, None when no shard output directory is set."""
+        if not self.config.billing_shard_output_dir:
+            return None
+        return ShardOutputStore(Path(self.config.billing_shard_output_dir), self.run_id)
+
+    @property
+    def queue_worker(self) -> QueueWorker | None:
+        """The worker of the work queue of the authorizations, None when they are not queued."""
+        if not self.work_queue_name:
+            return None
+        period = self.billing_period.start_date[:7]
+        return build_queue_worker(self.config, f"{self.work_queue_name}/{period}", self.run_id)
+
+    @property
+    def shard_output_names(self) -> list[str]:
+        """The outputs merged into the billing report, of each shard or queued authorization."""
+        queue_worker = self.queue_worker
+        if queue_worker is not None:
+            return queue_worker.list_task_keys()
+        return [
+            str(BillingShard(shard_index, self.shard_count))
+            for shard_index in range(self.shard_count)
+        ]
+
+    def split_by_month(self) -> list[Self]:
+        """Get a context for each month of the billing period, which spans several in a backfill."""
+        return [
+            replace(self, billing_period=billing_period)
+            for billing_period in self.billing_period.split_by_month()
+        ]
+
+
+@dataclass
+class BillingPeriodRun:
+    """Results of a billing journal run collected for one of its billing periods."""
+
+    context: BillingJournalContext
+    row_sink: BillingReportRowSink
+    journal_index: JournalIndex | None = None
+    pls_mismatches: list[PlsMismatch] = field(default_factory=list)
+
+    @classmethod
+    def start(cls, context: BillingJournalContext, exit_stack: ExitStack) -> Self:
+        """Open the report row sink of a billing period and index its existing journals.
+
+        Queued runs are not indexed, their journals are queried for each task instead, so
+        a task retried by another worker finds the journal its previous attempt created.
+        """
+        journal_index = None
+        if not context.dry_run and not context.work_queue_name:
+            journal_index = JournalIndex.from_billing_period(
+                context.billing_api_client, context.billing_period
+            )
+        return cls(context, exit_stack.enter_context(BillingReportRowSink()), journal_index)
+
+    def start_task(self, exit_stack: ExitStack) -> Self:
+        """Open a run of the same billing period collecting the results of a single task."""
+        return type(self)(
+            self.context, exit_stack.enter_context(BillingReportRowSink()), self.journal_index
+        )
+
+    def add_result(self, generator_result: AuthorizationJournalResult) -> None:
+        """Collect the billing report rows and PLS mismatches of an authorization."""
+        self.pls_mismatches.extend(generator_result.pls_mismatches)
+        self.row_sink.append(
+            generator_result.billing_report_rows, generator_result.billing_report_rows_by_account
+        )
 
 
 @dataclass
@@ -1,7 +1,7 @@
 """Billing journal models."""
 
 from dataclasses import dataclass
-from typing import Any, Self
+from typing import IO, Any, Self
 
 
 @dataclass
@@ -20,3 +20,12 @@ class Journal:
             name=payload.get("name"),
             status=payload.get("status"),
         )
+
+
+@dataclass
+class JournalAttachmentFile:
+    """A journal attachment file ready to be uploaded."""
+
+    filename: str
+    mimetype: str
+    stream: IO[bytes]
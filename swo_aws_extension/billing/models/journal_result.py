@@ -1,8 +1,10 @@
-from dataclasses import dataclass, field
+import json
+from dataclasses import asdict, dataclass, field, fields
 from decimal import Decimal
+from typing import Any, Self
 
 from swo_aws_extension.billing.models.journal_line import JournalLine
-from swo_aws_extension.billing.models.usage import OrganizationReport
+from swo_aws_extension.billing.models.usage import UsageReportAlias
 
 
 @dataclass
@@ -24,6 +26,23 @@ class BillingReportRow:
     spp_discount_pct: Decimal
     linked_account: str = ""
 
+    def to_jsonl(self) -> str:
+        """Export as a single JSONL line."""
+        json_dump = json.dumps(asdict(self), default=str)
+        return f"{json_dump}\n"
+
+    @classmethod
+    def from_dict(cls, row_data: dict[str, Any]) -> Self:
+        """Rebuild a row from the dictionary of a line exported by ``to_jsonl``."""
+        return cls(**{
+            row_field.name: (
+                Decimal(row_data[row_field.name])
+                if row_field.type is Decimal
+                else row_data[row_field.name]
+            )
+            for row_field in fields(cls)
+        })
+
 
 @dataclass
 class PlsMismatch:
@@ -49,7 +68,7 @@ class AgreementJournalResult:
     """Result of generating an agreement journal."""
 
     lines: list[JournalLine] = field(default_factory=list)
-    report: OrganizationReport | None = None
+    report: UsageReportAlias | None = None
     billing_report_rows: list[BillingReportRow] = field(default_factory=list)
     billing_report_rows_by_account: list[BillingReportRow] = field(default_factory=list)
     pls_mismatches: list[PlsMismatch] = field(default_factory=list)
@@ -69,7 +88,7 @@ class AuthorizationJournalResult:
     """Result of generating an authorization journal."""
 
     lines: list[JournalLine] = field(default_factory=list)
-    reports_by_agreement: dict[str, OrganizationReport] = field(default_factory=dict)
+    reports_by_agreement: dict[str, UsageReportAlias] = field(default_factory=dict)
     billing_report_rows: list[BillingReportRow] = field(default_factory=list)
     billing_report_rows_by_account: list[BillingReportRow] = field(default_factory=list)
     pls_mismatches: list[PlsMismatch] = field(default_factory=list)
@@ -0,0 +1,50 @@
+"""Billing report file models."""
+
+import os
+from dataclasses import dataclass
+from typing import IO
+
+BYTES_PER_KB = 1024
+SIZE_UNITS = ("B", "KB", "MB", "GB")
+
+
+def _format_size(size_bytes: int) -> str:
+    size = float(size_bytes)
+    unit_index = 0
+    while size >= BYTES_PER_KB and unit_index < len(SIZE_UNITS) - 1:
+        size /= BYTES_PER_KB
+        unit_index += 1
+    unit = SIZE_UNITS[unit_index]
+    return f"{size:.1f} {unit}"
+
+
+@dataclass
+class ReportFile:
+    """Billing report file ready to be uploaded."""
+
+    label: str
+    blob_suffix: str
+    row_count: int
+    stream: IO[bytes]
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the file, leaving the stream at its start."""
+        size = self.stream.seek(0, os.SEEK_END)
+        self.stream.seek(0)
+        return size
+
+
+@dataclass(frozen=True)
+class UploadedReportFile:
+    """Billing report file uploaded to Azure Blob Storage."""
+
+    label: str
+    row_count: int
+    size_bytes: int
+    url: str
+
+    @property
+    def summary(self) -> str:
+        """Row count, size and download link of the file for Teams notifications."""
+        return f"{self.row_count} rows, {_format_size(self.size_bytes)} - [Download]({self.url})"
@@ -0,0 +1,94 @@
+import io
+import json
+from pathlib import Path
+from typing import IO
+
+from swo_aws_extension.file_builder.json_stream import dump_json_stream, serialize_default
+
+type SectionOffsetsAlias = dict[str | None, dict[str, int]]
+
+
+def _index_sections(report_file: IO[bytes]) -> SectionOffsetsAlias:
+    """Map each account and key to the offset of its latest payload line.
+
+    Organization-level responses are indexed under the ``None`` account.
+    """
+    offsets_by_account: SectionOffsetsAlias = {None: {}}
+    for header_line in iter(report_file.readline, b""):
+        header = json.loads(header_line)
+        account_offsets = offsets_by_account.setdefault(header["account_id"], {})
+        account_offsets[header["key"]] = report_file.tell()
+        report_file.readline()
+    return offsets_by_account
+
+
+def _copy_sections(
+    report_file: IO[bytes],
+    offsets: dict[str, int],
+    stream: IO[bytes],
+) -> None:
+    stream.write(b"{")
+    for index, (key, offset) in enumerate(offsets.items()):
+        if index:
+            stream.write(b",")
+        report_file.seek(offset)
+        stream.write(f"{json.dumps(key)}:".encode())
+        stream.write(report_file.readline().rstrip(b"\n"))
+    stream.write(b"}")
+
+
+class SpilledOrganizationReport:
+    """Organization report whose raw AWS responses are appended to a file on disk.
+
+    Each response is appended as a header line naming its account and key,
+    followed by a line with its compact JSON payload, so only the response being
+    written or read is held in memory. A response written again under the same
+    key replaces the earlier one, as in ``OrganizationReport``.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._has_data = False
+
+    def add_organization_data(self, key: str, records: list[dict]) -> None:
+        """Append an organization-level raw response under the given key."""
+        self._append(None, key, records)
+
+    def add_account_data(self, account_id: str, key: str, records: list[dict]) -> None:
+        """Append an account-level raw response under the given key."""
+        self._append(account_id, key, records)
+
+    def has_data(self) -> bool:
+        """Check if the report holds any raw response."""
+        return self._has_data
+
+    def to_dict(self) -> dict:
+        """Read the full structure back from disk into a dictionary."""
+        json_buffer = io.BytesIO()
+        self.write_json(json_buffer)
+        return json.loads(json_buffer.getvalue())  # type: ignore[no-any-return]
+
+    def write_json(self, stream: IO[bytes]) -> None:
+        """Stream the report as compact JSON into a binary stream.
+
+        Payloads are copied from disk one at a time without being decoded.
+        """
+        with self.path.open("rb") as report_file:
+            offsets_by_account = _index_sections(report_file)
+            stream.write(b'{"organization_data":')
+            _copy_sections(report_file, offsets_by_account.pop(None), stream)
+            stream.write(b',"accounts_data":{')
+            for index, (account_id, offsets) in enumerate(offsets_by_account.items()):
+                if index:
+                    stream.write(b",")
+                stream.write(f"{json.dumps(account_id)}:".encode())
+                _copy_sections(report_file, offsets, stream)
+            stream.write(b"}}")
+
+    def _append(self, account_id: str | None, key: str, records: list[dict]) -> None:
+        header = json.dumps({"account_id": account_id, "key": key})
+        with self.path.open("ab") as report_file:
+            report_file.write(f"{header}\n".encode())
+            dump_json_stream(records, report_file, serialize_default)
+            report_file.write(b"\n")
+        self._has_data = True
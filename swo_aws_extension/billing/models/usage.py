@@ -1,5 +1,9 @@
 from dataclasses import dataclass, field
 from decimal import Decimal
+from typing import IO
+
+from swo_aws_extension.billing.models.spilled_report import SpilledOrganizationReport
+from swo_aws_extension.file_builder.json_stream import dump_json_stream, serialize_default
 
 type AccountDataAlias = dict[str, list[dict]]
 
@@ -54,6 +58,18 @@ class OrganizationReport:
     organization_data: dict[str, list[dict]] = field(default_factory=dict)
     accounts_data: dict[str, AccountDataAlias] = field(default_factory=dict)
 
+    def add_organization_data(self, key: str, records: list[dict]) -> None:
+        """Store an organization-level raw response under the given key."""
+        self.organization_data[key] = records
+
+    def add_account_data(self, account_id: str, key: str, records: list[dict]) -> None:
+        """Store an account-level raw response under the given key."""
+        self.accounts_data.setdefault(account_id, {})[key] = records
+
+    def has_data(self) -> bool:
+        """Check if the report holds any raw response."""
+        return bool(self.organization_data or self.accounts_data)
+
     def to_dict(self) -> dict:
         """Convert the full structure into a dictionary."""
         return {
@@ -61,12 +77,19 @@ class OrganizationReport:
             "accounts_data": self.accounts_data,
         }
 
+    def write_json(self, stream: IO[bytes]) -> None:
+        """Stream the report as compact JSON into a binary stream."""
+        dump_json_stream(self.to_dict(), stream, serialize_default)
+
+
+type UsageReportAlias = OrganizationReport | SpilledOrganizationReport
+
 
 @dataclass
 class OrganizationUsageResult:
     """Global container returned by the generator, includes raw and processed data."""
 
-    reports: OrganizationReport
+    reports: UsageReportAlias
     usage_by_account: dict[str, AccountUsage] = field(default_factory=dict)
 
     def has_enterprise_support(self) -> bool:
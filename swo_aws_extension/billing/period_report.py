@@ -0,0 +1,60 @@
+from swo_aws_extension.billing.billing_report_creator import BillingReportCreator
+from swo_aws_extension.billing.models.context import BillingJournalContext
+from swo_aws_extension.billing.models.journal_result import PlsMismatch
+from swo_aws_extension.billing.report_row_sink import BillingReportRowSink
+from swo_aws_extension.billing.shards import ShardOutputStore
+from swo_aws_extension.constants import BILLING_JOURNAL_ERROR_TITLE
+from swo_aws_extension.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def send_period_report(
+    context: BillingJournalContext,
+    row_sink: BillingReportRowSink,
+    pls_mismatches: list[PlsMismatch],
+) -> None:
+    """Send the PLS mismatch summary and the billing report of a billing period."""
+    if pls_mismatches:
+        details = "\n\n".join(f"• {mismatch.description}" for mismatch in pls_mismatches)
+        context.notifier.send_warning(
+            title="PLS Mismatch Summary",
+            text=f"{len(pls_mismatches)} agreement(s) with PLS mismatch:\n\n{details}",
+        )
+
+    if row_sink.row_count and not context.dry_run:
+        report_creator = BillingReportCreator(context.config, context.notifier)
+        report_creator.create_and_notify_teams(str(context.billing_period), row_sink)
+
+
+def _notify_missing_outputs(context: BillingJournalContext, missing_outputs: list[str]) -> None:
+    missing_outputs_str = ", ".join(missing_outputs)
+    logger.error("Missing outputs %s for %s", missing_outputs_str, context.billing_period)
+    context.notifier.send_error(
+        BILLING_JOURNAL_ERROR_TITLE,
+        (
+            f"Cannot merge the billing report for {context.billing_period}: "
+            f"the outputs of {missing_outputs_str} have not been written."
+        ),
+    )
+
+
+def merge_shard_reports(
+    context: BillingJournalContext, shard_outputs: ShardOutputStore, output_names: list[str]
+) -> None:
+    """Send a single report of each billing period from the outputs of every worker.
+
+    A billing period is skipped, and the failure notified, while any of the outputs,
+    of a shard or of an authorization of the work queue, has not been written yet.
+    """
+    for period_context in context.split_by_month():
+        billing_period = period_context.billing_period
+        missing_outputs = shard_outputs.get_missing_outputs(billing_period, output_names)
+        if missing_outputs:
+            _notify_missing_outputs(period_context, missing_outputs)
+            continue
+
+        logger.info("Merging %d outputs for %s", len(output_names), billing_period)
+        with BillingReportRowSink() as row_sink:
+            pls_mismatches = shard_outputs.merge(billing_period, output_names, row_sink)
+            send_period_report(period_context, row_sink, pls_mismatches)
@@ -0,0 +1,81 @@
+import json
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Self
+
+from swo_aws_extension.billing.models.journal_result import BillingReportRow
+from swo_aws_extension.file_builder.zip_builder import SPOOL_MAX_MEMORY_BYTES
+
+
+def _append_rows(rows_file: IO[bytes], rows: Iterable[BillingReportRow]) -> int:
+    row_count = 0
+    rows_file.seek(0, 2)
+    for row in rows:
+        rows_file.write(row.to_jsonl().encode())
+        row_count += 1
+    return row_count
+
+
+def _read_rows(rows_file: IO[bytes]) -> Iterator[BillingReportRow]:
+    rows_file.seek(0)
+    for row_line in rows_file:
+        yield BillingReportRow.from_dict(json.loads(row_line))
+
+
+def save_rows(rows: Iterable[BillingReportRow], path: Path) -> int:
+    """Write billing report rows to a JSON lines file and return how many were written."""
+    with path.open("wb") as rows_file:
+        return _append_rows(rows_file, rows)
+
+
+def load_rows(path: Path) -> Iterator[BillingReportRow]:
+    """Read back the billing report rows of a file written by ``save_rows``."""
+    with path.open("rb") as rows_file:
+        yield from _read_rows(rows_file)
+
+
+class BillingReportRowSink:
+    """Incremental on-disk sink of billing report rows.
+
+    Rows are appended as JSON lines to spooled temporary files as each
+    authorization completes, and read back lazily when the report is built, so
+    memory does not grow with the number of authorizations. Each kind of row
+    can be read in a single pass at a time.
+    """
+
+    def __init__(self, max_memory_size: int = SPOOL_MAX_MEMORY_BYTES) -> None:
+        self._rows_file = tempfile.SpooledTemporaryFile(max_size=max_memory_size)  # ruff:ignore[open-file-with-context-handler]
+        self._rows_by_account_file = tempfile.SpooledTemporaryFile(  # ruff:ignore[open-file-with-context-handler]
+            max_size=max_memory_size
+        )
+        self.row_count = 0
+        self.row_by_account_count = 0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def append(
+        self,
+        rows: Iterable[BillingReportRow],
+        rows_by_account: Iterable[BillingReportRow] = (),
+    ) -> None:
+        """Append the billing report rows of an authorization."""
+        self.row_count += _append_rows(self._rows_file, rows)
+        self.row_by_account_count += _append_rows(self._rows_by_account_file, rows_by_account)
+
+    def iter_rows(self) -> Iterator[BillingReportRow]:
+        """Read the billing report rows back in the order they were appended."""
+        return _read_rows(self._rows_file)
+
+    def iter_rows_by_account(self) -> Iterator[BillingReportRow]:
+        """Read the billing report rows by linked account back in the order they were appended."""
+        return _read_rows(self._rows_by_account_file)
+
+    def close(self) -> None:
+        """Close the underlying temporary files."""
+        self._rows_file.close()
+        self._rows_by_account_file.close()
@@ -0,0 +1,34 @@
+import os
+import tempfile
+from pathlib import Path
+
+from swo_aws_extension.billing.models.spilled_report import SpilledOrganizationReport
+from swo_aws_extension.billing.models.usage import UsageReportAlias
+
+REPORT_FILE_SUFFIX = ".jsonl"
+
+
+class ReportStore:
+    """Directory holding the usage reports of a billing run spilled to disk.
+
+    Every report gets its own append-only file, so the raw AWS responses of an
+    organization are kept on disk instead of in the worker memory until the
+    journal attachments are uploaded.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def create_report(self) -> SpilledOrganizationReport:
+        """Create an empty report backed by a new file in the store."""
+        file_descriptor, report_path = tempfile.mkstemp(
+            dir=self._directory, suffix=REPORT_FILE_SUFFIX
+        )
+        os.close(file_descriptor)
+        return SpilledOrganizationReport(Path(report_path))
+
+    def discard(self, report: UsageReportAlias) -> None:
+        """Remove the file backing a report that is no longer needed."""
+        if isinstance(report, SpilledOrganizationReport):
+            report.path.unlink(missing_ok=True)
@@ -0,0 +1,124 @@
+import hashlib
+import json
+import shutil
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from swo_aws_extension.billing.models.journal_result import PlsMismatch
+from swo_aws_extension.billing.report_row_sink import BillingReportRowSink, load_rows, save_rows
+from swo_aws_extension.logger import get_logger
+from swo_aws_extension.models import BillingPeriod
+
+logger = get_logger(__name__)
+
+ROWS_FILE_NAME = "rows.jsonl"
+ROWS_BY_ACCOUNT_FILE_NAME = "rows-by-account.jsonl"
+PLS_MISMATCHES_FILE_NAME = "pls-mismatches.json"
+SHARD_HASH_BYTES = 8
+
+
+def get_shard_index(authorization_id: str, shard_count: int) -> int:
+    """Get the shard of an authorization, the same in every process and every run."""
+    digest = hashlib.sha256(authorization_id.encode()).digest()
+    return int.from_bytes(digest[:SHARD_HASH_BYTES], "big") % shard_count
+
+
+@dataclass(frozen=True)
+class BillingShard:
+    """One of the shards splitting the authorizations of a billing run across processes."""
+
+    index: int
+    count: int
+
+    def __str__(self) -> str:
+        return f"shard-{self.index}-of-{self.count}"
+
+    def includes(self, authorization_id: str) -> bool:
+        """Whether the authorization is billed by this shard."""
+        return get_shard_index(authorization_id, self.count) == self.index
+
+    def select_authorizations(self, authorizations: list[dict]) -> list[dict]:
+        """Get the authorizations billed by this shard, in their original order."""
+        shard_authorizations = [
+            authorization
+            for authorization in authorizations
+            if self.includes(authorization.get("id", ""))
+        ]
+        logger.info(
+            "%s bills %d of %d authorizations",
+            self,
+            len(shard_authorizations),
+            len(authorizations),
+        )
+        return shard_authorizations
+
+
+class ShardOutputStore:
+    """Directory, shared by the workers of a billing run, holding their report outputs.
+
+    Each shard, or each authorization processed through the work queue, writes the
+    billing report rows and PLS mismatches of a billing period to its own output. The
+    merge step reads them back once every output is written, to build a single report
+    and notification. Outputs are kept apart per run, so an output missing from a run is
+    never replaced by the one an earlier run wrote for the same period.
+    """
+
+    def __init__(self, directory: Path, run_id: str) -> None:
+        self._directory = directory
+        self._run_id = run_id
+
+    def write(
+        self,
+        output_name: str,
+        billing_period: BillingPeriod,
+        row_sink: BillingReportRowSink,
+        pls_mismatches: list[PlsMismatch],
+    ) -> None:
+        """Write an output for a billing period."""
+        period_directory = self._get_period_directory(billing_period)
+        period_directory.mkdir(parents=True, exist_ok=True)
+        # Written aside and moved in place, so a merge never reads a partial output.
+        staging_directory = Path(tempfile.mkdtemp(dir=period_directory, prefix=f".{output_name}-"))
+        save_rows(row_sink.iter_rows(), staging_directory / ROWS_FILE_NAME)
+        save_rows(row_sink.iter_rows_by_account(), staging_directory / ROWS_BY_ACCOUNT_FILE_NAME)
+        (staging_directory / PLS_MISMATCHES_FILE_NAME).write_text(
+            json.dumps([asdict(pls_mismatch) for pls_mismatch in pls_mismatches])
+        )
+        output_directory = period_directory / output_name
+        shutil.rmtree(output_directory, ignore_errors=True)
+        staging_directory.rename(output_directory)
+
+    def get_missing_outputs(
+        self, billing_period: BillingPeriod, output_names: list[str]
+    ) -> list[str]:
+        """Get the names of the outputs not written for a billing period."""
+        period_directory = self._get_period_directory(billing_period)
+        return [
+            output_name
+            for output_name in output_names
+            if not (period_directory / output_name).is_dir()
+        ]
+
+    def merge(
+        self,
+        billing_period: BillingPeriod,
+        output_names: list[str],
+        row_sink: BillingReportRowSink,
+    ) -> list[PlsMismatch]:
+        """Append the report rows of the outputs to a sink and return their PLS mismatches."""
+        pls_mismatches: list[PlsMismatch] = []
+        period_directory = self._get_period_directory(billing_period)
+        for output_name in output_names:
+            output_directory = period_directory / output_name
+            row_sink.append(
+                load_rows(output_directory / ROWS_FILE_NAME),
+                load_rows(output_directory / ROWS_BY_ACCOUNT_FILE_NAME),
+            )
+            saved_mismatches = json.loads((output_directory / PLS_MISMATCHES_FILE_NAME).read_text())
+            pls_mismatches.extend(PlsMismatch(**mismatch) for mismatch in saved_mismatches)
+        return pls_mismatches
+
+    def _get_period_directory(self, billing_period: BillingPeriod) -> Path:
+        period_name = f"{billing_period.start_date}_{billing_period.end_date}"
+        return self._directory / period_name / self._run_id
@@ -0,0 +1,156 @@
+import contextvars
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from opentelemetry import metrics
+
+from swo_aws_extension.constants import BillingStageEnum
+from swo_aws_extension.swo.notifications.teams import FactsSection
+
+SUMMARY_ROW_FORMAT = "{0:<24}{1:>8}{2:>12}{3:>12}{4:>12}{5:>16}"
+
+meter = metrics.get_meter(__name__)
+stage_duration = meter.create_histogram(
+    "billing.stage.duration", unit="s", description="Duration of a billing pipeline stage call"
+)
+stage_calls = meter.create_counter(
+    "billing.stage.calls", description="Calls of a billing pipeline stage"
+)
+stage_rows = meter.create_counter(
+    "billing.stage.rows", description="Report rows fetched by a billing pipeline stage"
+)
+stage_lines = meter.create_counter(
+    "billing.stage.lines", description="Journal lines produced by a billing pipeline stage"
+)
+stage_bytes = meter.create_counter(
+    "billing.stage.bytes", unit="By", description="Bytes written by a billing pipeline stage"
+)
+
+
+@dataclass
+class StageCounts:
+    """Rows, lines and bytes handled by one call of a stage, filled in by the measured code."""
+
+    row_count: int = 0
+    line_count: int = 0
+    byte_count: int = 0
+
+
+@dataclass
+class StageTotals(StageCounts):
+    """Calls, time and counts of a stage over a billing journal run."""
+
+    calls: int = 0
+    seconds: float = 0
+
+    def add(self, seconds: float, counts: StageCounts) -> None:
+        """Add a call of the stage."""
+        self.calls += 1
+        self.seconds += seconds
+        self.row_count += counts.row_count
+        self.line_count += counts.line_count
+        self.byte_count += counts.byte_count
+
+    def describe(self) -> str:
+        """Describe the totals in a sentence, e.g. for a Teams facts section."""
+        return (
+            f"{self.calls} calls in {self.seconds:.2f}s, {self.row_count} rows, "
+            f"{self.line_count} lines, {self.byte_count} bytes"
+        )
+
+
+class StageMetrics:
+    """Per-stage timers and counters of a billing journal run.
+
+    Stages are measured with ``measure_stage`` while the metrics are collected with
+    ``collect_stage_metrics``, including from the worker threads of uploads and
+    downloads as long as they run in a copy of the caller context.
+    """
+
+    def __init__(self) -> None:
+        self._totals: dict[BillingStageEnum, StageTotals] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: BillingStageEnum, seconds: float, counts: StageCounts) -> None:
+        """Add a call of a stage to the run totals."""
+        with self._lock:
+            self._totals.setdefault(stage, StageTotals()).add(seconds, counts)
+
+    @property
+    def totals(self) -> dict[BillingStageEnum, StageTotals]:
+        """Totals of the measured stages, in pipeline order."""
+        with self._lock:
+            return {
+                stage: self._totals[stage] for stage in BillingStageEnum if stage in self._totals
+            }
+
+    def format_summary(self) -> str:
+        """Format the totals as a plain text table."""
+        summary_rows = [
+            SUMMARY_ROW_FORMAT.format("Stage", "Calls", "Seconds", "Rows", "Lines", "Bytes")
+        ]
+        summary_rows.extend(
+            SUMMARY_ROW_FORMAT.format(
+                stage,
+                totals.calls,
+                f"{totals.seconds:.2f}",
+                totals.row_count,
+                totals.line_count,
+                totals.byte_count,
+            )
+            for stage, totals in self.totals.items()
+        )
+        return "\n".join(summary_rows)
+
+    def to_facts_section(self) -> FactsSection:
+        """Describe the totals as a Teams facts section."""
+        stage_descriptions = {
+            str(stage): totals.describe() for stage, totals in self.totals.items()
+        }
+        return FactsSection(title="Billing pipeline stages", data=stage_descriptions)
+
+
+_stage_metrics: contextvars.ContextVar[StageMetrics | None] = contextvars.ContextVar(
+    "stage_metrics", default=None
+)
+
+
+@contextmanager
+def collect_stage_metrics() -> Iterator[StageMetrics]:
+    """Collect the stages measured in the current context until the block exits."""
+    stage_metrics = StageMetrics()
+    token = _stage_metrics.set(stage_metrics)
+    try:
+        yield stage_metrics
+    finally:
+        _stage_metrics.reset(token)
+
+
+def _record_call(stage: BillingStageEnum, seconds: float, counts: StageCounts) -> None:
+    attributes = {"stage": str(stage)}
+    stage_duration.record(seconds, attributes)
+    stage_calls.add(1, attributes)
+    stage_rows.add(counts.row_count, attributes)
+    stage_lines.add(counts.line_count, attributes)
+    stage_bytes.add(counts.byte_count, attributes)
+    stage_metrics = _stage_metrics.get()
+    if stage_metrics is not None:
+        stage_metrics.record(stage, seconds, counts)
+
+
+@contextmanager
+def measure_stage(stage: BillingStageEnum) -> Iterator[StageCounts]:
+    """Time a call of a stage and record it as OpenTelemetry metrics.
+
+    The yielded ``StageCounts`` can be filled in with the rows, lines and bytes
+    handled by the call. Failed calls are recorded as well.
+    """
+    counts = StageCounts()
+    start_time = time.perf_counter()
+    try:
+        yield counts
+    finally:
+        _record_call(stage, time.perf_counter() - start_time, counts)
@@ -3,7 +3,20 @@ from pathlib import Path
 
 from django.conf import settings
 
+from swo_aws_extension.constants import AttachmentFormatEnum
+
 DEFAULT_PLS_CHARGE_PERCENTAGE = 5.0
+DEFAULT_INVOICE_PDF_CACHE_MAX_SIZE_MB = 512
+DEFAULT_AZURE_STORAGE_UPLOAD_BLOCK_SIZE_MB = 8
+DEFAULT_AZURE_STORAGE_UPLOAD_MAX_CONCURRENCY = 4
+BYTES_PER_MB = 1024 * 1024
+DEFAULT_AWS_FAKE_BACKEND_ACCOUNTS = 10
+DEFAULT_WORK_QUEUE_LEASE_SECONDS = 3600
+DEFAULT_WORK_QUEUE_MAX_ATTEMPTS = 3
+DEFAULT_MPT_PAGE_LIMIT = 100
+DEFAULT_MPT_PAGE_FETCH_MAX_WORKERS = 4
+DEFAULT_CATALOG_CACHE_TTL_SECONDS = 3600
+DEFAULT_VALIDATION_MEMO_TTL_SECONDS = 30
 
 
 class Config:
@@ -233,6 +246,55 @@ class Config:
         """The Azure Storage SAS expiry days."""
         return int(settings.EXTENSION_CONFIG["AZURE_STORAGE_SAS_EXPIRY_DAYS"])
 
+    @property
+    def azure_storage_upload_block_size_bytes(self) -> int:
+        """The block size of streamed Azure Storage Blob uploads (set in MB, defaults to 8)."""
+        block_size_mb = settings.EXTENSION_CONFIG.get(
+            "AZURE_STORAGE_UPLOAD_BLOCK_SIZE_MB", DEFAULT_AZURE_STORAGE_UPLOAD_BLOCK_SIZE_MB
+        )
+        return int(block_size_mb) * BYTES_PER_MB
+
+    @property
+    def azure_storage_upload_max_concurrency(self) -> int:
+        """The number of blocks staged in parallel by streamed Azure Storage Blob uploads."""
+        return int(
+            settings.EXTENSION_CONFIG.get(
+                "AZURE_STORAGE_UPLOAD_MAX_CONCURRENCY", DEFAULT_AZURE_STORAGE_UPLOAD_MAX_CONCURRENCY
+            ),
+        )
+
+    @property
+    def mpt_page_limit(self) -> int:
+        """The number of entries asked for in each page of MPT API lists (defaults to 100)."""
+        return int(settings.EXTENSION_CONFIG.get("MPT_PAGE_LIMIT", DEFAULT_MPT_PAGE_LIMIT))
+
+    @property
+    def mpt_page_fetch_max_workers(self) -> int:
+        """The number of pages of an MPT API list fetched in parallel (defaults to 4)."""
+        return int(
+            settings.EXTENSION_CONFIG.get(
+                "MPT_PAGE_FETCH_MAX_WORKERS", DEFAULT_MPT_PAGE_FETCH_MAX_WORKERS
+            )
+        )
+
+    @property
+    def catalog_cache_ttl_seconds(self) -> int:
+        """Seconds MPT catalog items, parameters and templates are cached (defaults to 3600)."""
+        return int(
+            settings.EXTENSION_CONFIG.get(
+                "CATALOG_CACHE_TTL_SECONDS", DEFAULT_CATALOG_CACHE_TTL_SECONDS
+            )
+        )
+
+    @property
+    def validation_memo_ttl_seconds(self) -> int:
+        """Seconds an order validation result is reused for equivalent orders (defaults to 30)."""
+        return int(
+            settings.EXTENSION_CONFIG.get(
+                "VALIDATION_MEMO_TTL_SECONDS", DEFAULT_VALIDATION_MEMO_TTL_SECONDS
+            )
+        )
+
     @property
     def confluence_base_url(self) -> str:
         """The Confluence base URL."""
@@ -265,6 +327,84 @@ class Config:
             settings.EXTENSION_CONFIG.get("PLS_CHARGE_PERCENTAGE", DEFAULT_PLS_CHARGE_PERCENTAGE),
         )
 
+    @property
+    def invoice_pdf_cache_dir(self) -> str:
+        """The directory for the AWS invoice PDF cache (empty disables the cache)."""
+        return settings.EXTENSION_CONFIG.get("INVOICE_PDF_CACHE_DIR", "")
+
+    @property
+    def invoice_pdf_cache_max_size_mb(self) -> int:
+        """The maximum size of the AWS invoice PDF cache in MB (defaults to 512)."""
+        return int(
+            settings.EXTENSION_CONFIG.get(
+                "INVOICE_PDF_CACHE_MAX_SIZE_MB", DEFAULT_INVOICE_PDF_CACHE_MAX_SIZE_MB
+            ),
+        )
+
+    @property
+    def billing_attachment_format(self) -> AttachmentFormatEnum:
+        """The format of the usage report attachments of billing journals."""
+        return AttachmentFormatEnum(
+            settings.EXTENSION_CONFIG.get("BILLING_ATTACHMENT_FORMAT", AttachmentFormatEnum.JSON),
+        )
+
+    @property
+    def billing_data_exports_dir(self) -> str:
+        """The directory holding the AWS Data Exports files used as billing usage source."""
+        return settings.EXTENSION_CONFIG.get("BILLING_DATA_EXPORTS_DIR", "")
+
+    @property
+    def billing_shard_output_dir(self) -> str:
+        """The directory, shared by the billing worker pods, holding the outputs of each shard."""
+        return settings.EXTENSION_CONFIG.get("BILLING_SHARD_OUTPUT_DIR", "")
+
+    @property
+    def work_queue_path(self) -> str:
+        """The SQLite file of the durable work queue shared by the workers."""
+        return settings.EXTENSION_CONFIG.get("WORK_QUEUE_PATH", "")
+
+    @property
+    def work_queue_lease_seconds(self) -> int:
+        """Seconds a worker holds a task before another worker may take it (defaults to 3600)."""
+        return int(
+            settings.EXTENSION_CONFIG.get(
+                "WORK_QUEUE_LEASE_SECONDS", DEFAULT_WORK_QUEUE_LEASE_SECONDS
+            )
+        )
+
+    @property
+    def work_queue_max_attempts(self) -> int:
+        """Times a task is leased before it is marked as failed (defaults to 3)."""
+        return int(
+            settings.EXTENSION_CONFIG.get(
+                "WORK_QUEUE_MAX_ATTEMPTS", DEFAULT_WORK_QUEUE_MAX_ATTEMPTS
+            )
+        )
+
+    @property
+    def aws_fake_backend_organizations(self) -> int:
+        """Organizations served by the fake AWS backend (0, the default, disables it)."""
+        return int(settings.EXTENSION_CONFIG.get("AWS_FAKE_BACKEND_ORGANIZATIONS", 0))
+
+    @property
+    def aws_fake_backend_accounts(self) -> int:
+        """Linked accounts of each fake AWS organization (defaults to 10)."""
+        return int(
+            settings.EXTENSION_CONFIG.get(
+                "AWS_FAKE_BACKEND_ACCOUNTS", DEFAULT_AWS_FAKE_BACKEND_ACCOUNTS
+            ),
+        )
+
+    @property
+    def aws_fake_backend_latency_ms(self) -> int:
+        """Latency added to every fake AWS call in milliseconds (defaults to 0)."""
+        return int(settings.EXTENSION_CONFIG.get("AWS_FAKE_BACKEND_LATENCY_MS", 0))
+
+    @property
+    def aws_fake_backend_throttle_rate(self) -> float:
+        """Share of the fake AWS calls answered with a throttling error (defaults to 0)."""
+        return float(settings.EXTENSION_CONFIG.get("AWS_FAKE_BACKEND_THROTTLE_RATE", 0))
+
     def _patch_path(self, file_path):
         """Fixes relative paths to be from the project root."""
         path = Path(file_path)
@@ -237,6 +237,7 @@ COMMAND_INVALID_BILLING_DATE_FUTURE = "Invalid billing date. Future months are n
 BILLING_JOURNAL_SUCCESS_TITLE = "AWS Billing Journal Synchronization Success"
 BILLING_JOURNAL_ERROR_TITLE = "AWS Billing Journal Synchronization Error"
 BILLING_INVOICE_ATTACHMENT_WARNING_TITLE = "AWS Billing Invoice Attachment Warning"
+BILLING_JOURNAL_METRICS_TITLE = "AWS Billing Journal Run Metrics"
 COST_EXPLORER_DATE_FORMAT = "%Y-%m-%d"
 
 EXCEL_MIME_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
@@ -302,6 +303,44 @@ class ServiceDiscountTypeEnum(StrEnum):
     USAGE_AMOUNT = "USAGE_AMOUNT"
 
 
+class AttachmentFormatEnum(StrEnum):
+    """Enum for billing journal usage report attachment formats."""
+
+    JSON = "json"
+    JSON_GZIP = "json.gz"
+    ZIP = "zip"
+
+
+class UsageSourceEnum(StrEnum):
+    """Enum for the sources of the organization usage of billing journals."""
+
+    COST_EXPLORER = "cost-explorer"
+    DATA_EXPORTS = "data-exports"
+
+
+class WorkTaskStatusEnum(StrEnum):
+    """Enum for the states of a task in the durable work queue."""
+
+    PENDING = "pending"
+    LEASED = "leased"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class BillingStageEnum(StrEnum):
+    """Enum for the measured stages of the billing journal pipeline."""
+
+    INVOICES = "invoices"
+    BILLING_VIEWS = "billing_views"
+    COST_EXPLORER = "cost_explorer"
+    LINE_GENERATION = "line_generation"
+    ADDITIONAL_PROCESSORS = "additional_processors"
+    SERIALIZATION = "serialization"
+    JOURNAL_UPLOAD = "journal_upload"
+    ATTACHMENT_UPLOAD = "attachment_upload"
+    INVOICE_PDFS = "invoice_pdfs"
+
+
 class ItemSkuEnum(StrEnum):
     """Enum for item skus."""
 
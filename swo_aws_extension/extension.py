@@ -12,17 +12,33 @@ from mpt_extension_sdk.runtime.djapp.conf import get_for_product
 from ninja import Body
 
 from swo_aws_extension.flows.fulfillment.base import fulfill_order
-from swo_aws_extension.flows.validation.base import validate_order
+from swo_aws_extension.flows.validation.memo import validate_order_memoized
+from swo_aws_extension.utils.ttl_cache import TTLCache
+
+WEBHOOK_PRODUCT_CACHE_TTL_SECONDS = 3600
+WEBHOOK_PRODUCT_CACHE_MAX_SIZE = 128
 
 logger = logging.getLogger(__name__)
 
 ext = Extension()
+# The SDK caches every webhook for the life of the process. Its uncached function is
+# used instead, so webhook products expire from the bounded cache below.
+fetch_webhook = get_webhook.__wrapped__
+webhook_product_cache: TTLCache[str] = TTLCache(
+    "mpt.webhook_products", WEBHOOK_PRODUCT_CACHE_TTL_SECONDS, WEBHOOK_PRODUCT_CACHE_MAX_SIZE
+)
+
+
+def get_webhook_product_id(client: MPTClient, webhook_id: str) -> str:
+    """Product of a webhook, kept for an hour in a cache bounded to the latest webhooks."""
+    return webhook_product_cache.get_or_load(
+        webhook_id, lambda: fetch_webhook(client, webhook_id)["criteria"]["product.id"]
+    )
 
 
 def jwt_secret_callback(client: MPTClient, claims: Mapping[str, Any]) -> str:
     """JWT callback."""
-    webhook = get_webhook(client, claims["webhook_id"])
-    product_id = webhook["criteria"]["product.id"]
+    product_id = get_webhook_product_id(client, claims["webhook_id"])
     return get_for_product(settings, "WEBHOOKS_SECRETS", product_id)
 
 
@@ -43,7 +59,7 @@ def process_order_fulfillment(client, event):
 def process_order_validation(request, order: Annotated[dict, Body()]):
     """Start order process validation."""
     try:
-        validated_order = validate_order(request.client, order)
+        validated_order = validate_order_memoized(request.client, order)
     except Exception:
         logger.exception("Unexpected error during validation")
         return 400, {
@@ -0,0 +1,29 @@
+import csv
+import io
+from collections.abc import Iterable, Sequence
+from typing import IO
+
+
+def write_csv_stream(
+    headers: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    stream: IO[bytes],
+) -> int:
+    """Write a header line and rows as UTF-8 CSV into a binary stream.
+
+    Rows are written one at a time, so they can come from a lazy source. The
+    stream is left open.
+
+    Returns:
+        The number of rows written, not counting the header line.
+    """
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8", newline="")  # type: ignore[arg-type]
+    writer = csv.writer(text_stream)
+    writer.writerow(headers)
+    row_count = 0
+    for row in rows:
+        writer.writerow(row)
+        row_count += 1
+    text_stream.flush()
+    text_stream.detach()
+    return row_count
@@ -0,0 +1,27 @@
+import gzip
+import tempfile
+from typing import IO
+
+from swo_aws_extension.file_builder.zip_builder import SPOOL_MAX_MEMORY_BYTES
+
+
+class SpooledGzipBuilder:
+    """
+    A utility class to create a gzip file backed by a spooled temporary file.
+
+    The compressed data is kept in memory up to ``max_memory_size`` bytes and
+    rolled over to disk beyond that. The gzip header has no timestamp, so the
+    same content always gives the same compressed bytes.
+    """
+
+    def __init__(self, max_memory_size: int = SPOOL_MAX_MEMORY_BYTES):
+        self._buffer = tempfile.SpooledTemporaryFile(max_size=max_memory_size)  # ruff:ignore[open-file-with-context-handler]
+
+    def open(self) -> IO[bytes]:
+        """Open the gzip stream for writing."""
+        return gzip.GzipFile(fileobj=self._buffer, mode="wb", mtime=0)
+
+    def get_file_content(self) -> IO[bytes]:
+        """Return content."""
+        self._buffer.seek(0)
+        return self._buffer
@@ -0,0 +1,29 @@
+import datetime as dt
+import io
+import json
+from collections.abc import Callable
+from typing import IO, Any
+
+
+def serialize_default(unserializable: Any) -> str:
+    """JSON serializer for objects not serializable by default."""
+    if isinstance(unserializable, dt.datetime):
+        return unserializable.isoformat()
+    return str(unserializable)
+
+
+def dump_json_stream(
+    payload: Any,
+    stream: IO[bytes],
+    default: Callable[[Any], Any] | None = None,
+) -> None:
+    """Stream-encode a payload as compact UTF-8 JSON into a binary stream.
+
+    The payload is encoded chunk by chunk, so the full JSON document is never
+    built in memory. The stream is left open.
+    """
+    encoder = json.JSONEncoder(separators=(",", ":"), default=default)
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8")  # type: ignore[arg-type]
+    text_stream.writelines(encoder.iterencode(payload))
+    text_stream.flush()
+    text_stream.detach()
@@ -1,5 +1,9 @@
 import io
+import tempfile
 import zipfile
+from typing import IO
+
+SPOOL_MAX_MEMORY_BYTES = 8 * 1024 * 1024
 
 
 class InMemoryZipBuilder:
@@ -23,3 +27,35 @@ class InMemoryZipBuilder:
         self._zip.close()
         self._buffer.seek(0)
         return self._buffer
+
+
+class SpooledZipBuilder:
+    """
+    A utility class to create a ZIP file backed by a spooled temporary file.
+
+    The archive is kept in memory up to ``max_memory_size`` bytes and rolled
+    over to disk beyond that. Entries can be written at once or streamed
+    through ``open``, so large archives never have to be held in memory.
+    Streamed entries get a fixed timestamp, so the same content always gives
+    the same archive bytes.
+    """
+
+    def __init__(self, max_memory_size: int = SPOOL_MAX_MEMORY_BYTES):
+        self._buffer = tempfile.SpooledTemporaryFile(max_size=max_memory_size)  # ruff:ignore[open-file-with-context-handler]
+        self._zip = zipfile.ZipFile(self._buffer, "w", zipfile.ZIP_DEFLATED)
+
+    def write(self, filename: str, zip_data: str):
+        """Write to the zip file."""
+        self._zip.writestr(filename, zip_data)
+
+    def open(self, filename: str) -> IO[bytes]:
+        """Open a zip entry for streamed writing."""
+        zip_info = zipfile.ZipInfo(filename)
+        zip_info.compress_type = self._zip.compression
+        return self._zip.open(zip_info, "w", force_zip64=True)
+
+    def get_file_content(self) -> IO[bytes]:
+        """Return content."""
+        self._zip.close()
+        self._buffer.seek(0)
+        return self._buffer
@@ -2,7 +2,6 @@ import datetime as dt
 import logging
 
 from mpt_extension_sdk.mpt_http.base import MPTClient
-from mpt_extension_sdk.mpt_http.mpt import get_agreements_by_query
 
 from swo_aws_extension.airtable.finops_table import FinOpsEntitlementsTable
 from swo_aws_extension.airtable.models import FinOpsRecord
@@ -16,8 +15,10 @@ from swo_aws_extension.constants import FinOpsStatusEnum
 from swo_aws_extension.models import BillingPeriod
 from swo_aws_extension.swo.finops.client import get_ffc_client
 from swo_aws_extension.swo.finops.errors import FinOpsError
+from swo_aws_extension.swo.mpt.agreement import iter_agreements_by_query
 from swo_aws_extension.swo.notifications.teams import TeamsNotificationManager
 from swo_aws_extension.swo.rql.query_builder import RQLQuery
+from swo_aws_extension.work_queue.worker import QueueWorker, process_payloads
 
 logger = logging.getLogger(__name__)
 
@@ -41,42 +42,42 @@ class FinOpsEntitlementsProcessor:  # noqa: WPS214
         self.entitlements_table = FinOpsEntitlementsTable()
         self.finops_client = get_ffc_client()
 
-    def sync(self):
-        """Synchronize FinOps entitlements."""
-        for agreement in self._get_agreements():
-            agreement_id = agreement.get("id")
-            logger.info("%s - Start processing agreement.", agreement_id)
-            finops_entitlements = self.entitlements_table.get_by_agreement_id(agreement_id)
-
-            mpa_account_id = agreement.get("externalIds", {}).get("vendor", "")
-            if not mpa_account_id:
-                logger.info("%s - Skipping - MPA not found", agreement_id)
-                TeamsNotificationManager().send_error(
-                    NOTIFICATION_TITLE,
-                    f"{agreement_id} - Skipping - MPA not found",
-                )
-                continue
-
-            pma_account_id = (
-                agreement.get("authorization", {}).get("externalIds", {}).get("operations")
+    def sync(self, queue_worker: QueueWorker | None = None):
+        """Synchronize FinOps entitlements, through the work queue if a worker is given."""
+        process_payloads(self._get_agreements(), self._sync_agreement, queue_worker)
+
+    def _sync_agreement(self, agreement: dict) -> None:
+        agreement_id = agreement.get("id")
+        logger.info("%s - Start processing agreement.", agreement_id)
+        finops_entitlements = self.entitlements_table.get_by_agreement_id(agreement_id)
+
+        mpa_account_id = agreement.get("externalIds", {}).get("vendor", "")
+        if not mpa_account_id:
+            logger.info("%s - Skipping - MPA not found", agreement_id)
+            TeamsNotificationManager().send_error(
+                NOTIFICATION_TITLE,
+                f"{agreement_id} - Skipping - MPA not found",
             )
-            if not pma_account_id:
-                logger.info("%s - Skipping - PMA not found", agreement_id)
-                TeamsNotificationManager().send_error(
-                    NOTIFICATION_TITLE,
-                    f"{agreement_id} - Skipping - PMA not found",
-                )
-                continue
+            return
 
-            self._synchronize_accounts(
-                mpa_account_id,
-                pma_account_id,
-                agreement_id,
-                agreement.get("buyer", {}).get("id", ""),
-                finops_entitlements,
+        pma_account_id = agreement.get("authorization", {}).get("externalIds", {}).get("operations")
+        if not pma_account_id:
+            logger.info("%s - Skipping - PMA not found", agreement_id)
+            TeamsNotificationManager().send_error(
+                NOTIFICATION_TITLE,
+                f"{agreement_id} - Skipping - PMA not found",
             )
+            return
+
+        self._synchronize_accounts(
+            mpa_account_id,
+            pma_account_id,
+            agreement_id,
+            agreement.get("buyer", {}).get("id", ""),
+            finops_entitlements,
+        )
 
-            self._manage_terminated_accounts(agreement_id, finops_entitlements)
+        self._manage_terminated_accounts(agreement_id, finops_entitlements)
 
     def _manage_terminated_accounts(self, agreement_id, finops_entitlements: list[FinOpsRecord]):
         active_entitlements = [
@@ -170,7 +171,7 @@ class FinOpsEntitlementsProcessor:  # noqa: WPS214
             )
         else:
             rql_filter = RQLQuery(status="Active") & RQLQuery(product__id__in=self.product_ids)
-        return get_agreements_by_query(self.mpt_client, f"{rql_filter}{select}")
+        return iter_agreements_by_query(self.mpt_client, f"{rql_filter}{select}")
 
     def _get_or_create_entitlement_in_finops(
         self, agreement_id: str, account_id: str, buyer_id: str
@@ -1,5 +1,6 @@
 import datetime as dt
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from mpt_extension_sdk.mpt_http.base import MPTClient
@@ -16,7 +17,7 @@ from swo_aws_extension.parameters import (
 )
 from swo_aws_extension.swo.azure_blob_uploader import AzureBlobUploader
 from swo_aws_extension.swo.excel_report_builder import ExcelReportBuilder
-from swo_aws_extension.swo.mpt.authorization import get_authorizations
+from swo_aws_extension.swo.mpt.authorization import iter_authorizations
 from swo_aws_extension.swo.mpt.order import get_orders_by_query
 from swo_aws_extension.swo.notifications.teams import Button, TeamsNotificationManager
 from swo_aws_extension.swo.rql.query_builder import RQLQuery
@@ -77,18 +78,21 @@ class InvitationsReportCreator:
             connection_string=self.config.azure_storage_connection_string,
             container_name=self.config.azure_storage_container,
             sas_expiry_days=self.config.azure_storage_sas_expiry_days,
+            block_size=self.config.azure_storage_upload_block_size_bytes,
+            max_concurrency=self.config.azure_storage_upload_max_concurrency,
         )
 
     def create_and_notify_teams(self) -> None:
         """Create invitations report, upload to Azure Storage and notify via Teams.
 
-        The Excel is built in memory, uploaded to Azure Blob Storage and a Teams
-        notification with a download link (SAS URL valid for a configured period of time) is sent.
+        The Excel is streamed to a spooled temporary file, uploaded to Azure Blob Storage and
+        a Teams notification with a download link (SAS URL valid for a configured period of
+        time) is sent.
         """
         logger.info("Creating invitations report for Teams notification...")
 
-        authorizations = get_authorizations(
-            self.mpt_client, RQLQuery(product__id__in=self.product_ids), 10
+        authorizations = iter_authorizations(
+            self.mpt_client, RQLQuery(product__id__in=self.product_ids)
         )
 
         rows, errors = self._process_authorizations_into_rows(authorizations)
@@ -108,14 +112,14 @@ class InvitationsReportCreator:
         logger.info("Invitations report uploaded and Teams notification sent.")
 
     def _upload_report(self, rows: ReportRows) -> str:
-        excel_bytes = self.excel_builder.build_from_rows(rows)
         date_str = dt.datetime.now(dt.UTC).strftime("%Y-%m-%d")
         report_folder = self.config.report_invitations_folder
         blob_name = f"{report_folder}{date_str}.xlsx"
-        return self.blob_uploader.upload_and_get_sas_url(excel_bytes, blob_name)
+        with self.excel_builder.stream_from_rows(rows) as excel_file:
+            return self.blob_uploader.upload_stream_and_get_sas_url(excel_file, blob_name)
 
     def _process_authorizations_into_rows(
-        self, authorizations: list[dict]
+        self, authorizations: Iterable[dict]
     ) -> tuple[ReportRows, ErrorMessages]:
         """Process authorizations into report rows and collect errors."""
         rows: ReportRows = []
@@ -192,7 +196,7 @@ class InvitationsReportCreator:
             ])
         )
         query_str = f"{rql_filter}{select}"
-        return get_orders_by_query(self.mpt_client, query_str, limit=100)
+        return get_orders_by_query(self.mpt_client, query_str)
 
     def _invitation_to_row(
         self, invitation: dict, mpt_data: dict[str, ReportEntityData]
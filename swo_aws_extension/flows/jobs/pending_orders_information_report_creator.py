@@ -109,4 +109,4 @@ class PendingOrdersInformationReportCreator:
         report_statuses = ["Querying", "Processing"]
         rql_filter = RQLQuery(status__in=report_statuses)
         query_str = f"{rql_filter}{select}"
-        return get_orders_by_query(self.mpt_client, query_str, limit=100)
+        return get_orders_by_query(self.mpt_client, query_str)
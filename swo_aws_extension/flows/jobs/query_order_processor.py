@@ -1,5 +1,4 @@
 import logging
-from http import HTTPStatus
 from typing import Any
 
 import requests
@@ -14,6 +13,7 @@ from swo_aws_extension.processor.querying.aws_billing_transfer_invitation import
 )
 from swo_aws_extension.processor.querying.aws_channel_handshake import AWSChannelHandshakeProcessor
 from swo_aws_extension.processor.querying.aws_customer_roles import AWSCustomerRolesProcessor
+from swo_aws_extension.swo.mpt.order import get_orders_by_query
 from swo_aws_extension.swo.rql.query_builder import RQLQuery
 
 logger = logging.getLogger(__name__)
@@ -25,7 +25,7 @@ class PurchaseOrderQueryService:
     def __init__(self, client: MPTClient, config: Config):
         self.client = client
         self.config = config
-        self.page_limit = 10
+        self.page_limit: int | None = None
 
     def filter(self) -> RQLQuery:
         """Filter purchase orders in Querying state for MPT products."""
@@ -35,42 +35,25 @@ class PurchaseOrderQueryService:
         return orders_for_product_ids & orders_in_querying & order_is_purchase
 
     def fetch_orders(self) -> list[dict[str, Any]]:
-        """Retrieve orders matching filter criteria."""
-        orders: list[dict[str, Any]] = []
-        url = (
-            f"/commerce/orders?{self.filter()}&select=audit,parameters,lines,subscriptions,"
+        """Retrieve orders matching filter criteria.
+
+        Every page is fetched before any order is processed, because processing moves
+        orders out of the Querying filter and would shift the offsets of later pages.
+        """
+        query = (
+            f"{self.filter()}&select=audit,parameters,lines,subscriptions,"
             f"subscriptions.lines,agreement,seller,buyer,authorization.externalIds&order=audit.created.at"
         )
-        page = None
-        offset = 0
-        while self.has_more_pages(page):
-            try:
-                response = self.client.get(f"{url}&limit={self.page_limit}&offset={offset}")
-            except requests.RequestException:  # pragma: no cover
-                logger.exception("Cannot retrieve orders")
-                return []
-
-            if response.status_code == HTTPStatus.OK:
-                page = response.json()
-                orders.extend(page.get("data") or [])
-            else:  # pragma: no cover
-                logger.warning("Order API error: %s %s", response.status_code, response.content)
-                return []
-            offset += self.page_limit
-
-        return orders
+        try:
+            return get_orders_by_query(self.client, query, self.page_limit)
+        except requests.RequestException:
+            logger.exception("Cannot retrieve orders")
+            return []
 
     def get_orders_as_context(self) -> list[PurchaseContext]:
         """Retrieve orders and setup as PurchaseContext."""
         return [PurchaseContext.from_order_data(order) for order in self.fetch_orders()]
 
-    def has_more_pages(self, orders):
-        """Are there more pages."""
-        if not orders:
-            return True
-        pagination = orders["$meta"]["pagination"]
-        return pagination["total"] > pagination["limit"] + pagination["offset"]
-
 
 def process_query_orders(client, config):
     """Iterates orders contexts and processes each in the processor chain."""
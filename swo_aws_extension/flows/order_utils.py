@@ -6,7 +6,6 @@ from mpt_extension_sdk.mpt_http.mpt import (
     complete_order,
     fail_order,
     get_agreements_by_query,
-    get_product_template_or_default,
     query_order,
     update_order,
 )
@@ -16,6 +15,7 @@ from swo_aws_extension.constants import AgreementStatusEnum, MptOrderStatus
 from swo_aws_extension.flows.order import InitialAWSContext
 from swo_aws_extension.flows.steps.errors import OrderStatusChangeError
 from swo_aws_extension.parameters import get_mpa_account_id, set_mpa_account_id
+from swo_aws_extension.swo.mpt.catalog import get_product_template_or_default
 from swo_aws_extension.swo.rql.query_builder import RQLQuery
 
 logger = logging.getLogger(__name__)
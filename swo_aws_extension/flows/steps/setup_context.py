@@ -2,10 +2,7 @@ import logging
 from typing import override
 
 from mpt_extension_sdk.mpt_http.base import MPTClient
-from mpt_extension_sdk.mpt_http.mpt import (
-    _paginated,  # ruff:ignore[import-private-name]
-    update_order,
-)
+from mpt_extension_sdk.mpt_http.mpt import update_order
 
 from swo_aws_extension.aws.client import AWSClient
 from swo_aws_extension.aws.errors import AWSError
@@ -27,6 +24,7 @@ from swo_aws_extension.parameters import (
     set_fulfillment_parameter_value,
     set_phase,
 )
+from swo_aws_extension.swo.mpt.catalog import get_product_parameters
 
 logger = logging.getLogger(__name__)
 
@@ -108,10 +106,7 @@ class SetupContext(BasePhaseStep):
         if phase:
             return
 
-        # TODO: SDK candidate
-        product_parameters = _paginated(
-            client, f"catalog/products/{context.product_id}/parameters?phase=Fulfillment"
-        )
+        product_parameters = get_product_parameters(client, context.product_id, "Fulfillment")
 
         for parameter in product_parameters:
             if parameter.get("options", {}).get("defaultValue", None):
@@ -9,7 +9,7 @@ from mpt_extension_sdk.flows.context import (
     ORDER_TYPE_TERMINATION,
 )
 from mpt_extension_sdk.mpt_http.base import MPTClient
-from mpt_extension_sdk.mpt_http.mpt import get_agreement, get_product_items_by_skus
+from mpt_extension_sdk.mpt_http.mpt import get_agreement
 from mpt_extension_sdk.mpt_http.wrap_http_error import ValidationError
 
 from swo_aws_extension.constants import (
@@ -30,6 +30,7 @@ from swo_aws_extension.parameters import (
     set_order_parameter_constraints,
     set_ordering_parameter_error,
 )
+from swo_aws_extension.swo.mpt.catalog import get_product_items_by_skus
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,50 @@
+import itertools
+import logging
+from types import MappingProxyType
+
+from opentelemetry import metrics
+
+from swo_aws_extension.utils.latency import LatencyPercentiles, LatencyWindow
+
+LATENCY_WINDOW_SIZE = 1000
+LATENCY_REPORT_INTERVAL = 100
+
+logger = logging.getLogger(__name__)
+
+meter = metrics.get_meter(__name__)
+validation_duration = meter.create_histogram(
+    "orders.validation.duration", unit="s", description="Duration of an order validation"
+)
+
+_latency_windows = MappingProxyType({
+    "cached": LatencyWindow(LATENCY_WINDOW_SIZE),
+    "uncached": LatencyWindow(LATENCY_WINDOW_SIZE),
+})
+_validation_count = itertools.count(1)
+
+
+def get_validation_latency() -> dict[str, LatencyPercentiles]:
+    """Latency percentiles of the latest cached and uncached validations."""
+    return {path: window.get_percentiles() for path, window in _latency_windows.items()}
+
+
+def record_validation_latency(path: str, seconds: float) -> None:
+    """
+    Record the duration of a cached or uncached validation.
+
+    The duration goes to the ``orders.validation.duration`` histogram, and the p50 and p95
+    of both paths are logged every ``LATENCY_REPORT_INTERVAL`` validations.
+
+    Args:
+        path: "cached" or "uncached".
+        seconds: Duration of the validation.
+    """
+    validation_duration.record(seconds, {"path": path})
+    _latency_windows[path].record(seconds)
+    if next(_validation_count) % LATENCY_REPORT_INTERVAL == 0:
+        latency = get_validation_latency()
+        logger.info(
+            "Order validation latency: cached %s, uncached %s",
+            latency["cached"].describe(),
+            latency["uncached"].describe(),
+        )
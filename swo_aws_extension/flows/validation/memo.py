@@ -0,0 +1,114 @@
+import copy
+import hashlib
+import json
+import logging
+import time
+from functools import cache
+
+from mpt_extension_sdk.flows.context import ORDER_TYPE_TERMINATION
+from mpt_extension_sdk.mpt_http.base import MPTClient
+
+from swo_aws_extension.config import get_config
+from swo_aws_extension.flows.validation.base import validate_order
+from swo_aws_extension.flows.validation.latency import record_validation_latency
+from swo_aws_extension.utils.ttl_cache import TTLCache
+
+VALIDATION_MEMO_NAME = "orders.validation"
+VALIDATION_MEMO_MAX_SIZE = 512
+# Order fields validate_order sets, besides the ordering parameters.
+VALIDATED_FIELDS = ("lines", "error")
+# Termination orders are validated against the live subscriptions of their agreement.
+UNMEMOIZED_ORDER_TYPES = frozenset((ORDER_TYPE_TERMINATION,))
+
+logger = logging.getLogger(__name__)
+
+
+@cache
+def get_validation_memo() -> TTLCache[dict]:
+    """The process-wide memo of validated orders, kept for ``VALIDATION_MEMO_TTL_SECONDS``."""
+    return TTLCache(
+        VALIDATION_MEMO_NAME, get_config().validation_memo_ttl_seconds, VALIDATION_MEMO_MAX_SIZE
+    )
+
+
+def get_validation_fingerprint(order: dict) -> str:
+    """
+    Hash of the order fields and ordering parameters validate_order depends on.
+
+    Parameter errors are left out because the validation resets them.
+
+    Args:
+        order: The order to validate.
+
+    Returns:
+        The SHA-256 hex digest of the relevant fields.
+    """
+    ordering_parameters = [
+        {key: param_value for key, param_value in parameter.items() if key != "error"}
+        for parameter in order.get("parameters", {}).get("ordering", [])
+    ]
+    relevant_fields = {
+        "type": order.get("type"),
+        "error": order.get("error"),
+        "product": order.get("product", {}).get("id"),
+        "agreement": order.get("agreement", {}).get("id"),
+        "licensee": order.get("licensee", {}).get("id"),
+        "client": order.get("client", {}).get("id"),
+        "lines": order.get("lines"),
+        "ordering": ordering_parameters,
+    }
+    serialized_fields = json.dumps(relevant_fields, sort_keys=True, default=str)
+    return hashlib.sha256(serialized_fields.encode()).hexdigest()
+
+
+def _merge_validated_fields(order: dict, validated_order: dict) -> dict:
+    """Copy of an order with the fields set by the validation taken from a validated order."""
+    merged_order = copy.deepcopy(order)
+    merged_order.update(
+        copy.deepcopy({
+            field: field_value
+            for field, field_value in validated_order.items()
+            if field in VALIDATED_FIELDS
+        })
+    )
+    validated_ordering = validated_order.get("parameters", {}).get("ordering")
+    if validated_ordering is not None:
+        merged_order.setdefault("parameters", {})["ordering"] = copy.deepcopy(validated_ordering)
+    return merged_order
+
+
+def validate_order_memoized(client: MPTClient, order: dict) -> dict:
+    """
+    Validate an order, reusing a recent validation of an order with the same fingerprint.
+
+    Drafts are validated again on every edit, usually with the fields that matter for the
+    validation unchanged. Those calls skip validate_order and its MPT requests, and get the
+    validated lines, error and ordering parameters applied to the order they sent. Failed
+    validations are not memoized, and termination orders are always validated again.
+
+    The duplicate agreement check of purchase orders is reused for the memo TTL as well,
+    which is accepted since fulfillment checks for a previous order again.
+
+    Args:
+        client: MPT client for API calls.
+        order: The order dictionary to validate.
+
+    Returns:
+        The validated order.
+    """
+    start_time = time.perf_counter()
+    if order.get("type") in UNMEMOIZED_ORDER_TYPES:
+        validated_order = validate_order(client, order)
+        record_validation_latency("uncached", time.perf_counter() - start_time)
+        return validated_order
+    fingerprint = get_validation_fingerprint(order)
+    validated_order: dict | None = get_validation_memo().get(fingerprint)
+    path = "uncached" if validated_order is None else "cached"
+    if validated_order is None:
+        validated_order = validate_order(client, order)
+        get_validation_memo().put(fingerprint, validated_order)
+    else:
+        logger.debug("%s - Reusing the validation of an equivalent order", order.get("id"))
+    merged_order = _merge_validated_fields(order, validated_order)
+    record_validation_latency(path, time.perf_counter() - start_time)
+    return merged_order
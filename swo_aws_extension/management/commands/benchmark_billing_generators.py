@@ -0,0 +1,96 @@
+from pathlib import Path
+
+from swo_aws_extension.billing.benchmarks.measurement import (
+    BenchmarkResult,
+    write_benchmark_results,
+)
+from swo_aws_extension.billing.benchmarks.payloads import BenchmarkScenario
+from swo_aws_extension.billing.benchmarks.runner import DEFAULT_REPEAT, BillingBenchmark
+from swo_aws_extension.management.commands_helpers import StyledPrintCommand
+
+DEFAULT_OUTPUT = "billing-benchmark.json"
+RESULT_ROW_FORMAT = "{0:<44}{1:>12}{2:>12}{3:>14}{4:>10}"
+BYTES_PER_KIB = 1024
+SIZE_OPTIONS = ("accounts", "services", "days", "invoice_entities", "repeat")
+
+
+def _format_result(benchmark_result: BenchmarkResult) -> str:
+    return RESULT_ROW_FORMAT.format(
+        benchmark_result.name,
+        f"{benchmark_result.min_seconds:.4f}",
+        f"{benchmark_result.median_seconds:.4f}",
+        benchmark_result.peak_memory_bytes // BYTES_PER_KIB,
+        benchmark_result.output_count,
+    )
+
+
+class Command(StyledPrintCommand):
+    """Benchmark the billing generators on a synthetic organization."""
+
+    help = "Benchmark the billing journal generators on a synthetic organization"
+    name = "benchmark_billing_generators"
+
+    def add_arguments(self, parser):
+        """Add the size of the synthetic organization and the output file."""
+        parser.add_argument(
+            "--accounts",
+            type=int,
+            default=BenchmarkScenario.accounts,
+            help=f"Accounts of the organization (default: {BenchmarkScenario.accounts})",
+        )
+        parser.add_argument(
+            "--services",
+            type=int,
+            default=BenchmarkScenario.services,
+            help=f"Services used by each account (default: {BenchmarkScenario.services})",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=BenchmarkScenario.days,
+            help=f"Days of the billing period (default: {BenchmarkScenario.days})",
+        )
+        parser.add_argument(
+            "--invoice-entities",
+            type=int,
+            default=BenchmarkScenario.invoice_entities,
+            help=(
+                "Invoicing entities the services are spread across "
+                f"(default: {BenchmarkScenario.invoice_entities})"
+            ),
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=DEFAULT_REPEAT,
+            help=f"Timed runs of each step (default: {DEFAULT_REPEAT})",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=Path(DEFAULT_OUTPUT),
+            help=f"JSON file the results are written to (default: {DEFAULT_OUTPUT})",
+        )
+
+    def handle(self, *args, **options):  # noqa: WPS110
+        """Run command."""
+        invalid_options = [option for option in SIZE_OPTIONS if options[option] < 1]
+        if invalid_options:
+            option_name = invalid_options[0].replace("_", "-")
+            self.error(f"Invalid --{option_name}. Must be at least 1.")
+            return
+
+        scenario = BenchmarkScenario(
+            accounts=options["accounts"],
+            services=options["services"],
+            days=options["days"],
+            invoice_entities=options["invoice_entities"],
+        )
+        self.info(f"Start {self.name} for {scenario}")
+        benchmark_results = BillingBenchmark(scenario, options["repeat"]).run()
+        write_benchmark_results(options["output"], scenario, benchmark_results)
+
+        self.info(RESULT_ROW_FORMAT.format("Step", "Min (s)", "Median (s)", "Peak (KiB)", "Output"))
+        for benchmark_result in benchmark_results:
+            self.info(_format_result(benchmark_result))
+        self.success(f"Completed {self.name}. Results written to {options['output']}")
@@ -1,6 +1,8 @@
 import datetime as dt
 import re
+import tempfile
 from decimal import Decimal
+from pathlib import Path
 
 from django.conf import settings
 from mpt_extension_sdk.core.utils import setup_client
@@ -8,11 +10,14 @@ from mpt_extension_sdk.core.utils import setup_client
 from swo_aws_extension.billing.billing_journal_service import (
     BillingJournalService,
 )
+from swo_aws_extension.billing.data_exports_store import DataExportsStore
 from swo_aws_extension.billing.models.context import BillingJournalContext
-from swo_aws_extension.config import get_config
+from swo_aws_extension.billing.report_store import ReportStore
+from swo_aws_extension.config import Config, get_config
 from swo_aws_extension.constants import (
     COMMAND_INVALID_BILLING_DATE,
     COMMAND_INVALID_BILLING_DATE_FUTURE,
+    UsageSourceEnum,
 )
 from swo_aws_extension.management.commands_helpers import StyledPrintCommand
 from swo_aws_extension.models import BillingPeriod
@@ -23,6 +28,63 @@ MIN_BILLING_YEAR = 2025
 MAX_MONTH = 12
 MIN_BILLING_DAY = 5
 AUTH_PATTERN = re.compile(r"^AUT-(?:\d+-)*\d+$")
+YEAR_MONTH_PATTERN = re.compile(r"^\d{4}-\d{2}$")
+
+
+def _parse_year_month(year_month: str) -> tuple[int, int]:
+    year, month = year_month.split("-")
+    return int(year), int(month)
+
+
+def _build_data_exports(config: Config, usage_source: UsageSourceEnum) -> DataExportsStore | None:
+    if usage_source != UsageSourceEnum.DATA_EXPORTS:
+        return None
+    return DataExportsStore(Path(config.billing_data_exports_dir))
+
+
+def _validate_sharding(shard_index: int, shard_count: int, work_queue: str) -> str | None:
+    if work_queue and shard_count > 1:
+        return "--work-queue and --shard-count cannot be used together"
+    if shard_count < 1:
+        return f"Invalid --shard-count. Must be at least 1, got {shard_count}."
+    last_shard_index = shard_count - 1
+    if not 0 <= shard_index <= last_shard_index:
+        return (
+            f"Invalid --shard-index. Must be between 0 and {last_shard_index}, got {shard_index}."
+        )
+    return None
+
+
+def _validate_sharding_config(options: dict, config: Config) -> str | None:
+    is_sharded = options["shard_count"] > 1 or options["work_queue"]
+    if options["merge_shards"] and not is_sharded:
+        return "--merge-shards requires a --shard-count greater than 1 or a --work-queue"
+    if is_sharded and not options["run"]:
+        return "--run is required to run or merge shards or work queue workers"
+    if is_sharded and not config.billing_shard_output_dir:
+        return "EXT_BILLING_SHARD_OUTPUT_DIR must be set to run or merge shards"
+    if options["work_queue"] and not config.work_queue_path:
+        return "EXT_WORK_QUEUE_PATH must be set to use a work queue"
+    return None
+
+
+def _build_range_period(from_month: str, to_month: str) -> BillingPeriod:
+    """Build a billing period spanning the months of a backfill."""
+    return BillingPeriod(
+        start_date=BillingPeriod.from_year_month(*_parse_year_month(from_month)).start_date,
+        end_date=BillingPeriod.from_year_month(*_parse_year_month(to_month)).end_date,
+    )
+
+
+def _build_billing_period(options: dict) -> tuple[BillingPeriod, str]:
+    """Get the billing period to generate and its label."""
+    from_month, to_month = options.get("from_month"), options.get("to_month")
+    if from_month and to_month:
+        return _build_range_period(from_month, to_month), f"{from_month} to {to_month}"
+
+    year, month = options["year"], options["month"]
+    formatted_month = str(month).zfill(2)
+    return BillingPeriod.from_year_month(year, month), f"{year}-{formatted_month}"
 
 
 class Command(StyledPrintCommand):
@@ -31,7 +93,7 @@ class Command(StyledPrintCommand):
     help = "Generate Journals for monthly billing"
     name = "generate_billing_journals"
 
-    def add_arguments(self, parser):
+    def add_arguments(self, parser):  # noqa: WPS213
         """Add required arguments."""
         today = dt.datetime.now(tz=dt.UTC)
         default_year = today.year - 1 if today.month == 1 else today.year
@@ -49,6 +111,20 @@ class Command(StyledPrintCommand):
             default=default_month,
             help=f"Month for billing (1-12, default: {default_month})",
         )
+        parser.add_argument(
+            "--from",
+            dest="from_month",
+            metavar="YYYY-MM",
+            default=None,
+            help="First month of a backfill, processed with --to in a single run",
+        )
+        parser.add_argument(
+            "--to",
+            dest="to_month",
+            metavar="YYYY-MM",
+            default=None,
+            help="Last month of a backfill, processed with --from in a single run",
+        )
         mutex_group = parser.add_mutually_exclusive_group()
         mutex_group.add_argument(
             "--authorizations",
@@ -63,40 +139,112 @@ class Command(StyledPrintCommand):
             default=False,
             help="Generate journals in dry_run mode without uploading to MPT",
         )
+        parser.add_argument(
+            "--usage-source",
+            choices=[usage_source.value for usage_source in UsageSourceEnum],
+            default=UsageSourceEnum.COST_EXPLORER.value,
+            help=(
+                "Source of the organization usage: the Cost Explorer API or the AWS Data "
+                "Exports files in EXT_BILLING_DATA_EXPORTS_DIR (default: cost-explorer)"
+            ),
+        )
+        parser.add_argument(
+            "--shard-index",
+            type=int,
+            default=0,
+            help="Shard of the authorizations generated by this process (default: 0)",
+        )
+        parser.add_argument(
+            "--shard-count",
+            type=int,
+            default=1,
+            help=(
+                "Shards the authorizations are split across by a stable hash of their id. "
+                "Each shard writes its report outputs to EXT_BILLING_SHARD_OUTPUT_DIR "
+                "(default: 1, no sharding)"
+            ),
+        )
+        parser.add_argument(
+            "--merge-shards",
+            action="store_true",
+            default=False,
+            help=(
+                "Send the billing report and PLS mismatch summary merged from the outputs "
+                "of the --shard-count shards, or of the --work-queue, instead of generating "
+                "journals"
+            ),
+        )
+        parser.add_argument(
+            "--work-queue",
+            metavar="NAME",
+            default="",
+            help=(
+                "Queue in EXT_WORK_QUEUE_PATH the authorizations are pulled from by every "
+                "worker running the command with the same name. Each authorization writes its "
+                "report outputs to EXT_BILLING_SHARD_OUTPUT_DIR"
+            ),
+        )
+        parser.add_argument(
+            "--run",
+            metavar="RUN",
+            default="",
+            help=(
+                "Run the shards or --work-queue workers belong to, required with them. Each "
+                "run bills every authorization again and keeps its own outputs, merged by "
+                "the --merge-shards run with the same value"
+            ),
+        )
 
     def handle(self, *args, **options):  # noqa: WPS110 WPS210
         """Run command."""
-        year, month = options["year"], options["month"]
         authorizations = options["authorizations"]
-
-        error = self.validate(year, month, authorizations)
+        error = self._validate_options(options)
         if error:
             self.error(error)
             return
 
+        billing_period, period = _build_billing_period(options)
+
         auth_str = " ".join(authorizations) if authorizations else "all"
-        formatted_month = str(month).zfill(2)
-        period = f"{year}-{formatted_month}"
         self.info(f"Start {self.name} for {period} ({auth_str})")
 
         config = get_config()
+        usage_source = UsageSourceEnum(options.get("usage_source", UsageSourceEnum.COST_EXPLORER))
+        if usage_source == UsageSourceEnum.DATA_EXPORTS and not config.billing_data_exports_dir:
+            self.error("EXT_BILLING_DATA_EXPORTS_DIR must be set to use the Data Exports source")
+            return
+
+        error = _validate_sharding_config(options, config)
+        if error:
+            self.error(error)
+            return
+
         notifier = TeamsNotificationManager()
-        billing_period = BillingPeriod.from_year_month(year, month)
 
         client = setup_client()
-        job_context = BillingJournalContext(
-            mpt_client=client,
-            billing_api_client=BillingClient(client),
-            config=config,
-            billing_period=billing_period,
-            product_ids=settings.MPT_PRODUCTS_IDS,
-            notifier=notifier,
-            authorizations=authorizations,
-            pls_charge_percentage=Decimal(str(config.pls_charge_percentage)),
-            dry_run=options.get("dry_run", False),
-        )
-        service = BillingJournalService(job_context)
-        service.run()
+        with tempfile.TemporaryDirectory(prefix="billing-reports-") as reports_dir:
+            job_context = BillingJournalContext(
+                mpt_client=client,
+                billing_api_client=BillingClient(client),
+                config=config,
+                billing_period=billing_period,
+                product_ids=settings.MPT_PRODUCTS_IDS,
+                notifier=notifier,
+                authorizations=authorizations,
+                pls_charge_percentage=Decimal(str(config.pls_charge_percentage)),
+                dry_run=options.get("dry_run", False),
+                report_store=ReportStore(Path(reports_dir)),
+                data_exports=_build_data_exports(config, usage_source),
+                shard_index=options["shard_index"],
+                shard_count=options["shard_count"],
+                work_queue_name=options["work_queue"],
+                run_id=options["run"],
+            )
+            service = BillingJournalService(job_context)
+            if options["merge_shards"]:
+                service.merge_shard_reports()
+            else:
+                service.run()
 
         self.success(f"Completed {self.name} for {period}.")
 
@@ -118,6 +266,45 @@ class Command(StyledPrintCommand):
 
         return None
 
+    def validate_range(
+        self,
+        from_month: str | None,
+        to_month: str | None,
+        authorizations: list,
+    ) -> str | None:
+        """Validate the months of a backfill. Returns error message or None if valid."""
+        if not from_month or not to_month:
+            return "Both --from and --to are required for a backfill"
+
+        invalid = [
+            year_month
+            for year_month in (from_month, to_month)
+            if not YEAR_MONTH_PATTERN.match(year_month)
+        ]
+        if invalid:
+            return f"Invalid month {invalid[0]}. Must be in YYYY-MM format."
+
+        if from_month > to_month:
+            return f"Invalid range. {from_month} is after {to_month}."
+
+        error = self._validate_year_month(*_parse_year_month(from_month))
+        if error:
+            return error
+
+        return self.validate(*_parse_year_month(to_month), authorizations)
+
+    def _validate_options(self, options: dict) -> str | None:
+        error = _validate_sharding(
+            options["shard_index"], options["shard_count"], options["work_queue"]
+        )
+        if error:
+            return error
+        if options.get("from_month") or options.get("to_month"):
+            return self.validate_range(
+                options.get("from_month"), options.get("to_month"), options["authorizations"]
+            )
+        return self.validate(options["year"], options["month"], options["authorizations"])
+
     def _validate_year_month(self, year: int, month: int) -> str | None:
         if year < MIN_BILLING_YEAR:
             return f"Year must be {MIN_BILLING_YEAR} or higher, got {year}"
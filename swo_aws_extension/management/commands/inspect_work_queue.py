@@ -0,0 +1,116 @@
+import time
+
+from swo_aws_extension.config import get_config
+from swo_aws_extension.management.commands_helpers import StyledPrintCommand
+from swo_aws_extension.work_queue.models import WorkLease, WorkQueueStats
+from swo_aws_extension.work_queue.sqlite_queue import SQLiteWorkQueue
+
+DEFAULT_WINDOW_MINUTES = 60
+SECONDS_PER_MINUTE = 60
+STATS_ROW_FORMAT = "{0:<40}{1:>10}{2:>10}{3:>12}{4:>10}{5:>12}"
+LEASE_ROW_FORMAT = "{0:<40}{1:<30}{2:>10}{3:>16}"
+
+
+def _format_stats(queue_stats: WorkQueueStats, window_minutes: int) -> str:
+    tasks_per_minute = queue_stats.recently_completed / window_minutes
+    return STATS_ROW_FORMAT.format(
+        queue_stats.queue_name,
+        queue_stats.pending,
+        queue_stats.leased,
+        queue_stats.completed,
+        queue_stats.failed,
+        f"{tasks_per_minute:.2f}",
+    )
+
+
+def _format_lease(lease: WorkLease, now: float) -> str:
+    return LEASE_ROW_FORMAT.format(
+        f"{lease.queue_name}/{lease.key}",
+        lease.lease_owner,
+        lease.attempts,
+        int(lease.expires_at - now),
+    )
+
+
+class Command(StyledPrintCommand):
+    """Inspect the queues of the durable work queue."""
+
+    help = "Show the depth, in-flight leases and throughput of the work queues"
+    name = "inspect_work_queue"
+
+    def add_arguments(self, parser):
+        """Add the queue to inspect and the throughput window."""
+        parser.add_argument(
+            "--queue",
+            metavar="NAME",
+            default=None,
+            help="Queue to inspect (default: every queue)",
+        )
+        parser.add_argument(
+            "--window",
+            type=int,
+            default=DEFAULT_WINDOW_MINUTES,
+            help=(
+                "Minutes of completed tasks the throughput is measured over "
+                f"(default: {DEFAULT_WINDOW_MINUTES})"
+            ),
+        )
+        parser.add_argument(
+            "--purge",
+            action="store_true",
+            default=False,
+            help="Remove every task of the --queue, so it can be run again",
+        )
+
+    def handle(self, *args, **options):  # noqa: WPS110
+        """Run command."""
+        config = get_config()
+        if not config.work_queue_path:
+            self.error("EXT_WORK_QUEUE_PATH must be set to inspect the work queue")
+            return
+        if options["window"] < 1:
+            self.error("Invalid --window. Must be at least 1.")
+            return
+
+        work_queue = SQLiteWorkQueue.from_config(config)
+        queue_name = options["queue"]
+        if options["purge"]:
+            if not queue_name:
+                self.error("--purge requires --queue")
+                return
+            purged_count = work_queue.purge(queue_name)
+            self.success(f"Removed {purged_count} tasks of work queue {queue_name}")
+            return
+
+        self._print_stats(work_queue, queue_name, options["window"])
+        self._print_leases(work_queue, queue_name)
+
+    def _print_stats(
+        self, work_queue: SQLiteWorkQueue, queue_name: str | None, window_minutes: int
+    ) -> None:
+        completed_since = time.time() - window_minutes * SECONDS_PER_MINUTE
+        queue_stats = [
+            stats
+            for stats in work_queue.get_stats(completed_since)
+            if queue_name in {None, stats.queue_name}
+        ]
+        if not queue_stats:
+            self.info("No tasks in the work queue")
+            return
+        self.info(
+            STATS_ROW_FORMAT.format(
+                "Queue", "Pending", "Leased", "Completed", "Failed", "Tasks/min"
+            )
+        )
+        for stats in queue_stats:
+            self.info(_format_stats(stats, window_minutes))
+
+    def _print_leases(self, work_queue: SQLiteWorkQueue, queue_name: str | None) -> None:
+        leases = work_queue.list_leases(queue_name)
+        if not leases:
+            self.info("No in-flight leases")
+            return
+        now = time.time()
+        self.info(LEASE_ROW_FORMAT.format("Task", "Worker", "Attempt", "Expires in (s)"))
+        for lease in leases:
+            self.info(_format_lease(lease, now))
@@ -0,0 +1,39 @@
+import argparse
+
+from django.core.management import call_command
+
+from swo_aws_extension.aws.fake.backend import FakeAWSBackend
+from swo_aws_extension.aws.fake.transport import fake_aws_backend
+from swo_aws_extension.config import get_config
+from swo_aws_extension.management.commands_helpers import StyledPrintCommand
+
+
+class Command(StyledPrintCommand):
+    """Run a management command against the fake AWS backend, to load-test it."""
+
+    help = "Run a management command with its AWS calls served by the fake AWS backend"
+    name = "load_test"
+
+    def add_arguments(self, parser):
+        """Add the command to run and its arguments."""
+        parser.add_argument("command_name", metavar="COMMAND", help="Command to run")
+        parser.add_argument(
+            "command_args",
+            metavar="ARGS",
+            nargs=argparse.REMAINDER,
+            help="Arguments of the command",
+        )
+
+    def handle(self, *args, **options):  # noqa: WPS110
+        """Run command."""
+        config = get_config()
+        if not config.aws_fake_backend_organizations:
+            self.error("EXT_AWS_FAKE_BACKEND_ORGANIZATIONS must be set to run a load test")
+            return
+        with fake_aws_backend(FakeAWSBackend.from_config(config)):
+            call_command(
+                options["command_name"],
+                *options["command_args"],
+                stdout=self.stdout,
+                stderr=self.stderr,
+            )
@@ -1,8 +1,14 @@
 from django.conf import settings
 from mpt_extension_sdk.core.utils import setup_client
 
+from swo_aws_extension.config import get_config
 from swo_aws_extension.management.commands_helpers import StyledPrintCommand
-from swo_aws_extension.swo.mpt.sync.agreement_syncer import synchronize_agreements
+from swo_aws_extension.swo.mpt.sync.agreement_syncer import (
+    AgreementSyncer,
+    get_agreements_to_synchronize,
+    synchronize_agreements,
+)
+from swo_aws_extension.work_queue.worker import build_queue_worker
 
 
 class Command(StyledPrintCommand):
@@ -25,12 +31,50 @@ class Command(StyledPrintCommand):
             default=False,
             help="Test synchronization without making changes",
         )
+        parser.add_argument(
+            "--work-queue",
+            metavar="NAME",
+            default="",
+            help=(
+                "Queue in EXT_WORK_QUEUE_PATH the agreements are pulled from by every worker "
+                "running the command with the same name"
+            ),
+        )
+        parser.add_argument(
+            "--work-queue-run",
+            metavar="RUN",
+            default="",
+            help=(
+                "Run of the --work-queue the worker joins, each run processing every task "
+                "again (default: today's UTC date)"
+            ),
+        )
 
     def handle(self, *args, **options):  # noqa: WPS110
         """Run command."""
+        config = get_config()
+        if options["work_queue"] and not config.work_queue_path:
+            self.error("EXT_WORK_QUEUE_PATH must be set to use a work queue")
+            return
+
         self.info("Start synchronizing agreements...")
         mpt_client = setup_client()
-        synchronize_agreements(
-            mpt_client, options["agreements"], settings.MPT_PRODUCTS_IDS, dry_run=options["dry_run"]
-        )
+        if options["work_queue"]:
+            syncer = AgreementSyncer(mpt_client, dry_run=options["dry_run"])
+            queue_worker = build_queue_worker(
+                config, options["work_queue"], options["work_queue_run"]
+            )
+            queue_worker.run(
+                get_agreements_to_synchronize(
+                    mpt_client, options["agreements"], settings.MPT_PRODUCTS_IDS
+                ),
+                syncer.process,
+            )
+        else:
+            synchronize_agreements(
+                mpt_client,
+                options["agreements"],
+                settings.MPT_PRODUCTS_IDS,
+                dry_run=options["dry_run"],
+            )
         self.success("Synchronizing agreements completed.")
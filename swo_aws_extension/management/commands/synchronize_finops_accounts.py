@@ -6,6 +6,7 @@ from swo_aws_extension.flows.jobs.finops_entitlements_processor import (
     FinOpsEntitlementsProcessor,
 )
 from swo_aws_extension.management.commands_helpers import StyledPrintCommand
+from swo_aws_extension.work_queue.worker import build_queue_worker
 
 config = Config()
 
@@ -25,13 +26,39 @@ class Command(StyledPrintCommand):
             default=[],
             help="list of specific agreements to synchronize separated by space",
         )
+        parser.add_argument(
+            "--work-queue",
+            metavar="NAME",
+            default="",
+            help=(
+                "Queue in EXT_WORK_QUEUE_PATH the agreements are pulled from by every worker "
+                "running the command with the same name"
+            ),
+        )
+        parser.add_argument(
+            "--work-queue-run",
+            metavar="RUN",
+            default="",
+            help=(
+                "Run of the --work-queue the worker joins, each run processing every task "
+                "again (default: today's UTC date)"
+            ),
+        )
 
     def handle(self, *args, **options):  # noqa: WPS110
         """Run command."""
+        queue_name = options["work_queue"]
+        if queue_name and not config.work_queue_path:
+            self.error("EXT_WORK_QUEUE_PATH must be set to use a work queue")
+            return
+
         self.info(f"Start processing {self.name}")
         mpt_client = setup_client()
         aws_processor = FinOpsEntitlementsProcessor(
             mpt_client, config, options["agreements"], settings.MPT_PRODUCTS_IDS
         )
-        aws_processor.sync()
+        queue_worker = None
+        if queue_name:
+            queue_worker = build_queue_worker(config, queue_name, options["work_queue_run"])
+        aws_processor.sync(queue_worker)
         self.success(f"Processing {self.name} completed.")
@@ -1,8 +1,26 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from django.core.management.base import BaseCommand
 
+from swo_aws_extension.aws.call_metrics import AWSCallMetrics, collect_aws_call_metrics
+
 
 class StyledPrintCommand(BaseCommand):
-    """Base Command to share shortcuts for success/info output."""
+    """Base Command to share shortcuts for success/info output.
+
+    Every run also collects the AWS API calls it makes in ``aws_call_metrics`` and
+    prints a per-operation summary of them once the command completes.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.aws_call_metrics = AWSCallMetrics()
+
+    def execute(self, *args, **options):
+        """Run the command, accounting its AWS API calls."""
+        with self._collect_aws_calls():
+            return super().execute(*args, **options)
 
     def success(self, message: str) -> None:
         """Shortcut for writing message to stdout with success style."""
@@ -19,3 +37,13 @@ class StyledPrintCommand(BaseCommand):
     def error(self, message: str) -> None:
         """Shortcut for writing message to stdout with error style."""
         self.stderr.write(self.style.ERROR(message), ending="\n")
+
+    @contextmanager
+    def _collect_aws_calls(self) -> Iterator[None]:
+        with collect_aws_call_metrics() as aws_call_metrics:
+            self.aws_call_metrics = aws_call_metrics
+            try:
+                yield
+            finally:
+                if aws_call_metrics.total_calls:
+                    self.info(f"AWS API calls:\n{aws_call_metrics.format_summary()}")
@@ -57,3 +57,15 @@ class BillingPeriod:
             start_date=start_date.strftime(COST_EXPLORER_DATE_FORMAT),
             end_date=end_date.strftime(COST_EXPLORER_DATE_FORMAT),
         )
+
+    def split_by_month(self) -> list[Self]:
+        """Split the billing period into the calendar months it covers.
+
+        A billing period of a single month is returned as its only month.
+        """
+        months: list[Self] = []
+        month_start = dt.date.fromisoformat(self.start_date)
+        while month_start.strftime(COST_EXPLORER_DATE_FORMAT) < self.end_date:
+            months.append(self.from_year_month(month_start.year, month_start.month))
+            month_start = dt.date.fromisoformat(months[-1].end_date)
+        return months
@@ -1,11 +1,55 @@
 import datetime as dt
+import functools
 import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import IO
 
-from azure.storage.blob import BlobSasPermissions, BlobServiceClient, generate_blob_sas
+from azure.storage.blob import (
+    BlobBlock,
+    BlobClient,
+    BlobSasPermissions,
+    BlobServiceClient,
+    generate_blob_sas,
+)
+
+DEFAULT_UPLOAD_BLOCK_SIZE_BYTES = 8 * 1024 * 1024
+DEFAULT_UPLOAD_MAX_CONCURRENCY = 4
+BLOCK_ID_LENGTH = 8
 
 logger = logging.getLogger(__name__)
 
 
+def _read_blocks(source: IO[bytes] | Iterable[bytes], block_size: int) -> Iterator[bytes]:
+    """Split a file-like object or an iterator of chunks into blocks of ``block_size`` bytes."""
+    if hasattr(source, "read"):
+        yield from iter(functools.partial(source.read, block_size), b"")
+        return
+
+    buffer = bytearray()
+    for chunk in source:
+        buffer.extend(chunk)
+        while len(buffer) >= block_size:
+            yield bytes(buffer[:block_size])
+            del buffer[:block_size]  # noqa: WPS420
+    if buffer:
+        yield bytes(buffer)
+
+
+def _build_block_id(index: int) -> str:
+    # Block ids must all have the same length within a blob.
+    return str(index).zfill(BLOCK_ID_LENGTH)
+
+
+def _wait_for_free_slot(pending: set[Future[object]], max_pending: int) -> set[Future[object]]:
+    """Wait until fewer than ``max_pending`` futures are running, re-raising their errors."""
+    while len(pending) >= max_pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            future.result()
+    return pending
+
+
 class AzureBlobUploader:
     """Handles uploading files to Azure Blob Storage and generating SAS URLs."""
 
@@ -14,9 +58,13 @@ class AzureBlobUploader:
         connection_string: str,
         container_name: str,
         sas_expiry_days: int,
+        block_size: int = DEFAULT_UPLOAD_BLOCK_SIZE_BYTES,
+        max_concurrency: int = DEFAULT_UPLOAD_MAX_CONCURRENCY,
     ):
         self.container_name = container_name
         self.sas_expiry_days = sas_expiry_days
+        self.block_size = block_size
+        self.max_concurrency = max_concurrency
         self.blob_service_client = BlobServiceClient.from_connection_string(connection_string)
 
     def upload_and_get_sas_url(self, file_data: bytes, blob_name: str) -> str:
@@ -29,13 +77,58 @@ class AzureBlobUploader:
         Returns:
             A SAS URL for accessing the uploaded blob.
         """
-        blob_client = self.blob_service_client.get_blob_client(
+        blob_client = self._get_blob_client(blob_name)
+        blob_client.upload_blob(file_data, overwrite=True)
+        logger.info("Report uploaded to Azure Blob: %s/%s", self.container_name, blob_name)
+        return self._get_sas_url(blob_client, blob_name)
+
+    def upload_stream_and_get_sas_url(
+        self,
+        source: IO[bytes] | Iterable[bytes],
+        blob_name: str,
+    ) -> str:
+        """Uploads a stream as a block blob and returns a SAS URL.
+
+        The source is read block by block and the blocks are staged in parallel,
+        with at most ``max_concurrency`` blocks in memory at a time. The block list
+        is committed once every block is staged.
+
+        Args:
+            source: A readable binary file or an iterator of byte chunks.
+            blob_name: The name of the blob in the container.
+
+        Returns:
+            A SAS URL for accessing the uploaded blob.
+        """
+        blob_client = self._get_blob_client(blob_name)
+        block_ids = self._stage_blocks(blob_client, _read_blocks(source, self.block_size))
+        blob_client.commit_block_list([BlobBlock(block_id=block_id) for block_id in block_ids])
+        logger.info(
+            "Report uploaded to Azure Blob in %d blocks: %s/%s",
+            len(block_ids),
+            self.container_name,
+            blob_name,
+        )
+        return self._get_sas_url(blob_client, blob_name)
+
+    def _stage_blocks(self, blob_client: BlobClient, blocks: Iterator[bytes]) -> list[str]:
+        block_ids: list[str] = []
+        pending: set[Future[object]] = set()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for index, block in enumerate(blocks):
+                pending = _wait_for_free_slot(pending, self.max_concurrency)
+                block_ids.append(_build_block_id(index))
+                pending.add(executor.submit(blob_client.stage_block, block_ids[-1], block))
+            _wait_for_free_slot(pending, 1)
+        return block_ids
+
+    def _get_blob_client(self, blob_name: str) -> BlobClient:
+        return self.blob_service_client.get_blob_client(
             container=self.container_name,
             blob=blob_name,
         )
-        blob_client.upload_blob(file_data, overwrite=True)
-        logger.info("Report uploaded to Azure Blob: %s/%s", self.container_name, blob_name)
 
+    def _get_sas_url(self, blob_client: BlobClient, blob_name: str) -> str:
         account_name = self.blob_service_client.account_name
         account_key = self.blob_service_client.credential.account_key
         sas_token = generate_blob_sas(
@@ -1,15 +1,48 @@
+import tempfile
+from collections.abc import Iterable
 from io import BytesIO
 from pathlib import Path
+from typing import IO
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
+from swo_aws_extension.file_builder.zip_builder import SPOOL_MAX_MEMORY_BYTES
+
 type SheetDefinition = tuple[str, list[str], list[list[str]]]
+type StreamedSheetDefinition = tuple[str, list[str], Iterable[list[str]]]
 
 _HEADER_FONT = Font(bold=True)
 
 
+def _stream_sheet(
+    ws: Worksheet,
+    headers: list[str],
+    rows: Iterable[list[str]],
+) -> None:
+    header_cells = []
+    for header in headers:
+        header_cell = WriteOnlyCell(ws, value=header)
+        header_cell.font = _HEADER_FONT
+        header_cells.append(header_cell)
+    ws.append(header_cells)
+    row_count = 1
+    for row_data in rows:
+        ws.append(row_data)
+        row_count += 1
+    if headers:
+        ws.auto_filter.ref = f"A1:{get_column_letter(len(headers))}{row_count}"
+
+
+def _save_to_bytes(wb: Workbook) -> bytes:
+    buf = BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
 class ExcelReportBuilder:
     """Builds an Excel workbook for the invitations report."""
 
@@ -24,7 +57,7 @@ class ExcelReportBuilder:
         if ws.title == "Sheet":
             ws.title = self.sheet_name
         self._populate_sheet(ws, self.headers, rows)
-        return self._save_to_bytes(wb)
+        return _save_to_bytes(wb)
 
     def build_multi_sheet(self, sheets: list[SheetDefinition]) -> bytes:
         """Build an Excel workbook with multiple named sheets and return its raw bytes."""
@@ -33,7 +66,28 @@ class ExcelReportBuilder:
             ws = wb.active if idx == 0 else wb.create_sheet()
             ws.title = sheet_def[0]
             self._populate_sheet(ws, sheet_def[1], sheet_def[2])
-        return self._save_to_bytes(wb)
+        return _save_to_bytes(wb)
+
+    def stream_from_rows(self, rows: Iterable[list[str]]) -> IO[bytes]:
+        """Stream rows into a write-only workbook and return it as a spooled file."""
+        return self.stream_multi_sheet([(self.sheet_name, self.headers, rows)])
+
+    def stream_multi_sheet(self, sheets: Iterable[StreamedSheetDefinition]) -> IO[bytes]:
+        """Stream rows into a write-only workbook with multiple named sheets.
+
+        Rows are consumed one at a time and written straight to the sheet, so
+        memory stays constant in the number of rows. The workbook is saved to a
+        spooled temporary file, rewound and returned.
+        """
+        wb = Workbook(write_only=True)
+        for title, headers, rows in sheets:
+            _stream_sheet(wb.create_sheet(title), headers, rows)
+        workbook_file = tempfile.SpooledTemporaryFile(  # ruff:ignore[open-file-with-context-handler]
+            max_size=SPOOL_MAX_MEMORY_BYTES
+        )
+        wb.save(workbook_file)
+        workbook_file.seek(0)
+        return workbook_file
 
     def save(self, file_path: str, file_content: bytes) -> None:
         """Save the provided bytes to the specified file path."""
@@ -51,8 +105,3 @@ class ExcelReportBuilder:
         for row_data in rows:
             ws.append(row_data)
         ws.auto_filter.ref = ws.dimensions
-
-    def _save_to_bytes(self, wb: Workbook) -> bytes:
-        buf = BytesIO()
-        wb.save(buf)
-        return buf.getvalue()
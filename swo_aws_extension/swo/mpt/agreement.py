@@ -0,0 +1,24 @@
+from collections.abc import Iterator
+
+from mpt_extension_sdk.mpt_http.base import MPTClient
+
+from swo_aws_extension.swo.mpt.httpquery import iter_all_by_url
+
+
+# TODO: SDK candidate and should use dependency injection for mpt_client
+def iter_agreements_by_query(
+    mpt_client: MPTClient, query: str, limit: int | None = None
+) -> Iterator[dict]:  # pragma: no cover
+    """
+    This method is used to stream the agreements by query, fetching pages as they are consumed.
+
+    Args:
+        mpt_client (MPTClient): MPT API client instance.
+        query (str): Query to filter agreements.
+        limit (int | None): Agreements per page, the MPT_PAGE_LIMIT setting if None.
+
+    Returns:
+        Iterator[dict]: Agreements, in the order of the API.
+    """
+    url = f"/commerce/agreements?{query}"
+    return iter_all_by_url(mpt_client, url, limit)
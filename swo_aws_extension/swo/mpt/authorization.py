@@ -1,27 +1,82 @@
+from collections.abc import Iterator
+
 from mpt_extension_sdk.mpt_http.base import MPTClient
-from mpt_extension_sdk.mpt_http.mpt import _paginated  # ruff:ignore[import-private-name]
+from mpt_extension_sdk.mpt_http.mpt import get_agreements_by_query
 
+from swo_aws_extension.constants import AgreementStatusEnum
+from swo_aws_extension.swo.mpt.httpquery import iter_all_by_url
 from swo_aws_extension.swo.rql.query_builder import RQLQuery
 
 
 # TODO: SDK candidate and should use dependency injection for mpt_client
-def get_authorizations(
-    mpt_client: MPTClient, rql_query: RQLQuery | None, limit: int = 10
-) -> list[dict]:  # pragma: no cover
+def iter_authorizations(
+    mpt_client: MPTClient, rql_query: RQLQuery | None, limit: int | None = None
+) -> Iterator[dict]:  # pragma: no cover
     """
-    Retrieve authorizations based on the provided RQL query.
+    Yield authorizations based on the provided RQL query, fetching pages as they are consumed.
 
     Args:
         mpt_client (MPTClient): MPT API client instance.
         rql_query (RQLQuery | None): Query to filter authorizations, or None for no filter.
-        limit (int): Maximum number of authorizations to retrieve.
+        limit (int | None): Authorizations per page, the MPT_PAGE_LIMIT setting if None.
 
     Returns:
-        list[dict]: List of authorizations.
+        Iterator[dict]: Authorizations, in the order of the API.
     """
     url = (
         f"/catalog/authorizations?{rql_query}&select=externalIds,product"
         if rql_query
         else "/catalog/authorizations?select=externalIds,product"
     )
-    return _paginated(mpt_client, url, limit=limit)
+    return iter_all_by_url(mpt_client, url, limit)
+
+
+def get_authorizations(
+    mpt_client: MPTClient, rql_query: RQLQuery | None, limit: int | None = None
+) -> list[dict]:  # pragma: no cover
+    """
+    Retrieve authorizations based on the provided RQL query.
+
+    Args:
+        mpt_client (MPTClient): MPT API client instance.
+        rql_query (RQLQuery | None): Query to filter authorizations, or None for no filter.
+        limit (int | None): Authorizations per page, the MPT_PAGE_LIMIT setting if None.
+
+    Returns:
+        list[dict]: List of authorizations.
+    """
+    return list(iter_authorizations(mpt_client, rql_query, limit))
+
+
+def build_authorizations_query(
+    product_ids: list[str], authorization_ids: list[str] | None
+) -> RQLQuery:
+    """Build the query of the authorizations of the products, optionally only some of them."""
+    rql_query = RQLQuery(product__id__in=product_ids)
+    if authorization_ids:
+        unique_ids = list(set(authorization_ids))
+        rql_query = RQLQuery(id__in=unique_ids) & rql_query
+    return rql_query
+
+
+def get_authorization_agreements(
+    mpt_client: MPTClient, authorization_id: str, product_ids: list[str]
+) -> list[dict]:
+    """
+    Retrieve the active and updating agreements of an authorization.
+
+    Args:
+        mpt_client (MPTClient): MPT API client instance.
+        authorization_id (str): The authorization to get the agreements of.
+        product_ids (list[str]): Products the agreements must belong to.
+
+    Returns:
+        list[dict]: Agreements with their subscriptions, lines and parameters.
+    """
+    select = "&select=subscriptions,subscriptions.lines,parameters"
+    rql_filter = (
+        RQLQuery(authorization__id=authorization_id)
+        & RQLQuery(status__in=[AgreementStatusEnum.ACTIVE, AgreementStatusEnum.UPDATING])
+        & RQLQuery(product__id__in=product_ids)
+    )
+    return get_agreements_by_query(mpt_client, f"{rql_filter}{select}")
@@ -0,0 +1,72 @@
+import copy
+from collections.abc import Sequence
+from functools import cache
+
+from mpt_extension_sdk.mpt_http import mpt
+from mpt_extension_sdk.mpt_http.base import MPTClient
+
+from swo_aws_extension.config import get_config
+from swo_aws_extension.logger import get_logger
+from swo_aws_extension.utils.ttl_cache import TTLCache, TTLCacheStats
+
+CATALOG_CACHE_NAME = "mpt.catalog"
+CATALOG_CACHE_MAX_SIZE = 256
+
+logger = get_logger(__name__)
+
+
+@cache
+def get_catalog_cache() -> TTLCache:
+    """The process-wide cache of MPT catalog lookups, kept for ``CATALOG_CACHE_TTL_SECONDS``."""
+    return TTLCache(
+        CATALOG_CACHE_NAME, get_config().catalog_cache_ttl_seconds, CATALOG_CACHE_MAX_SIZE
+    )
+
+
+def invalidate_catalog_cache() -> None:
+    """Drop every cached catalog lookup, so the next ones are read from MPT again."""
+    logger.info("Invalidating the catalog cache: %s", get_catalog_cache_stats())
+    get_catalog_cache().invalidate()
+
+
+def get_catalog_cache_stats() -> TTLCacheStats:
+    """Hits, misses and entries of the catalog cache."""
+    return get_catalog_cache().get_stats()
+
+
+def get_product_items_by_skus(
+    mpt_client: MPTClient, product_id: str, skus: Sequence[str]
+) -> list[dict]:
+    """Retrieve the catalog items of a product with the given SKUs, cached.
+
+    Empty results are not cached, so items added to the catalog are found on the next lookup.
+    """
+    cache_key = ("items", product_id, tuple(skus))
+    product_items = get_catalog_cache().get(cache_key)
+    if product_items is None:
+        product_items = mpt.get_product_items_by_skus(mpt_client, product_id, skus)
+        if product_items:
+            get_catalog_cache().put(cache_key, product_items)
+    return copy.deepcopy(product_items)
+
+
+def get_product_parameters(mpt_client: MPTClient, product_id: str, phase: str) -> list[dict]:
+    """Retrieve the parameters of a product for an order phase, cached."""
+    product_parameters = get_catalog_cache().get_or_load(
+        ("parameters", product_id, phase),
+        lambda: mpt._paginated(  # ruff:ignore[private-member-access]
+            mpt_client, f"catalog/products/{product_id}/parameters?phase={phase}"
+        ),
+    )
+    return copy.deepcopy(product_parameters)
+
+
+def get_product_template_or_default(
+    mpt_client: MPTClient, product_id: str, status: str, name: str | None = None
+) -> dict | None:
+    """Retrieve a product template by name, or the default one of the status, cached."""
+    template = get_catalog_cache().get_or_load(
+        ("template", product_id, status, name),
+        lambda: mpt.get_product_template_or_default(mpt_client, product_id, status, name),
+    )
+    return copy.deepcopy(template)
@@ -1,7 +1,86 @@
+import contextvars
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from typing import Annotated, Self
 
 from mpt_extension_sdk.mpt_http.base import MPTClient
 
+from swo_aws_extension.config import get_config
+
+PageFetcher = Callable[[int, int], dict]
+
+
+def _submit_pages(
+    executor: Executor, fetch_page: PageFetcher, offsets: Iterator[int], limit: int, count: int
+) -> list[Future]:
+    return [
+        executor.submit(contextvars.copy_context().run, fetch_page, offset, limit)
+        for offset in islice(offsets, count)
+    ]
+
+
+def _iter_prefetched_pages(
+    first_page: dict,
+    fetch_page: PageFetcher,
+    offsets: Iterator[int],
+    limit: int,
+    max_workers: int,
+) -> Iterator[dict]:
+    """Yield the pages in order, while up to ``max_workers`` of the next ones download."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = deque(_submit_pages(executor, fetch_page, offsets, limit, max_workers))
+        yield first_page
+        while futures:
+            future = futures.popleft()
+            futures.extend(_submit_pages(executor, fetch_page, offsets, limit, 1))
+            yield future.result()
+
+
+def iter_all_pages(fetch_page: PageFetcher, page_limit: int, max_workers: int) -> Iterator:
+    """Yield the entries of every page of an MPT API list, in order.
+
+    The first page reveals the total, so the offsets of the remaining pages are known
+    up front and up to ``max_workers`` of them are fetched in parallel, ahead of the
+    entries being consumed. At most that many pages are held in memory. The page size
+    the API returned is used for the offsets, in case it caps the one asked for.
+    """
+    first_page = fetch_page(0, page_limit)
+    pagination = first_page["$meta"]["pagination"]
+    page_limit = pagination["limit"] or page_limit
+    offsets = iter(range(page_limit, pagination["total"], page_limit))
+    for page in _iter_prefetched_pages(first_page, fetch_page, offsets, page_limit, max_workers):
+        yield from page["data"]
+
+
+def _fetch_url_page(mpt_client: MPTClient, url: str, offset: int, limit: int) -> dict:
+    response = mpt_client.get(f"{url}&limit={limit}&offset={offset}")
+    response.raise_for_status()
+    return response.json()
+
+
+def iter_all_by_url(
+    mpt_client: MPTClient, url: str, page_limit: int | None = None
+) -> Iterator[dict]:
+    """Yield every entry of an MPT API list URL, which must already have a query string.
+
+    Pages have ``page_limit`` entries, the ``MPT_PAGE_LIMIT`` setting if not given.
+    """
+    config = get_config()
+    return iter_all_pages(
+        partial(_fetch_url_page, mpt_client, url),
+        page_limit or config.mpt_page_limit,
+        config.mpt_page_fetch_max_workers,
+    )
+
+
+def get_all_by_url(mpt_client: MPTClient, url: str, page_limit: int | None = None) -> list[dict]:
+    """Fetch every entry of an MPT API list URL, which must already have a query string."""
+    return list(iter_all_by_url(mpt_client, url, page_limit))
+
+
 # TODO: SDK candidate
 
 
@@ -13,25 +92,17 @@ class HttpQuery[T]:
         self._url = url
         self._query = query
 
-    def _has_more_pages(self, page):
-        if not page:
-            return True
-        pagination = page["$meta"]["pagination"]
-        return pagination["total"] > pagination["limit"] + pagination["offset"]
-
-    def _paginated(self, limit=10):
-        items = []
-        page = None
-        offset = 0
-        while self._has_more_pages(page):
-            page = self.page(offset, limit)
-            items.extend(page["data"])
-            offset += limit
-        return items
-
     def all(self) -> list[T]:
         """Paginate over all entries and return whole list from the API."""
-        return self._paginated()
+        return list(self.iter())
+
+    def iter(self) -> Iterator[T]:
+        """Yield every entry from the API, fetching the next pages while they are consumed.
+
+        Pages have ``MPT_PAGE_LIMIT`` entries and are fetched in parallel.
+        """
+        config = get_config()
+        return iter_all_pages(self.page, config.mpt_page_limit, config.mpt_page_fetch_max_workers)
 
     def one(self) -> T:
         """Get only one entry from the API."""
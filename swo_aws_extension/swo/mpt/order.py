@@ -1,10 +1,31 @@
+from collections.abc import Iterator
+
 from mpt_extension_sdk.mpt_http.base import MPTClient
-from mpt_extension_sdk.mpt_http.mpt import _paginated  # ruff:ignore[import-private-name]
+
+from swo_aws_extension.swo.mpt.httpquery import iter_all_by_url
 
 
 # TODO: SDK candidate and should use dependency injection for mpt_client
+def iter_orders_by_query(
+    mpt_client: MPTClient, query: str, limit: int | None = None
+) -> Iterator[dict]:  # pragma: no cover
+    """
+    This method is used to stream the orders by query, fetching pages as they are consumed.
+
+    Args:
+        mpt_client (MPTClient): MPT API client instance.
+        query (str): Query to filter orders.
+        limit (int | None): Orders per page, the MPT_PAGE_LIMIT setting if None.
+
+    Returns:
+        Iterator[dict]: Orders, in the order of the API.
+    """
+    url = f"/commerce/orders?{query}"
+    return iter_all_by_url(mpt_client, url, limit)
+
+
 def get_orders_by_query(
-    mpt_client: MPTClient, query: str, limit: int = 10
+    mpt_client: MPTClient, query: str, limit: int | None = None
 ) -> list[dict]:  # pragma: no cover
     """
     This method is used to get the orders by query.
@@ -12,10 +33,9 @@ def get_orders_by_query(
     Args:
         mpt_client (MPTClient): MPT API client instance.
         query (str): Query to filter orders.
-        limit (int): Maximum number of orders to retrieve.
+        limit (int | None): Orders per page, the MPT_PAGE_LIMIT setting if None.
 
     Returns:
         list[dict]: List of orders.
     """
-    url = f"/commerce/orders?{query}"
-    return _paginated(mpt_client, url, limit=limit)
+    return list(iter_orders_by_query(mpt_client, query, limit))
@@ -6,7 +6,6 @@ from mpt_api_client.exceptions import MPTError
 from mpt_extension_sdk.mpt_http.base import MPTClient
 from mpt_extension_sdk.mpt_http.mpt import (
     create_agreement_subscription,
-    get_product_items_by_skus,
     terminate_subscription,
     update_agreement_subscription,
 )
@@ -28,6 +27,7 @@ from swo_aws_extension.constants import (
 from swo_aws_extension.logger import get_logger
 from swo_aws_extension.models import BillingPeriod
 from swo_aws_extension.parameters import get_termination_date
+from swo_aws_extension.swo.mpt.catalog import get_product_items_by_skus
 from swo_aws_extension.swo.mpt.sync.base import AgreementProcessor, AgreementType
 from swo_aws_extension.swo.notifications.teams import TeamsNotificationManager
 
@@ -276,21 +276,21 @@ def get_accepted_inbound_responsibility_transfers(pma_account_id: str) -> dict:
     return result
 
 
-def synchronize_agreements(
+def get_agreements_to_synchronize(
     mpt_client: MPTClient,
     agreement_ids: list[str],
     product_ids: list[str],
-    *,
-    dry_run: bool,
-) -> None:
+) -> list[dict]:
     """
-    Synchronize all agreements.
+    Get the active agreements to synchronize.
 
     Args:
         mpt_client: The MPT client.
-        agreement_ids: List of specific agreement IDs to synchronize.
+        agreement_ids: List of specific agreement IDs to synchronize, or empty for all.
         product_ids: List of product IDs to filter agreements.
-        dry_run: Whether to perform a dry run.
+
+    Returns:
+        The agreements with their parameters and subscriptions.
     """
     product_ids = set(product_ids)
     select = (
@@ -309,11 +309,30 @@ def synchronize_agreements(
         rql_query = RQLQuery(status="Active") & RQLQuery(product__id__in=product_ids)
         rql_query = f"{rql_query}{select}"
 
+    return get_agreements_by_query(mpt_client, rql_query)
+
+
+def synchronize_agreements(
+    mpt_client: MPTClient,
+    agreement_ids: list[str],
+    product_ids: list[str],
+    *,
+    dry_run: bool,
+) -> None:
+    """
+    Synchronize all agreements.
+
+    Args:
+        mpt_client: The MPT client.
+        agreement_ids: List of specific agreement IDs to synchronize.
+        product_ids: List of product IDs to filter agreements.
+        dry_run: Whether to perform a dry run.
+    """
     syncer = AgreementSyncer(
         mpt_client,
         dry_run=dry_run,
     )
-    for agreement in get_agreements_by_query(mpt_client, rql_query):
+    for agreement in get_agreements_to_synchronize(mpt_client, agreement_ids, product_ids):
         syncer.process(agreement)
 
 
@@ -0,0 +1,50 @@
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+MEDIAN_PERCENT = 50
+TAIL_PERCENT = 95
+
+
+def _get_percentile(sorted_durations: list[float], percent: int) -> float:
+    if not sorted_durations:
+        return 0
+    rank = math.ceil(percent * len(sorted_durations) / 100)
+    return sorted_durations[max(rank, 1) - 1]
+
+
+@dataclass(frozen=True)
+class LatencyPercentiles:
+    """Median and 95th percentile of a window of durations."""
+
+    count: int
+    p50: float
+    p95: float
+
+    def describe(self) -> str:
+        """Describe the percentiles in a sentence, e.g. for a log line."""
+        return f"p50={self.p50:.3f}s p95={self.p95:.3f}s over {self.count} calls"
+
+
+class LatencyWindow:
+    """Durations of the latest ``size`` calls, e.g. validations of a path."""
+
+    def __init__(self, size: int) -> None:
+        self._durations: deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """Add the duration of a call, dropping the oldest one when full."""
+        with self._lock:
+            self._durations.append(seconds)
+
+    def get_percentiles(self) -> LatencyPercentiles:
+        """Median and 95th percentile of the recorded durations, 0 when there are none."""
+        with self._lock:
+            durations = sorted(self._durations)
+        return LatencyPercentiles(
+            len(durations),
+            _get_percentile(durations, MEDIAN_PERCENT),
+            _get_percentile(durations, TAIL_PERCENT),
+        )
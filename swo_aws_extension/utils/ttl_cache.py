@@ -0,0 +1,100 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import cast
+
+from opentelemetry import metrics
+
+meter = metrics.get_meter(__name__)
+cache_hits = meter.create_counter("cache.hits", description="Lookups served from a cache")
+cache_misses = meter.create_counter("cache.misses", description="Lookups missing from a cache")
+
+
+@dataclass(frozen=True)
+class TTLCacheStats:
+    """Hits and misses of a cache since it was created."""
+
+    name: str
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of the lookups served from the cache, 0 before the first lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+
+class TTLCache[CachedT]:
+    """Thread-safe in-memory cache whose entries expire ``ttl_seconds`` after being stored.
+
+    Once it holds ``max_size`` entries the least recently used one is evicted. Hits and
+    misses are counted in the ``cache.hits`` and ``cache.misses`` metrics, labelled with
+    the cache name.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float, max_size: int) -> None:
+        self.name = name
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, tuple[float, CachedT]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> CachedT | None:
+        """Return the cached value of a key, or None when it is missing or expired."""
+        return self._lookup(key)[1]
+
+    def put(self, key: Hashable, cached_value: CachedT) -> None:
+        """Store the value of a key, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, cached_value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, load: Callable[[], CachedT]) -> CachedT:
+        """Return the cached value of a key, loading and storing it on a miss.
+
+        Errors raised by ``load`` are not cached. Concurrent misses of the same key may
+        load it more than once.
+        """
+        is_hit, cached_value = self._lookup(key)
+        if is_hit:
+            return cast(CachedT, cached_value)
+
+        loaded_value = load()
+        self.put(key, loaded_value)
+        return loaded_value
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Remove the entry of a key, or every entry when no key is given."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def get_stats(self) -> TTLCacheStats:
+        """Hits, misses and number of entries of the cache."""
+        with self._lock:
+            return TTLCacheStats(self.name, self._hits, self._misses, len(self._entries))
+
+    def _lookup(self, key: Hashable) -> tuple[bool, CachedT | None]:
+        with self._lock:
+            entry = self._entries.get(key)
+            is_hit = entry is not None and entry[0] > time.monotonic()
+            if is_hit:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        counter = cache_hits if is_hit else cache_misses
+        counter.add(1, {"cache": self.name})
+        if entry is not None and is_hit:
+            return True, entry[1]
+        return False, None
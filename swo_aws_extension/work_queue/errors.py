@@ -0,0 +1,2 @@
+class NetworkFilesystemError(Exception):
+    """The work queue file is on a network filesystem, where SQLite locking is unsafe."""
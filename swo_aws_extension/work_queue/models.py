@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class WorkTask:
+    """A task of the work queue leased by a worker."""
+
+    queue_name: str
+    key: str
+    payload: Any
+    attempts: int
+    lease_owner: str
+
+
+@dataclass(frozen=True)
+class WorkLease:
+    """A task of the work queue held by a worker."""
+
+    queue_name: str
+    key: str
+    lease_owner: str
+    attempts: int
+    expires_at: float
+
+
+@dataclass(frozen=True)
+class WorkQueueStats:
+    """Number of tasks of a work queue in each state."""
+
+    queue_name: str
+    pending: int
+    leased: int
+    completed: int
+    failed: int
+    recently_completed: int
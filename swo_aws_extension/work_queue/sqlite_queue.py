@@ -0,0 +1,328 @@
+import json
+import sqlite3
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import closing, contextmanager
+from itertools import starmap
+from pathlib import Path
+from typing import Any, Self
+
+from swo_aws_extension.config import Config
+from swo_aws_extension.constants import WorkTaskStatusEnum
+from swo_aws_extension.work_queue.errors import NetworkFilesystemError
+from swo_aws_extension.work_queue.models import WorkLease, WorkQueueStats, WorkTask
+
+BUSY_TIMEOUT_SECONDS = 30
+LEASE_EXPIRED_ERROR = "Lease expired on the last attempt"
+MOUNTS_PATH = Path("/proc/self/mounts")
+NETWORK_FILESYSTEM_TYPES = frozenset((
+    "9p",
+    "afs",
+    "ceph",
+    "cifs",
+    "fuse.gcsfuse",
+    "fuse.glusterfs",
+    "fuse.s3fs",
+    "fuse.sshfs",
+    "glusterfs",
+    "lustre",
+    "nfs",
+    "nfs4",
+    "smb3",
+    "smbfs",
+))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_tasks (
+    queue_name TEXT NOT NULL,
+    task_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    enqueued_at REAL NOT NULL,
+    completed_at REAL,
+    last_error TEXT,
+    PRIMARY KEY (queue_name, task_key)
+);
+CREATE INDEX IF NOT EXISTS work_tasks_status ON work_tasks (queue_name, status);
+"""
+
+ENQUEUE_SQL = """
+INSERT OR IGNORE INTO work_tasks (queue_name, task_key, payload, status, enqueued_at)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+FAIL_EXPIRED_LEASES_SQL = """
+UPDATE work_tasks
+SET status = ?, lease_owner = NULL, lease_expires_at = NULL, last_error = ?
+WHERE queue_name = ? AND status = ? AND lease_expires_at < ? AND attempts >= ?
+"""
+
+LEASE_SQL = """
+UPDATE work_tasks
+SET status = ?, lease_owner = ?, lease_expires_at = ?, attempts = attempts + 1
+WHERE rowid = (
+    SELECT rowid FROM work_tasks
+    WHERE queue_name = ? AND (status = ? OR (status = ? AND lease_expires_at < ?))
+    ORDER BY enqueued_at, rowid
+    LIMIT 1
+)
+RETURNING task_key, payload, attempts
+"""
+
+RENEW_SQL = """
+UPDATE work_tasks
+SET lease_expires_at = ?
+WHERE queue_name = ? AND task_key = ? AND status = ? AND lease_owner = ?
+"""
+
+COMPLETE_SQL = """
+UPDATE work_tasks
+SET status = ?, lease_owner = NULL, lease_expires_at = NULL, completed_at = ?
+WHERE queue_name = ? AND task_key = ? AND lease_owner = ?
+"""
+
+FAIL_SQL = """
+UPDATE work_tasks
+SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END,
+    lease_owner = NULL, lease_expires_at = NULL, last_error = ?
+WHERE queue_name = ? AND task_key = ? AND lease_owner = ?
+"""
+
+TASK_KEYS_SQL = """
+SELECT task_key FROM work_tasks
+WHERE queue_name = ? AND status != ?
+ORDER BY enqueued_at, rowid
+"""
+
+STATS_SQL = """
+SELECT
+    queue_name,
+    SUM(status = ?),
+    SUM(status = ?),
+    SUM(status = ?),
+    SUM(status = ?),
+    SUM(status = ? AND completed_at >= ?)
+FROM work_tasks
+GROUP BY queue_name
+ORDER BY queue_name
+"""
+
+LEASES_SQL = """
+SELECT queue_name, task_key, lease_owner, attempts, lease_expires_at FROM work_tasks
+WHERE status = ? AND (? IS NULL OR queue_name = ?)
+ORDER BY lease_expires_at
+"""
+
+
+def _read_mounts() -> dict[Path, str]:
+    try:
+        mount_lines = MOUNTS_PATH.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return {}
+    mount_fields = (mount_line.split() for mount_line in mount_lines)
+    return {Path(fields[1]): fields[2] for fields in mount_fields}
+
+
+def get_filesystem_type(path: Path) -> str | None:
+    """Type of the filesystem a path is on, from the mount table, None when it is unknown."""
+    resolved_path = path.resolve()
+    mounts = _read_mounts()
+    mount_points = [
+        mount_point for mount_point in mounts if resolved_path.is_relative_to(mount_point)
+    ]
+    if not mount_points:
+        return None
+    return mounts[max(mount_points, key=lambda mount_point: len(mount_point.parts))]
+
+
+class SQLiteWorkQueue:  # noqa: WPS214
+    """Durable work queue of tasks leased by any number of workers, kept in a SQLite file.
+
+    A worker leases the oldest pending task for ``lease_seconds`` and completes or fails
+    it. Tasks whose lease expires, because their worker crashed, are leased again by
+    the next worker asking for one, until they have been tried ``max_attempts`` times.
+    Tasks are identified by their key within a queue, so every worker can enqueue the
+    same tasks and each of them is processed once. A worker still processing a task
+    renews its lease, so only tasks of crashed workers are taken over.
+
+    Every call opens its own connection, so the queue can be shared by threads and
+    by the processes of a single host. SQLite locking is unsafe on network filesystems,
+    so opening a queue on one raises ``NetworkFilesystemError``. The rollback journal is
+    used rather than WAL, which needs memory shared by every process.
+    """
+
+    def __init__(self, path: Path, lease_seconds: int, max_attempts: int) -> None:
+        self._path = path
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        filesystem_type = get_filesystem_type(self._path.parent)
+        if filesystem_type in NETWORK_FILESYSTEM_TYPES:
+            raise NetworkFilesystemError(
+                f"Work queue {path} is on a {filesystem_type} network filesystem. "
+                "It must be on a volume local to the node running the workers."
+            )
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=DELETE")
+            connection.executescript(SCHEMA)
+
+    @classmethod
+    def from_config(cls, config: Config) -> Self:
+        """Open the work queue of the ``WORK_QUEUE_*`` settings."""
+        return cls(
+            Path(config.work_queue_path),
+            config.work_queue_lease_seconds,
+            config.work_queue_max_attempts,
+        )
+
+    def enqueue(self, queue_name: str, payloads_by_key: Mapping[str, Any]) -> int:
+        """Add the tasks not in the queue yet and return how many were added."""
+        enqueued_at = time.time()
+        with self._connect() as connection:
+            cursor = connection.executemany(
+                ENQUEUE_SQL,
+                [
+                    (queue_name, key, json.dumps(payload), WorkTaskStatusEnum.PENDING, enqueued_at)
+                    for key, payload in payloads_by_key.items()
+                ],
+            )
+            return cursor.rowcount
+
+    def lease(self, queue_name: str, lease_owner: str) -> WorkTask | None:
+        """Lease the oldest pending task, or one whose lease has expired, if there is any."""
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                FAIL_EXPIRED_LEASES_SQL,
+                (
+                    WorkTaskStatusEnum.FAILED,
+                    LEASE_EXPIRED_ERROR,
+                    queue_name,
+                    WorkTaskStatusEnum.LEASED,
+                    now,
+                    self._max_attempts,
+                ),
+            )
+            leased_row = connection.execute(
+                LEASE_SQL,
+                (
+                    WorkTaskStatusEnum.LEASED,
+                    lease_owner,
+                    now + self._lease_seconds,
+                    queue_name,
+                    WorkTaskStatusEnum.PENDING,
+                    WorkTaskStatusEnum.LEASED,
+                    now,
+                ),
+            ).fetchone()
+        if leased_row is None:
+            return None
+        return WorkTask(
+            queue_name,
+            leased_row["task_key"],
+            json.loads(leased_row["payload"]),
+            leased_row["attempts"],
+            lease_owner,
+        )
+
+    @property
+    def lease_seconds(self) -> int:
+        """Seconds a task is leased for, from its lease or its last renewal."""
+        return self._lease_seconds
+
+    def renew(self, task: WorkTask) -> bool:
+        """Extend the lease of a task. Returns False if the lease was lost to another worker."""
+        with self._connect() as connection:
+            cursor = connection.execute(
+                RENEW_SQL,
+                (
+                    time.time() + self._lease_seconds,
+                    task.queue_name,
+                    task.key,
+                    WorkTaskStatusEnum.LEASED,
+                    task.lease_owner,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, task: WorkTask) -> bool:
+        """Mark a task as completed. Returns False if the lease was lost to another worker."""
+        with self._connect() as connection:
+            cursor = connection.execute(
+                COMPLETE_SQL,
+                (
+                    WorkTaskStatusEnum.COMPLETED,
+                    time.time(),
+                    task.queue_name,
+                    task.key,
+                    task.lease_owner,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, task: WorkTask, error: str) -> None:
+        """Release a task to be tried again, or mark it as failed after its last attempt."""
+        with self._connect() as connection:
+            connection.execute(
+                FAIL_SQL,
+                (
+                    self._max_attempts,
+                    WorkTaskStatusEnum.FAILED,
+                    WorkTaskStatusEnum.PENDING,
+                    error,
+                    task.queue_name,
+                    task.key,
+                    task.lease_owner,
+                ),
+            )
+
+    def list_task_keys(self, queue_name: str) -> list[str]:
+        """List the keys of the tasks of a queue that have not failed, in enqueue order."""
+        with self._connect() as connection:
+            rows = connection.execute(TASK_KEYS_SQL, (queue_name, WorkTaskStatusEnum.FAILED))
+            return [row["task_key"] for row in rows]
+
+    def get_stats(self, completed_since: float) -> list[WorkQueueStats]:
+        """Count the tasks of every queue by state, and those completed since a time."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                STATS_SQL,
+                (
+                    WorkTaskStatusEnum.PENDING,
+                    WorkTaskStatusEnum.LEASED,
+                    WorkTaskStatusEnum.COMPLETED,
+                    WorkTaskStatusEnum.FAILED,
+                    WorkTaskStatusEnum.COMPLETED,
+                    completed_since,
+                ),
+            )
+            return list(starmap(WorkQueueStats, rows))
+
+    def list_leases(self, queue_name: str | None = None) -> list[WorkLease]:
+        """List the leased tasks, of every queue or of one, by expiry."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                LEASES_SQL, (WorkTaskStatusEnum.LEASED, queue_name, queue_name)
+            )
+            return list(starmap(WorkLease, rows))
+
+    def purge(self, queue_name: str) -> int:
+        """Remove every task of a queue and return how many were removed."""
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "DELETE FROM work_tasks WHERE queue_name = ?", (queue_name,)
+            )
+            return cursor.rowcount
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection committing its transaction on exit, or rolling it back on error."""
+        with (
+            closing(sqlite3.connect(self._path, timeout=BUSY_TIMEOUT_SECONDS)) as connection,
+            connection,
+        ):
+            connection.row_factory = sqlite3.Row
+            yield connection
@@ -0,0 +1,161 @@
+import datetime as dt
+import os
+import socket
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+
+from swo_aws_extension.config import Config
+from swo_aws_extension.logger import get_logger
+from swo_aws_extension.work_queue.models import WorkTask
+from swo_aws_extension.work_queue.sqlite_queue import SQLiteWorkQueue
+
+logger = get_logger(__name__)
+
+DEFAULT_POLL_SECONDS = 5.0
+# Leases are renewed this many times per lease period while their task is processed
+LEASE_RENEWALS_PER_PERIOD = 3
+
+TaskProcessor = Callable[[dict], None]
+
+
+def get_run_id(run_id: str = "") -> str:
+    """Identify a run of a recurring job, by today's UTC date when no id is given."""
+    return run_id or dt.datetime.now(dt.UTC).date().isoformat()
+
+
+def get_run_queue_name(queue_name: str, run_id: str = "") -> str:
+    """Name of the queue of one run of a recurring job, today's UTC date by default.
+
+    Tasks are keyed by id within a queue and never processed twice, so every run of a
+    job needs a queue of its own for its tasks to be processed again.
+    """
+    return f"{queue_name}/{get_run_id(run_id)}"
+
+
+def get_worker_id() -> str:
+    """Identify this process among the workers of a queue."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class QueueWorker:
+    """Worker processing the tasks of a queue shared with any number of other workers.
+
+    Every worker enqueues the same payloads, keyed by their ``id``, and then leases
+    tasks until the queue is drained, so fast workers take over the tasks that slow
+    ones have not reached yet. When no task is left to lease, the worker keeps polling
+    while other workers hold leases, to take over the tasks of a worker that crashed.
+    The lease of the task being processed is renewed every ``renew_seconds`` from a
+    heartbeat thread, so tasks taking longer than a lease are not taken over.
+    """
+
+    def __init__(
+        self,
+        work_queue: SQLiteWorkQueue,
+        queue_name: str,
+        worker_id: str | None = None,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        renew_seconds: float | None = None,
+    ) -> None:
+        self.queue_name = queue_name
+        self._work_queue = work_queue
+        self._worker_id = worker_id or get_worker_id()
+        self._poll_seconds = poll_seconds
+        self._renew_seconds = renew_seconds or work_queue.lease_seconds / LEASE_RENEWALS_PER_PERIOD
+
+    def run(self, payloads: Iterable[dict], process: TaskProcessor) -> int:
+        """Enqueue the payloads and process tasks until the queue is drained.
+
+        Returns the number of tasks processed by this worker.
+        """
+        enqueued_count = self._work_queue.enqueue(
+            self.queue_name, {payload["id"]: payload for payload in payloads}
+        )
+        logger.info("Enqueued %d new tasks to work queue %s", enqueued_count, self.queue_name)
+        processed_count = 0
+        while True:
+            task = self._work_queue.lease(self.queue_name, self._worker_id)
+            if task:
+                self._process_task(task, process)
+                processed_count += 1
+                continue
+            if not self._work_queue.list_leases(self.queue_name):
+                logger.info(
+                    "Work queue %s drained, %d tasks processed by %s",
+                    self.queue_name,
+                    processed_count,
+                    self._worker_id,
+                )
+                return processed_count
+            time.sleep(self._poll_seconds)
+
+    def list_task_keys(self) -> list[str]:
+        """List the keys of the tasks of the queue that have not failed."""
+        return self._work_queue.list_task_keys(self.queue_name)
+
+    def _process_task(self, task: WorkTask, process: TaskProcessor) -> None:
+        logger.info(
+            "%s - Processing task of work queue %s (attempt %d)",
+            task.key,
+            self.queue_name,
+            task.attempts,
+        )
+        try:
+            with self._keep_lease(task):
+                process(task.payload)
+        except Exception as error:
+            logger.exception("%s - Task of work queue %s failed", task.key, self.queue_name)
+            self._work_queue.fail(task, str(error))
+            return
+        if not self._work_queue.complete(task):
+            logger.warning(
+                "%s - Lease of the task expired before it completed, it may be processed twice",
+                task.key,
+            )
+
+    @contextmanager
+    def _keep_lease(self, task: WorkTask) -> Iterator[None]:
+        stopped = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._renew_lease, args=(task, stopped), name=f"lease-{task.key}", daemon=True
+        )
+        heartbeat.start()
+        try:
+            yield
+        finally:
+            stopped.set()
+            heartbeat.join()
+
+    def _renew_lease(self, task: WorkTask, stopped: threading.Event) -> None:
+        while not stopped.wait(self._renew_seconds):
+            try:
+                is_renewed = self._work_queue.renew(task)
+            except sqlite3.Error:
+                logger.exception("%s - Failed to renew the lease of the task", task.key)
+                continue
+            if not is_renewed:
+                logger.warning(
+                    "%s - Lease of the task was lost to another worker, it may be processed twice",
+                    task.key,
+                )
+                return
+
+
+def build_queue_worker(config: Config, queue_name: str, run_id: str = "") -> QueueWorker:
+    """Build a worker of a run of a queue of the work queue of the ``WORK_QUEUE_*`` settings."""
+    return QueueWorker(SQLiteWorkQueue.from_config(config), get_run_queue_name(queue_name, run_id))
+
+
+def process_payloads(
+    payloads: Iterable[dict],
+    process: TaskProcessor,
+    queue_worker: QueueWorker | None = None,
+) -> None:
+    """Process the payloads one after another, or through a work queue if a worker is given."""
+    if queue_worker is None:
+        for payload in payloads:
+            process(payload)
+        return
+    queue_worker.run(payloads, process)
@@ -0,0 +1,35 @@
+from swo_aws_extension.aws.fake.organizations import build_fake_organizations
+
+
+def test_build_fake_organizations_is_deterministic():
+    result = build_fake_organizations(organization_count=2, accounts_per_organization=2, seed=7)
+
+    assert result == build_fake_organizations(2, 2, seed=7)
+    assert [organization.mpa_account_id for organization in result] == [
+        "100000000000",
+        "100000000001",
+    ]
+    assert list(result[1].accounts) == ["100000000001", "200000010001", "200000010002"]
+
+
+def test_build_fake_organizations_costs():
+    result = build_fake_organizations(organization_count=1, accounts_per_organization=1)
+
+    assert len(result[0].cost_items) == 2 * 8
+    assert result[0].get_daily_total() > 0
+
+
+def test_build_fake_organizations_invoicing_entities():
+    result = build_fake_organizations(
+        organization_count=1,
+        accounts_per_organization=0,
+        services_per_account=10,
+        invoicing_entity_count=3,
+    )
+
+    assert result[0].invoicing_entities == [
+        "Amazon Web Services, Inc.",
+        "Fake Invoicing Entity 1",
+        "Fake Invoicing Entity 2",
+    ]
+    assert result[0].cost_items[9].service == "Fake Service 9"
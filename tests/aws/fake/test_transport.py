@@ -0,0 +1,130 @@
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+
+from swo_aws_extension.aws.call_metrics import AWSCallKey, AWSCallMetrics, collect_aws_call_metrics
+from swo_aws_extension.aws.client import AWSClient
+from swo_aws_extension.aws.fake.backend import FakeAWSBackend, FaultInjection
+from swo_aws_extension.aws.fake.organizations import build_fake_organizations
+from swo_aws_extension.aws.fake.transport import fake_aws_backend
+from swo_aws_extension.models import BillingPeriod
+
+PMA_ACCOUNT_ID = "999900000000"
+MPA_ACCOUNT_ID = "100000000001"
+YEAR = 2025
+FEBRUARY_DAYS = 28
+# Every account has usage, SPP discount and tax costs
+RECORD_TYPES_PER_ACCOUNT = 3
+ACCOUNTS = 8
+THROTTLED_ATTEMPTS = 2
+
+
+@pytest.fixture
+def fake_backend():
+    return FakeAWSBackend(
+        build_fake_organizations(organization_count=2, accounts_per_organization=3)
+    )
+
+
+@pytest.fixture
+def fake_aws_client(config, fake_backend, monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with fake_aws_backend(fake_backend):
+        yield AWSClient(config, PMA_ACCOUNT_ID, "FakeRole")
+
+
+def _collect_metrics(config, backend) -> AWSCallMetrics:
+    with collect_aws_call_metrics() as metrics, fake_aws_backend(backend):
+        AWSClient(config, PMA_ACCOUNT_ID, "FakeRole").get_inbound_responsibility_transfers()
+        return metrics
+
+
+def test_inbound_transfers(fake_aws_client):
+    result = fake_aws_client.get_inbound_responsibility_transfers()
+
+    assert [transfer["Source"]["ManagementAccountId"] for transfer in result] == [
+        "100000000000",
+        MPA_ACCOUNT_ID,
+    ]
+
+
+def test_cost_and_usage_grouped(fake_aws_client, fake_backend):
+    organization = fake_backend.organizations[1]
+
+    results_by_time, attributes = fake_aws_client.get_cost_and_usage_with_attributes(  # act
+        BillingPeriod.from_year_month(YEAR, 1),
+        group_by=[{"Type": "DIMENSION", "Key": "LINKED_ACCOUNT"}],
+        filter_by={"Not": {"Dimensions": {"Key": "RECORD_TYPE", "Values": ["Tax"]}}},
+        view_arn=organization.billing_view_arn,
+    )
+
+    groups = results_by_time[0]["Groups"]
+    assert [group["Keys"][0] for group in groups] == list(organization.accounts)
+    assert [attribute["Value"] for attribute in attributes] == list(organization.accounts)
+
+
+def test_cost_and_usage_daily(fake_aws_client):
+    result, _ = fake_aws_client.get_cost_and_usage_with_attributes(  # act
+        BillingPeriod.from_year_month(YEAR, 2),
+        group_by=[
+            {"Type": "DIMENSION", "Key": "LINKED_ACCOUNT"},
+            {"Type": "DIMENSION", "Key": "RECORD_TYPE"},
+        ],
+        granularity="DAILY",
+    )
+
+    days = {result_by_time["TimePeriod"]["Start"] for result_by_time in result}
+    group_count = sum(len(result_by_time["Groups"]) for result_by_time in result)
+    assert len(days) == FEBRUARY_DAYS
+    assert group_count == FEBRUARY_DAYS * ACCOUNTS * RECORD_TYPES_PER_ACCOUNT
+
+
+def test_billing_views(fake_aws_client, fake_backend):
+    result = fake_aws_client.get_billing_views_by_account_id(
+        MPA_ACCOUNT_ID, "2025-01-01", "2025-01-31"
+    )
+
+    assert [billing_view["arn"] for billing_view in result] == [
+        fake_backend.organizations[1].billing_view_arn
+    ]
+
+
+def test_invoices(fake_aws_client):
+    invoices = fake_aws_client.list_invoice_summaries_by_account_id(PMA_ACCOUNT_ID, YEAR, 1)
+
+    result = fake_aws_client.download_invoice_pdf(invoices[1]["InvoiceId"])
+
+    assert [invoice["BillSourceAccounts"] for invoice in invoices] == [
+        ["100000000000"],
+        [MPA_ACCOUNT_ID],
+    ]
+    assert result.startswith(b"%PDF")
+
+
+def test_unsupported_operation(fake_backend):
+    with fake_aws_backend(fake_backend):
+        sts_client = boto3.client(
+            "sts",
+            region_name="us-east-1",
+            aws_access_key_id="test_access_key",
+            aws_secret_access_key="test_secret_key",  # ruff:ignore[hardcoded-password-func-arg]
+        )
+
+        with pytest.raises(ClientError, match="UnsupportedOperation"):
+            sts_client.get_session_token()
+
+
+def test_throttling_is_retried(config, monkeypatch, mocker):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    mocker.patch("time.sleep", autospec=True)
+    backend = FakeAWSBackend(
+        build_fake_organizations(1, 1), FaultInjection(throttle_rate=0.5, seed=2)
+    )
+
+    result = _collect_metrics(config, backend)
+
+    call_totals = result.totals[
+        AWSCallKey("organizations", "ListInboundResponsibilityTransfers", PMA_ACCOUNT_ID)
+    ]
+    assert call_totals.calls == 1
+    assert call_totals.retries == call_totals.throttles == THROTTLED_ATTEMPTS
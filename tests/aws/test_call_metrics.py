@@ -0,0 +1,188 @@
+import contextlib
+from http import HTTPStatus
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+from botocore.exceptions import ClientError, EndpointConnectionError
+from botocore.stub import Stubber
+
+from swo_aws_extension.aws.call_metrics import (
+    AWSCallCounts,
+    AWSCallKey,
+    AWSCallMetrics,
+    collect_aws_call_metrics,
+    register_call_metrics,
+)
+from swo_aws_extension.utils.latency import LatencyPercentiles
+
+MODULE = "swo_aws_extension.aws.call_metrics"
+ACCOUNT_ID = "123456789012"
+CALL_KEY = AWSCallKey("sts", "GetCallerIdentity", ACCOUNT_ID)
+CALL_EVENT = "sts.GetCallerIdentity"
+CALL_SECONDS = 0.5
+SLOWEST_CALL_SECONDS = 2.0
+CALL_DURATIONS = (0.1, CALL_SECONDS, SLOWEST_CALL_SECONDS)
+
+
+@pytest.fixture
+def sts_client():
+    client = boto3.client(
+        "sts",
+        region_name="us-east-1",
+        aws_access_key_id="test_access_key",
+        aws_secret_access_key="test_secret_key",  # ruff:ignore[hardcoded-password-func-arg]
+    )
+    return register_call_metrics(client, ACCOUNT_ID)
+
+
+def _emit_call(sts_client, status_code, attempt_error_codes):
+    events = sts_client.meta.events
+    request_context = {}
+    events.emit(
+        f"before-call.{CALL_EVENT}",
+        model=sts_client.meta.service_model.operation_model("GetCallerIdentity"),
+        params={},
+        request_signer=None,
+        context=request_context,
+    )
+    for attempts, error_code in enumerate(attempt_error_codes, start=1):
+        events.emit(
+            f"needs-retry.{CALL_EVENT}",
+            response=(AWSResponse("", status_code, {}, None), {"Error": {"Code": error_code}}),
+            endpoint=None,
+            operation=None,
+            attempts=attempts,
+            caught_exception=None,
+            request_dict={"context": request_context},
+        )
+    events.emit(
+        f"after-call.{CALL_EVENT}",
+        http_response=AWSResponse("", status_code, {"content-length": "42"}, None),
+        parsed={},
+        model=None,
+        context=request_context,
+    )
+
+
+def _collect_totals(aws_call):
+    with collect_aws_call_metrics() as aws_call_metrics:
+        with contextlib.suppress(ClientError, EndpointConnectionError):
+            aws_call()
+        return aws_call_metrics.totals
+
+
+def test_register_call_metrics_records_calls(sts_client):
+    stubber = Stubber(sts_client)
+    stubber.add_response("get_caller_identity", {"Account": ACCOUNT_ID})
+    stubber.activate()
+
+    result = _collect_totals(sts_client.get_caller_identity)
+
+    totals = result[CALL_KEY]
+    assert (totals.calls, totals.errors, totals.retries) == (1, 0, 0)
+
+
+def test_register_call_metrics_records_client_errors(sts_client):
+    stubber = Stubber(sts_client)
+    stubber.add_client_error("get_caller_identity", service_error_code="AccessDenied")
+    stubber.activate()
+
+    result = _collect_totals(sts_client.get_caller_identity)
+
+    assert result[CALL_KEY].errors == 1
+
+
+def test_register_call_metrics_counts_retries_and_throttles(sts_client):
+    result = _collect_totals(
+        lambda: _emit_call(
+            sts_client, HTTPStatus.BAD_REQUEST, ["Throttling", "ThrottlingException"]
+        )
+    )
+
+    totals = result[CALL_KEY]
+    assert (totals.calls, totals.retries, totals.throttles) == (1, 1, 2)
+    assert (totals.errors, totals.byte_count) == (1, 42)
+
+
+def test_register_call_metrics_records_connection_errors(sts_client, mocker):
+    mocker.patch.object(
+        sts_client._endpoint,  # ruff:ignore[private-member-access]
+        "make_request",
+        side_effect=EndpointConnectionError(endpoint_url="https://sts.amazonaws.com"),
+    )
+
+    result = _collect_totals(sts_client.get_caller_identity)
+
+    assert result[CALL_KEY].errors == 1
+
+
+def test_register_call_metrics_emits_opentelemetry_metrics(sts_client, mocker):
+    mock_calls = mocker.patch(f"{MODULE}.aws_calls", autospec=True)
+    mock_throttles = mocker.patch(f"{MODULE}.aws_call_throttles", autospec=True)
+
+    _emit_call(sts_client, HTTPStatus.TOO_MANY_REQUESTS, ["SlowDown"])  # act
+
+    attributes = {"service": "sts", "operation": "GetCallerIdentity", "account": ACCOUNT_ID}
+    mock_calls.add.assert_called_once_with(1, attributes)
+    mock_throttles.add.assert_called_once_with(1, attributes)
+
+
+def test_collect_aws_call_metrics_ignores_calls_before_it(sts_client):
+    _emit_call(sts_client, HTTPStatus.OK, [None])
+
+    result = _collect_totals(lambda: None)
+
+    assert result == {}
+
+
+def test_format_summary():
+    aws_call_metrics = AWSCallMetrics()
+    aws_call_metrics.record(CALL_KEY, CALL_SECONDS, AWSCallCounts(retries=2, byte_count=10))
+
+    result = aws_call_metrics.format_summary().splitlines()
+
+    assert result[0].split() == [
+        "Service",
+        "Operation",
+        "Account",
+        "Calls",
+        "Retries",
+        "Throttles",
+        "Errors",
+        "Seconds",
+        "p50",
+        "(s)",
+        "p95",
+        "(s)",
+        "Max",
+        "(s)",
+        "Bytes",
+    ]
+    assert result[1].split() == [
+        "sts",
+        "GetCallerIdentity",
+        ACCOUNT_ID,
+        "1",
+        "2",
+        "0",
+        "0",
+        "0.50",
+        "0.500",
+        "0.500",
+        "0.500",
+        "10",
+    ]
+
+
+def test_aws_call_totals_latency_distribution():
+    aws_call_metrics = AWSCallMetrics()
+    for seconds in CALL_DURATIONS:
+        aws_call_metrics.record(CALL_KEY, seconds, AWSCallCounts())
+
+    result = aws_call_metrics.totals[CALL_KEY]
+
+    assert result.get_percentiles() == LatencyPercentiles(
+        count=len(CALL_DURATIONS), p50=CALL_SECONDS, p95=SLOWEST_CALL_SECONDS
+    )
+    assert result.max_seconds == SLOWEST_CALL_SECONDS
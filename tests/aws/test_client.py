@@ -14,6 +14,7 @@ from swo_aws_extension.aws.client import (
 from swo_aws_extension.aws.errors import (
     AWSError,
     InvalidDateInTerminateResponsibilityError,
+    InvoicePDFNotReadyError,
 )
 from swo_aws_extension.models import BillingPeriod
 
@@ -828,13 +829,28 @@ def test_get_invoice_pdf_stops_after_three_tries(
     mock_client.get_invoice_pdf.side_effect = resource_not_found_error
     mock_sleep = mocker.patch("swo_aws_extension.aws.client.time.sleep", autospec=True)
 
-    with pytest.raises(AWSError, match="ResourceNotFoundException"):
+    with pytest.raises(InvoicePDFNotReadyError, match="ResourceNotFoundException"):
         mock_aws_client.get_invoice_pdf("INV-001")
 
     assert mock_client.get_invoice_pdf.call_count == 3
     assert mock_sleep.call_args_list == [mocker.call(1), mocker.call(2)]
 
 
+def test_get_invoice_pdf_single_attempt_no_sleep(
+    mocker, config, aws_client_factory, resource_not_found_error
+):
+    mock_aws_client, mock_client = aws_client_factory(config, "test_account_id", "test_role_name")
+    mock_client.exceptions.ResourceNotFoundException = ResourceNotFoundException
+    mock_client.get_invoice_pdf.side_effect = resource_not_found_error
+    mock_sleep = mocker.patch("swo_aws_extension.aws.client.time.sleep", autospec=True)
+
+    with pytest.raises(InvoicePDFNotReadyError):
+        mock_aws_client.download_invoice_pdf("INV-001", max_attempts=1)
+
+    mock_client.get_invoice_pdf.assert_called_once_with(InvoiceId="INV-001")
+    mock_sleep.assert_not_called()
+
+
 def test_download_invoice_pdf_returns_content(config, aws_client_factory, requests_mocker):
     mock_aws_client, mock_client = aws_client_factory(config, "test_account_id", "test_role_name")
     document_url = "https://example.test/invoice.pdf"
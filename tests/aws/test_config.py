@@ -2,7 +2,19 @@ import os
 
 import pytest
 
-from swo_aws_extension.config import DEFAULT_PLS_CHARGE_PERCENTAGE, Config, get_config
+from swo_aws_extension.config import (
+    DEFAULT_CATALOG_CACHE_TTL_SECONDS,
+    DEFAULT_INVOICE_PDF_CACHE_MAX_SIZE_MB,
+    DEFAULT_MPT_PAGE_FETCH_MAX_WORKERS,
+    DEFAULT_MPT_PAGE_LIMIT,
+    DEFAULT_PLS_CHARGE_PERCENTAGE,
+    DEFAULT_VALIDATION_MEMO_TTL_SECONDS,
+    DEFAULT_WORK_QUEUE_LEASE_SECONDS,
+    DEFAULT_WORK_QUEUE_MAX_ATTEMPTS,
+    Config,
+    get_config,
+)
+from swo_aws_extension.constants import AttachmentFormatEnum
 
 
 def test_ccp_client_id(settings):
@@ -119,3 +131,151 @@ def test_pls_charge_percentage(settings):
     result = get_config()
 
     assert result.pls_charge_percentage == DEFAULT_PLS_CHARGE_PERCENTAGE
+
+
+def test_invoice_pdf_cache_defaults(settings):
+    settings.EXTENSION_CONFIG.pop("INVOICE_PDF_CACHE_DIR", None)
+    settings.EXTENSION_CONFIG.pop("INVOICE_PDF_CACHE_MAX_SIZE_MB", None)
+
+    result = get_config()
+
+    assert not result.invoice_pdf_cache_dir
+    assert result.invoice_pdf_cache_max_size_mb == DEFAULT_INVOICE_PDF_CACHE_MAX_SIZE_MB
+
+
+def test_invoice_pdf_cache_settings(settings):
+    settings.EXTENSION_CONFIG["INVOICE_PDF_CACHE_DIR"] = "/var/cache/invoices"
+    settings.EXTENSION_CONFIG["INVOICE_PDF_CACHE_MAX_SIZE_MB"] = "1"
+
+    result = get_config()
+
+    assert result.invoice_pdf_cache_dir == "/var/cache/invoices"
+    assert result.invoice_pdf_cache_max_size_mb == 1
+
+
+def test_billing_attachment_format_default(settings):
+    settings.EXTENSION_CONFIG.pop("BILLING_ATTACHMENT_FORMAT", None)
+
+    result = get_config()
+
+    assert result.billing_attachment_format == AttachmentFormatEnum.JSON
+
+
+def test_billing_attachment_format(settings):
+    settings.EXTENSION_CONFIG["BILLING_ATTACHMENT_FORMAT"] = "zip"
+
+    result = get_config()
+
+    assert result.billing_attachment_format == AttachmentFormatEnum.ZIP
+
+
+def test_azure_storage_upload_defaults(settings):
+    settings.EXTENSION_CONFIG.pop("AZURE_STORAGE_UPLOAD_BLOCK_SIZE_MB", None)
+    settings.EXTENSION_CONFIG.pop("AZURE_STORAGE_UPLOAD_MAX_CONCURRENCY", None)
+
+    result = get_config()
+
+    assert result.azure_storage_upload_block_size_bytes == 8 * 1024 * 1024
+    assert result.azure_storage_upload_max_concurrency == 4
+
+
+def test_azure_storage_upload_settings(settings):
+    settings.EXTENSION_CONFIG["AZURE_STORAGE_UPLOAD_BLOCK_SIZE_MB"] = "2"
+    settings.EXTENSION_CONFIG["AZURE_STORAGE_UPLOAD_MAX_CONCURRENCY"] = "8"
+
+    result = get_config()
+
+    assert result.azure_storage_upload_block_size_bytes == 2 * 1024 * 1024
+    assert result.azure_storage_upload_max_concurrency == 8
+
+
+def test_billing_data_exports_dir(settings):
+    settings.EXTENSION_CONFIG["BILLING_DATA_EXPORTS_DIR"] = "/data/exports"
+
+    result = get_config()
+
+    assert result.billing_data_exports_dir == "/data/exports"
+
+
+def test_billing_shard_output_dir(settings):
+    settings.EXTENSION_CONFIG["BILLING_SHARD_OUTPUT_DIR"] = "/data/billing-shards"
+
+    result = get_config()
+
+    assert result.billing_shard_output_dir == "/data/billing-shards"
+
+
+def test_work_queue_defaults(settings):
+    settings.EXTENSION_CONFIG.pop("WORK_QUEUE_PATH", None)
+    settings.EXTENSION_CONFIG.pop("WORK_QUEUE_LEASE_SECONDS", None)
+    settings.EXTENSION_CONFIG.pop("WORK_QUEUE_MAX_ATTEMPTS", None)
+
+    result = get_config()
+
+    assert not result.work_queue_path
+    assert result.work_queue_lease_seconds == DEFAULT_WORK_QUEUE_LEASE_SECONDS
+    assert result.work_queue_max_attempts == DEFAULT_WORK_QUEUE_MAX_ATTEMPTS
+
+
+def test_work_queue_settings(settings):
+    settings.EXTENSION_CONFIG["WORK_QUEUE_PATH"] = "/data/work-queue.db"
+    settings.EXTENSION_CONFIG["WORK_QUEUE_LEASE_SECONDS"] = "60"
+    settings.EXTENSION_CONFIG["WORK_QUEUE_MAX_ATTEMPTS"] = "5"
+
+    result = get_config()
+
+    assert result.work_queue_path == "/data/work-queue.db"
+    assert result.work_queue_lease_seconds == 60
+    assert result.work_queue_max_attempts == 5
+
+
+def test_mpt_page_defaults(extension_settings):
+    extension_settings.EXTENSION_CONFIG.pop("MPT_PAGE_LIMIT", None)
+    extension_settings.EXTENSION_CONFIG.pop("MPT_PAGE_FETCH_MAX_WORKERS", None)
+
+    result = get_config()
+
+    assert result.mpt_page_limit == DEFAULT_MPT_PAGE_LIMIT
+    assert result.mpt_page_fetch_max_workers == DEFAULT_MPT_PAGE_FETCH_MAX_WORKERS
+
+
+def test_mpt_page_settings(extension_settings):
+    extension_settings.EXTENSION_CONFIG["MPT_PAGE_LIMIT"] = "10"
+    extension_settings.EXTENSION_CONFIG["MPT_PAGE_FETCH_MAX_WORKERS"] = "8"
+
+    result = get_config()
+
+    assert result.mpt_page_limit == 10
+    assert result.mpt_page_fetch_max_workers == 8
+
+
+def test_catalog_cache_ttl_seconds_default(extension_settings):
+    extension_settings.EXTENSION_CONFIG.pop("CATALOG_CACHE_TTL_SECONDS", None)
+
+    result = get_config().catalog_cache_ttl_seconds
+
+    assert result == DEFAULT_CATALOG_CACHE_TTL_SECONDS
+
+
+def test_catalog_cache_ttl_seconds(extension_settings):
+    extension_settings.EXTENSION_CONFIG["CATALOG_CACHE_TTL_SECONDS"] = "60"
+
+    result = get_config().catalog_cache_ttl_seconds
+
+    assert result == 60
+
+
+def test_validation_memo_ttl_seconds_default(extension_settings):
+    extension_settings.EXTENSION_CONFIG.pop("VALIDATION_MEMO_TTL_SECONDS", None)
+
+    result = get_config().validation_memo_ttl_seconds
+
+    assert result == DEFAULT_VALIDATION_MEMO_TTL_SECONDS
+
+
+def test_validation_memo_ttl_seconds(extension_settings):
+    extension_settings.EXTENSION_CONFIG["VALIDATION_MEMO_TTL_SECONDS"] = "0"
+
+    result = get_config().validation_memo_ttl_seconds
+
+    assert result == 0
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from swo_aws_extension.billing.benchmarks.measurement import measure, write_benchmark_results
+from swo_aws_extension.billing.benchmarks.payloads import BenchmarkScenario, SyntheticAWSClient
+from swo_aws_extension.billing.benchmarks.runner import BillingBenchmark
+
+SCENARIO = BenchmarkScenario(accounts=3, services=4, days=2, invoice_entities=2)
+
+
+def test_billing_benchmark_run():
+    result = BillingBenchmark(SCENARIO, repeat=1).run()
+
+    assert [benchmark_result.name for benchmark_result in result] == [
+        "CostExplorerUsageGenerator.run",
+        "JournalLineGenerator.generate",
+        "ServiceDiscountProcessor.process",
+        "SupportDiscountProcessor.process",
+        "PlSDiscountProcessor.process",
+        "PlSChargeProcessor.process",
+        "SavingPlansDistributionProcessor.process",
+        "BillingReportRowsBuilder.build",
+        "BillingReportRowsBuilder.build_by_account",
+        "JournalLine.to_jsonl",
+    ]
+    assert result[0].output_count == SCENARIO.accounts
+    assert result[1].output_count > 0
+    assert result[-1].output_count == result[1].output_count
+    assert all(benchmark_result.peak_memory_bytes > 0 for benchmark_result in result[:2])
+
+
+def test_synthetic_client_replays_payloads():
+    aws_client = SyntheticAWSClient(SCENARIO)
+    billing_views = aws_client.get_billing_views_by_account_id(
+        aws_client.mpa_account_id, "2025-01-01", "2025-01-02"
+    )
+    group_by = [{"Type": "DIMENSION", "Key": "LINKED_ACCOUNT"}]
+    cost_and_usage = aws_client.get_cost_and_usage(
+        SCENARIO.billing_period, group_by, view_arn=billing_views[0]["arn"]
+    )
+
+    result = aws_client.get_cost_and_usage(
+        SCENARIO.billing_period, group_by, view_arn=billing_views[0]["arn"]
+    )
+
+    assert result == cost_and_usage
+    assert result is not cost_and_usage
+    assert len(result[0]["Groups"]) == SCENARIO.accounts
+
+
+def test_measure():
+    result = measure("step", lambda: [1, 2, 3], repeat=3)
+
+    assert result.repeat == 3
+    assert result.output_count == 3
+    assert result.min_seconds <= result.median_seconds
+
+
+def test_measure_requires_a_repeat():
+    with pytest.raises(ValueError, match="at least once"):
+        measure("step", list, repeat=0)
+
+
+def test_write_benchmark_results(tmp_path):
+    output_path = tmp_path / "benchmark.json"
+    benchmark_result = measure("step", list, repeat=1)
+
+    write_benchmark_results(output_path, SCENARIO, [benchmark_result])  # act
+
+    benchmark_run = json.loads(output_path.read_text(encoding="utf-8"))
+    assert benchmark_run["scenario"]["accounts"] == SCENARIO.accounts
+    assert benchmark_run["results"][0]["name"] == "step"
@@ -17,6 +17,7 @@ from swo_aws_extension.billing.models.search import (
     SearchItem,
     SearchSource,
 )
+from swo_aws_extension.constants import AttachmentFormatEnum
 from swo_aws_extension.models import BillingPeriod
 
 
@@ -38,9 +39,19 @@ def mock_context(mock_mpt_client, mock_billing_client):
     context.billing_period = BillingPeriod(start_date="2025-10-01", end_date="2025-11-01")
     context.config = MagicMock()
     context.config.mpt_portal_base_url = "https://mpt.test"
+    context.config.invoice_pdf_cache_dir = ""
+    context.config.billing_attachment_format = AttachmentFormatEnum.JSON
     context.notifier = MagicMock()
     context.product_ids = ["PROD-1"]
     context.pls_charge_percentage = Decimal("5.0")
+    context.report_store = None
+    context.data_exports = None
+    context.shard = None
+    context.shard_outputs = None
+    context.shard_count = 1
+    context.work_queue_name = ""
+    context.queue_worker = None
+    context.split_by_month.return_value = [context]
     return context
 
 
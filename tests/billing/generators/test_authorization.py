@@ -2,6 +2,7 @@ import pytest
 
 from swo_aws_extension.aws.client import AWSClient
 from swo_aws_extension.aws.errors import AWSError
+from swo_aws_extension.billing.data_exports_store import DataExportsStore
 from swo_aws_extension.billing.generators.agreement import (
     AgreementJournalGenerator,
 )
@@ -12,6 +13,7 @@ from swo_aws_extension.billing.generators.invoice import InvoiceGenerator
 from swo_aws_extension.billing.generators.usage import (
     CostExplorerUsageGenerator,
 )
+from swo_aws_extension.billing.models.context import BillingJournalContext
 from swo_aws_extension.billing.models.journal_line import JournalLine
 from swo_aws_extension.billing.models.journal_result import (
     AgreementJournalResult,
@@ -20,7 +22,9 @@ from swo_aws_extension.billing.models.journal_result import (
     PlsMismatch,
 )
 from swo_aws_extension.billing.models.usage import OrganizationReport
+from swo_aws_extension.billing.report_store import ReportStore
 from swo_aws_extension.constants import BILLING_JOURNAL_ERROR_TITLE
+from swo_aws_extension.models import BillingPeriod
 
 MODULE = "swo_aws_extension.billing.generators.authorization"
 
@@ -32,7 +36,7 @@ def authorization():
 
 @pytest.fixture
 def mock_get_agreements(mocker):
-    return mocker.patch(f"{MODULE}.get_agreements_by_query", autospec=True)
+    return mocker.patch(f"{MODULE}.get_authorization_agreements", autospec=True)
 
 
 @pytest.fixture
@@ -122,10 +126,63 @@ def test_processes_agreements(
     assert result.lines == [mock_journal_line, mock_journal_line]
     assert result.invoice_ids == {"INV-001", "INV-002"}
     billing_aws_client_provider.assert_called_once_with()
-    mock_usage_generator_cls.assert_called_once_with(billing_aws_client)
+    mock_usage_generator_cls.assert_called_once_with(billing_aws_client, OrganizationReport)
     mock_invoice_generator_cls.assert_called_once_with(billing_aws_client)
 
 
+def test_spills_reports_to_report_store(
+    tmp_path,
+    mock_context,
+    mock_get_agreements,
+    mock_agreement_generator_cls,
+    mock_usage_generator_cls,
+    mock_invoice_generator_cls,
+    mock_aws_client_cls,
+    billing_aws_client_provider,
+    authorization,
+):
+    mock_get_agreements.return_value = [{"id": "AGR-1"}]
+    mock_agreement_generator_cls.return_value.run.return_value = AgreementJournalResult()
+    report_store = ReportStore(tmp_path)
+    mock_context.report_store = report_store
+    generator = AuthorizationJournalGenerator(mock_context)
+
+    generator.run(authorization, billing_aws_client_provider)  # act
+
+    mock_usage_generator_cls.assert_called_once_with(
+        billing_aws_client_provider.return_value, report_store.create_report
+    )
+
+
+def test_reads_usage_from_data_exports(
+    mocker,
+    tmp_path,
+    mock_context,
+    mock_get_agreements,
+    mock_agreement_generator_cls,
+    mock_usage_generator_cls,
+    mock_invoice_generator_cls,
+    mock_aws_client_cls,
+    billing_aws_client_provider,
+    authorization,
+):
+    mock_data_exports_generator_cls = mocker.patch(
+        f"{MODULE}.DataExportsUsageGenerator", autospec=True
+    )
+    mock_get_agreements.return_value = [{"id": "AGR-1"}]
+    mock_agreement_generator_cls.return_value.run.return_value = AgreementJournalResult()
+    data_exports = DataExportsStore(tmp_path)
+    mock_context.data_exports = data_exports
+    generator = AuthorizationJournalGenerator(mock_context)
+
+    generator.run(authorization, billing_aws_client_provider)  # act
+
+    mock_data_exports_generator_cls.assert_called_once_with(
+        data_exports, "MPA-123", OrganizationReport
+    )
+    mock_usage_generator_cls.assert_not_called()
+
+
 def test_exception_sends_error(
     mocker,
     mock_context,
@@ -280,3 +337,46 @@ def test_pma_usage_error_does_not_crash(
 
     assert result.billing_report_rows == []
     mock_generate_billing_report_rows.assert_not_called()
+
+
+def test_run_periods_shares_lookups_between_periods(
+    mocker,
+    mock_context,
+    mock_get_agreements,
+    mock_agreement_generator_cls,
+    mock_usage_generator_cls,
+    mock_invoice_generator_cls,
+    mock_aws_client_cls,
+    billing_aws_client_provider,
+    mock_generate_billing_report_rows,
+    authorization,
+):
+    mock_get_agreements.return_value = [{"id": "AGR-1"}]
+    mock_agreement_generator_cls.return_value.run.return_value = AgreementJournalResult()
+    mock_backfill_client_cls = mocker.patch(f"{MODULE}.BackfillCostClient", autospec=True)
+    period_contexts = [
+        mocker.MagicMock(spec=BillingJournalContext, billing_period=billing_period)
+        for billing_period in BillingPeriod(
+            start_date="2025-10-01", end_date="2025-12-01"
+        ).split_by_month()
+    ]
+    generator = AuthorizationJournalGenerator(mock_context)
+
+    result = generator.run_periods(authorization, billing_aws_client_provider, period_contexts)
+
+    assert result == [AuthorizationJournalResult(), AuthorizationJournalResult()]
+    mock_get_agreements.assert_called_once_with(
+        mock_context.mpt_client, "AUTH-1", mock_context.product_ids
+    )
+    mock_aws_client_cls.assert_called_once()
+    billing_aws_client_provider.assert_called_once_with()
+    mock_backfill_client_cls.assert_called_once_with(
+        billing_aws_client_provider.return_value,
+        [period_context.billing_period for period_context in period_contexts],
+    )
+    mock_usage_generator_cls.assert_called_with(
+        mock_backfill_client_cls.return_value, OrganizationReport
+    )
+    assert [call.args[1] for call in mock_agreement_generator_cls.call_args_list] == (
+        period_contexts
+    )
@@ -1,11 +1,15 @@
+import csv
+import gzip
 from decimal import Decimal
 
 import pytest
 
 from swo_aws_extension.aws.client import AWSClient
 from swo_aws_extension.aws.errors import AWSError
+from swo_aws_extension.billing.data_exports_store import DataExportsStore
 from swo_aws_extension.billing.generators.usage import (
     CostExplorerUsageGenerator,
+    DataExportsUsageGenerator,
 )
 from swo_aws_extension.billing.models.invoice import (
     InvoiceEntity,
@@ -14,7 +18,8 @@ from swo_aws_extension.billing.models.invoice import (
 from swo_aws_extension.billing.models.usage import (
     OrganizationUsageResult,
 )
-from swo_aws_extension.constants import AWSRecordTypeEnum
+from swo_aws_extension.billing.stage_metrics import collect_stage_metrics
+from swo_aws_extension.constants import AWSRecordTypeEnum, BillingStageEnum
 from swo_aws_extension.models import BillingPeriod
 
 
@@ -366,3 +371,136 @@ def test_create_metric_without_invoicing_entity(
     ]
     assert usage_metrics[0].invoice_entity is None
     assert not usage_metrics[0].invoice_id
+
+
+def _results_by_time(start, end, groups):
+    return {"TimePeriod": {"Start": start, "End": end}, "Groups": groups}
+
+
+def _group(keys, amount=None):
+    if amount is None:
+        return {"Keys": keys}
+    return {"Keys": keys, "Metrics": {"UnblendedCost": {"Amount": amount}}}
+
+
+@pytest.fixture
+def parity_organization_invoice():
+    return OrganizationInvoice(
+        entities={
+            "Amazon Web Services EMEA SARL:AWS": InvoiceEntity(invoice_id="EUINV-1"),
+            "Amazon Web Services, Inc.:AWS_MARKETPLACE": InvoiceEntity(invoice_id="INV-2"),
+        },
+    )
+
+
+@pytest.fixture
+def parity_data_exports(tmp_path):
+    export_path = tmp_path / "BILLING_PERIOD=2025-10" / "parity-00001.csv.gz"
+    export_path.parent.mkdir(parents=True)
+    emea = "Amazon Web Services EMEA SARL"
+    with gzip.open(export_path, "wt", encoding="utf-8", newline="") as export_file:
+        writer = csv.writer(export_file)
+        writer.writerow([
+            "bill_payer_account_id",
+            "bill_billing_entity",
+            "bill_invoicing_entity",
+            "line_item_usage_account_id",
+            "line_item_line_item_type",
+            "line_item_usage_start_date",
+            "line_item_unblended_cost",
+            "product_product_name",
+        ])
+        writer.writerows([
+            ["MPA-1", "AWS", emea, "ACC-1", "Usage", "2025-10-01T00:00:00Z", "4.25", "EC2"],
+            ["MPA-1", "AWS", emea, "ACC-1", "Usage", "2025-10-01T10:00:00Z", "6.25", "EC2"],
+            ["MPA-1", "AWS", emea, "ACC-1", "SppDiscount", "2025-10-01T00:00:00Z", "-0.5", "EC2"],
+            ["MPA-1", "AWS", emea, "ACC-1", "Tax", "2025-10-02T00:00:00Z", "2.1", "EC2"],
+            [
+                "MPA-1",
+                "AWS Marketplace",
+                "Amazon Web Services, Inc.",
+                "ACC-2",
+                "Usage",
+                "2025-10-01T00:00:00Z",
+                "30",
+                "Vendor Product",
+            ],
+            ["MPA-2", "AWS", emea, "ACC-9", "Usage", "2025-10-01T00:00:00Z", "99", "EC2"],
+        ])
+    return DataExportsStore(tmp_path)
+
+
+@pytest.fixture
+def parity_cost_explorer_responses():
+    first_day = ("2025-10-01", "2025-10-02")
+    second_day = ("2025-10-02", "2025-10-03")
+    emea = "Amazon Web Services EMEA SARL"
+    return [
+        [_results_by_time("2025-10-01", "2025-11-01", [_group(["ACC-1"]), _group(["ACC-2"])])],
+        [_results_by_time(*first_day, [_group(["ACC-2", "Vendor Product"], "30")])],
+        [
+            _results_by_time(*first_day, [_group(["EC2", emea])]),
+            _results_by_time(*second_day, [_group(["EC2", emea])]),
+        ],
+        [
+            _results_by_time(
+                *first_day,
+                [
+                    _group([AWSRecordTypeEnum.USAGE, "EC2"], "10.5"),
+                    _group([AWSRecordTypeEnum.SOLUTION_PROVIDER_PROGRAM_DISCOUNT, "EC2"], "-0.5"),
+                ],
+            ),
+            _results_by_time(*second_day, [_group([AWSRecordTypeEnum.TAX, "EC2"], "2.1")]),
+        ],
+        [_results_by_time(*first_day, [_group(["Vendor Product", "Amazon Web Services, Inc."])])],
+        [],
+    ]
+
+
+def test_data_exports_usage_matches_cost_explorer(
+    generator,
+    mock_aws_client,
+    billing_period,
+    parity_organization_invoice,
+    parity_data_exports,
+    parity_cost_explorer_responses,
+):
+    mock_aws_client.get_billing_views_by_account_id.return_value = [{"arn": "arn:...:view/1"}]
+    mock_aws_client.get_cost_and_usage.side_effect = parity_cost_explorer_responses
+    cost_explorer_result = generator.run(
+        "USD", "MPA-1", billing_period, parity_organization_invoice
+    )
+    data_exports_generator = DataExportsUsageGenerator(parity_data_exports, "PMA-1")
+
+    result = data_exports_generator.run("USD", "MPA-1", billing_period, parity_organization_invoice)
+
+    assert result.usage_by_account == cost_explorer_result.usage_by_account
+    assert set(result.usage_by_account) == {"ACC-1", "ACC-2"}
+    assert result.reports.has_data()
+
+
+def test_data_exports_run_without_exported_usage(tmp_path, billing_period, organization_invoice):
+    data_exports_generator = DataExportsUsageGenerator(DataExportsStore(tmp_path), "PMA-1")
+
+    result = data_exports_generator.run("USD", "MPA-1", billing_period, organization_invoice)
+
+    assert not result.usage_by_account
+
+
+def test_run_measures_aws_stages(
+    generator,
+    mock_aws_client,
+    billing_period,
+    organization_invoice,
+    single_billing_view,
+    single_account_usage,
+):
+    mock_aws_client.get_billing_views_by_account_id.return_value = single_billing_view
+    mock_aws_client.get_cost_and_usage.side_effect = single_account_usage
+
+    with collect_stage_metrics() as stage_metrics:
+        generator.run("USD", "MPA-1", billing_period, organization_invoice)  # act
+
+        stage_totals = stage_metrics.totals
+    assert stage_totals[BillingStageEnum.BILLING_VIEWS].row_count == 1
+    assert stage_totals[BillingStageEnum.COST_EXPLORER].calls == len(single_account_usage)
@@ -1,9 +1,18 @@
+from contextlib import ExitStack
 from dataclasses import asdict
 from decimal import Decimal
 
-from swo_aws_extension.billing.models.context import BillingJournalContext
+from swo_aws_extension.billing.models.context import BillingJournalContext, BillingPeriodRun
+from swo_aws_extension.billing.models.journal_result import (
+    AuthorizationJournalResult,
+    PlsMismatch,
+)
+from swo_aws_extension.billing.report_row_sink import BillingReportRowSink
+from swo_aws_extension.billing.shards import BillingShard, ShardOutputStore
 from swo_aws_extension.models import BillingPeriod
 
+MODULE = "swo_aws_extension.billing.models.context"
+
 
 def test_initialization():
     billing_period = BillingPeriod(start_date="2025-10-01", end_date="2025-11-01")
@@ -28,6 +37,12 @@ def test_initialization():
         "authorizations": ["AUTH-1"],
         "pls_charge_percentage": Decimal("5.0"),
         "dry_run": False,
+        "report_store": None,
+        "data_exports": None,
+        "shard_index": 0,
+        "shard_count": 1,
+        "work_queue_name": "",
+        "run_id": "",
     }
     assert asdict(result) == expected
 
@@ -46,3 +61,166 @@ def test_authorizations_defaults_to_none():
 
     assert result.authorizations is None
     assert result.pls_charge_percentage == Decimal("5.0")
+
+
+def test_shard_is_none_without_sharding(mocker):
+    context = BillingJournalContext(
+        mpt_client="mpt_client",
+        billing_api_client="billing_client",
+        config=mocker.MagicMock(billing_shard_output_dir=""),
+        billing_period=BillingPeriod(start_date="2025-10-01", end_date="2025-11-01"),
+        product_ids=["PROD-1"],
+        notifier="notifier",
+    )
+
+    result = (context.shard, context.shard_outputs)
+
+    assert result == (None, None)
+
+
+def test_shard_of_sharded_run(mocker, tmp_path):
+    context = BillingJournalContext(
+        mpt_client="mpt_client",
+        billing_api_client="billing_client",
+        config=mocker.MagicMock(billing_shard_output_dir=str(tmp_path)),
+        billing_period=BillingPeriod(start_date="2025-10-01", end_date="2025-11-01"),
+        product_ids=["PROD-1"],
+        notifier="notifier",
+        shard_index=2,
+        shard_count=4,
+    )
+
+    result = context.shard
+
+    assert result == BillingShard(index=2, count=4)
+    assert isinstance(context.shard_outputs, ShardOutputStore)
+
+
+def test_shard_output_names_of_sharded_run(mocker):
+    context = BillingJournalContext(
+        mpt_client="mpt_client",
+        billing_api_client="billing_client",
+        config=mocker.MagicMock(),
+        billing_period=BillingPeriod(start_date="2025-10-01", end_date="2025-11-01"),
+        product_ids=["PROD-1"],
+        notifier="notifier",
+        shard_count=2,
+    )
+
+    result = context.shard_output_names
+
+    assert result == ["shard-0-of-2", "shard-1-of-2"]
+    assert context.queue_worker is None
+
+
+def test_shard_output_names_of_queued_run(mocker, tmp_path):
+    config = mocker.MagicMock(
+        work_queue_path=str(tmp_path / "queue.db"),
+        work_queue_lease_seconds=60,
+        work_queue_max_attempts=3,
+    )
+    context = BillingJournalContext(
+        mpt_client="mpt_client",
+        billing_api_client="billing_client",
+        config=config,
+        billing_period=BillingPeriod(start_date="2025-10-01", end_date="2025-11-01"),
+        product_ids=["PROD-1"],
+        notifier="notifier",
+        work_queue_name="billing-2025-10",
+    )
+    authorizations = [{"id": "AUT-1"}, {"id": "AUT-2"}]
+    context.queue_worker.run(authorizations, lambda _authorization: None)
+
+    result = context.shard_output_names
+
+    assert result == ["AUT-1", "AUT-2"]
+
+
+def test_queue_worker_is_scoped_to_period_and_run(mocker, tmp_path):
+    config = mocker.MagicMock(
+        work_queue_path=str(tmp_path / "queue.db"),
+        work_queue_lease_seconds=60,
+        work_queue_max_attempts=3,
+    )
+    context = BillingJournalContext(
+        mpt_client="mpt_client",
+        billing_api_client="billing_client",
+        config=config,
+        billing_period=BillingPeriod(start_date="2025-10-01", end_date="2025-11-01"),
+        product_ids=["PROD-1"],
+        notifier="notifier",
+        work_queue_name="billing",
+        run_id="2025-11-03",
+    )
+
+    result = context.queue_worker.queue_name
+
+    assert result == "billing/2025-10/2025-11-03"
+
+
+def test_split_by_month():
+    context = BillingJournalContext(
+        mpt_client="mpt_client",
+        billing_api_client="billing_client",
+        config="config",
+        billing_period=BillingPeriod(start_date="2025-11-01", end_date="2026-01-01"),
+        product_ids=["PROD-1"],
+        notifier="notifier",
+        dry_run=True,
+    )
+
+    result = context.split_by_month()
+
+    assert [period_context.billing_period for period_context in result] == [
+        BillingPeriod(start_date="2025-11-01", end_date="2025-12-01"),
+        BillingPeriod(start_date="2025-12-01", end_date="2026-01-01"),
+    ]
+    assert all(period_context.dry_run for period_context in result)
+
+
+def test_billing_period_run_adds_result(mocker):
+    row_sink = mocker.create_autospec(BillingReportRowSink, instance=True)
+    period_run = BillingPeriodRun(mocker.MagicMock(spec=BillingJournalContext), row_sink)
+    mismatch = PlsMismatch(agreement_id="AGR-1", pls_in_order=True, report_has_enterprise=False)
+    generator_result = AuthorizationJournalResult(pls_mismatches=[mismatch])
+
+    period_run.add_result(generator_result)  # act
+
+    assert period_run.pls_mismatches == [mismatch]
+    row_sink.append.assert_called_once_with([], [])
+
+
+def test_billing_period_run_start_indexes_journals(mocker, mock_context):
+    mock_context.dry_run = False
+    mock_journal_index_cls = mocker.patch(f"{MODULE}.JournalIndex", autospec=True)
+
+    with ExitStack() as exit_stack:
+        result = BillingPeriodRun.start(mock_context, exit_stack)
+
+    assert result.journal_index == mock_journal_index_cls.from_billing_period.return_value
+    mock_journal_index_cls.from_billing_period.assert_called_once_with(
+        mock_context.billing_api_client, mock_context.billing_period
+    )
+
+
+def test_billing_period_run_start_skips_journals_in_dry_run(mocker, mock_context):
+    mock_context.dry_run = True
+    mock_journal_index_cls = mocker.patch(f"{MODULE}.JournalIndex", autospec=True)
+
+    with ExitStack() as exit_stack:
+        result = BillingPeriodRun.start(mock_context, exit_stack)
+
+    assert result.journal_index is None
+    mock_journal_index_cls.from_billing_period.assert_not_called()
+
+
+def test_billing_period_run_start_skips_journals_of_queued_run(mocker, mock_context):
+    mock_context.dry_run = False
+    mock_context.work_queue_name = "billing"
+    mock_journal_index_cls = mocker.patch(f"{MODULE}.JournalIndex", autospec=True)
+
+    with ExitStack() as exit_stack:
+        result = BillingPeriodRun.start(mock_context, exit_stack)
+
+    assert result.journal_index is None
+    mock_journal_index_cls.from_billing_period.assert_not_called()
@@ -1,6 +1,9 @@
+import json
+from decimal import Decimal
+
 import pytest
 
-from swo_aws_extension.billing.models.journal_result import PlsMismatch
+from swo_aws_extension.billing.models.journal_result import BillingReportRow, PlsMismatch
 
 
 @pytest.mark.parametrize(
@@ -39,3 +42,26 @@ def test_pls_mismatch_description(pls_in_order, report_has_enterprise, expected)
     )
 
     assert result.description == expected
+
+
+def test_billing_report_row_round_trips_through_jsonl():
+    row = BillingReportRow(
+        authorization_id="AUTH-1",
+        pma="PMA-1",
+        agreement_id="AGR-1",
+        mpa="MPA-1",
+        service_name="EC2",
+        pp=Decimal("10.5"),
+        sp=Decimal("11.5"),
+        currency="USD",
+        invoice_id="INV-1",
+        invoice_entity="INV-E1",
+        exchange_rate=Decimal("1.2"),
+        spp_discount=Decimal("-1.0"),
+        spp_discount_pct=Decimal("1.0") / Decimal("11.5"),
+        linked_account="ACC-001",
+    )
+
+    result = BillingReportRow.from_dict(json.loads(row.to_jsonl()))
+
+    assert result == row
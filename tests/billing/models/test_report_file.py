@@ -0,0 +1,33 @@
+from io import BytesIO
+
+import pytest
+
+from swo_aws_extension.billing.models.report_file import ReportFile, UploadedReportFile
+
+
+def test_report_file_size_bytes_rewinds_stream():
+    stream = BytesIO(b"abcdefghij")
+    stream.seek(4)
+    report_file = ReportFile("CSV", ".csv.gz", 1, stream)
+
+    result = report_file.size_bytes
+
+    assert result == 10
+    assert stream.tell() == 0
+
+
+@pytest.mark.parametrize(
+    ("size_bytes", "expected_size"),
+    [
+        (512, "512.0 B"),
+        (2048, "2.0 KB"),
+        (5 * 1024 * 1024, "5.0 MB"),
+        (3 * 1024**4, "3072.0 GB"),
+    ],
+)
+def test_uploaded_report_file_summary(size_bytes, expected_size):
+    uploaded = UploadedReportFile("CSV", 3, size_bytes, "https://url")
+
+    result = uploaded.summary
+
+    assert result == f"3 rows, {expected_size} - [Download](https://url)"
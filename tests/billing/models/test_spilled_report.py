@@ -0,0 +1,59 @@
+import datetime as dt
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+from swo_aws_extension.billing.models.spilled_report import SpilledOrganizationReport
+from swo_aws_extension.billing.models.usage import OrganizationReport
+
+
+def _fill_report(report):
+    report.add_organization_data("MARKETPLACE", [{"amount": Decimal("1.5")}])
+    report.add_account_data("123", "SERVICE_INVOICE_ENTITY", [{"entity": "AWS Inc."}])
+    report.add_account_data("123", "RECORD_TYPE_AND_SERVICE_COST", [{"line": "old"}])
+    report.add_account_data(
+        "456", "SERVICE_INVOICE_ENTITY", [{"date": dt.date.fromisoformat("2025-10-01")}]
+    )
+    report.add_account_data("123", "RECORD_TYPE_AND_SERVICE_COST", [{"line": "new"}])
+    report.add_organization_data("INVOICES", [])
+
+
+@pytest.fixture
+def spilled_report(tmp_path):
+    report_path = tmp_path / "report.jsonl"
+    report_path.touch()
+    return SpilledOrganizationReport(report_path)
+
+
+def test_spilled_report_matches_in_memory_report(spilled_report):
+    in_memory_report = OrganizationReport()
+    _fill_report(in_memory_report)
+    _fill_report(spilled_report)
+    in_memory_json = io.BytesIO()
+    in_memory_report.write_json(in_memory_json)
+    spilled_json = io.BytesIO()
+
+    spilled_report.write_json(spilled_json)  # act
+
+    assert spilled_json.getvalue() == in_memory_json.getvalue()
+    assert json.loads(spilled_json.getvalue()) == spilled_report.to_dict()
+
+
+def test_spilled_report_keeps_latest_response_per_key(spilled_report):
+    _fill_report(spilled_report)
+
+    result = spilled_report.to_dict()
+
+    assert result["accounts_data"]["123"]["RECORD_TYPE_AND_SERVICE_COST"] == [{"line": "new"}]
+    assert list(result["organization_data"]) == ["MARKETPLACE", "INVOICES"]
+
+
+def test_spilled_report_without_data(spilled_report):
+    stream = io.BytesIO()
+
+    spilled_report.write_json(stream)  # act
+
+    assert not spilled_report.has_data()
+    assert json.loads(stream.getvalue()) == {"organization_data": {}, "accounts_data": {}}
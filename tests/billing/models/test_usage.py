@@ -188,3 +188,12 @@ def test_has_enterprise_support_false(metric):
     result = usage_result.has_enterprise_support()  # act
 
     assert result is False
+
+
+def test_organization_report_has_data():
+    report = OrganizationReport()
+
+    report.add_account_data("123", "SERVICE_INVOICE_ENTITY", [])  # act
+
+    assert report.has_data()
+    assert report.accounts_data == {"123": {"SERVICE_INVOICE_ENTITY": []}}
@@ -0,0 +1,107 @@
+import pytest
+
+from swo_aws_extension.aws.client import AWSClient
+from swo_aws_extension.aws.errors import AWSError
+from swo_aws_extension.billing.backfill_cost_client import BackfillCostClient
+from swo_aws_extension.models import BillingPeriod
+
+BILLING_YEAR = 2025
+BILLING_MONTH = 10
+GROUP_BY = ({"Type": "DIMENSION", "Key": "LINKED_ACCOUNT"},)
+
+
+def _build_result_by_time(start, end, account_id):
+    return {
+        "TimePeriod": {"Start": start, "End": end},
+        "Groups": [{"Keys": [account_id], "Metrics": {}}],
+    }
+
+
+@pytest.fixture
+def billing_periods():
+    return BillingPeriod(start_date="2025-10-01", end_date="2025-12-01").split_by_month()
+
+
+@pytest.fixture
+def mock_aws_client(mocker):
+    aws_client = mocker.create_autospec(AWSClient, instance=True)
+    aws_client.get_cost_and_usage.return_value = [
+        _build_result_by_time("2025-10-01", "2025-10-02", "ACC-1"),
+        _build_result_by_time("2025-10-02", "2025-10-03", "ACC-2"),
+        _build_result_by_time("2025-11-01", "2025-11-02", "ACC-3"),
+    ]
+    return aws_client
+
+
+def test_get_cost_and_usage_fetches_range_once(mock_aws_client, billing_periods):
+    client = BackfillCostClient(mock_aws_client, billing_periods)
+
+    result = [
+        client.get_cost_and_usage(billing_period, list(GROUP_BY), view_arn="VIEW-1")
+        for billing_period in billing_periods
+    ]
+
+    assert result == [
+        [
+            _build_result_by_time("2025-10-01", "2025-10-02", "ACC-1"),
+            _build_result_by_time("2025-10-02", "2025-10-03", "ACC-2"),
+        ],
+        [_build_result_by_time("2025-11-01", "2025-11-02", "ACC-3")],
+    ]
+    mock_aws_client.get_cost_and_usage.assert_called_once_with(
+        BillingPeriod(start_date="2025-10-01", end_date="2025-12-01"),
+        list(GROUP_BY),
+        None,
+        "VIEW-1",
+        "MONTHLY",
+    )
+
+
+def test_get_cost_and_usage_fetches_month_again_once_served(mock_aws_client, billing_periods):
+    client = BackfillCostClient(mock_aws_client, billing_periods)
+    client.get_cost_and_usage(billing_periods[0], list(GROUP_BY))
+
+    client.get_cost_and_usage(billing_periods[0], list(GROUP_BY))  # act
+
+    assert mock_aws_client.get_cost_and_usage.call_count == 2
+    mock_aws_client.get_cost_and_usage.assert_called_with(
+        billing_periods[0], list(GROUP_BY), None, None, "MONTHLY"
+    )
+
+
+def test_get_cost_and_usage_falls_back_to_month_on_error(mock_aws_client, billing_periods):
+    range_results = mock_aws_client.get_cost_and_usage.return_value
+    mock_aws_client.get_cost_and_usage.side_effect = [AWSError("view not active"), range_results]
+    client = BackfillCostClient(mock_aws_client, billing_periods)
+
+    result = client.get_cost_and_usage(billing_periods[1], view_arn="VIEW-1")
+
+    assert result == range_results
+    mock_aws_client.get_cost_and_usage.assert_called_with(
+        billing_periods[1], None, None, "VIEW-1", "MONTHLY"
+    )
+
+
+def test_get_cost_and_usage_outside_range(mock_aws_client, billing_periods):
+    client = BackfillCostClient(mock_aws_client, billing_periods)
+    billing_period = BillingPeriod(start_date="2025-09-01", end_date="2025-10-01")
+
+    client.get_cost_and_usage(billing_period, granularity="DAILY")  # act
+
+    mock_aws_client.get_cost_and_usage.assert_called_once_with(
+        billing_period, None, None, None, "DAILY"
+    )
+
+
+def test_delegates_billing_views_and_invoice_summaries(mock_aws_client, billing_periods):
+    client = BackfillCostClient(mock_aws_client, billing_periods)
+
+    result = (
+        client.get_billing_views_by_account_id("MPA-1", "2025-10-01", "2025-10-31"),
+        client.list_invoice_summaries_by_account_id("MPA-1", BILLING_YEAR, BILLING_MONTH),
+    )
+
+    assert result == (
+        mock_aws_client.get_billing_views_by_account_id.return_value,
+        mock_aws_client.list_invoice_summaries_by_account_id.return_value,
+    )
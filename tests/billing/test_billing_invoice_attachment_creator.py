@@ -1,13 +1,15 @@
+from functools import partial
 from io import BytesIO
 
 import pytest
 from requests import HTTPError
 
 from swo_aws_extension.aws.client import AWSClient
-from swo_aws_extension.aws.errors import AWSError
+from swo_aws_extension.aws.errors import AWSError, InvoicePDFNotReadyError
 from swo_aws_extension.billing.billing_invoice_attachment_creator import (
     BillingInvoiceAttachmentCreator,
 )
+from swo_aws_extension.billing.invoice_pdf_cache import InvoicePDFCache
 
 
 @pytest.fixture
@@ -22,6 +24,13 @@ def billing_api_client(mocker):
     return mocker.MagicMock()
 
 
+def _download(responses_by_invoice, invoice_id, max_attempts):
+    response = responses_by_invoice[invoice_id].pop(0)
+    if isinstance(response, Exception):
+        raise response
+    return response
+
+
 @pytest.fixture
 def creator(aws_client, billing_api_client):
     return BillingInvoiceAttachmentCreator(aws_client, billing_api_client)
@@ -33,7 +42,7 @@ def test_create_for_journal_uploads_invoice_pdf(creator, aws_client, billing_api
     result = creator.create_for_journal("JRN-1", {"INV-001"})
 
     assert (result.uploaded_invoice_ids, result.failed_invoice_ids) == ({"INV-001"}, set())
-    aws_client.download_invoice_pdf.assert_called_once_with("INV-001")
+    aws_client.download_invoice_pdf.assert_called_once_with("INV-001", max_attempts=1)
     billing_api_client.journal.attachments.assert_called_once_with("JRN-1")
     upload = billing_api_client.journal.attachments.return_value.upload
     upload.assert_called_once()
@@ -45,7 +54,13 @@ def test_create_for_journal_uploads_invoice_pdf(creator, aws_client, billing_api
 
 
 def test_create_for_journal_continues_after_failure(creator, aws_client, billing_api_client):
-    aws_client.download_invoice_pdf.side_effect = [AWSError("AWS failure"), b"invoice-pdf"]
+    aws_client.download_invoice_pdf.side_effect = partial(
+        _download,
+        {
+            "INV-001": [AWSError("AWS failure")],
+            "INV-002": [b"invoice-pdf"],
+        },
+    )
     upload = billing_api_client.journal.attachments.return_value.upload
 
     result = creator.create_for_journal("JRN-1", {"INV-001", "INV-002"})
@@ -86,3 +101,73 @@ def test_create_for_journal_with_no_invoices_does_nothing(creator, aws_client):
     assert result.uploaded_invoice_ids == set()
     assert result.failed_invoice_ids == set()
     aws_client.download_invoice_pdf.assert_not_called()
+
+
+def test_create_for_journal_retries_not_ready_invoices_at_the_end(
+    mocker, creator, aws_client, billing_api_client
+):
+    mock_sleep = mocker.patch(
+        "swo_aws_extension.billing.billing_invoice_attachment_creator.time.sleep",
+        autospec=True,
+    )
+    aws_client.download_invoice_pdf.side_effect = partial(
+        _download,
+        {
+            "INV-001": [InvoicePDFNotReadyError("not ready"), b"invoice-1"],
+            "INV-002": [b"invoice-2"],
+        },
+    )
+    upload = billing_api_client.journal.attachments.return_value.upload
+
+    result = creator.create_for_journal("JRN-1", {"INV-001", "INV-002"})
+
+    assert result.uploaded_invoice_ids == {"INV-001", "INV-002"}
+    assert result.failed_invoice_ids == set()
+    assert aws_client.download_invoice_pdf.call_count == 3
+    assert upload.call_args_list[-1].kwargs["filename"] == "AWS-Invoice-INV-001.pdf"
+    mock_sleep.assert_called_once_with(1)
+
+
+def test_create_for_journal_fails_invoices_never_ready(
+    mocker, creator, aws_client, billing_api_client
+):
+    mock_sleep = mocker.patch(
+        "swo_aws_extension.billing.billing_invoice_attachment_creator.time.sleep",
+        autospec=True,
+    )
+    aws_client.download_invoice_pdf.side_effect = InvoicePDFNotReadyError("not ready")
+    upload = billing_api_client.journal.attachments.return_value.upload
+
+    result = creator.create_for_journal("JRN-1", {"INV-001"})
+
+    assert result.failed_invoice_ids == {"INV-001"}
+    assert result.uploaded_invoice_ids == set()
+    assert aws_client.download_invoice_pdf.call_count == 3
+    assert mock_sleep.call_args_list == [mocker.call(1), mocker.call(2)]
+    upload.assert_not_called()
+
+
+def test_create_for_journal_uses_cached_invoice(aws_client, billing_api_client, mocker):
+    pdf_cache = mocker.create_autospec(InvoicePDFCache, instance=True)
+    pdf_cache.get.return_value = b"cached-pdf"
+    creator = BillingInvoiceAttachmentCreator(aws_client, billing_api_client, pdf_cache=pdf_cache)
+    upload = billing_api_client.journal.attachments.return_value.upload
+
+    result = creator.create_for_journal("JRN-1", {"INV-001"})
+
+    assert result.uploaded_invoice_ids == {"INV-001"}
+    aws_client.download_invoice_pdf.assert_not_called()
+    pdf_cache.put.assert_not_called()
+    assert upload.call_args.kwargs["file"].getvalue() == b"cached-pdf"
+
+
+def test_create_for_journal_caches_downloaded_invoice(aws_client, billing_api_client, mocker):
+    pdf_cache = mocker.create_autospec(InvoicePDFCache, instance=True)
+    pdf_cache.get.return_value = None
+    aws_client.download_invoice_pdf.return_value = b"invoice-pdf"
+    creator = BillingInvoiceAttachmentCreator(aws_client, billing_api_client, pdf_cache=pdf_cache)
+
+    result = creator.create_for_journal("JRN-1", {"INV-001"})
+
+    assert result.uploaded_invoice_ids == {"INV-001"}
+    pdf_cache.put.assert_called_once_with("INV-001", b"invoice-pdf")
@@ -1,3 +1,4 @@
+import logging
 from decimal import Decimal
 
 import pytest
@@ -11,6 +12,7 @@ from swo_aws_extension.billing.billing_journal_service import (
 from swo_aws_extension.billing.generators.authorization import (
     AuthorizationJournalGenerator,
 )
+from swo_aws_extension.billing.models.context import BillingJournalContext
 from swo_aws_extension.billing.models.journal_line import (
     ExternalIds,
     JournalLine,
@@ -24,11 +26,17 @@ from swo_aws_extension.billing.models.journal_result import (
 )
 from swo_aws_extension.billing.models.usage import OrganizationReport
 from swo_aws_extension.billing.providers import BillingAWSClientProvider
+from swo_aws_extension.billing.report_store import ReportStore
+from swo_aws_extension.billing.shards import BillingShard, ShardOutputStore
+from swo_aws_extension.billing.stage_metrics import measure_stage
 from swo_aws_extension.constants import (
     BILLING_INVOICE_ATTACHMENT_WARNING_TITLE,
     BILLING_JOURNAL_ERROR_TITLE,
+    BILLING_JOURNAL_METRICS_TITLE,
+    BillingStageEnum,
 )
 from swo_aws_extension.swo.rql.query_builder import RQLQuery
+from swo_aws_extension.work_queue.worker import QueueWorker
 
 MODULE = "swo_aws_extension.billing.billing_journal_service"
 
@@ -53,7 +61,7 @@ def test_no_authorizations_skips_processing(
     result = service.run()
 
     assert result is None
-    mock_auth_generator_cls.return_value.run.assert_not_called()
+    mock_auth_generator_cls.return_value.run_periods.assert_not_called()
 
 
 def test_processes_authorizations(
@@ -66,7 +74,7 @@ def test_processes_authorizations(
     }
     mock_get_authorizations.return_value = [authorization]
     mock_auth_gen = mocker.MagicMock(spec=AuthorizationJournalGenerator)
-    mock_auth_gen.run.return_value = AuthorizationJournalResult()
+    mock_auth_gen.run_periods.return_value = [AuthorizationJournalResult()]
     mock_auth_generator_cls.return_value = mock_auth_gen
     provider_factory = mocker.create_autospec(BillingAWSClientProvider)
     service = BillingJournalService(mock_context, provider_factory)
@@ -74,7 +82,9 @@ def test_processes_authorizations(
     service.run()  # act
 
     provider_factory.assert_called_once_with(mock_context.config, "MPA-123")
-    mock_auth_gen.run.assert_called_once_with(authorization, provider_factory.return_value)
+    mock_auth_gen.run_periods.assert_called_once_with(
+        authorization, provider_factory.return_value, [mock_context]
+    )
 
 
 def test_exception_sends_error(
@@ -83,7 +93,7 @@ def test_exception_sends_error(
     mock_context.dry_run = False
     mock_get_authorizations.return_value = [{"id": "AUTH-1"}]
     mock_auth_gen = mocker.MagicMock(spec=AuthorizationJournalGenerator)
-    mock_auth_gen.run.side_effect = Exception("Test failure")
+    mock_auth_gen.run_periods.side_effect = Exception("Test failure")
     mock_auth_generator_cls.return_value = mock_auth_gen
     service = BillingJournalService(mock_context)
 
@@ -119,7 +129,7 @@ def test_creates_new_journal_when_no_pending(
     mock_get_authorizations.return_value = [authorization]
     mock_auth_gen = mocker.MagicMock(spec=AuthorizationJournalGenerator)
     mock_line = mocker.MagicMock(spec=JournalLine)
-    mock_auth_gen.run.return_value = AuthorizationJournalResult(lines=[mock_line])
+    mock_auth_gen.run_periods.return_value = [AuthorizationJournalResult(lines=[mock_line])]
     mock_auth_generator_cls.return_value = mock_auth_gen
     mock_journal_manager_cls = mocker.patch(f"{MODULE}.JournalManager", autospec=True)
     mock_journal_manager = mock_journal_manager_cls.return_value
@@ -139,22 +149,41 @@ def test_processes_authorizations_creates_billing_report(
     authorization = {"id": "AUTH-1"}
     mock_get_authorizations.return_value = [authorization]
     mock_line = mocker.MagicMock(spec=JournalLine)
-    mock_row = mocker.MagicMock(spec=BillingReportRow)
-    mock_auth_gen = mocker.MagicMock(spec=AuthorizationJournalGenerator)
-    mock_auth_gen.run.return_value = AuthorizationJournalResult(
-        lines=[mock_line], billing_report_rows=[mock_row]
+    report_row = BillingReportRow(
+        authorization_id="AUTH-1",
+        pma="PMA-1",
+        agreement_id="AGR-1",
+        mpa="MPA-1",
+        service_name="EC2",
+        pp=Decimal("10.5"),
+        sp=Decimal("11.5"),
+        currency="USD",
+        invoice_id="INV-1",
+        invoice_entity="INV-E1",
+        exchange_rate=Decimal("1.2"),
+        spp_discount=Decimal("-1.0"),
+        spp_discount_pct=Decimal("0.087"),
     )
+    mock_auth_gen = mocker.MagicMock(spec=AuthorizationJournalGenerator)
+    mock_auth_gen.run_periods.return_value = [
+        AuthorizationJournalResult(lines=[mock_line], billing_report_rows=[report_row])
+    ]
     mock_auth_generator_cls.return_value = mock_auth_gen
     mocker.patch(f"{MODULE}.JournalManager", autospec=True)
-    mock_report_creator_cls = mocker.patch(f"{MODULE}.BillingReportCreator", autospec=True)
+    mock_report_creator_cls = mocker.patch(
+        "swo_aws_extension.billing.period_report.BillingReportCreator", autospec=True
+    )
     mock_report_creator = mock_report_creator_cls.return_value
     service = BillingJournalService(mock_context)
 
     service.run()  # act
 
     mock_report_creator.create_and_notify_teams.assert_called_once_with(
-        str(mock_context.billing_period), [mock_row], []
+        str(mock_context.billing_period), mocker.ANY
     )
+    row_sink = mock_report_creator.create_and_notify_teams.call_args.args[1]
+    assert row_sink.row_count == 1
+    assert row_sink.row_by_account_count == 0
 
 
 def test_uploads_journal_when_lines_generated(
@@ -165,7 +194,7 @@ def test_uploads_journal_when_lines_generated(
     mock_get_authorizations.return_value = [authorization]
     mock_auth_gen = mocker.MagicMock(spec=AuthorizationJournalGenerator)
     mock_line = mocker.MagicMock(spec=JournalLine)
-    mock_auth_gen.run.return_value = AuthorizationJournalResult(lines=[mock_line])
+    mock_auth_gen.run_periods.return_value = [AuthorizationJournalResult(lines=[mock_line])]
     mock_auth_generator_cls.return_value = mock_auth_gen
     mock_journal_manager_cls = mocker.patch(f"{MODULE}.JournalManager", autospec=True)
     mock_journal_manager = mock_journal_manager_cls.return_value
@@ -175,7 +204,7 @@ def test_uploads_journal_when_lines_generated(
 
     service.run()  # act
 
-    mock_journal_manager.upload_journal.assert_called_once_with("JRN-1", [mock_line])
+    mock_journal_manager.upload_journal.assert_called_once_with(mock_journal, [mock_line])
     mock_journal_manager.notify_success.assert_called_once_with("JRN-1", 1)
 
 
@@ -204,10 +233,12 @@ def test_uploads_attachments_when_reports_present(
     report = OrganizationReport(organization_data={"usage": [{"key": "val"}]})
     mock_auth_gen = mocker.MagicMock(spec=AuthorizationJournalGenerator)
     mock_line = mocker.MagicMock(spec=JournalLine)
-    mock_auth_gen.run.return_value = AuthorizationJournalResult(
-        lines=[mock_line],
-        reports_by_agreement={"AGR-1": report},
-    )
+    mock_auth_gen.run_periods.return_value = [
+        AuthorizationJournalResult(
+            lines=[mock_line],
+            reports_by_agreement={"AGR-1": report},
+        )
+    ]
     mock_auth_generator_cls.return_value = mock_auth_gen
     mock_journal_manager_cls = mocker.patch(f"{MODULE}.JournalManager", autospec=True)
     mock_journal_manager = mock_journal_manager_cls.return_value
@@ -221,6 +252,34 @@ def test_uploads_attachments_when_reports_present(
     mock_journal_manager.notify_success.assert_called_once_with("JRN-1", 1)
 
 
+def test_discards_spilled_reports_after_upload(
+    mocker, tmp_path, mock_context, mock_get_authorizations, mock_auth_generator_cls
+):
+    mock_context.dry_run = False
+    mock_context.report_store = ReportStore(tmp_path)
+    mock_get_authorizations.return_value = [{"id": "AUTH-1"}]
+    report = mock_context.report_store.create_report()
+    report.add_organization_data("INVOICES", [{"id": "INV-1"}])
+    generator_result = AuthorizationJournalResult(
+        lines=[mocker.MagicMock(spec=JournalLine)],
+        reports_by_agreement={"AGR-1": report},
+    )
+    mock_auth_generator_cls.return_value.run_periods.return_value = [generator_result]
+    mock_journal_manager_cls = mocker.patch(f"{MODULE}.JournalManager", autospec=True)
+    mock_journal_manager_cls.return_value.get_pending_journal.return_value = mocker.MagicMock(
+        id="JRN-1"
+    )
+    service = BillingJournalService(mock_context)
+
+    service.run()  # act
+
+    mock_journal_manager_cls.return_value.upload_attachments.assert_called_once_with(
+        "JRN-1", {"AGR-1": report}
+    )
+    assert not report.path.exists()
+    assert not generator_result.reports_by_agreement
+
+
 def test_uploads_invoice_attachments_and_sends_warning_for_failures(
     mocker, mock_context, mock_get_authorizations, mock_auth_generator_cls
 ):
@@ -233,10 +292,12 @@ def test_uploads_invoice_attachments_and_sends_warning_for_failures(
     mock_auth_gen = mocker.MagicMock(spec=AuthorizationJournalGenerator)
     mock_line = mocker.MagicMock(spec=JournalLine)
     invoice_ids = {"INV-001", "INV-002"}
-    mock_auth_gen.run.return_value = AuthorizationJournalResult(
-        lines=[mock_line],
-        invoice_ids=invoice_ids,
-    )
+    mock_auth_gen.run_periods.return_value = [
+        AuthorizationJournalResult(
+            lines=[mock_line],
+            invoice_ids=invoice_ids,
+        )
+    ]
     mock_auth_generator_cls.return_value = mock_auth_gen
     mock_journal_manager_cls = mocker.patch(f"{MODULE}.JournalManager", autospec=True)
     mock_journal_manager = mock_journal_manager_cls.return_value
@@ -262,11 +323,12 @@ def test_uploads_invoice_attachments_and_sends_warning_for_failures(
         "PMA-123",
         mock_context.config.billing_role_name,
     )
-    billing_aws_client_provider = mock_auth_gen.run.call_args.args[1]
+    billing_aws_client_provider = mock_auth_gen.run_periods.call_args.args[1]
     assert billing_aws_client_provider() is mock_aws_client_cls.return_value
     mock_invoice_creator_cls.assert_called_once_with(
         mock_aws_client_cls.return_value,
         mock_context.billing_api_client,
+        pdf_cache=None,
     )
     mock_invoice_creator.create_for_journal.assert_called_once_with("JRN-1", invoice_ids)
     mock_context.notifier.send_warning.assert_called_once_with(
@@ -288,11 +350,13 @@ def test_dry_run_skips_upload(
     mock_line.external_ids = ExternalIds(invoice="INV-1", reference="AGR-1", vendor="MPA-1")
     mock_line.price = Price(pp_x1=Decimal("100.00"), unit_pp=Decimal("100.00"))
     report = OrganizationReport(organization_data={"usage": [{"key": "val"}]})
-    mock_auth_gen.run.return_value = AuthorizationJournalResult(
-        lines=[mock_line],
-        reports_by_agreement={"AGR-1": report},
-        invoice_ids={"INV-001"},
-    )
+    mock_auth_gen.run_periods.return_value = [
+        AuthorizationJournalResult(
+            lines=[mock_line],
+            reports_by_agreement={"AGR-1": report},
+            invoice_ids={"INV-001"},
+        )
+    ]
     mock_auth_generator_cls.return_value = mock_auth_gen
     mock_journal_manager_cls = mocker.patch(f"{MODULE}.JournalManager", autospec=True)
     mock_invoice_creator_cls = mocker.patch(
@@ -317,10 +381,12 @@ def test_dry_run_skips_upload_with_empty_reports(
     mock_line.to_jsonl.return_value = '{"test": 1}\n'
     mock_line.external_ids = ExternalIds(invoice="INV-1", reference="AGR-1", vendor="MPA-1")
     mock_line.price = Price(pp_x1=Decimal("100.00"), unit_pp=Decimal("100.00"))
-    mock_auth_gen.run.return_value = AuthorizationJournalResult(
-        lines=[mock_line],
-        reports_by_agreement={},
-    )
+    mock_auth_gen.run_periods.return_value = [
+        AuthorizationJournalResult(
+            lines=[mock_line],
+            reports_by_agreement={},
+        )
+    ]
     mock_auth_generator_cls.return_value = mock_auth_gen
     mock_journal_manager_cls = mocker.patch(f"{MODULE}.JournalManager", autospec=True)
     service = BillingJournalService(mock_context)
@@ -339,9 +405,9 @@ def test_pls_mismatch_sends_warning(
     mock_auth_gen = mocker.MagicMock(spec=AuthorizationJournalGenerator)
     mock_line = mocker.MagicMock(spec=JournalLine)
     mismatch = PlsMismatch(agreement_id="AGR-1", pls_in_order=True, report_has_enterprise=False)
-    mock_auth_gen.run.return_value = AuthorizationJournalResult(
-        lines=[mock_line], pls_mismatches=[mismatch]
-    )
+    mock_auth_gen.run_periods.return_value = [
+        AuthorizationJournalResult(lines=[mock_line], pls_mismatches=[mismatch])
+    ]
     mock_auth_generator_cls.return_value = mock_auth_gen
     mocker.patch(f"{MODULE}.JournalManager", autospec=True)
     service = BillingJournalService(mock_context)
@@ -366,10 +432,12 @@ def test_dry_run_skips_upload_with_empty_report_data(
     mock_line.external_ids = ExternalIds(invoice="INV-1", reference="AGR-1", vendor="MPA-1")
     mock_line.price = Price(pp_x1=Decimal("100.00"), unit_pp=Decimal("100.00"))
     empty_report = OrganizationReport(organization_data={}, accounts_data={})
-    mock_auth_gen.run.return_value = AuthorizationJournalResult(
-        lines=[mock_line],
-        reports_by_agreement={"AGR-1": empty_report},
-    )
+    mock_auth_gen.run_periods.return_value = [
+        AuthorizationJournalResult(
+            lines=[mock_line],
+            reports_by_agreement={"AGR-1": empty_report},
+        )
+    ]
     mock_auth_generator_cls.return_value = mock_auth_gen
     mock_journal_manager_cls = mocker.patch(f"{MODULE}.JournalManager", autospec=True)
     service = BillingJournalService(mock_context)
@@ -377,3 +445,221 @@ def test_dry_run_skips_upload_with_empty_report_data(
     service.run()  # act
 
     mock_journal_manager_cls.assert_not_called()
+
+
+def test_backfill_publishes_journal_per_period(
+    mocker, mock_context, mock_get_authorizations, mock_auth_generator_cls
+):
+    mock_context.dry_run = False
+    authorization = {"id": "AUTH-1", "externalIds": {"operations": "MPA-123"}}
+    mock_get_authorizations.return_value = [authorization]
+    period_contexts = [
+        mocker.MagicMock(
+            spec=BillingJournalContext,
+            dry_run=False,
+            billing_api_client=mock_context.billing_api_client,
+            billing_period=mock_context.billing_period,
+        )
+        for _ in range(2)
+    ]
+    mock_context.split_by_month.return_value = period_contexts
+    mock_line = mocker.MagicMock(spec=JournalLine)
+    mock_auth_generator_cls.return_value.run_periods.return_value = [
+        AuthorizationJournalResult(lines=[mock_line]),
+        AuthorizationJournalResult(lines=[mock_line, mock_line]),
+    ]
+    mock_journal_manager_cls = mocker.patch(f"{MODULE}.JournalManager", autospec=True)
+    mock_journal_manager = mock_journal_manager_cls.return_value
+    mock_journal = mocker.MagicMock(id="JRN-1")
+    mock_journal_manager.get_pending_journal.return_value = mock_journal
+    provider_factory = mocker.create_autospec(BillingAWSClientProvider)
+    service = BillingJournalService(mock_context, provider_factory)
+
+    service.run()  # act
+
+    provider_factory.assert_called_once_with(mock_context.config, "MPA-123")
+    mock_auth_generator_cls.return_value.run_periods.assert_called_once_with(
+        authorization, provider_factory.return_value, period_contexts
+    )
+    assert mock_journal_manager_cls.call_args_list == [
+        mocker.call(period_contexts[0], "AUTH-1", mocker.ANY),
+        mocker.call(period_contexts[1], "AUTH-1", mocker.ANY),
+    ]
+    assert mock_journal_manager.upload_journal.call_args_list == [
+        mocker.call(mock_journal, [mock_line]),
+        mocker.call(mock_journal, [mock_line, mock_line]),
+    ]
+
+
+def _generate_with_stage(*args):
+    with measure_stage(BillingStageEnum.INVOICES) as stage_counts:
+        stage_counts.row_count = 2
+    return [AuthorizationJournalResult()]
+
+
+def test_sends_stage_metrics_to_teams(
+    mocker, mock_context, mock_get_authorizations, mock_auth_generator_cls
+):
+    mock_context.dry_run = False
+    mock_get_authorizations.return_value = [{"id": "AUTH-1"}]
+    mock_auth_generator_cls.return_value.run_periods.side_effect = _generate_with_stage
+    service = BillingJournalService(mock_context)
+
+    service.run()  # act
+
+    mock_context.notifier.send_success.assert_called_once_with(
+        BILLING_JOURNAL_METRICS_TITLE,
+        "Billing journal run from 2025-10-01 to 2025-11-01.",
+        facts=mocker.ANY,
+    )
+    send_success = mock_context.notifier.send_success
+    assert list(send_success.call_args.kwargs["facts"].data) == ["invoices"]
+
+
+def _fail_with_stage(*args):
+    _generate_with_stage()
+    raise RuntimeError("AWS unavailable")
+
+
+def test_sends_stage_metrics_of_failed_run_as_warning(
+    mocker, mock_context, mock_get_authorizations, mock_auth_generator_cls
+):
+    mock_context.dry_run = False
+    mock_context.work_queue_name = "billing"
+    mock_context.queue_worker = None
+    mock_get_authorizations.return_value = [{"id": "AUTH-1"}]
+    mock_auth_generator_cls.return_value.run_periods.side_effect = _fail_with_stage
+    service = BillingJournalService(mock_context)
+
+    with pytest.raises(RuntimeError, match="AWS unavailable"):
+        service.run()  # act
+
+    mock_context.notifier.send_warning.assert_called_once_with(
+        BILLING_JOURNAL_METRICS_TITLE,
+        "Billing journal run from 2025-10-01 to 2025-11-01 failed.",
+        facts=mocker.ANY,
+    )
+    mock_context.notifier.send_success.assert_not_called()
+
+
+def test_dry_run_logs_stage_metrics(
+    caplog, mock_context, mock_get_authorizations, mock_auth_generator_cls
+):
+    mock_context.dry_run = True
+    mock_get_authorizations.return_value = [{"id": "AUTH-1"}]
+    mock_auth_generator_cls.return_value.run_periods.side_effect = _generate_with_stage
+    service = BillingJournalService(mock_context)
+
+    with caplog.at_level(logging.INFO):
+        service.run()  # act
+
+    assert "[DRY-RUN] Billing pipeline stages:" in caplog.text
+    mock_context.notifier.send_success.assert_not_called()
+
+
+def test_shard_bills_only_its_authorizations(
+    mocker, mock_context, mock_get_authorizations, mock_auth_generator_cls
+):
+    mock_context.dry_run = False
+    mock_context.shard = BillingShard(index=0, count=2)
+    mock_context.shard_outputs = mocker.MagicMock(spec=ShardOutputStore)
+    authorizations = [{"id": f"AUT-{number}"} for number in range(10)]
+    mock_get_authorizations.return_value = authorizations
+    mock_auth_generator_cls.return_value.run_periods.return_value = [AuthorizationJournalResult()]
+    service = BillingJournalService(mock_context, mocker.create_autospec(BillingAWSClientProvider))
+
+    service.run()  # act
+
+    billed_authorizations = [
+        call.args[0] for call in mock_auth_generator_cls.return_value.run_periods.call_args_list
+    ]
+    assert billed_authorizations == [
+        authorization
+        for authorization in authorizations
+        if mock_context.shard.includes(authorization["id"])
+    ]
+
+
+def test_shard_writes_outputs_instead_of_report(
+    mocker, mock_context, mock_get_authorizations, mock_auth_generator_cls
+):
+    mock_context.dry_run = False
+    mock_context.shard = BillingShard(index=1, count=3)
+    mock_context.shard_outputs = mocker.MagicMock(spec=ShardOutputStore)
+    mock_get_authorizations.return_value = []
+    mock_report_creator_cls = mocker.patch(
+        "swo_aws_extension.billing.period_report.BillingReportCreator", autospec=True
+    )
+    service = BillingJournalService(mock_context)
+
+    service.run()  # act
+
+    mock_context.shard_outputs.write.assert_called_once_with(
+        str(mock_context.shard), mock_context.billing_period, mocker.ANY, []
+    )
+    mock_report_creator_cls.assert_not_called()
+    mock_context.notifier.send_warning.assert_not_called()
+
+
+def test_merge_shard_reports(mocker, mock_context):
+    mock_context.shard_outputs = mocker.MagicMock(spec=ShardOutputStore)
+    mock_merge = mocker.patch(f"{MODULE}.merge_shard_reports", autospec=True)
+    service = BillingJournalService(mock_context)
+
+    service.merge_shard_reports()  # act
+
+    mock_merge.assert_called_once_with(
+        mock_context, mock_context.shard_outputs, mock_context.shard_output_names
+    )
+
+
+def test_merge_shard_reports_requires_output_dir(mock_context):
+    service = BillingJournalService(mock_context)
+
+    with pytest.raises(ValueError, match="shard output directory"):
+        service.merge_shard_reports()
+
+
+def test_queued_authorizations_write_outputs_per_authorization(
+    mocker, mock_context, mock_get_authorizations, mock_auth_generator_cls
+):
+    mock_context.dry_run = False
+    mock_context.shard_outputs = mocker.MagicMock(spec=ShardOutputStore)
+    mock_context.queue_worker = mocker.MagicMock(spec=QueueWorker)
+    mock_context.queue_worker.run.side_effect = lambda payloads, process: [
+        process(payload) for payload in payloads
+    ]
+    mock_get_authorizations.return_value = [{"id": "AUT-1"}, {"id": "AUT-2"}]
+    mock_auth_generator_cls.return_value.run_periods.return_value = [AuthorizationJournalResult()]
+    mock_send_period_report = mocker.patch(f"{MODULE}.send_period_report", autospec=True)
+    service = BillingJournalService(mock_context, mocker.create_autospec(BillingAWSClientProvider))
+
+    service.run()  # act
+
+    written_outputs = [call.args[:2] for call in mock_context.shard_outputs.write.call_args_list]
+    assert written_outputs == [
+        ("AUT-1", mock_context.billing_period),
+        ("AUT-2", mock_context.billing_period),
+    ]
+    mock_send_period_report.assert_not_called()
+
+
+def test_queued_authorization_generation_failure_is_raised(
+    mocker, mock_context, mock_get_authorizations, mock_auth_generator_cls
+):
+    mock_context.dry_run = False
+    mock_context.work_queue_name = "billing"
+    mock_context.shard_outputs = mocker.MagicMock(spec=ShardOutputStore)
+    mock_context.queue_worker = mocker.MagicMock(spec=QueueWorker)
+    mock_context.queue_worker.run.side_effect = lambda payloads, process: [
+        process(payload) for payload in payloads
+    ]
+    mock_get_authorizations.return_value = [{"id": "AUT-1"}]
+    mock_auth_generator_cls.return_value.run_periods.side_effect = RuntimeError("Throttled")
+    service = BillingJournalService(mock_context, mocker.create_autospec(BillingAWSClientProvider))
+
+    with pytest.raises(RuntimeError, match="Throttled"):
+        service.run()  # act
+
+    mock_context.shard_outputs.write.assert_not_called()
+    mock_context.notifier.send_error.assert_called_once()
@@ -1,9 +1,16 @@
+import gzip
 from decimal import Decimal
+from io import BytesIO
 
 import pytest
 
-from swo_aws_extension.billing.billing_report_creator import BillingReportCreator
+from swo_aws_extension.billing.billing_report_creator import (
+    BILLING_REPORT_BY_ACCOUNT_HEADERS,
+    BILLING_REPORT_HEADERS,
+    BillingReportCreator,
+)
 from swo_aws_extension.billing.models.journal_result import BillingReportRow
+from swo_aws_extension.billing.report_row_sink import BillingReportRowSink
 from swo_aws_extension.config import Config
 from swo_aws_extension.swo.notifications.teams import TeamsNotificationManager
 
@@ -49,59 +56,140 @@ def sample_row():
     )
 
 
+@pytest.fixture
+def row_sink():
+    with BillingReportRowSink() as sink:
+        yield sink
+
+
 def test_create_and_notify_teams_skips_empty(
-    mock_config, mock_notifier, mock_blob_uploader_cls, mock_excel_builder_cls
+    mock_config, mock_notifier, mock_blob_uploader_cls, mock_excel_builder_cls, row_sink
 ):
     creator = BillingReportCreator(mock_config, mock_notifier)
 
-    creator.create_and_notify_teams("2024-01", [])  # act
+    creator.create_and_notify_teams("2024-01", row_sink)  # act
 
-    mock_excel_builder_cls.return_value.build_multi_sheet.assert_not_called()
+    mock_excel_builder_cls.return_value.stream_multi_sheet.assert_not_called()
     mock_notifier.send_success.assert_not_called()
 
 
 def test_create_and_notify_teams_success(
-    mock_config, mock_notifier, mock_blob_uploader_cls, mock_excel_builder_cls, sample_row
+    mock_config,
+    mock_notifier,
+    mock_blob_uploader_cls,
+    mock_excel_builder_cls,
+    sample_row,
+    row_sink,
 ):
+    row_sink.append([sample_row])
     mock_excel_builder = mock_excel_builder_cls.return_value
-    mock_excel_builder.build_multi_sheet.return_value = b"excel_bytes"
+    mock_excel_builder.stream_multi_sheet.return_value = BytesIO(b"excel_bytes")
     mock_blob_uploader = mock_blob_uploader_cls.return_value
-    mock_blob_uploader.upload_and_get_sas_url.return_value = "https://azure.blob/report.xlsx"
+    mock_blob_uploader.upload_stream_and_get_sas_url.return_value = "https://azure.blob/report.xlsx"
     creator = BillingReportCreator(mock_config, mock_notifier)
 
-    creator.create_and_notify_teams("2024-01", [sample_row])  # act
+    creator.create_and_notify_teams("2024-01", row_sink)  # act
 
-    mock_excel_builder.build_multi_sheet.assert_called_once()
-    mock_blob_uploader.upload_and_get_sas_url.assert_called_once()
+    mock_excel_builder.stream_multi_sheet.assert_called_once()
+    blob_names = [
+        call.args[1] for call in mock_blob_uploader.upload_stream_and_get_sas_url.call_args_list
+    ]
+    folder = mock_config.report_billing_folder
+    assert blob_names == [
+        f"{folder}2024-01.xlsx",
+        f"{folder}2024-01.csv.gz",
+        f"{folder}2024-01-by-account.csv.gz",
+    ]
     mock_notifier.send_success.assert_called_once()
 
 
+def test_create_and_notify_teams_exports_csv_gzip(
+    mocker,
+    mock_config,
+    mock_notifier,
+    mock_blob_uploader_cls,
+    mock_excel_builder_cls,
+    sample_row,
+    row_sink,
+):
+    row_sink.append([sample_row])
+    mock_excel_builder_cls.return_value.stream_multi_sheet.return_value = BytesIO(b"excel_bytes")
+    uploaded_data = []
+    mock_blob_uploader_cls.return_value.upload_stream_and_get_sas_url.side_effect = (
+        lambda source, blob_name: uploaded_data.append(source.read()) or "https://url"
+    )
+    creator = BillingReportCreator(mock_config, mock_notifier)
+
+    creator.create_and_notify_teams("2024-01", row_sink)  # act
+
+    csv_lines = gzip.decompress(uploaded_data[1]).decode().splitlines()
+    assert csv_lines == [
+        ",".join(BILLING_REPORT_HEADERS),
+        'AUTH-1,PMA-1,AGR-1,MPA-1,EC2,10.5,11.5,USD,INV-1,INV-E1,1.2,-1.0,"0,0870 (8.70%)"',
+    ]
+    assert gzip.decompress(uploaded_data[2]).decode().splitlines() == [
+        ",".join(BILLING_REPORT_BY_ACCOUNT_HEADERS)
+    ]
+
+
+def test_create_and_notify_teams_reports_file_summaries(
+    mock_config,
+    mock_notifier,
+    mock_blob_uploader_cls,
+    mock_excel_builder_cls,
+    sample_row,
+    row_sink,
+):
+    row_sink.append([sample_row], [sample_row])
+    mock_excel_builder_cls.return_value.stream_multi_sheet.return_value = BytesIO(b"excel_bytes")
+    mock_blob_uploader_cls.return_value.upload_stream_and_get_sas_url.return_value = "https://url"
+    creator = BillingReportCreator(mock_config, mock_notifier)
+
+    creator.create_and_notify_teams("2024-01", row_sink)  # act
+
+    facts = mock_notifier.send_success.call_args.kwargs["facts"]
+    assert list(facts.data) == ["Excel workbook", "Billing Report CSV", "By Linked Account CSV"]
+    assert facts.data["Excel workbook"] == "2 rows, 11.0 B - [Download](https://url)"
+
+
 def test_create_and_notify_teams_upload_failure(
-    mock_config, mock_notifier, mock_blob_uploader_cls, mock_excel_builder_cls, sample_row
+    mock_config,
+    mock_notifier,
+    mock_blob_uploader_cls,
+    mock_excel_builder_cls,
+    sample_row,
+    row_sink,
 ):
-    mock_excel_builder_cls.return_value.build_multi_sheet.return_value = b"excel_bytes"
-    mock_blob_uploader_cls.return_value.upload_and_get_sas_url.side_effect = Exception(
+    row_sink.append([sample_row])
+    mock_excel_builder_cls.return_value.stream_multi_sheet.return_value = BytesIO(b"excel_bytes")
+    mock_blob_uploader_cls.return_value.upload_stream_and_get_sas_url.side_effect = Exception(
         "Upload failed"
     )
     creator = BillingReportCreator(mock_config, mock_notifier)
 
-    creator.create_and_notify_teams("2024-01", [sample_row])  # act
+    creator.create_and_notify_teams("2024-01", row_sink)  # act
 
     mock_notifier.send_success.assert_not_called()
     mock_notifier.send_error.assert_called_once()
 
 
 def test_create_and_notify_teams_converts_decimals_to_string(
-    mock_config, mock_notifier, mock_blob_uploader_cls, mock_excel_builder_cls, sample_row
+    mock_config,
+    mock_notifier,
+    mock_blob_uploader_cls,
+    mock_excel_builder_cls,
+    sample_row,
+    row_sink,
 ):
+    row_sink.append([sample_row])
     mock_excel_builder = mock_excel_builder_cls.return_value
-    mock_excel_builder.build_multi_sheet.return_value = b"excel_bytes"
-    mock_blob_uploader_cls.return_value.upload_and_get_sas_url.return_value = "https://url"
+    mock_excel_builder.stream_multi_sheet.return_value = BytesIO(b"excel_bytes")
+    mock_blob_uploader_cls.return_value.upload_stream_and_get_sas_url.return_value = "https://url"
     creator = BillingReportCreator(mock_config, mock_notifier)
 
-    creator.create_and_notify_teams("2024-01", [sample_row])  # act
+    creator.create_and_notify_teams("2024-01", row_sink)  # act
 
-    call_args = mock_excel_builder.build_multi_sheet.call_args[0][0]
+    call_args = mock_excel_builder.stream_multi_sheet.call_args[0][0]
     sheet1_name, _, sheet1_rows = call_args[0]
     assert sheet1_name == "Billing Report"
     expected_row = [
@@ -119,15 +207,20 @@ def test_create_and_notify_teams_converts_decimals_to_string(
         "-1.0",
         "0,0870 (8.70%)",
     ]
-    assert sheet1_rows == [expected_row]
+    assert list(sheet1_rows) == [expected_row]
 
 
 def test_create_and_notify_teams_builds_by_account_sheet(
-    mock_config, mock_notifier, mock_blob_uploader_cls, mock_excel_builder_cls, sample_row
+    mock_config,
+    mock_notifier,
+    mock_blob_uploader_cls,
+    mock_excel_builder_cls,
+    sample_row,
+    row_sink,
 ):
     mock_excel_builder = mock_excel_builder_cls.return_value
-    mock_excel_builder.build_multi_sheet.return_value = b"excel_bytes"
-    mock_blob_uploader_cls.return_value.upload_and_get_sas_url.return_value = "https://url"
+    mock_excel_builder.stream_multi_sheet.return_value = BytesIO(b"excel_bytes")
+    mock_blob_uploader_cls.return_value.upload_stream_and_get_sas_url.return_value = "https://url"
     by_account_row = BillingReportRow(
         authorization_id="AUTH-1",
         pma="PMA-1",
@@ -144,12 +237,13 @@ def test_create_and_notify_teams_builds_by_account_sheet(
         spp_discount_pct=Decimal("1.0") / Decimal("11.5"),
         linked_account="ACC-001",
     )
+    row_sink.append([sample_row], [by_account_row])
     creator = BillingReportCreator(mock_config, mock_notifier)
 
-    creator.create_and_notify_teams("2024-01", [sample_row], [by_account_row])  # act
+    creator.create_and_notify_teams("2024-01", row_sink)  # act
 
-    call_args = mock_excel_builder.build_multi_sheet.call_args[0][0]
+    call_args = mock_excel_builder.stream_multi_sheet.call_args[0][0]
     sheet2_name, sheet2_headers, sheet2_rows = call_args[1]
     assert sheet2_name == "By Linked Account"
     assert "Linked Account" in sheet2_headers
-    assert sheet2_rows[0][4] == "ACC-001"
+    assert next(sheet2_rows)[4] == "ACC-001"
@@ -0,0 +1,148 @@
+from decimal import Decimal
+
+import pytest
+
+from swo_aws_extension.billing.data_exports_client import (
+    DATA_EXPORTS_VIEW_ARN_PREFIX,
+    DataExportsCostClient,
+)
+from swo_aws_extension.billing.data_exports_store import DataExportsStore, UsageKey
+from swo_aws_extension.constants import AWS_MARKETPLACE, AWSRecordTypeEnum
+from swo_aws_extension.models import BillingPeriod
+
+MPA_VIEW_ARN = f"{DATA_EXPORTS_VIEW_ARN_PREFIX}MPA-1"
+
+
+def _build_usage_key(usage_date, account, record_type, billing_entity="AWS"):
+    return UsageKey(
+        usage_date=usage_date,
+        linked_account=account,
+        service="Amazon EC2",
+        record_type=record_type,
+        invoicing_entity="Amazon Web Services EMEA SARL",
+        billing_entity=billing_entity,
+    )
+
+
+@pytest.fixture
+def billing_period():
+    return BillingPeriod(start_date="2025-10-01", end_date="2025-11-01")
+
+
+@pytest.fixture
+def mock_data_exports(mocker):
+    data_exports = mocker.MagicMock(spec=DataExportsStore)
+    payer_usage = {
+        _build_usage_key("2025-10-01", "ACC-1", AWSRecordTypeEnum.USAGE): Decimal("1.5"),
+        _build_usage_key("2025-10-02", "ACC-1", AWSRecordTypeEnum.USAGE): Decimal("2.5"),
+        _build_usage_key("2025-10-02", "ACC-1", AWSRecordTypeEnum.TAX): Decimal("0.5"),
+        _build_usage_key("2025-10-01", "ACC-2", AWSRecordTypeEnum.USAGE, AWS_MARKETPLACE): Decimal(
+            "3.25"
+        ),
+    }
+    data_exports.get_payer_usage.side_effect = lambda payer, _: (
+        payer_usage if payer == "MPA-1" else {}
+    )
+    data_exports.get_account_usage.side_effect = lambda payer, accounts, _: {
+        usage_key: amount
+        for usage_key, amount in data_exports.get_payer_usage(payer, _).items()
+        if usage_key.linked_account in accounts
+    }
+    return data_exports
+
+
+def test_get_billing_views_for_payer_with_usage(mock_data_exports):
+    client = DataExportsCostClient(mock_data_exports, "PMA-1")
+
+    result = client.get_billing_views_by_account_id("MPA-1", "2025-10-01", "2025-10-31")
+
+    assert [billing_view["arn"] for billing_view in result] == [MPA_VIEW_ARN]
+
+
+def test_get_billing_views_for_payer_without_usage(mock_data_exports):
+    client = DataExportsCostClient(mock_data_exports, "PMA-1")
+
+    result = client.get_billing_views_by_account_id("MPA-2", "2025-10-01", "2025-10-31")
+
+    assert not result
+
+
+def test_get_cost_and_usage_groups_monthly_usage(mock_data_exports, billing_period):
+    client = DataExportsCostClient(mock_data_exports, "PMA-1")
+
+    result = client.get_cost_and_usage(
+        billing_period,
+        group_by=[{"Type": "DIMENSION", "Key": "LINKED_ACCOUNT"}],
+        view_arn=MPA_VIEW_ARN,
+    )
+
+    assert result == [
+        {
+            "TimePeriod": {"Start": "2025-10-01", "End": "2025-11-01"},
+            "Total": {},
+            "Groups": [
+                {
+                    "Keys": ["ACC-1"],
+                    "Metrics": {"UnblendedCost": {"Amount": "4.5", "Unit": "USD"}},
+                },
+                {
+                    "Keys": ["ACC-2"],
+                    "Metrics": {"UnblendedCost": {"Amount": "3.25", "Unit": "USD"}},
+                },
+            ],
+            "Estimated": False,
+        }
+    ]
+
+
+def test_get_cost_and_usage_filters_daily_usage(mock_data_exports, billing_period):
+    client = DataExportsCostClient(mock_data_exports, "PMA-1")
+    filter_by = {
+        "And": [
+            {"Dimensions": {"Key": "LINKED_ACCOUNT", "Values": ["ACC-1"]}},
+            {"Not": {"Dimensions": {"Key": "RECORD_TYPE", "Values": ["Tax"]}}},
+        ]
+    }
+
+    result = client.get_cost_and_usage(
+        billing_period,
+        [{"Type": "DIMENSION", "Key": "RECORD_TYPE"}, {"Type": "DIMENSION", "Key": "SERVICE"}],
+        filter_by,
+        view_arn=MPA_VIEW_ARN,
+        granularity="DAILY",
+    )
+
+    assert [
+        (result_by_time["TimePeriod"], group["Keys"], group["Metrics"]["UnblendedCost"]["Amount"])
+        for result_by_time in result
+        for group in result_by_time["Groups"]
+    ] == [
+        ({"Start": "2025-10-01", "End": "2025-10-02"}, ["Usage", "Amazon EC2"], "1.5"),
+        ({"Start": "2025-10-02", "End": "2025-10-03"}, ["Usage", "Amazon EC2"], "2.5"),
+    ]
+
+
+def test_get_cost_and_usage_reads_usage_of_filtered_accounts(mock_data_exports, billing_period):
+    client = DataExportsCostClient(mock_data_exports, "PMA-1")
+    filter_by = {
+        "And": [
+            {"Not": {"Dimensions": {"Key": "RECORD_TYPE", "Values": ["Tax"]}}},
+            {"Dimensions": {"Key": "LINKED_ACCOUNT", "Values": ["ACC-2"]}},
+        ]
+    }
+
+    result = client.get_cost_and_usage(billing_period, filter_by=filter_by, view_arn=MPA_VIEW_ARN)
+
+    assert result[0]["Groups"] == [
+        {"Keys": [], "Metrics": {"UnblendedCost": {"Amount": "3.25", "Unit": "USD"}}}
+    ]
+    mock_data_exports.get_account_usage.assert_called_once_with("MPA-1", ["ACC-2"], billing_period)
+
+
+def test_get_cost_and_usage_without_view_uses_client_payer(mock_data_exports, billing_period):
+    client = DataExportsCostClient(mock_data_exports, "PMA-1")
+
+    result = client.get_cost_and_usage(billing_period, view_arn="")
+
+    assert not result
+    mock_data_exports.get_payer_usage.assert_called_once_with("PMA-1", billing_period)
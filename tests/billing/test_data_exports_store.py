@@ -0,0 +1,144 @@
+import csv
+import gzip
+from decimal import Decimal
+
+import pytest
+
+from swo_aws_extension.billing.data_exports_store import DataExportsStore, UsageKey
+from swo_aws_extension.constants import AWSRecordTypeEnum
+from swo_aws_extension.models import BillingPeriod
+
+HEADER = (
+    "identity_line_item_id",
+    "bill_payer_account_id",
+    "bill_billing_entity",
+    "bill_invoicing_entity",
+    "line_item_usage_account_id",
+    "line_item_line_item_type",
+    "line_item_usage_start_date",
+    "line_item_unblended_cost",
+    "line_item_product_code",
+    "product_product_name",
+)
+
+
+def _write_export(path, rows):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, "wt", encoding="utf-8", newline="") as export_file:
+        writer = csv.writer(export_file)
+        writer.writerow(HEADER)
+        writer.writerows(rows)
+
+
+def _build_row(payer, account, line_item_type, cost, product_name="Amazon EC2"):
+    return [
+        "line-1",
+        payer,
+        "AWS",
+        "Amazon Web Services EMEA SARL",
+        account,
+        line_item_type,
+        "2025-10-01T00:00:00Z",
+        cost,
+        "AmazonEC2",
+        product_name,
+    ]
+
+
+@pytest.fixture
+def billing_period():
+    return BillingPeriod(start_date="2025-10-01", end_date="2025-11-01")
+
+
+def test_get_payer_usage_sums_rows_of_all_files(tmp_path, billing_period):
+    period_dir = tmp_path / "BILLING_PERIOD=2025-10"
+    _write_export(period_dir / "part-0.csv.gz", [_build_row("MPA-1", "ACC-1", "Usage", "1.25")])
+    _write_export(period_dir / "part-1.csv.gz", [_build_row("MPA-1", "ACC-1", "Usage", "2.5")])
+    data_exports = DataExportsStore(tmp_path)
+
+    result = data_exports.get_payer_usage("MPA-1", billing_period)
+
+    expected_key = UsageKey(
+        usage_date="2025-10-01",
+        linked_account="ACC-1",
+        service="Amazon EC2",
+        record_type=AWSRecordTypeEnum.USAGE,
+        invoicing_entity="Amazon Web Services EMEA SARL",
+        billing_entity="AWS",
+    )
+    assert result == {expected_key: Decimal("3.75")}
+
+
+def test_get_payer_usage_filters_by_payer(tmp_path, billing_period):
+    _write_export(
+        tmp_path / "BILLING_PERIOD=2025-10" / "part-0.csv.gz",
+        [_build_row("MPA-1", "ACC-1", "Usage", "1"), _build_row("MPA-2", "ACC-2", "Usage", "2")],
+    )
+    data_exports = DataExportsStore(tmp_path)
+
+    result = data_exports.get_payer_usage("MPA-2", billing_period)
+
+    assert [usage_key.linked_account for usage_key in result] == ["ACC-2"]
+
+
+def test_get_account_usage_keeps_usage_of_accounts(tmp_path, billing_period):
+    _write_export(
+        tmp_path / "BILLING_PERIOD=2025-10" / "part-0.csv.gz",
+        [
+            _build_row("MPA-1", "ACC-1", "Usage", "1"),
+            _build_row("MPA-1", "ACC-2", "Usage", "2"),
+            _build_row("MPA-1", "ACC-3", "Usage", "3"),
+        ],
+    )
+    data_exports = DataExportsStore(tmp_path)
+
+    result = data_exports.get_account_usage("MPA-1", ["ACC-1", "ACC-3"], billing_period)
+
+    assert sorted(result.values()) == [Decimal(1), Decimal(3)]
+
+
+def test_get_payer_usage_without_exports(tmp_path, billing_period):
+    data_exports = DataExportsStore(tmp_path)
+
+    result = data_exports.get_payer_usage("MPA-1", billing_period)
+
+    assert result == {}
+
+
+def test_get_payer_usage_reads_plain_csv(tmp_path, billing_period):
+    export_path = tmp_path / "BILLING_PERIOD=2025-10" / "export.csv"
+    export_path.parent.mkdir(parents=True)
+    with export_path.open("w", encoding="utf-8", newline="") as export_file:
+        writer = csv.writer(export_file)
+        writer.writerow(HEADER)
+        writer.writerow(_build_row("MPA-1", "ACC-1", "Tax", "0.5"))
+    data_exports = DataExportsStore(tmp_path)
+
+    result = data_exports.get_payer_usage("MPA-1", billing_period)
+
+    assert list(result.values()) == [Decimal("0.5")]
+
+
+@pytest.mark.parametrize(
+    ("line_item_type", "product_name", "expected_record_type"),
+    [
+        ("SppDiscount", "Amazon EC2", AWSRecordTypeEnum.SOLUTION_PROVIDER_PROGRAM_DISCOUNT),
+        ("BundledDiscount", "Amazon EC2", AWSRecordTypeEnum.BUNDLE_DISCOUNT),
+        ("RIFee", "Amazon EC2", AWSRecordTypeEnum.RECURRING),
+        ("Fee", "AWS Support (Business)", AWSRecordTypeEnum.SUPPORT),
+        ("Fee", "Amazon Route 53", "Fee"),
+        ("Credit", "Amazon EC2", AWSRecordTypeEnum.CREDIT),
+    ],
+)
+def test_get_payer_usage_maps_record_types(
+    tmp_path, billing_period, line_item_type, product_name, expected_record_type
+):
+    _write_export(
+        tmp_path / "BILLING_PERIOD=2025-10" / "part-0.csv.gz",
+        [_build_row("MPA-1", "ACC-1", line_item_type, "1", product_name)],
+    )
+    data_exports = DataExportsStore(tmp_path)
+
+    result = data_exports.get_payer_usage("MPA-1", billing_period)
+
+    assert [usage_key.record_type for usage_key in result] == [expected_record_type]
@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from swo_aws_extension.billing.invoice_pdf_cache import (
+    BYTES_PER_MB,
+    InvoicePDFCache,
+    build_invoice_pdf_cache,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return InvoicePDFCache(tmp_path / "invoices", max_size_bytes=10)
+
+
+def test_get_returns_none_on_miss(cache):
+    result = cache.get("INV-001")
+
+    assert result is None
+
+
+def test_put_then_get_returns_content(cache):
+    cache.put("INV-001", b"pdf-1")
+
+    result = cache.get("INV-001")
+
+    assert result == b"pdf-1"
+
+
+def test_get_discards_corrupted_entry(tmp_path, cache):
+    cache.put("INV-001", b"pdf-1")
+    pdf_path = next((tmp_path / "invoices").glob("*.pdf"))
+    pdf_path.write_bytes(b"tampered")
+
+    result = cache.get("INV-001")
+
+    assert result is None
+    assert not list((tmp_path / "invoices").iterdir())
+
+
+def test_put_evicts_least_recently_used_entries(tmp_path, cache):
+    cache.put("INV-001", b"pdf-1")
+    cache.put("INV-002", b"pdf-2")
+    pdf_paths = sorted((tmp_path / "invoices").glob("*.pdf"), key=os.path.getmtime)
+    for age, pdf_path in enumerate(pdf_paths):
+        os.utime(pdf_path, (age, age))
+
+    cache.put("INV-003", b"pdf-3")  # act
+
+    assert cache.get("INV-001") is None
+    assert cache.get("INV-002") == b"pdf-2"
+    assert cache.get("INV-003") == b"pdf-3"
+
+
+def test_build_invoice_pdf_cache_disabled(mocker):
+    config = mocker.MagicMock(invoice_pdf_cache_dir="")
+
+    result = build_invoice_pdf_cache(config)
+
+    assert result is None
+
+
+def test_build_invoice_pdf_cache_enabled(mocker, tmp_path):
+    config = mocker.MagicMock(
+        invoice_pdf_cache_dir=str(tmp_path / "invoices"),
+        invoice_pdf_cache_max_size_mb=1,
+    )
+
+    result = build_invoice_pdf_cache(config)
+
+    assert isinstance(result, InvoicePDFCache)
+    assert (tmp_path / "invoices").is_dir()
+    result.put("INV-001", b"x" * BYTES_PER_MB)
+    assert result.get("INV-001") == b"x" * BYTES_PER_MB
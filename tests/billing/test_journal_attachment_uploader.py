@@ -0,0 +1,188 @@
+import datetime as dt
+import gzip
+import hashlib
+import json
+import zipfile
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError, Response
+
+from swo_aws_extension.billing.journal_attachment_uploader import (
+    JournalAttachmentUploader,
+    build_report_attachment,
+)
+from swo_aws_extension.billing.journal_digests import UploadedFiles, describe_with_digest
+from swo_aws_extension.billing.models.usage import OrganizationReport
+from swo_aws_extension.billing.report_store import ReportStore
+from swo_aws_extension.constants import AttachmentFormatEnum
+
+MODULE = "swo_aws_extension.billing.journal_attachment_uploader"
+
+
+@pytest.fixture
+def report():
+    return OrganizationReport(
+        organization_data={
+            "usage": [{"date": dt.datetime.fromisoformat("2025-10-01T00:00:00+00:00")}],
+        },
+        accounts_data={"123": {"usage": [{"amount": Decimal("1.5")}]}},
+    )
+
+
+@pytest.fixture
+def uploader(mock_billing_client):
+    return JournalAttachmentUploader(mock_billing_client)
+
+
+@pytest.fixture
+def expected_report_data():
+    return {
+        "organization_data": {"usage": [{"date": "2025-10-01T00:00:00+00:00"}]},
+        "accounts_data": {"123": {"usage": [{"amount": "1.5"}]}},
+    }
+
+
+def test_build_report_attachment_json(report, expected_report_data):
+    result = build_report_attachment("AGR-1", report, AttachmentFormatEnum.JSON)
+
+    assert (result.filename, result.mimetype) == ("AGR-1.json", "application/json")
+    assert json.loads(result.stream.read()) == expected_report_data
+
+
+def test_build_report_attachment_gzip(report, expected_report_data):
+    result = build_report_attachment("AGR-1", report, AttachmentFormatEnum.JSON_GZIP)
+
+    assert (result.filename, result.mimetype) == ("AGR-1.json.gz", "application/gzip")
+    assert json.loads(gzip.decompress(result.stream.read())) == expected_report_data
+
+
+def test_build_report_attachment_zip(report, expected_report_data):
+    result = build_report_attachment("AGR-1", report, AttachmentFormatEnum.ZIP)
+
+    assert (result.filename, result.mimetype) == ("AGR-1.zip", "application/zip")
+    with zipfile.ZipFile(result.stream) as zip_file:
+        assert json.loads(zip_file.read("AGR-1.json")) == expected_report_data
+
+
+def test_build_report_attachment_streams_spilled_report(tmp_path, expected_report_data):
+    report = ReportStore(tmp_path).create_report()
+    report.add_organization_data("usage", [{"date": "2025-10-01T00:00:00+00:00"}])
+    report.add_account_data("123", "usage", [{"amount": Decimal("1.5")}])
+
+    result = build_report_attachment("AGR-1", report, AttachmentFormatEnum.JSON_GZIP)
+
+    assert json.loads(gzip.decompress(result.stream.read())) == expected_report_data
+
+
+def test_upload_reports_sends_whole_file(mock_billing_client, report):
+    uploader = JournalAttachmentUploader(mock_billing_client, AttachmentFormatEnum.JSON_GZIP)
+    upload = mock_billing_client.journal.attachments("JRN-001").upload
+    uploaded_payloads = []
+    upload.side_effect = lambda **kwargs: uploaded_payloads.append(kwargs["file"].read())
+
+    uploader.upload_reports("JRN-001", {"AGR-1": report})  # act
+
+    assert len(uploaded_payloads) == 1
+    assert json.loads(gzip.decompress(uploaded_payloads[0]))["accounts_data"]
+
+
+def _http_error(status_code):
+    response = Response()
+    response.status_code = status_code
+    return HTTPError(f"{status_code} error", response=response)
+
+
+def test_upload_attachments_isolates_failures(uploader, mock_billing_client):
+    reports = {
+        "AGR-1": OrganizationReport(organization_data={"usage": [{"key": "value"}]}),
+        "AGR-2": OrganizationReport(organization_data={"usage": [{"key": "value"}]}),
+    }
+    upload = mock_billing_client.journal.attachments("JRN-001").upload
+    upload.side_effect = lambda **kwargs: _fail_for_agreement(kwargs["filename"], "AGR-1.json")
+
+    uploader.upload_reports("JRN-001", reports)  # act
+
+    uploaded_filenames = {call.kwargs["filename"] for call in upload.call_args_list}
+    assert uploaded_filenames == {"AGR-1.json", "AGR-2.json"}
+
+
+def test_upload_attachments_retries_transient_errors(mocker, uploader, mock_billing_client):
+    mock_sleep = mocker.patch(f"{MODULE}.time.sleep", autospec=True)
+    report = OrganizationReport(organization_data={"usage": [{"key": "value"}]})
+    upload = mock_billing_client.journal.attachments("JRN-001").upload
+    upload.side_effect = [
+        _http_error(HTTPStatus.SERVICE_UNAVAILABLE),
+        RequestsConnectionError("reset"),
+        {"id": "ATT-1"},
+    ]
+
+    uploader.upload_reports("JRN-001", {"AGR-1": report})  # act
+
+    assert upload.call_count == 3
+    assert mock_sleep.call_args_list == [mocker.call(1), mocker.call(2)]
+
+
+def test_upload_attachments_does_not_retry_client_errors(mocker, uploader, mock_billing_client):
+    mock_sleep = mocker.patch(f"{MODULE}.time.sleep", autospec=True)
+    report = OrganizationReport(organization_data={"usage": [{"key": "value"}]})
+    upload = mock_billing_client.journal.attachments("JRN-001").upload
+    upload.side_effect = _http_error(HTTPStatus.BAD_REQUEST)
+
+    uploader.upload_reports("JRN-001", {"AGR-1": report})  # act
+
+    upload.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_upload_attachments_stops_after_max_attempts(mocker, uploader, mock_billing_client):
+    mocker.patch(f"{MODULE}.time.sleep", autospec=True)
+    report = OrganizationReport(organization_data={"usage": [{"key": "value"}]})
+    upload = mock_billing_client.journal.attachments("JRN-001").upload
+    upload.side_effect = _http_error(HTTPStatus.BAD_GATEWAY)
+
+    uploader.upload_reports("JRN-001", {"AGR-1": report})  # act
+
+    assert upload.call_count == 3
+
+
+def _fail_for_agreement(filename, failing_filename):
+    if filename == failing_filename:
+        raise HTTPError("API error")
+    return {"id": "ATT-1"}
+
+
+def _uploaded_attachment(attachment_id, filename, file_bytes):
+    return {
+        "id": attachment_id,
+        "name": filename,
+        "description": describe_with_digest(
+            "Usage reports", hashlib.sha256(file_bytes).hexdigest()
+        ),
+    }
+
+
+def test_upload_reports_skips_unchanged_attachment(uploader, mock_billing_client, report):
+    attachment_file = build_report_attachment("AGR-1", report, AttachmentFormatEnum.JSON)
+    uploaded_files = UploadedFiles([
+        _uploaded_attachment("ATT-1", "AGR-1.json", attachment_file.stream.read())
+    ])
+
+    uploader.upload_reports("JRN-001", {"AGR-1": report}, uploaded_files)  # act
+
+    mock_billing_client.journal.attachments("JRN-001").upload.assert_not_called()
+
+
+def test_upload_reports_replaces_changed_attachment(uploader, mock_billing_client, report):
+    mock_billing_client.journal.attachments("JRN-001").all.return_value = [
+        _uploaded_attachment("ATT-1", "AGR-1.json", b"{}")
+    ]
+    attachments_client = mock_billing_client.journal.attachments("JRN-001")
+
+    uploader.upload_reports("JRN-001", {"AGR-1": report})  # act
+
+    attachment = attachments_client.upload.call_args.kwargs["attachment"]
+    assert attachment["description"].startswith("Usage reports for AWS agreement AGR-1 (sha256:")
+    attachments_client.delete.assert_called_once_with("ATT-1")
@@ -0,0 +1,72 @@
+import hashlib
+from io import BytesIO
+
+from requests import HTTPError
+
+from swo_aws_extension.billing.journal_digests import (
+    UploadedFiles,
+    compute_digest,
+    delete_attachments,
+    describe_with_digest,
+)
+
+DIGEST = hashlib.sha256(b"content").hexdigest()
+OTHER_DIGEST = hashlib.sha256(b"other").hexdigest()
+
+
+def test_compute_digest_rewinds_stream():
+    stream = BytesIO(b"content")
+    stream.read()
+
+    result = compute_digest(stream)
+
+    assert (result, stream.tell()) == (DIGEST, 0)
+
+
+def test_uploaded_files_matches_name_and_digest():
+    uploaded_files = UploadedFiles([
+        {"id": "ATT-1", "name": "AGR-1.json", "description": describe_with_digest("AGR-1", DIGEST)},
+        {"id": "ATT-2", "name": "AGR-2.json", "description": "Usage reports for AWS agreement"},
+    ])
+
+    result = (
+        uploaded_files.is_uploaded("AGR-1.json", DIGEST),
+        uploaded_files.is_uploaded("AGR-1.json", OTHER_DIGEST),
+        uploaded_files.is_uploaded("AGR-2.json", DIGEST),
+        uploaded_files.is_uploaded("AGR-3.json", DIGEST),
+    )
+
+    assert result == (True, False, False, False)
+
+
+def test_uploaded_files_get_attachment_ids():
+    uploaded_files = UploadedFiles([
+        {"id": "ATT-1", "name": "AGR-1.json", "description": ""},
+        {"id": "ATT-2", "name": "AGR-1.json", "description": ""},
+        {"id": "ATT-3", "name": "AGR-2.json", "description": ""},
+    ])
+
+    result = uploaded_files.get_attachment_ids("AGR-1.json")
+
+    assert result == ["ATT-1", "ATT-2"]
+
+
+def test_uploaded_files_from_journal(mock_billing_client):
+    attachments_client = mock_billing_client.journal.attachments.return_value
+    attachments_client.all.return_value = [
+        {"id": "ATT-1", "name": "AGR-1.json", "description": describe_with_digest("AGR-1", DIGEST)},
+    ]
+
+    result = UploadedFiles.from_journal(mock_billing_client, "JRN-001")
+
+    assert result.is_uploaded("AGR-1.json", DIGEST)
+    mock_billing_client.journal.attachments.assert_called_once_with("JRN-001")
+
+
+def test_delete_attachments_continues_after_failure(mock_billing_client):
+    delete = mock_billing_client.journal.attachments.return_value.delete
+    delete.side_effect = [HTTPError("API error"), None]
+
+    delete_attachments(mock_billing_client, "JRN-001", ["ATT-1", "ATT-2"])  # act
+
+    assert [call.args for call in delete.call_args_list] == [("ATT-1",), ("ATT-2",)]
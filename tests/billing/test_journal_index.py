@@ -0,0 +1,56 @@
+from swo_aws_extension.billing.journal_index import JournalIndex, build_external_id
+from swo_aws_extension.billing.models.journal import Journal
+from swo_aws_extension.models import BillingPeriod
+from swo_aws_extension.swo.rql.query_builder import RQLQuery
+
+
+def _journal(journal_id, authorization_id, status):
+    return {"id": journal_id, "status": status, "authorization": {"id": authorization_id}}
+
+
+def test_build_external_id():
+    billing_period = BillingPeriod(start_date="2025-10-01", end_date="2025-11-01")
+
+    result = build_external_id(billing_period)
+
+    assert result == "AWS-2025-October-BT"
+
+
+def test_from_billing_period_queries_journals_once(mock_billing_client):
+    billing_period = BillingPeriod(start_date="2025-10-01", end_date="2025-11-01")
+    journal_query = mock_billing_client.journal.query.return_value
+    journal_query.all.return_value = [
+        _journal("JRN-1", "AUTH-1", "Draft"),
+    ]
+
+    result = JournalIndex.from_billing_period(mock_billing_client, billing_period)
+
+    assert result.count_journals("AUTH-1") == 1
+    mock_billing_client.journal.query.assert_called_once_with(
+        RQLQuery(externalIds__vendor="AWS-2025-October-BT")
+    )
+
+
+def test_get_pending_journal_by_authorization():
+    journal_index = JournalIndex([
+        _journal("JRN-1", "AUTH-1", "Completed"),
+        _journal("JRN-2", "AUTH-1", "Validated"),
+        _journal("JRN-3", "AUTH-2", "Completed"),
+    ])
+
+    result = (
+        journal_index.get_pending_journal("AUTH-1"),
+        journal_index.get_pending_journal("AUTH-2"),
+        journal_index.get_pending_journal("AUTH-3"),
+    )
+
+    assert result == (Journal(id="JRN-2", status="Validated"), None, None)
+
+
+def test_count_journals_includes_added_journal():
+    journal_index = JournalIndex([_journal("JRN-1", "AUTH-1", "Completed")])
+    journal_index.add_journal("AUTH-1", Journal(id="JRN-2"))
+
+    result = journal_index.count_journals("AUTH-1")
+
+    assert result == 2
@@ -1,13 +1,14 @@
-import datetime as dt
-from decimal import Decimal
+import hashlib
 from io import BytesIO
 
 from requests import HTTPError
 
-from swo_aws_extension.billing.journal_manager import serialize_default
+from swo_aws_extension.billing.journal_index import JournalIndex
+from swo_aws_extension.billing.journal_manager import JournalManager
+from swo_aws_extension.billing.models.journal import Journal
 from swo_aws_extension.billing.models.journal_line import JournalLine
 from swo_aws_extension.billing.models.usage import OrganizationReport
-from swo_aws_extension.constants import BILLING_JOURNAL_SUCCESS_TITLE
+from swo_aws_extension.constants import BILLING_JOURNAL_SUCCESS_TITLE, AttachmentFormatEnum
 from swo_aws_extension.swo.notifications.teams import Button
 
 MODULE = "swo_aws_extension.billing.journal_manager"
@@ -79,7 +80,7 @@ def test_upload_journal(mocker, manager, mock_billing_client):
     expected_bytesio = BytesIO(b'{"test": 1}\n{"test": 1}\n')
     mocker.patch(f"{MODULE}.BytesIO", return_value=expected_bytesio)
 
-    manager.upload_journal("JRN-123", [line_mock, line_mock])  # act
+    manager.upload_journal(Journal(id="JRN-123", status="Draft"), [line_mock, line_mock])  # act
 
     mock_billing_client.journal.upload.assert_called_once_with(
         "JRN-123", expected_bytesio, "journal.jsonl"
@@ -98,20 +99,21 @@ def test_notify_success(manager, mock_context):
     )
 
 
-def test_upload_attachments_uploads_report_with_data(mocker, manager, mock_billing_client):
+def test_upload_attachments_uploads_report_with_data(
+    mocker, manager, mock_context, mock_billing_client
+):
     report = OrganizationReport(
         organization_data={"usage": [{"key": "value"}]},
         accounts_data={},
     )
-    expected_bytesio = mocker.MagicMock(spec=BytesIO)
-    mocker.patch(f"{MODULE}.BytesIO", return_value=expected_bytesio)
+    mock_context.config.billing_attachment_format = AttachmentFormatEnum.JSON_GZIP
 
     manager.upload_attachments("JRN-001", {"AGR-1": report})  # act
 
     mock_billing_client.journal.attachments("JRN-001").upload.assert_called_once_with(
-        filename="AGR-1.json",
-        mimetype="application/json",
-        file=expected_bytesio,
+        filename="AGR-1.json.gz",
+        mimetype="application/gzip",
+        file=mocker.ANY,
         attachment=mocker.ANY,
     )
 
@@ -135,17 +137,84 @@ def test_upload_attachments_logs_error_on_failure(manager, mock_billing_client):
     mock_billing_client.journal.attachments("JRN-001").upload.assert_called_once()
 
 
-def test_serialize_default_with_datetime():
-    datetime_value = dt.datetime.fromisoformat("2025-10-15T12:30:00+00:00")
+def test_upload_journal_records_digest(mocker, manager, mock_billing_client):
+    line_mock = mocker.MagicMock(spec=JournalLine)
+    line_mock.to_jsonl.return_value = '{"test": 1}\n'
+    attachments_client = mock_billing_client.journal.attachments("JRN-123")
+    attachments_client.all.return_value = [
+        {"id": "ATT-1", "name": "journal.jsonl.sha256", "description": "(sha256:outdated)"},
+    ]
+    digest = hashlib.sha256(b'{"test": 1}\n').hexdigest()
+
+    manager.upload_journal(Journal(id="JRN-123", status="Draft"), [line_mock])  # act
+
+    mock_billing_client.journal.upload.assert_called_once()
+    attachments_client.upload.assert_called_once_with(
+        filename="journal.jsonl.sha256",
+        mimetype="text/plain",
+        file=mocker.ANY,
+        attachment={
+            "name": "journal.jsonl.sha256",
+            "description": f"Digest of the journal file (sha256:{digest})",
+        },
+    )
+    attachments_client.delete.assert_called_once_with("ATT-1")
+
+
+def test_upload_journal_skips_unchanged_file(mocker, manager, mock_billing_client):
+    line_mock = mocker.MagicMock(spec=JournalLine)
+    line_mock.to_jsonl.return_value = '{"test": 1}\n'
+    digest = hashlib.sha256(b'{"test": 1}\n').hexdigest()
+    attachments_client = mock_billing_client.journal.attachments("JRN-123")
+    attachments_client.all.return_value = [
+        {"id": "ATT-1", "name": "journal.jsonl.sha256", "description": f"(sha256:{digest})"},
+    ]
+
+    manager.upload_journal(Journal(id="JRN-123", status="Draft"), [line_mock])  # act
+
+    mock_billing_client.journal.upload.assert_not_called()
+    attachments_client.upload.assert_not_called()
 
-    result = serialize_default(datetime_value)  # act
 
-    assert result == "2025-10-15T12:30:00+00:00"
+def test_get_pending_journal_uses_journal_index(mock_context, mock_billing_client):
+    journal_index = JournalIndex([
+        {"id": "JRN-001", "status": "Draft", "authorization": {"id": "AUTH-123"}},
+    ])
+    manager = JournalManager(mock_context, "AUTH-123", journal_index)
 
+    result = manager.get_pending_journal()
 
-def test_serialize_default_with_non_datetime():
-    decimal_value = Decimal("123.45")
+    assert result.id == "JRN-001"
+    mock_billing_client.journal.query.assert_not_called()
+
+
+def test_create_new_journal_uses_journal_index(mock_context, mock_billing_client):
+    journal_index = JournalIndex([
+        {"id": "JRN-001", "status": "Completed", "authorization": {"id": "AUTH-123"}},
+    ])
+    mock_billing_client.journal.create.return_value = {"id": "JRN-NEW", "status": "Draft"}
+    manager = JournalManager(mock_context, "AUTH-123", journal_index)
+
+    result = manager.create_new_journal()
+
+    assert result.id == "JRN-NEW"
+    assert journal_index.count_journals("AUTH-123") == 2
+    journal_create = mock_billing_client.journal.create
+    assert journal_create.call_args.args[0]["name"] == "1 October 2025 BT #2"
+    mock_billing_client.journal.query.assert_not_called()
+
+
+def test_upload_journal_uploads_unchanged_file_of_error_journal(
+    mocker, manager, mock_billing_client
+):
+    line_mock = mocker.MagicMock(spec=JournalLine)
+    line_mock.to_jsonl.return_value = '{"test": 1}\n'
+    digest = hashlib.sha256(b'{"test": 1}\n').hexdigest()
+    attachments_client = mock_billing_client.journal.attachments("JRN-123")
+    attachments_client.all.return_value = [
+        {"id": "ATT-1", "name": "journal.jsonl.sha256", "description": f"(sha256:{digest})"},
+    ]
 
-    result = serialize_default(decimal_value)  # act
+    manager.upload_journal(Journal(id="JRN-123", status="Error"), [line_mock])  # act
 
-    assert result == "123.45"
+    mock_billing_client.journal.upload.assert_called_once()
@@ -0,0 +1,109 @@
+from decimal import Decimal
+
+import pytest
+
+from swo_aws_extension.billing.models.journal_result import BillingReportRow, PlsMismatch
+from swo_aws_extension.billing.period_report import merge_shard_reports, send_period_report
+from swo_aws_extension.billing.report_row_sink import BillingReportRowSink
+from swo_aws_extension.billing.shards import BillingShard, ShardOutputStore
+from swo_aws_extension.constants import BILLING_JOURNAL_ERROR_TITLE
+
+MODULE = "swo_aws_extension.billing.period_report"
+
+
+def _build_row(authorization_id):
+    return BillingReportRow(
+        authorization_id=authorization_id,
+        pma="PMA-1",
+        agreement_id="AGR-1",
+        mpa="MPA-1",
+        service_name="EC2",
+        pp=Decimal("10.5"),
+        sp=Decimal("11.5"),
+        currency="USD",
+        invoice_id="INV-1",
+        invoice_entity="INV-E1",
+        exchange_rate=Decimal("1.2"),
+        spp_discount=Decimal("-1.0"),
+        spp_discount_pct=Decimal("0.087"),
+    )
+
+
+@pytest.fixture
+def mock_report_creator_cls(mocker):
+    return mocker.patch(f"{MODULE}.BillingReportCreator", autospec=True)
+
+
+@pytest.fixture
+def row_sink():
+    with BillingReportRowSink() as sink:
+        yield sink
+
+
+def test_send_period_report(mock_context, mock_report_creator_cls, row_sink):
+    mock_context.dry_run = False
+    row_sink.append([_build_row("AUT-1")])
+    mismatch = PlsMismatch(agreement_id="AGR-1", pls_in_order=True, report_has_enterprise=False)
+
+    send_period_report(mock_context, row_sink, [mismatch])  # act
+
+    mock_context.notifier.send_warning.assert_called_once_with(
+        title="PLS Mismatch Summary",
+        text=f"1 agreement(s) with PLS mismatch:\n\n• {mismatch.description}",
+    )
+    mock_report_creator_cls.return_value.create_and_notify_teams.assert_called_once_with(
+        str(mock_context.billing_period), row_sink
+    )
+
+
+def test_send_period_report_dry_run_skips_report(mock_context, mock_report_creator_cls, row_sink):
+    mock_context.dry_run = True
+    row_sink.append([_build_row("AUT-1")])
+
+    send_period_report(mock_context, row_sink, [])  # act
+
+    mock_report_creator_cls.assert_not_called()
+    mock_context.notifier.send_warning.assert_not_called()
+
+
+def test_merge_shard_reports(mocker, mock_context, mock_report_creator_cls, tmp_path):
+    mock_context.dry_run = False
+    mock_context.shard_count = 2
+    shard_outputs = ShardOutputStore(tmp_path, "2025-11-03")
+    for shard_index in range(2):
+        with BillingReportRowSink() as shard_row_sink:
+            shard_row_sink.append([_build_row(f"AUT-{shard_index}")])
+            shard_outputs.write(
+                str(BillingShard(shard_index, 2)), mock_context.billing_period, shard_row_sink, []
+            )
+    merged_row_counts = []
+    mock_create = mock_report_creator_cls.return_value.create_and_notify_teams
+    mock_create.side_effect = lambda billing_period_str, row_sink: merged_row_counts.append(
+        row_sink.row_count
+    )
+
+    merge_shard_reports(mock_context, shard_outputs, ["shard-0-of-2", "shard-1-of-2"])  # act
+
+    mock_create.assert_called_once_with(str(mock_context.billing_period), mocker.ANY)
+    assert merged_row_counts == [2]
+    mock_context.notifier.send_error.assert_not_called()
+
+
+def test_merge_shard_reports_with_missing_outputs(mock_context, mock_report_creator_cls, tmp_path):
+    mock_context.shard_count = 3
+    shard_outputs = ShardOutputStore(tmp_path, "2025-11-03")
+    with BillingReportRowSink() as shard_row_sink:
+        shard_outputs.write("shard-1-of-3", mock_context.billing_period, shard_row_sink, [])
+
+    merge_shard_reports(
+        mock_context, shard_outputs, ["shard-0-of-3", "shard-1-of-3", "shard-2-of-3"]
+    )  # act
+
+    mock_context.notifier.send_error.assert_called_once_with(
+        BILLING_JOURNAL_ERROR_TITLE,
+        (
+            f"Cannot merge the billing report for {mock_context.billing_period}: the outputs "
+            "of shard-0-of-3, shard-2-of-3 have not been written."
+        ),
+    )
+    mock_report_creator_cls.assert_not_called()
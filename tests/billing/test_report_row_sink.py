@@ -0,0 +1,80 @@
+from decimal import Decimal
+
+import pytest
+
+from swo_aws_extension.billing.models.journal_result import BillingReportRow
+from swo_aws_extension.billing.report_row_sink import BillingReportRowSink, load_rows, save_rows
+
+
+def _build_row(authorization_id, linked_account=""):
+    return BillingReportRow(
+        authorization_id=authorization_id,
+        pma="PMA-1",
+        agreement_id="AGR-1",
+        mpa="MPA-1",
+        service_name="EC2",
+        pp=Decimal("10.5"),
+        sp=Decimal("11.5"),
+        currency="USD",
+        invoice_id="INV-1",
+        invoice_entity="INV-E1",
+        exchange_rate=Decimal("1.2"),
+        spp_discount=Decimal("-1.0"),
+        spp_discount_pct=Decimal("0.087"),
+        linked_account=linked_account,
+    )
+
+
+@pytest.fixture
+def row_sink():
+    with BillingReportRowSink(max_memory_size=1) as sink:
+        yield sink
+
+
+def test_append_keeps_rows_in_order(row_sink):
+    rows = [_build_row("AUTH-1"), _build_row("AUTH-2")]
+    row_sink.append(rows[:1])
+
+    row_sink.append(rows[1:])  # act
+
+    assert row_sink.row_count == 2
+    assert list(row_sink.iter_rows()) == rows
+
+
+def test_append_keeps_rows_by_account_apart(row_sink):
+    row = _build_row("AUTH-1")
+    row_by_account = _build_row("AUTH-1", linked_account="ACC-001")
+
+    row_sink.append([row], [row_by_account])  # act
+
+    assert row_sink.row_by_account_count == 1
+    assert list(row_sink.iter_rows()) == [row]
+    assert list(row_sink.iter_rows_by_account()) == [row_by_account]
+
+
+def test_iter_rows_can_be_read_again(row_sink):
+    row_sink.append([_build_row("AUTH-1")])
+    list(row_sink.iter_rows())
+
+    result = list(row_sink.iter_rows())
+
+    assert [row.authorization_id for row in result] == ["AUTH-1"]
+
+
+def test_append_after_reading_adds_to_the_end(row_sink):
+    row_sink.append([_build_row("AUTH-1")])
+    list(row_sink.iter_rows())
+
+    row_sink.append([_build_row("AUTH-2")])  # act
+
+    assert [row.authorization_id for row in row_sink.iter_rows()] == ["AUTH-1", "AUTH-2"]
+
+
+def test_saved_rows_are_loaded_back(tmp_path):
+    rows = [_build_row("AUTH-1"), _build_row("AUTH-2", linked_account="ACC-001")]
+    rows_path = tmp_path / "rows.jsonl"
+
+    row_count = save_rows(rows, rows_path)  # act
+
+    assert row_count == 2
+    assert list(load_rows(rows_path)) == rows
@@ -0,0 +1,30 @@
+from swo_aws_extension.billing.models.usage import OrganizationReport
+from swo_aws_extension.billing.report_store import ReportStore
+
+
+def test_create_report_uses_a_new_file_per_report(tmp_path):
+    report_store = ReportStore(tmp_path / "reports")
+
+    result = [report_store.create_report(), report_store.create_report()]
+
+    assert result[0].path != result[1].path
+    assert all(report.path.parent == tmp_path / "reports" for report in result)
+    assert all(report.path.exists() for report in result)
+
+
+def test_discard_removes_report_file(tmp_path):
+    report_store = ReportStore(tmp_path)
+    report = report_store.create_report()
+    report.add_organization_data("INVOICES", [{"id": "INV-1"}])
+
+    report_store.discard(report)  # act
+
+    assert not report.path.exists()
+
+
+def test_discard_ignores_in_memory_report(tmp_path):
+    report_store = ReportStore(tmp_path)
+
+    report_store.discard(OrganizationReport())  # act
+
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,109 @@
+from decimal import Decimal
+
+import pytest
+
+from swo_aws_extension.billing.models.journal_result import BillingReportRow, PlsMismatch
+from swo_aws_extension.billing.report_row_sink import BillingReportRowSink
+from swo_aws_extension.billing.shards import BillingShard, ShardOutputStore, get_shard_index
+from swo_aws_extension.models import BillingPeriod
+
+BILLING_PERIOD = BillingPeriod(start_date="2025-10-01", end_date="2025-11-01")
+
+
+def _build_row(authorization_id, linked_account=""):
+    return BillingReportRow(
+        authorization_id=authorization_id,
+        pma="PMA-1",
+        agreement_id="AGR-1",
+        mpa="MPA-1",
+        service_name="EC2",
+        pp=Decimal("10.5"),
+        sp=Decimal("11.5"),
+        currency="USD",
+        invoice_id="INV-1",
+        invoice_entity="INV-E1",
+        exchange_rate=Decimal("1.2"),
+        spp_discount=Decimal("-1.0"),
+        spp_discount_pct=Decimal("0.087"),
+        linked_account=linked_account,
+    )
+
+
+def _write_shard(shard_outputs, output_name, authorization_id, pls_mismatches=()):
+    with BillingReportRowSink() as row_sink:
+        row_sink.append(
+            [_build_row(authorization_id)], [_build_row(authorization_id, linked_account="ACC-1")]
+        )
+        shard_outputs.write(output_name, BILLING_PERIOD, row_sink, list(pls_mismatches))
+
+
+@pytest.fixture
+def shard_outputs(tmp_path):
+    return ShardOutputStore(tmp_path, "2025-11-03")
+
+
+def test_get_shard_index_is_stable():
+    result = get_shard_index("AUT-1234-5678", 4)
+
+    assert result == 1
+
+
+def test_shard_name():
+    result = str(BillingShard(index=1, count=3))
+
+    assert result == "shard-1-of-3"
+
+
+def test_shards_split_every_authorization_once():
+    authorizations = [{"id": f"AUT-{number}"} for number in range(100)]
+    shards = [BillingShard(index=shard_index, count=3) for shard_index in range(3)]
+
+    result = [shard.select_authorizations(authorizations) for shard in shards]
+
+    billed_ids = sorted(
+        authorization["id"]
+        for shard_authorizations in result
+        for authorization in shard_authorizations
+    )
+    assert billed_ids == sorted(authorization["id"] for authorization in authorizations)
+    assert all(result)
+
+
+def test_merge_combines_the_outputs_of_every_shard(shard_outputs):
+    mismatch = PlsMismatch(agreement_id="AGR-1", pls_in_order=True, report_has_enterprise=False)
+    _write_shard(shard_outputs, "shard-0-of-2", "AUT-1", [mismatch])
+    _write_shard(shard_outputs, "shard-1-of-2", "AUT-2")
+
+    with BillingReportRowSink() as row_sink:
+        result = shard_outputs.merge(BILLING_PERIOD, ["shard-0-of-2", "shard-1-of-2"], row_sink)
+
+        assert result == [mismatch]
+        assert [row.authorization_id for row in row_sink.iter_rows()] == ["AUT-1", "AUT-2"]
+        assert row_sink.row_by_account_count == 2
+
+
+def test_write_replaces_previous_outputs_of_shard(shard_outputs):
+    _write_shard(shard_outputs, "AUT-1", "AUT-1")
+
+    _write_shard(shard_outputs, "AUT-1", "AUT-2")  # act
+
+    with BillingReportRowSink() as row_sink:
+        shard_outputs.merge(BILLING_PERIOD, ["AUT-1"], row_sink)
+        assert [row.authorization_id for row in row_sink.iter_rows()] == ["AUT-2"]
+
+
+def test_get_missing_outputs(shard_outputs):
+    _write_shard(shard_outputs, "AUT-2", "AUT-2")
+
+    result = shard_outputs.get_missing_outputs(BILLING_PERIOD, ["AUT-1", "AUT-2", "AUT-3"])
+
+    assert result == ["AUT-1", "AUT-3"]
+
+
+def test_get_missing_outputs_ignores_outputs_of_other_runs(tmp_path):
+    _write_shard(ShardOutputStore(tmp_path, "2025-11-02"), "AUT-1", "AUT-1")
+    shard_outputs = ShardOutputStore(tmp_path, "2025-11-03")
+
+    result = shard_outputs.get_missing_outputs(BILLING_PERIOD, ["AUT-1"])
+
+    assert result == ["AUT-1"]
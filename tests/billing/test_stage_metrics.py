@@ -0,0 +1,99 @@
+import contextlib
+
+import pytest
+
+from swo_aws_extension.billing.stage_metrics import (
+    StageCounts,
+    StageMetrics,
+    collect_stage_metrics,
+    measure_stage,
+)
+from swo_aws_extension.constants import BillingStageEnum
+
+MODULE = "swo_aws_extension.billing.stage_metrics"
+UPLOAD_SECONDS = 0.25
+
+
+def _measure_call(stage, row_count=0, line_count=0, byte_count=0):
+    with measure_stage(stage) as stage_counts:
+        stage_counts.row_count = row_count
+        stage_counts.line_count = line_count
+        stage_counts.byte_count = byte_count
+
+
+def _measure_calls():
+    _measure_call(BillingStageEnum.JOURNAL_UPLOAD, byte_count=10)
+    _measure_call(BillingStageEnum.COST_EXPLORER, row_count=3)
+    _measure_call(BillingStageEnum.COST_EXPLORER, row_count=4)
+
+
+def _fail_call():
+    with measure_stage(BillingStageEnum.INVOICES):
+        raise ValueError("failed")
+
+
+def _collect_totals(measured_code):
+    with collect_stage_metrics() as stage_metrics:
+        with contextlib.suppress(ValueError):
+            measured_code()
+        return stage_metrics.totals
+
+
+def test_measure_stage_collects_totals():
+    result = _collect_totals(_measure_calls)
+
+    assert list(result) == [BillingStageEnum.COST_EXPLORER, BillingStageEnum.JOURNAL_UPLOAD]
+    cost_explorer_totals = result[BillingStageEnum.COST_EXPLORER]
+    assert (cost_explorer_totals.calls, cost_explorer_totals.row_count) == (2, 7)
+    assert result[BillingStageEnum.JOURNAL_UPLOAD].byte_count == 10
+
+
+def test_measure_stage_records_failed_calls():
+    result = _collect_totals(_fail_call)
+
+    assert result[BillingStageEnum.INVOICES].calls == 1
+
+
+def test_measure_stage_reraises_errors():
+    with pytest.raises(ValueError, match="failed"):
+        _fail_call()
+
+
+def test_measure_stage_emits_opentelemetry_metrics(mocker):
+    mock_calls = mocker.patch(f"{MODULE}.stage_calls", autospec=True)
+    mock_lines = mocker.patch(f"{MODULE}.stage_lines", autospec=True)
+
+    _measure_call(BillingStageEnum.LINE_GENERATION, line_count=5)  # act
+
+    mock_calls.add.assert_called_once_with(1, {"stage": "line_generation"})
+    mock_lines.add.assert_called_once_with(5, {"stage": "line_generation"})
+
+
+def test_collect_stage_metrics_ignores_calls_before_it():
+    _measure_call(BillingStageEnum.INVOICES, row_count=1)
+
+    result = _collect_totals(lambda: None)
+
+    assert result == {}
+
+
+def test_format_summary():
+    stage_metrics = StageMetrics()
+    stage_metrics.record(BillingStageEnum.INVOICES, 1.5, StageCounts(row_count=2))  # noqa: WPS432
+
+    result = stage_metrics.format_summary().splitlines()
+
+    assert result[0].split() == ["Stage", "Calls", "Seconds", "Rows", "Lines", "Bytes"]
+    assert result[1].split() == ["invoices", "1", "1.50", "2", "0", "0"]
+
+
+def test_to_facts_section():
+    stage_metrics = StageMetrics()
+    stage_metrics.record(
+        BillingStageEnum.JOURNAL_UPLOAD, UPLOAD_SECONDS, StageCounts(byte_count=100)
+    )
+
+    result = stage_metrics.to_facts_section()
+
+    assert result.title == "Billing pipeline stages"
+    assert result.data == {"journal_upload": "1 calls in 0.25s, 0 rows, 0 lines, 100 bytes"}
@@ -16,6 +16,7 @@ from swo_aws_extension.constants import (
     SupportTypesEnum,
 )
 from swo_aws_extension.swo.ccp.client import CCPClient
+from swo_aws_extension.swo.mpt.catalog import invalidate_catalog_cache
 
 PARAM_COMPANY_NAME = "ACME Inc"
 AWESOME_PRODUCT = "Awesome product"
@@ -219,6 +220,11 @@ def force_test_settings():
         yield
 
 
+@pytest.fixture(autouse=True)
+def clear_catalog_cache():
+    invalidate_catalog_cache()
+
+
 @pytest.fixture
 def aws_client_factory(mocker, settings):
     def factory(config, mpa_account_id, role_name):
@@ -1157,14 +1163,15 @@ def webhook(settings):
 
 @pytest.fixture
 def mock_get_webhook(mocker, webhook):
-    return mocker.patch("swo_aws_extension.extension.get_webhook", return_value=webhook, spec=True)
+    return mocker.patch(
+        "swo_aws_extension.extension.fetch_webhook", return_value=webhook, spec=True
+    )
 
 
 @pytest.fixture
 def extension_settings(settings):
-    current_extension_config = copy.copy(settings.EXTENSION_CONFIG)
-    yield settings
-    settings.EXTENSION_CONFIG = current_extension_config
+    settings.EXTENSION_CONFIG = copy.copy(settings.EXTENSION_CONFIG)
+    return settings
 
 
 @pytest.fixture
@@ -1178,7 +1185,7 @@ def ffc_client_settings(extension_settings):
 
 @pytest.fixture
 def mock_validate_order(mocker):
-    return mocker.patch("swo_aws_extension.extension.validate_order", spec=True)
+    return mocker.patch("swo_aws_extension.extension.validate_order_memoized", spec=True)
 
 
 @pytest.fixture
@@ -0,0 +1,14 @@
+from io import BytesIO
+
+from swo_aws_extension.file_builder.csv_stream import write_csv_stream
+
+
+def test_write_csv_stream_writes_header_and_rows():
+    stream = BytesIO()
+    rows = iter([["1", "a,b"], ["2", "ü"]])
+
+    result = write_csv_stream(["id", "name"], rows, stream)
+
+    assert result == 2
+    assert stream.getvalue().decode() == 'id,name\r\n1,"a,b"\r\n2,ü\r\n'
+    assert not stream.closed
@@ -0,0 +1,24 @@
+import gzip
+
+from swo_aws_extension.file_builder.gzip_builder import SpooledGzipBuilder
+
+
+def test_spooled_gzip_builder_compresses_stream():
+    builder = SpooledGzipBuilder(max_memory_size=1)
+    with builder.open() as gzip_stream:
+        gzip_stream.write(b"first line\n")
+        gzip_stream.write(b"second line\n")
+
+    result = gzip.decompress(builder.get_file_content().read())
+
+    assert result == b"first line\nsecond line\n"
+
+
+def test_spooled_gzip_builder_writes_no_timestamp():
+    builder = SpooledGzipBuilder()
+    with builder.open() as gzip_stream:
+        gzip_stream.write(b"line\n")
+
+    result = builder.get_file_content().read()
+
+    assert result[4:8] == b"\x00\x00\x00\x00"
@@ -0,0 +1,41 @@
+import datetime as dt
+import io
+import json
+from decimal import Decimal
+
+from swo_aws_extension.file_builder.json_stream import dump_json_stream, serialize_default
+
+
+def test_dump_json_stream_writes_compact_json():
+    stream = io.BytesIO()
+
+    dump_json_stream({"name": "café", "items": [1, 2]}, stream)  # act
+
+    assert stream.getvalue() == json.dumps(
+        {"name": "café", "items": [1, 2]}, separators=(",", ":")
+    ).encode("utf-8")
+    assert not stream.closed
+
+
+def test_dump_json_stream_uses_default_serializer():
+    stream = io.BytesIO()
+
+    dump_json_stream({"amount": Decimal("1.50")}, stream, default=str)  # act
+
+    assert json.loads(stream.getvalue()) == {"amount": "1.50"}
+
+
+def test_serialize_default_with_datetime():
+    datetime_value = dt.datetime.fromisoformat("2025-10-15T12:30:00+00:00")
+
+    result = serialize_default(datetime_value)  # act
+
+    assert result == "2025-10-15T12:30:00+00:00"
+
+
+def test_serialize_default_with_non_datetime():
+    decimal_value = Decimal("123.45")
+
+    result = serialize_default(decimal_value)  # act
+
+    assert result == "123.45"
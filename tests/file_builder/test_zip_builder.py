@@ -1,6 +1,6 @@
 import zipfile
 
-from swo_aws_extension.file_builder.zip_builder import InMemoryZipBuilder
+from swo_aws_extension.file_builder.zip_builder import InMemoryZipBuilder, SpooledZipBuilder
 
 
 def test_in_memory_zip_builder_add_and_get_zip():
@@ -21,3 +21,34 @@ def test_in_memory_zip_builder_add_and_get_zip():
         '{"account1": "value1"}',
         '{"account2": "value2"}',
     )
+
+
+def test_spooled_zip_builder_streams_entries():
+    builder = SpooledZipBuilder(max_memory_size=1)
+    builder.write("report1.jsonl", '{"account1": "value1"}')
+    with builder.open("report2.jsonl") as entry_stream:
+        entry_stream.write(b'{"account2": ')
+        entry_stream.write(b'"value2"}')
+    zip_file = builder.get_file_content()
+
+    with zipfile.ZipFile(zip_file, "r") as zf:
+        result = (
+            zf.read("report1.jsonl").decode(),
+            zf.read("report2.jsonl").decode(),
+        )
+
+    assert result == ('{"account1": "value1"}', '{"account2": "value2"}')
+
+
+def test_spooled_zip_builder_streams_entries_with_fixed_timestamp():
+    builder = SpooledZipBuilder()
+    with builder.open("report.jsonl") as entry_stream:
+        entry_stream.write(b"{}")
+
+    with zipfile.ZipFile(builder.get_file_content(), "r") as zf:
+        result = zf.getinfo("report.jsonl")
+
+    assert (result.date_time, result.compress_type) == (
+        (1980, 1, 1, 0, 0, 0),
+        zipfile.ZIP_DEFLATED,
+    )
@@ -8,19 +8,20 @@ from swo_aws_extension.flows.jobs.finops_entitlements_processor import (
     FinOpsEntitlementsProcessor,
 )
 from swo_aws_extension.swo.finops.errors import FinOpsError
+from swo_aws_extension.work_queue.worker import QueueWorker
 
 MPT_BASE_URL = "https://localhost/public"
 AGREEMENTS_URL = (
     f"{MPT_BASE_URL}/v1/commerce/agreements?"
     "and(eq(status,'Active'),in(product.id,(PRD-1111-1111)))"
     "&select=parameters,subscriptions,authorization.externalIds.operations"
-    "&limit=10&offset=0"
+    "&limit=100&offset=0"
 )
 AGREEMENTS_WITH_IDS_URL = (
     f"{MPT_BASE_URL}/v1/commerce/agreements?"
     "and(in(id,(AGR-0001)),eq(status,'Active'),in(product.id,(PRD-1111-1111)))"
     "&select=parameters,subscriptions,authorization.externalIds.operations"
-    "&limit=10&offset=0"
+    "&limit=100&offset=0"
 )
 PRODUCT_IDS = ("PRD-1111-1111",)
 FROZEN_DATE = "2025-12-22 00:00:00"
@@ -115,6 +116,29 @@ def test_sync_creates_new_entitlement(
     mock_entitlements_table.save.assert_called_once()
 
 
+def test_sync_through_work_queue(
+    mocker,
+    agreement_factory,
+    mock_agreements_response,
+    mock_entitlements_table,
+    mock_finops_client,
+    finops_processor,
+):
+    agreement = agreement_factory()
+    mock_agreements_response(agreements=[agreement])
+    queued_agreements = []
+    mock_queue_worker = mocker.MagicMock(spec=QueueWorker)
+    mock_queue_worker.run.side_effect = lambda payloads, _process: queued_agreements.extend(
+        payloads
+    )
+    processor = finops_processor()
+
+    processor.sync(mock_queue_worker)  # act
+
+    assert queued_agreements == [agreement]
+    mock_entitlements_table.get_by_agreement_id.assert_not_called()
+
+
 @freeze_time(FROZEN_DATE)
 def test_sync_updates_existing(
     mocker,
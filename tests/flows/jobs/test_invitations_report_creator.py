@@ -17,7 +17,7 @@ def external_mocks(mocker):
     mocker.patch(f"{MODULE}.AWSClient", autospec=True, return_value=mock_aws_client)
 
     mock_blob_uploader = mocker.MagicMock(spec=AzureBlobUploader)
-    mock_blob_uploader.upload_and_get_sas_url.return_value = (
+    mock_blob_uploader.upload_stream_and_get_sas_url.return_value = (
         "https://acc.blob.core.windows.net/container/blob.xlsx?sas-token"
     )
     mocker.patch(f"{MODULE}.AzureBlobUploader", autospec=True, return_value=mock_blob_uploader)
@@ -65,7 +65,7 @@ def _make_invitation(
 def _patch_authorizations_and_agreements(
     mocker, report_creator, authorizations, agreements, orders
 ):
-    mocker.patch(f"{MODULE}.get_authorizations", autospec=True, return_value=authorizations)
+    mocker.patch(f"{MODULE}.iter_authorizations", autospec=True, return_value=authorizations)
     mocker.patch(f"{MODULE}.get_agreements_by_query", autospec=True, return_value=agreements)
     mocker.patch(f"{MODULE}.get_orders_by_query", autospec=True, return_value=orders)
 
@@ -106,9 +106,9 @@ def test_create_and_notify_teams_happy_path(
 
     report_creator.create_and_notify_teams()  # act
 
-    external_mocks["blob_uploader"].upload_and_get_sas_url.assert_called_once()
-    external_mocks["excel_builder"].build_from_rows.assert_called_once()
-    built_rows = external_mocks["excel_builder"].build_from_rows.call_args[0][0]
+    external_mocks["blob_uploader"].upload_stream_and_get_sas_url.assert_called_once()
+    external_mocks["excel_builder"].stream_from_rows.assert_called_once()
+    built_rows = external_mocks["excel_builder"].stream_from_rows.call_args[0][0]
     assert len(built_rows) == 1
     expected_row = [
         "651706759263",
@@ -139,7 +139,7 @@ def test_no_authorizations(mocker, report_creator, external_mocks):
 
     report_creator.create_and_notify_teams()  # act
 
-    external_mocks["blob_uploader"].upload_and_get_sas_url.assert_called_once()
+    external_mocks["blob_uploader"].upload_stream_and_get_sas_url.assert_called_once()
     assert "0" in external_mocks["teams"].send_success.call_args.args[1]
 
 
@@ -171,7 +171,7 @@ def test_aws_error_sends_teams_error_and_continues(
         {"id": "AUT-FAIL", "externalIds": {"operations": "111"}},
         {"id": "AUT-OK", "externalIds": {"operations": "222"}},
     ]
-    mocker.patch(f"{MODULE}.get_authorizations", autospec=True, return_value=authorizations)
+    mocker.patch(f"{MODULE}.iter_authorizations", autospec=True, return_value=authorizations)
     ok_client = mocker.MagicMock(spec=AWSClient)
     ok_client.get_inbound_responsibility_transfers.return_value = []
     mocker.patch(f"{MODULE}.AWSClient", side_effect=[AWSError("boom"), ok_client])
@@ -217,7 +217,7 @@ def test_invitation_without_matching_agreement(
 
     report_creator.create_and_notify_teams()  # act
 
-    external_mocks["blob_uploader"].upload_and_get_sas_url.assert_called_once()
+    external_mocks["blob_uploader"].upload_stream_and_get_sas_url.assert_called_once()
 
 
 def test_agreement_without_matching_invitation(
@@ -252,7 +252,7 @@ def test_agreement_without_matching_invitation(
 
     report_creator.create_and_notify_teams()  # act
 
-    external_mocks["blob_uploader"].upload_and_get_sas_url.assert_called_once()
+    external_mocks["blob_uploader"].upload_stream_and_get_sas_url.assert_called_once()
 
 
 def test_invitation_with_no_dates(
@@ -288,7 +288,7 @@ def test_invitation_with_no_dates(
 
     report_creator.create_and_notify_teams()  # act
 
-    external_mocks["blob_uploader"].upload_and_get_sas_url.assert_called_once()
+    external_mocks["blob_uploader"].upload_stream_and_get_sas_url.assert_called_once()
 
 
 def test_agreement_with_none_authorization(
@@ -323,7 +323,7 @@ def test_agreement_with_none_authorization(
 
     report_creator.create_and_notify_teams()  # act
 
-    external_mocks["blob_uploader"].upload_and_get_sas_url.assert_called_once()
+    external_mocks["blob_uploader"].upload_stream_and_get_sas_url.assert_called_once()
 
 
 def test_agreement_with_none_mpa_account_id(
@@ -358,7 +358,7 @@ def test_agreement_with_none_mpa_account_id(
 
     report_creator.create_and_notify_teams()  # act
 
-    external_mocks["blob_uploader"].upload_and_get_sas_url.assert_called_once()
+    external_mocks["blob_uploader"].upload_stream_and_get_sas_url.assert_called_once()
 
 
 def test_unmatched_invitation_with_no_dates(
@@ -394,7 +394,7 @@ def test_unmatched_invitation_with_no_dates(
 
     report_creator.create_and_notify_teams()  # act
 
-    external_mocks["blob_uploader"].upload_and_get_sas_url.assert_called_once()
+    external_mocks["blob_uploader"].upload_stream_and_get_sas_url.assert_called_once()
 
 
 def test_invitation_uses_order_data_when_agreement_has_no_matching_transfer_id(
@@ -435,7 +435,7 @@ def test_invitation_uses_order_data_when_agreement_has_no_matching_transfer_id(
 
     report_creator.create_and_notify_teams()  # act
 
-    external_mocks["blob_uploader"].upload_and_get_sas_url.assert_called_once()
+    external_mocks["blob_uploader"].upload_stream_and_get_sas_url.assert_called_once()
 
 
 def test_order_without_transfer_id_is_skipped(
@@ -476,4 +476,4 @@ def test_order_without_transfer_id_is_skipped(
 
     report_creator.create_and_notify_teams()  # act
 
-    external_mocks["blob_uploader"].upload_and_get_sas_url.assert_called_once()
+    external_mocks["blob_uploader"].upload_stream_and_get_sas_url.assert_called_once()
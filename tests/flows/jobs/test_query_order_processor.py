@@ -83,30 +83,6 @@ def test_filter(service: PurchaseOrderQueryService) -> None:
     )
 
 
-def test_has_more_pages_no_orders(service: PurchaseOrderQueryService) -> None:
-    page = None
-
-    result = service.has_more_pages(page)
-
-    assert result is True
-
-
-def test_has_more_pages_true(service: PurchaseOrderQueryService) -> None:
-    page = {"$meta": {"pagination": {"total": 20, "limit": 10, "offset": 0}}}
-
-    result = service.has_more_pages(page)
-
-    assert result is True
-
-
-def test_has_more_pages_false(service: PurchaseOrderQueryService) -> None:
-    page = {"$meta": {"pagination": {"total": 10, "limit": 10, "offset": 0}}}
-
-    result = service.has_more_pages(page)
-
-    assert result is False
-
-
 def test_fetch_orders_success(service: PurchaseOrderQueryService, mock_client: MagicMock) -> None:
     first_page = MagicMock(spec=requests.Response)
     first_page.status_code = 200
@@ -145,8 +121,7 @@ def test_fetch_orders_error_status(
     service: PurchaseOrderQueryService, mock_client: MagicMock
 ) -> None:
     mock_response = MagicMock()
-    mock_response.status_code = 400
-    mock_response.content = b"Bad Request"
+    mock_response.raise_for_status.side_effect = requests.HTTPError("400 Bad Request")
     mock_client.get.return_value = mock_response
 
     result = service.fetch_orders()
@@ -154,6 +129,22 @@ def test_fetch_orders_error_status(
     assert result == []
 
 
+def test_fetch_orders_drops_orders_when_a_page_fails(
+    service: PurchaseOrderQueryService, mock_client: MagicMock
+) -> None:
+    first_page = MagicMock(spec=requests.Response)
+    first_page.json.return_value = {
+        "data": [{"id": "ORD-1"}],
+        "$meta": {"pagination": {"total": 2, "limit": 1, "offset": 0}},
+    }
+    mock_client.get.side_effect = [first_page, requests.RequestException("API Error")]
+    service.page_limit = 1
+
+    result = service.fetch_orders()
+
+    assert result == []
+
+
 def test_get_orders_as_context(mocker: Any, service: PurchaseOrderQueryService) -> None:
     orders = [{"id": "ORD-1", "agreement": {}, "seller": {}, "buyer": {}}]
     mocker.patch.object(service, "fetch_orders", return_value=orders)
@@ -163,3 +154,25 @@ def test_get_orders_as_context(mocker: Any, service: PurchaseOrderQueryService)
     assert len(result) == 1
     assert isinstance(result[0], PurchaseContext)
     assert result[0].order["id"] == "ORD-1"
+
+
+def test_fetch_orders_fetches_every_page_before_processing(
+    service: PurchaseOrderQueryService, mock_client: MagicMock
+) -> None:
+    first_page = MagicMock(spec=requests.Response)
+    first_page.json.return_value = {
+        "data": [{"id": "ORD-1"}],
+        "$meta": {"pagination": {"total": 2, "limit": 1, "offset": 0}},
+    }
+    second_page = MagicMock(spec=requests.Response)
+    second_page.json.return_value = {
+        "data": [{"id": "ORD-2"}],
+        "$meta": {"pagination": {"total": 2, "limit": 1, "offset": 1}},
+    }
+    mock_client.get.side_effect = [first_page, second_page]
+    service.page_limit = 1
+
+    result = service.fetch_orders()
+
+    assert isinstance(result, list)
+    assert mock_client.get.call_count == 2
@@ -42,7 +42,7 @@ def test_setup_context_with_pma(
         return_value=updated_order,
     )
     mocker.patch(
-        "swo_aws_extension.flows.steps.setup_context._paginated",
+        "swo_aws_extension.flows.steps.setup_context.get_product_parameters",
         return_value=product_parameters_factory(),
     )
     context = PurchaseContext.from_order_data(order)
@@ -105,7 +105,7 @@ def test_setup_context_invalid_aws_credentials(
     )
     mocker.patch("swo_aws_extension.flows.steps.setup_context.update_processing_template")
     mocker.patch(
-        "swo_aws_extension.flows.steps.setup_context._paginated",
+        "swo_aws_extension.flows.steps.setup_context.get_product_parameters",
         return_value=product_parameters_factory(),
     )
     order = order_factory()
@@ -135,7 +135,7 @@ def test_setup_context_invalid_apn_credentials(
     )
     mocker.patch("swo_aws_extension.flows.steps.setup_context.update_processing_template")
     mocker.patch(
-        "swo_aws_extension.flows.steps.setup_context._paginated",
+        "swo_aws_extension.flows.steps.setup_context.get_product_parameters",
         return_value=product_parameters_factory(),
     )
     order = order_factory()
@@ -268,7 +268,7 @@ def test_init_template_notify_when_no_phase(
         return_value=order,
     )
     mocker.patch(
-        "swo_aws_extension.flows.steps.setup_context._paginated",
+        "swo_aws_extension.flows.steps.setup_context.get_product_parameters",
         return_value=product_parameters_factory(),
     )
     context = PurchaseContext.from_order_data(order)
@@ -325,8 +325,8 @@ def test_init_parameter_default_values_sets_fulfillment_defaults(
     next_step_mock = mocker.MagicMock(spec=Step)
     mocker.patch("swo_aws_extension.flows.steps.setup_context.AWSClient")
     mocker.patch("swo_aws_extension.flows.steps.setup_context.update_processing_template")
-    mocked_paginated = mocker.patch(
-        "swo_aws_extension.flows.steps.setup_context._paginated",
+    mock_get_product_parameters = mocker.patch(
+        "swo_aws_extension.flows.steps.setup_context.get_product_parameters",
         return_value=product_parameters_factory(),
     )
     fulfillment_parameters = fulfillment_parameters_factory(
@@ -349,8 +349,8 @@ def test_init_parameter_default_values_sets_fulfillment_defaults(
 
     step(mpt_client_mock, context, next_step_mock)  # act
 
-    mocked_paginated.assert_called_once_with(
-        mpt_client_mock, f"catalog/products/{context.product_id}/parameters?phase=Fulfillment"
+    mock_get_product_parameters.assert_called_once_with(
+        mpt_client_mock, context.product_id, "Fulfillment"
     )
     next_step_mock.assert_called_once_with(mpt_client_mock, context)
     assert (
@@ -392,8 +392,8 @@ def test_init_parameter_default_values_skipped_when_phase_is_informed(
     next_step_mock = mocker.MagicMock(spec=Step)
     mocker.patch("swo_aws_extension.flows.steps.setup_context.AWSClient")
     mocker.patch("swo_aws_extension.flows.steps.setup_context.update_processing_template")
-    mocked_paginated = mocker.patch(
-        "swo_aws_extension.flows.steps.setup_context._paginated",
+    mock_get_product_parameters = mocker.patch(
+        "swo_aws_extension.flows.steps.setup_context.get_product_parameters",
         return_value=product_parameters_factory(),
     )
     fulfillment_parameters = fulfillment_parameters_factory(
@@ -412,7 +412,7 @@ def test_init_parameter_default_values_skipped_when_phase_is_informed(
 
     step(mpt_client_mock, context, next_step_mock)  # act
 
-    mocked_paginated.assert_not_called()
+    mock_get_product_parameters.assert_not_called()
     next_step_mock.assert_called_once_with(mpt_client_mock, context)
     assert not get_fulfillment_parameter(
         FulfillmentParametersEnum.SERVICE_DISCOUNT.value, context.order
@@ -444,7 +444,7 @@ def test_strip_whitespace_from_mpa_account(
     mocker.patch("swo_aws_extension.flows.steps.setup_context.AWSClient")
     mocker.patch("swo_aws_extension.flows.steps.setup_context.update_processing_template")
     mocker.patch(
-        "swo_aws_extension.flows.steps.setup_context._paginated",
+        "swo_aws_extension.flows.steps.setup_context.get_product_parameters",
         return_value=product_parameters_factory(),
     )
     order = order_factory(
@@ -475,7 +475,7 @@ def test_reset_ordering_parameter_error_on_master_payer_id(
     mocker.patch("swo_aws_extension.flows.steps.setup_context.AWSClient")
     mocker.patch("swo_aws_extension.flows.steps.setup_context.update_processing_template")
     mocker.patch(
-        "swo_aws_extension.flows.steps.setup_context._paginated",
+        "swo_aws_extension.flows.steps.setup_context.get_product_parameters",
         return_value=product_parameters_factory(),
     )
     order = order_factory(
@@ -0,0 +1,26 @@
+import pytest
+
+from swo_aws_extension.flows.validation.latency import (
+    get_validation_latency,
+    record_validation_latency,
+)
+
+MODULE = "swo_aws_extension.flows.validation.latency"
+
+
+@pytest.mark.parametrize("path", ["cached", "uncached"])
+def test_record_validation_latency(path):
+    previous_count = get_validation_latency()[path].count
+
+    record_validation_latency(path, 0.1)  # act
+
+    assert get_validation_latency()[path].count == previous_count + 1
+
+
+def test_record_validation_latency_logs_percentiles(mocker, caplog):
+    mocker.patch(f"{MODULE}.LATENCY_REPORT_INTERVAL", 1)
+
+    with caplog.at_level("INFO"):
+        record_validation_latency("cached", 0.1)  # act
+
+    assert "Order validation latency: cached p50=" in caplog.text
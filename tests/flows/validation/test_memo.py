@@ -0,0 +1,153 @@
+import pytest
+
+from swo_aws_extension.flows.validation.memo import (
+    get_validation_fingerprint,
+    get_validation_memo,
+    validate_order_memoized,
+)
+
+MODULE = "swo_aws_extension.flows.validation.memo"
+
+
+@pytest.fixture(autouse=True)
+def clear_validation_memo():
+    get_validation_memo.cache_clear()
+    yield
+    get_validation_memo.cache_clear()
+
+
+@pytest.fixture
+def mock_validate_order(mocker):
+    return mocker.patch(
+        f"{MODULE}.validate_order",
+        autospec=True,
+        side_effect=lambda _client, order: {
+            **order,
+            "lines": [{"item": {"id": "ITM-1"}, "quantity": 1}],
+        },
+    )
+
+
+def test_get_validation_fingerprint_ignores_irrelevant_fields(order_factory):
+    order = order_factory()
+    edited_order = {**order, "status": "Querying", "audit": {"updated": "now"}}
+
+    result = get_validation_fingerprint(edited_order)
+
+    assert result == get_validation_fingerprint(order)
+
+
+def test_get_validation_fingerprint_ignores_parameter_errors(order_factory):
+    order = order_factory()
+    edited_order = order_factory()
+    parameter = edited_order["parameters"]["ordering"][0]
+    parameter["error"] = {"id": "AWS001", "message": "Invalid"}
+
+    result = get_validation_fingerprint(edited_order)
+
+    assert result == get_validation_fingerprint(order)
+
+
+def test_get_validation_fingerprint_changes_with_parameters(order_factory):
+    order = order_factory()
+    edited_order = order_factory()
+    edited_order["parameters"]["ordering"][0]["value"] = "changed"
+
+    result = get_validation_fingerprint(edited_order)
+
+    assert result != get_validation_fingerprint(order)
+
+
+def test_validate_order_memoized_reuses_validation(mocker, order_factory, mock_validate_order):
+    client = mocker.MagicMock()
+    validate_order_memoized(client, order_factory())
+    edited_order = {**order_factory(), "status": "Querying"}
+
+    result = validate_order_memoized(client, edited_order)
+
+    assert result == {**edited_order, "lines": [{"item": {"id": "ITM-1"}, "quantity": 1}]}
+    mock_validate_order.assert_called_once()
+
+
+def test_validate_order_memoized_returns_copies(mocker, order_factory, mock_validate_order):
+    client = mocker.MagicMock()
+    validated_order = validate_order_memoized(client, order_factory())
+    validated_order["lines"][0]["quantity"] = 2
+
+    result = validate_order_memoized(client, order_factory())
+
+    assert result["lines"] == [{"item": {"id": "ITM-1"}, "quantity": 1}]
+
+
+def test_validate_order_memoized_adds_ordering_parameters(mocker, order_factory):
+    ordering = [{"externalId": "orderAccountId", "value": "123456789012"}]
+    mocker.patch(
+        f"{MODULE}.validate_order",
+        autospec=True,
+        side_effect=lambda _client, order: {**order, "parameters": {"ordering": ordering}},
+    )
+    order = order_factory()
+    order.pop("parameters")
+
+    result = validate_order_memoized(mocker.MagicMock(), order)
+
+    assert result["parameters"] == {"ordering": ordering}
+
+
+def test_validate_order_memoized_validates_changed_orders(
+    mocker, order_factory, mock_validate_order
+):
+    client = mocker.MagicMock()
+    validate_order_memoized(client, order_factory())
+
+    validate_order_memoized(client, order_factory(order_type="Change"))  # act
+
+    assert mock_validate_order.call_count == 2
+
+
+def test_validate_order_memoized_validates_termination_orders_again(
+    mocker, order_factory, mock_validate_order
+):
+    client = mocker.MagicMock()
+    validate_order_memoized(client, order_factory(order_type="Termination"))
+
+    validate_order_memoized(client, order_factory(order_type="Termination"))  # act
+
+    assert mock_validate_order.call_count == 2
+
+
+def test_validate_order_memoized_does_not_memoize_errors(mocker, order_factory):
+    mock_validate_order = mocker.patch(
+        f"{MODULE}.validate_order",
+        autospec=True,
+        side_effect=[RuntimeError("Unavailable"), order_factory()],
+    )
+    client = mocker.MagicMock()
+
+    with pytest.raises(RuntimeError, match="Unavailable"):
+        validate_order_memoized(client, order_factory())  # act
+
+    assert validate_order_memoized(client, order_factory()) == order_factory()
+    assert mock_validate_order.call_count == 2
+
+
+def test_validate_order_memoized_records_latency(mocker, order_factory, mock_validate_order):
+    mock_record = mocker.patch(f"{MODULE}.record_validation_latency", autospec=True)
+    client = mocker.MagicMock()
+    validate_order_memoized(client, order_factory())
+
+    validate_order_memoized(client, order_factory())  # act
+
+    assert [call.args[0] for call in mock_record.call_args_list] == ["uncached", "cached"]
+
+
+def test_validate_order_memoized_disabled(
+    mocker, extension_settings, order_factory, mock_validate_order
+):
+    extension_settings.EXTENSION_CONFIG["VALIDATION_MEMO_TTL_SECONDS"] = "0"
+    client = mocker.MagicMock()
+    validate_order_memoized(client, order_factory())
+
+    validate_order_memoized(client, order_factory())  # act
+
+    assert mock_validate_order.call_count == 2
@@ -0,0 +1,34 @@
+import json
+
+from django.core.management import call_command
+
+from swo_aws_extension.billing.benchmarks.runner import BillingBenchmark
+
+
+def test_benchmark_billing_generators(tmp_path, capsys):
+    output_path = tmp_path / "benchmark.json"
+
+    call_command(
+        "benchmark_billing_generators",
+        accounts=2,
+        services=2,
+        days=1,
+        repeat=1,
+        output=output_path,
+    )  # act
+
+    benchmark_run = json.loads(output_path.read_text(encoding="utf-8"))
+    assert benchmark_run["scenario"]["accounts"] == 2
+    assert "JournalLine.to_jsonl" in capsys.readouterr().out
+
+
+def test_benchmark_billing_generators_invalid_size(mocker, capsys):
+    mock_benchmark = mocker.patch(
+        "swo_aws_extension.management.commands.benchmark_billing_generators.BillingBenchmark",
+        spec=BillingBenchmark,
+    )
+
+    call_command("benchmark_billing_generators", invoice_entities=0)  # act
+
+    mock_benchmark.assert_not_called()
+    assert "Invalid --invoice-entities" in capsys.readouterr().err
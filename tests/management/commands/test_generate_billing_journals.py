@@ -1,4 +1,5 @@
 from io import StringIO
+from pathlib import Path
 
 import pytest
 from django.core.management import call_command
@@ -8,6 +9,7 @@ from swo_aws_extension.constants import (
     COMMAND_INVALID_BILLING_DATE,
     COMMAND_INVALID_BILLING_DATE_FUTURE,
 )
+from swo_aws_extension.models import BillingPeriod
 
 MODULE = "swo_aws_extension.management.commands.generate_billing_journals"
 
@@ -204,3 +206,271 @@ def test_command_with_invalid_authorization_fails(mock_service, command_output):
     assert "Invalid authorizations id:" in error_output
     assert "PRD-123-123-002" in error_output
     mock_service.return_value.run.assert_not_called()
+
+
+@freeze_time("2026-01-05 00:00:00")
+def test_command_with_data_exports_usage_source(mocker, settings, mock_service, command_output):
+    settings.EXTENSION_CONFIG["BILLING_DATA_EXPORTS_DIR"] = "/data/exports"
+    mock_store_cls = mocker.patch(f"{MODULE}.DataExportsStore", autospec=True)
+
+    call_command(  # act
+        "generate_billing_journals",
+        usage_source="data-exports",
+        stdout=command_output["out"],
+        stderr=command_output["err"],
+    )
+
+    mock_store_cls.assert_called_once_with(Path("/data/exports"))
+    job_context = mock_service.call_args.args[0]
+    assert job_context.data_exports == mock_store_cls.return_value
+
+
+@freeze_time("2026-01-05 00:00:00")
+def test_command_with_data_exports_usage_source_requires_dir(
+    settings, mock_service, command_output
+):
+    settings.EXTENSION_CONFIG["BILLING_DATA_EXPORTS_DIR"] = ""
+
+    call_command(  # act
+        "generate_billing_journals",
+        usage_source="data-exports",
+        stdout=command_output["out"],
+        stderr=command_output["err"],
+    )
+
+    _, error_output = _get_output(command_output)
+    assert "EXT_BILLING_DATA_EXPORTS_DIR must be set" in error_output
+    mock_service.assert_not_called()
+
+
+@freeze_time("2026-01-05 00:00:00")
+def test_command_with_backfill_range(mock_service, command_output):
+    result = call_command(
+        "generate_billing_journals",
+        from_month="2025-10",
+        to_month="2025-12",
+        stdout=command_output["out"],
+        stderr=command_output["err"],
+    )
+
+    assert result is None
+    output, error_output = _get_output(command_output)
+    assert "Start generate_billing_journals for 2025-10 to 2025-12 (all)" in output
+    assert not error_output
+    job_context = mock_service.call_args.args[0]
+    assert job_context.billing_period == BillingPeriod(
+        start_date="2025-10-01", end_date="2026-01-01"
+    )
+    mock_service.return_value.run.assert_called_once()
+
+
+@freeze_time("2026-01-05 00:00:00")
+@pytest.mark.parametrize(
+    ("range_options", "expected_error"),
+    [
+        ({"from_month": "2025-10"}, "Both --from and --to are required for a backfill"),
+        (
+            {"from_month": "2025-10", "to_month": "2025/12"},
+            "Invalid month 2025/12. Must be in YYYY-MM format.",
+        ),
+        (
+            {"from_month": "2025-12", "to_month": "2025-10"},
+            "Invalid range. 2025-12 is after 2025-10.",
+        ),
+        (
+            {"from_month": "2024-12", "to_month": "2025-10"},
+            "Year must be 2025 or higher, got 2024",
+        ),
+        ({"from_month": "2025-10", "to_month": "2026-01"}, COMMAND_INVALID_BILLING_DATE_FUTURE),
+    ],
+)
+def test_command_with_invalid_backfill_range_fails(
+    mock_service, command_output, range_options, expected_error
+):
+    call_command(  # act
+        "generate_billing_journals",
+        **range_options,
+        stdout=command_output["out"],
+        stderr=command_output["err"],
+    )
+
+    _, error_output = _get_output(command_output)
+    assert expected_error in error_output
+    mock_service.assert_not_called()
+
+
+@freeze_time("2026-01-05 00:00:00")
+def test_command_with_shard(extension_settings, mock_service, command_output):
+    extension_settings.EXTENSION_CONFIG["BILLING_SHARD_OUTPUT_DIR"] = "/data/billing-shards"
+
+    call_command(  # act
+        "generate_billing_journals",
+        shard_index=1,
+        shard_count=4,
+        run="run-1",
+        stdout=command_output["out"],
+        stderr=command_output["err"],
+    )
+
+    job_context = mock_service.call_args.args[0]
+    assert (job_context.shard_index, job_context.shard_count) == (1, 4)
+    mock_service.return_value.run.assert_called_once()
+    mock_service.return_value.merge_shard_reports.assert_not_called()
+
+
+@freeze_time("2026-01-05 00:00:00")
+def test_command_merges_shards(extension_settings, mock_service, command_output):
+    extension_settings.EXTENSION_CONFIG["BILLING_SHARD_OUTPUT_DIR"] = "/data/billing-shards"
+
+    call_command(  # act
+        "generate_billing_journals",
+        shard_count=4,
+        merge_shards=True,
+        run="run-1",
+        stdout=command_output["out"],
+        stderr=command_output["err"],
+    )
+
+    mock_service.return_value.merge_shard_reports.assert_called_once()
+    mock_service.return_value.run.assert_not_called()
+
+
+@freeze_time("2026-01-05 00:00:00")
+@pytest.mark.parametrize("merge_shards", [True, False])
+def test_command_with_shards_requires_output_dir(
+    extension_settings, mock_service, command_output, merge_shards
+):
+    extension_settings.EXTENSION_CONFIG["BILLING_SHARD_OUTPUT_DIR"] = ""
+
+    call_command(  # act
+        "generate_billing_journals",
+        shard_count=2,
+        merge_shards=merge_shards,
+        run="run-1",
+        stdout=command_output["out"],
+        stderr=command_output["err"],
+    )
+
+    _, error_output = _get_output(command_output)
+    assert "EXT_BILLING_SHARD_OUTPUT_DIR must be set" in error_output
+    mock_service.assert_not_called()
+
+
+@freeze_time("2026-01-05 00:00:00")
+@pytest.mark.parametrize(
+    ("shard_index", "shard_count", "expected_error"),
+    [
+        (0, 0, "Invalid --shard-count. Must be at least 1, got 0."),
+        (2, 2, "Invalid --shard-index. Must be between 0 and 1, got 2."),
+        (-1, 2, "Invalid --shard-index. Must be between 0 and 1, got -1."),
+    ],
+)
+def test_command_with_invalid_shard_fails(
+    mock_service, command_output, shard_index, shard_count, expected_error
+):
+    call_command(  # act
+        "generate_billing_journals",
+        shard_index=shard_index,
+        shard_count=shard_count,
+        stdout=command_output["out"],
+        stderr=command_output["err"],
+    )
+
+    _, error_output = _get_output(command_output)
+    assert expected_error in error_output
+    mock_service.assert_not_called()
+
+
+@freeze_time("2026-01-05 00:00:00")
+def test_command_with_work_queue(extension_settings, mock_service, command_output):
+    extension_settings.EXTENSION_CONFIG["BILLING_SHARD_OUTPUT_DIR"] = "/data/billing-shards"
+    extension_settings.EXTENSION_CONFIG["WORK_QUEUE_PATH"] = "/data/work-queue.db"
+
+    call_command(  # act
+        "generate_billing_journals",
+        work_queue="billing-2025-12",
+        run="run-2",
+        stdout=command_output["out"],
+        stderr=command_output["err"],
+    )
+
+    job_context = mock_service.call_args.args[0]
+    assert job_context.work_queue_name == "billing-2025-12"
+    assert job_context.run_id == "run-2"
+    mock_service.return_value.run.assert_called_once()
+
+
+@freeze_time("2026-01-05 00:00:00")
+@pytest.mark.parametrize(
+    ("extension_config", "shard_count", "expected_error"),
+    [
+        (
+            {"BILLING_SHARD_OUTPUT_DIR": "/data/billing-shards", "WORK_QUEUE_PATH": ""},
+            1,
+            "EXT_WORK_QUEUE_PATH must be set to use a work queue",
+        ),
+        (
+            {"BILLING_SHARD_OUTPUT_DIR": "", "WORK_QUEUE_PATH": "/data/work-queue.db"},
+            1,
+            "EXT_BILLING_SHARD_OUTPUT_DIR must be set",
+        ),
+        (
+            {"BILLING_SHARD_OUTPUT_DIR": "/data/billing-shards"},
+            2,
+            "--work-queue and --shard-count cannot be used together",
+        ),
+    ],
+)
+def test_command_with_invalid_work_queue_fails(
+    extension_settings, mock_service, command_output, extension_config, shard_count, expected_error
+):
+    extension_settings.EXTENSION_CONFIG.update(extension_config)
+
+    call_command(  # act
+        "generate_billing_journals",
+        work_queue="billing-2025-12",
+        shard_count=shard_count,
+        run="run-1",
+        stdout=command_output["out"],
+        stderr=command_output["err"],
+    )
+
+    _, error_output = _get_output(command_output)
+    assert expected_error in error_output
+    mock_service.assert_not_called()
+
+
+@freeze_time("2026-01-05 00:00:00")
+@pytest.mark.parametrize(
+    ("sharding_options", "expected_error"),
+    [
+        (
+            {"merge_shards": True, "run": "run-1"},
+            "--merge-shards requires a --shard-count greater than 1 or a --work-queue",
+        ),
+        ({"shard_count": 2}, "--run is required to run or merge shards or work queue workers"),
+        (
+            {"shard_count": 2, "merge_shards": True},
+            "--run is required to run or merge shards or work queue workers",
+        ),
+        (
+            {"work_queue": "billing-2025-12"},
+            "--run is required to run or merge shards or work queue workers",
+        ),
+    ],
+)
+def test_command_with_invalid_sharding_options_fails(
+    extension_settings, mock_service, command_output, sharding_options, expected_error
+):
+    extension_settings.EXTENSION_CONFIG["BILLING_SHARD_OUTPUT_DIR"] = "/data/billing-shards"
+
+    call_command(  # act
+        "generate_billing_journals",
+        **sharding_options,
+        stdout=command_output["out"],
+        stderr=command_output["err"],
+    )
+
+    _, error_output = _get_output(command_output)
+    assert expected_error in error_output
+    mock_service.assert_not_called()
@@ -0,0 +1,72 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from freezegun import freeze_time
+
+from swo_aws_extension.work_queue.sqlite_queue import SQLiteWorkQueue
+
+LEASE_SECONDS = 600
+
+
+@pytest.fixture
+def work_queue(settings, tmp_path):
+    settings.EXTENSION_CONFIG["WORK_QUEUE_PATH"] = str(tmp_path / "queue.db")
+    settings.EXTENSION_CONFIG["WORK_QUEUE_LEASE_SECONDS"] = LEASE_SECONDS
+    return SQLiteWorkQueue(tmp_path / "queue.db", lease_seconds=LEASE_SECONDS, max_attempts=3)
+
+
+@freeze_time("2025-12-01 10:00:00")
+def test_inspect_work_queue(work_queue):
+    work_queue.enqueue("billing", {"AUT-1": {}, "AUT-2": {}, "AUT-3": {}})
+    work_queue.complete(work_queue.lease("billing", "worker-1"))
+    work_queue.lease("billing", "worker-2")
+    output = StringIO()
+
+    call_command("inspect_work_queue", window=1, stdout=output)  # act
+
+    lines = output.getvalue().splitlines()
+    assert lines[1].split() == ["billing", "1", "1", "1", "0", "1.00"]
+    assert lines[3].split() == ["billing/AUT-2", "worker-2", "1", str(LEASE_SECONDS)]
+
+
+def test_inspect_empty_work_queue(work_queue):
+    output = StringIO()
+
+    call_command("inspect_work_queue", queue="billing", stdout=output)  # act
+
+    assert output.getvalue().splitlines() == ["No tasks in the work queue", "No in-flight leases"]
+
+
+def test_purge_work_queue(work_queue):
+    work_queue.enqueue("billing", {"AUT-1": {}, "AUT-2": {}})
+    output = StringIO()
+
+    call_command("inspect_work_queue", queue="billing", purge=True, stdout=output)  # act
+
+    assert "Removed 2 tasks of work queue billing" in output.getvalue()
+    assert work_queue.get_stats(0) == []
+
+
+@pytest.mark.parametrize(
+    ("options", "expected_error"),
+    [
+        ({"purge": True}, "--purge requires --queue"),
+        ({"window": 0}, "Invalid --window. Must be at least 1."),
+    ],
+)
+def test_inspect_work_queue_with_invalid_options_fails(work_queue, options, expected_error):
+    error_output = StringIO()
+
+    call_command("inspect_work_queue", stderr=error_output, **options)  # act
+
+    assert expected_error in error_output.getvalue()
+
+
+def test_inspect_work_queue_requires_path(settings):
+    settings.EXTENSION_CONFIG["WORK_QUEUE_PATH"] = ""
+    error_output = StringIO()
+
+    call_command("inspect_work_queue", stderr=error_output)  # act
+
+    assert "EXT_WORK_QUEUE_PATH must be set" in error_output.getvalue()
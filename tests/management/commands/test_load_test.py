@@ -0,0 +1,43 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from swo_aws_extension.aws.client import AWSClient
+from swo_aws_extension.config import get_config
+
+PMA_ACCOUNT_ID = "999900000000"
+
+
+def _list_inbound_transfers(*args, **kwargs):
+    transfers = AWSClient(
+        get_config(), PMA_ACCOUNT_ID, "FakeRole"
+    ).get_inbound_responsibility_transfers()
+    kwargs["stdout"].write(f"{len(transfers)} transfers")
+
+
+def test_load_test_serves_aws_calls_from_fake_backend(extension_settings, mocker, monkeypatch):
+    extension_settings.EXTENSION_CONFIG["AWS_FAKE_BACKEND_ORGANIZATIONS"] = "2"
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    mock_call_command = mocker.patch(
+        "swo_aws_extension.management.commands.load_test.call_command",
+        autospec=True,
+        side_effect=_list_inbound_transfers,
+    )
+    output = StringIO()
+
+    call_command("load_test", "generate_billing_journals", "--year", "2025", stdout=output)  # act
+
+    assert mock_call_command.call_args.args == ("generate_billing_journals", "--year", "2025")
+    assert "2 transfers" in output.getvalue()
+
+
+def test_load_test_requires_fake_backend(mocker):
+    mock_call_command = mocker.patch(
+        "swo_aws_extension.management.commands.load_test.call_command", autospec=True
+    )
+    error = StringIO()
+
+    call_command("load_test", "generate_billing_journals", stderr=error)  # act
+
+    assert "EXT_AWS_FAKE_BACKEND_ORGANIZATIONS must be set" in error.getvalue()
+    mock_call_command.assert_not_called()
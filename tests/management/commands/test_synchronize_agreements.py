@@ -1,6 +1,10 @@
+from io import StringIO
+
 import pytest
 from django.core.management import call_command
 
+MODULE = "swo_aws_extension.management.commands.synchronize_agreements"
+
 
 @pytest.mark.parametrize("dry_run", [True, False])
 def test_check_pool_notifications_agreements_ids(mocker, dry_run):
@@ -31,3 +35,33 @@ def test_check_pool_notifications_all_agreements(mocker, dry_run):
     )  # act
 
     mocked_handle.assert_called_once()
+
+
+def test_synchronize_agreements_with_work_queue(mocker, settings):
+    settings.EXTENSION_CONFIG["WORK_QUEUE_PATH"] = "/data/work-queue.db"
+    mocker.patch(f"{MODULE}.setup_client", autospec=True)
+    mock_get_agreements = mocker.patch(f"{MODULE}.get_agreements_to_synchronize", autospec=True)
+    mock_syncer_cls = mocker.patch(f"{MODULE}.AgreementSyncer", autospec=True)
+    mock_build_queue_worker = mocker.patch(f"{MODULE}.build_queue_worker", autospec=True)
+    mock_synchronize = mocker.patch(f"{MODULE}.synchronize_agreements", autospec=True)
+
+    call_command(  # act
+        "synchronize_agreements", work_queue="agreements", work_queue_run="2026-01-05"
+    )
+
+    mock_build_queue_worker.assert_called_once_with(mocker.ANY, "agreements", "2026-01-05")
+    mock_build_queue_worker.return_value.run.assert_called_once_with(
+        mock_get_agreements.return_value, mock_syncer_cls.return_value.process
+    )
+    mock_synchronize.assert_not_called()
+
+
+def test_synchronize_agreements_with_work_queue_requires_path(mocker, settings):
+    settings.EXTENSION_CONFIG["WORK_QUEUE_PATH"] = ""
+    mock_synchronize = mocker.patch(f"{MODULE}.synchronize_agreements", autospec=True)
+    error_output = StringIO()
+
+    call_command("synchronize_agreements", work_queue="agreements", stderr=error_output)  # act
+
+    assert "EXT_WORK_QUEUE_PATH must be set" in error_output.getvalue()
+    mock_synchronize.assert_not_called()
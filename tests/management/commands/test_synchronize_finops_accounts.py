@@ -1,9 +1,13 @@
+from io import StringIO
+
 from django.core.management import call_command
 
 from swo_aws_extension.flows.jobs.finops_entitlements_processor import (
     FinOpsEntitlementsProcessor,
 )
 
+MODULE = "swo_aws_extension.management.commands.synchronize_finops_accounts"
+
 
 def test_sync_finops_accounts(mocker):
     mock_processor = mocker.MagicMock(spec=FinOpsEntitlementsProcessor)
@@ -32,3 +36,26 @@ def test_sync_finops_with_agreements(mocker):
 
     mocked_handle.assert_called_once()
     mock_processor.sync.assert_called_once()
+
+
+def test_sync_finops_with_work_queue(mocker):
+    mock_processor = mocker.MagicMock(spec=FinOpsEntitlementsProcessor)
+    mocker.patch(f"{MODULE}.FinOpsEntitlementsProcessor", return_value=mock_processor)
+    mocker.patch(f"{MODULE}.config", work_queue_path="/data/work-queue.db")
+    mock_build_queue_worker = mocker.patch(f"{MODULE}.build_queue_worker", autospec=True)
+
+    call_command("synchronize_finops_accounts", work_queue="finops")  # act
+
+    mock_build_queue_worker.assert_called_once_with(mocker.ANY, "finops", "")
+    mock_processor.sync.assert_called_once_with(mock_build_queue_worker.return_value)
+
+
+def test_sync_finops_with_work_queue_requires_path(mocker):
+    mock_processor_cls = mocker.patch(f"{MODULE}.FinOpsEntitlementsProcessor")
+    mocker.patch(f"{MODULE}.config", work_queue_path="")
+    error_output = StringIO()
+
+    call_command("synchronize_finops_accounts", work_queue="finops", stderr=error_output)  # act
+
+    assert "EXT_WORK_QUEUE_PATH must be set" in error_output.getvalue()
+    mock_processor_cls.assert_not_called()
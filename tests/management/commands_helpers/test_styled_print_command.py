@@ -1,3 +1,4 @@
+from swo_aws_extension.aws.call_metrics import AWSCallCounts, AWSCallKey
 from swo_aws_extension.management.commands_helpers import StyledPrintCommand
 
 
@@ -25,3 +26,30 @@ def test_dummy_command_messages(mocker):
     assert any("Hello, world!" in str(call) for call in stdout_calls)
     assert any("Dangerous world" in str(call) for call in stdout_calls)
     assert any("Broken world" in str(call) for call in stderr_calls)
+
+
+class AWSCallingCommand(StyledPrintCommand):
+    def handle(self, *args, **options):  # noqa: WPS110
+        self.aws_call_metrics.record(
+            AWSCallKey("ce", "GetCostAndUsage", "123456789012"), 1, AWSCallCounts()
+        )
+
+
+def test_command_prints_aws_call_summary(mocker):
+    mock_stdout = mocker.Mock()
+    command = AWSCallingCommand(stdout=mock_stdout, stderr=mocker.Mock())
+
+    command.execute(force_color=False, no_color=False, skip_checks=True)  # act
+
+    summary = mock_stdout.write.call_args.args[0]
+    assert summary.startswith("AWS API calls:")
+    assert "GetCostAndUsage" in summary
+
+
+def test_command_skips_empty_aws_call_summary(mocker):
+    mock_stdout = mocker.Mock()
+    command = DummyCommand(stdout=mock_stdout, stderr=mocker.Mock())
+
+    command.execute(force_color=False, no_color=False, skip_checks=True)  # act
+
+    assert all("AWS API calls" not in str(call) for call in mock_stdout.write.call_args_list)
@@ -3,7 +3,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from swo_aws_extension.swo.mpt.httpquery import HttpQuery
+from swo_aws_extension.swo.mpt.httpquery import HttpQuery, get_all_by_url, iter_all_pages
 
 
 class DummyModel(UserDict):
@@ -22,33 +22,71 @@ def test_init():
     assert result._query == query  # ruff:ignore[private-member-access]
 
 
-def test_has_more_pages_no_page():
-    mock_client = MagicMock()
-    hq = HttpQuery(mock_client, "https://fake-url")
+def _build_page(entries, total, limit, offset):
+    return {
+        "data": entries,
+        "$meta": {"pagination": {"total": total, "limit": limit, "offset": offset}},
+    }
 
-    result = hq._has_more_pages(None)  # ruff:ignore[private-member-access]
 
-    assert result is True
+def test_iter_all_pages_fetches_remaining_pages_in_order():
+    mock_fetch_page = MagicMock(
+        side_effect=[
+            _build_page([1, 2], 5, 2, 0),
+            _build_page([3, 4], 5, 2, 2),
+            _build_page([5], 5, 2, 4),
+        ]
+    )
 
+    result = list(iter_all_pages(mock_fetch_page, 2, 2))
 
-def test_has_more_pages_with_more():
-    mock_client = MagicMock()
-    hq = HttpQuery(mock_client, "https://fake-url")
-    page = {"$meta": {"pagination": {"total": 20, "limit": 10, "offset": 0}}}
+    assert result == [1, 2, 3, 4, 5]
+    assert mock_fetch_page.call_count == 3
+
+
+def test_iter_all_pages_uses_page_size_returned_by_api():
+    first_page = _build_page([1], 2, 1, 0)
+    mock_fetch_page = MagicMock(side_effect=[first_page, _build_page([2], 2, 1, 1)])
+
+    result = list(iter_all_pages(mock_fetch_page, 100, 4))
+
+    assert result == [1, 2]
+    mock_fetch_page.assert_called_with(1, 1)
+
+
+def test_iter_all_pages_single_page():
+    mock_fetch_page = MagicMock(return_value=_build_page([1, 2], 2, 10, 0))
 
-    result = hq._has_more_pages(page)  # ruff:ignore[private-member-access]
+    result = list(iter_all_pages(mock_fetch_page, 10, 4))
 
-    assert result is True
+    assert result == [1, 2]
+    mock_fetch_page.assert_called_once_with(0, 10)
 
 
-def test_has_more_pages_with_no_more():
+def test_iter_all_pages_fetches_a_bounded_number_of_pages_ahead():
+    mock_fetch_page = MagicMock(
+        side_effect=[_build_page([offset], 5, 1, offset) for offset in range(5)]
+    )
+    entries = iter_all_pages(mock_fetch_page, 1, 2)
+
+    result = [next(entries), next(entries)]
+
+    assert result == [0, 1]
+    assert mock_fetch_page.call_count <= 4
+
+
+def test_get_all_by_url(extension_settings):
+    extension_settings.EXTENSION_CONFIG["MPT_PAGE_LIMIT"] = 2
     mock_client = MagicMock()
-    hq = HttpQuery(mock_client, "https://fake-url")
-    page = {"$meta": {"pagination": {"total": 20, "limit": 10, "offset": 10}}}
+    mock_client.get.return_value.json.side_effect = [
+        _build_page([{"id": 1}, {"id": 2}], 3, 2, 0),
+        _build_page([{"id": 3}], 3, 2, 2),
+    ]
 
-    result = hq._has_more_pages(page)  # ruff:ignore[private-member-access]
+    result = get_all_by_url(mock_client, "/commerce/orders?eq(status,Querying)")
 
-    assert result is False
+    assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
+    mock_client.get.assert_called_with("/commerce/orders?eq(status,Querying)&limit=2&offset=2")
 
 
 def test_page_returns_response_data():
@@ -89,6 +127,20 @@ def test_all_returns_paginated_data():
     assert result == [{"id": 1}, {"id": 2}]
 
 
+def test_iter_is_lazy(extension_settings):
+    extension_settings.EXTENSION_CONFIG["MPT_PAGE_LIMIT"] = 1
+    mock_client = MagicMock()
+    first_page = _build_page([{"id": 1}], 1, 1, 0)
+    mock_client.get.return_value.json.return_value = first_page
+    hq = HttpQuery(mock_client, "https://fake-url")
+
+    result = hq.iter()
+
+    mock_client.get.assert_not_called()
+    assert list(result) == [{"id": 1}]
+    mock_client.get.assert_called_once_with("https://fake-url?offset=0&limit=1")
+
+
 def test_query_combines_existing_and_new_rql():
     mock_client = MagicMock()
     base_query = "foo=1"
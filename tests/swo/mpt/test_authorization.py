@@ -0,0 +1,34 @@
+from swo_aws_extension.swo.mpt.authorization import (
+    build_authorizations_query,
+    get_authorization_agreements,
+)
+from swo_aws_extension.swo.rql.query_builder import RQLQuery
+
+MODULE = "swo_aws_extension.swo.mpt.authorization"
+
+
+def test_build_authorizations_query_without_authorizations():
+    result = build_authorizations_query(["PROD-1"], None)
+
+    assert str(result) == str(RQLQuery(product__id__in=["PROD-1"]))
+
+
+def test_build_authorizations_query_with_authorizations():
+    result = build_authorizations_query(["PROD-1"], ["AUTH-1", "AUTH-1"])
+
+    expected = RQLQuery(id__in=["AUTH-1"]) & RQLQuery(product__id__in=["PROD-1"])
+    assert str(result) == str(expected)
+
+
+def test_get_authorization_agreements(mocker):
+    mock_get_agreements = mocker.patch(f"{MODULE}.get_agreements_by_query", autospec=True)
+    mpt_client = mocker.MagicMock()
+
+    result = get_authorization_agreements(mpt_client, "AUTH-1", ["PROD-1"])
+
+    assert result == mock_get_agreements.return_value
+    mock_get_agreements.assert_called_once_with(
+        mpt_client,
+        "and(eq(authorization.id,'AUTH-1'),in(status,(Active,Updating)),in(product.id,(PROD-1)))"
+        "&select=subscriptions,subscriptions.lines,parameters",
+    )
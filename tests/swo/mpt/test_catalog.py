@@ -0,0 +1,108 @@
+import pytest
+
+from swo_aws_extension.swo.mpt.catalog import (
+    get_catalog_cache,
+    get_catalog_cache_stats,
+    get_product_items_by_skus,
+    get_product_parameters,
+    get_product_template_or_default,
+    invalidate_catalog_cache,
+)
+
+MODULE = "swo_aws_extension.swo.mpt.catalog"
+
+
+@pytest.fixture(autouse=True)
+def clear_catalog_cache():
+    get_catalog_cache.cache_clear()
+    yield
+    get_catalog_cache.cache_clear()
+
+
+def test_get_product_items_by_skus_is_cached(mocker):
+    mock_get_items = mocker.patch(
+        f"{MODULE}.mpt.get_product_items_by_skus", autospec=True, return_value=[{"id": "ITM-1"}]
+    )
+    mpt_client = mocker.MagicMock()
+    get_product_items_by_skus(mpt_client, "PRD-1", ["SKU-1"])
+
+    result = get_product_items_by_skus(mpt_client, "PRD-1", ["SKU-1"])
+
+    assert result == [{"id": "ITM-1"}]
+    mock_get_items.assert_called_once_with(mpt_client, "PRD-1", ["SKU-1"])
+    assert get_catalog_cache_stats().hits == 1
+
+
+def test_get_product_items_by_skus_returns_copies(mocker):
+    mocker.patch(
+        f"{MODULE}.mpt.get_product_items_by_skus", autospec=True, return_value=[{"id": "ITM-1"}]
+    )
+    mpt_client = mocker.MagicMock()
+    product_items = get_product_items_by_skus(mpt_client, "PRD-1", ["SKU-1"])
+    product_items[0]["id"] = "changed"
+
+    result = get_product_items_by_skus(mpt_client, "PRD-1", ["SKU-1"])
+
+    assert result == [{"id": "ITM-1"}]
+
+
+def test_get_product_parameters_is_cached(mocker):
+    mock_paginated = mocker.patch(
+        f"{MODULE}.mpt._paginated", autospec=True, return_value=[{"externalId": "param"}]
+    )
+    mpt_client = mocker.MagicMock()
+    get_product_parameters(mpt_client, "PRD-1", "Fulfillment")
+
+    result = get_product_parameters(mpt_client, "PRD-1", "Fulfillment")
+
+    assert result == [{"externalId": "param"}]
+    mock_paginated.assert_called_once_with(
+        mpt_client, "catalog/products/PRD-1/parameters?phase=Fulfillment"
+    )
+
+
+def test_get_product_template_or_default_is_cached_by_name(mocker):
+    mock_get_template = mocker.patch(
+        f"{MODULE}.mpt.get_product_template_or_default",
+        autospec=True,
+        side_effect=[{"id": "TPL-1"}, {"id": "TPL-2"}],
+    )
+    mpt_client = mocker.MagicMock()
+    get_product_template_or_default(mpt_client, "PRD-1", "Completed", "First")
+    get_product_template_or_default(mpt_client, "PRD-1", "Completed", "First")
+
+    result = get_product_template_or_default(mpt_client, "PRD-1", "Completed", "Second")
+
+    assert result == {"id": "TPL-2"}
+    assert mock_get_template.call_count == 2
+
+
+def test_get_product_items_by_skus_does_not_cache_no_items(mocker):
+    mock_get_items = mocker.patch(
+        f"{MODULE}.mpt.get_product_items_by_skus",
+        autospec=True,
+        side_effect=[[], [{"id": "ITM-1"}]],
+    )
+    mpt_client = mocker.MagicMock()
+    get_product_items_by_skus(mpt_client, "PRD-1", ["SKU-1"])
+
+    result = get_product_items_by_skus(mpt_client, "PRD-1", ["SKU-1"])
+
+    assert result == [{"id": "ITM-1"}]
+    assert mock_get_items.call_count == 2
+
+
+def test_invalidate_catalog_cache(mocker, caplog):
+    mock_get_items = mocker.patch(
+        f"{MODULE}.mpt.get_product_items_by_skus", autospec=True, return_value=[{"id": "ITM-1"}]
+    )
+    mpt_client = mocker.MagicMock()
+    get_product_items_by_skus(mpt_client, "PRD-1", ["SKU-1"])
+    with caplog.at_level("INFO"):
+        invalidate_catalog_cache()
+
+    result = get_product_items_by_skus(mpt_client, "PRD-1", ["SKU-1"])
+
+    assert result == [{"id": "ITM-1"}]
+    assert mock_get_items.call_count == 2
+    assert "Invalidating the catalog cache" in caplog.text
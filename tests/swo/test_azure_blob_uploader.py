@@ -1,3 +1,7 @@
+from io import BytesIO
+
+import pytest
+from azure.core.exceptions import HttpResponseError
 from azure.storage.blob import BlobClient
 
 from swo_aws_extension.swo.azure_blob_uploader import AzureBlobUploader
@@ -31,3 +35,58 @@ def test_upload_and_get_sas_url(mocker):
     )
     mock_blob_client.upload_blob.assert_called_once_with(b"data", overwrite=True)
     assert result == "https://test.blob.core.windows.net/test-container/report.xlsx?fake-sas"
+
+
+@pytest.fixture
+def mock_blob_client(mocker):
+    mock_blob_service_client_cls = mocker.patch(f"{MODULE}.BlobServiceClient", autospec=True)
+    mock_service_client = mock_blob_service_client_cls.from_connection_string.return_value
+    mock_service_client.account_name = "test_account"
+    mock_service_client.credential.account_key = "test_key"
+    mock_blob_client = mocker.MagicMock(spec=BlobClient)
+    mock_blob_client.url = "https://test.blob.core.windows.net/test-container/report.xlsx"
+    mock_service_client.get_blob_client.return_value = mock_blob_client
+    mocker.patch(f"{MODULE}.generate_blob_sas", autospec=True, return_value="fake-sas")
+    return mock_blob_client
+
+
+def _staged_blocks(mock_blob_client):
+    return sorted(call.args for call in mock_blob_client.stage_block.call_args_list)
+
+
+def _committed_block_ids(mock_blob_client):
+    block_list = mock_blob_client.commit_block_list.call_args.args[0]
+    return [block.id for block in block_list]
+
+
+def test_upload_stream_stages_file_in_blocks(mock_blob_client):
+    uploader = AzureBlobUploader("connection", "test-container", 7, block_size=4)
+
+    result = uploader.upload_stream_and_get_sas_url(BytesIO(b"abcdefghij"), "report.xlsx")
+
+    assert _staged_blocks(mock_blob_client) == [
+        ("00000000", b"abcd"),
+        ("00000001", b"efgh"),
+        ("00000002", b"ij"),
+    ]
+    assert _committed_block_ids(mock_blob_client) == ["00000000", "00000001", "00000002"]
+    mock_blob_client.upload_blob.assert_not_called()
+    assert result == "https://test.blob.core.windows.net/test-container/report.xlsx?fake-sas"
+
+
+def test_upload_stream_rechunks_iterator(mock_blob_client):
+    uploader = AzureBlobUploader("connection", "test-container", 7, block_size=4, max_concurrency=1)
+
+    uploader.upload_stream_and_get_sas_url(iter([b"ab", b"cdefg", b"", b"h"]), "report.csv")  # act
+
+    assert _staged_blocks(mock_blob_client) == [("00000000", b"abcd"), ("00000001", b"efgh")]
+
+
+def test_upload_stream_does_not_commit_when_staging_fails(mock_blob_client):
+    mock_blob_client.stage_block.side_effect = [None, HttpResponseError("stage failed")]
+    uploader = AzureBlobUploader("connection", "test-container", 7, block_size=4, max_concurrency=1)
+
+    with pytest.raises(HttpResponseError):
+        uploader.upload_stream_and_get_sas_url(BytesIO(b"abcdefghij"), "report.xlsx")
+
+    mock_blob_client.commit_block_list.assert_not_called()
@@ -68,3 +68,34 @@ def test_build_from_rows_keeps_existing_sheet_title(mocker):
     builder.build_from_rows([])  # act
 
     assert mock_ws.title == "AlreadyNamed"
+
+
+def test_stream_multi_sheet_writes_row_iterators():
+    builder = ExcelReportBuilder([], "Unused")
+    sheets = [
+        ("Sales", ["Region", "Amount"], iter([["EU", "100"], ["US", "200"]])),
+        ("Returns", ["Item", "Qty"], iter([["Widget", "5"]])),
+    ]
+
+    result = builder.stream_multi_sheet(sheets)
+
+    wb = load_workbook(filename=result)
+    assert wb.sheetnames == ["Sales", "Returns"]
+    sales_ws = wb["Sales"]
+    assert [[cell.value for cell in row] for row in sales_ws.iter_rows()] == [
+        ["Region", "Amount"],
+        ["EU", "100"],
+        ["US", "200"],
+    ]
+    assert wb["Returns"].cell(row=2, column=1).value == "Widget"
+
+
+def test_stream_from_rows_keeps_header_style_and_auto_filter():
+    builder = ExcelReportBuilder(["Header 1", "Header 2"], "TestSheet")
+
+    result = builder.stream_from_rows(iter([["Val 1", "Val 2"], ["Val 3", "Val 4"]]))
+
+    ws = load_workbook(filename=result)["TestSheet"]
+    assert ws.cell(row=1, column=1).font.bold
+    assert not ws.cell(row=2, column=1).font.bold
+    assert ws.auto_filter.ref == "A1:B3"
@@ -7,12 +7,21 @@ from mpt_extension_sdk.mpt_http.base import MPTClient
 from mpt_extension_sdk.runtime.djapp.conf import get_for_product
 
 from swo_aws_extension.extension import (
+    WEBHOOK_PRODUCT_CACHE_TTL_SECONDS,
     ext,
     jwt_secret_callback,
     process_order_fulfillment,
+    webhook_product_cache,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_webhook_product_cache():
+    webhook_product_cache.invalidate()
+    yield
+    webhook_product_cache.invalidate()
+
+
 def test_listener_registered():
     result = ext.events.get_listener("orders")
 
@@ -21,7 +30,7 @@ def test_listener_registered():
 
 def test_jwt_secret_callback(mocker, settings, mpt_client, webhook):
     mocked_webhook = mocker.patch(
-        "swo_aws_extension.extension.get_webhook",
+        "swo_aws_extension.extension.fetch_webhook",
         return_value=webhook,
     )
 
@@ -31,6 +40,51 @@ def test_jwt_secret_callback(mocker, settings, mpt_client, webhook):
     mocked_webhook.assert_called_once_with(mpt_client, "WH-123-123")
 
 
+def test_jwt_secret_callback_caches_webhook_product(mocker, settings, mpt_client, webhook):
+    mocked_webhook = mocker.patch(
+        "swo_aws_extension.extension.fetch_webhook",
+        return_value=webhook,
+    )
+    jwt_secret_callback(mpt_client, {"webhook_id": "WH-123-123"})
+
+    result = jwt_secret_callback(mpt_client, {"webhook_id": "WH-123-123"})
+
+    assert result == get_for_product(settings, "WEBHOOKS_SECRETS", "PRD-1111-1111")
+    mocked_webhook.assert_called_once_with(mpt_client, "WH-123-123")
+
+
+def test_jwt_secret_callback_does_not_cache_errors(mocker, settings, mpt_client, webhook):
+    mocked_webhook = mocker.patch(
+        "swo_aws_extension.extension.fetch_webhook",
+        side_effect=[RuntimeError("Unavailable"), webhook],
+    )
+
+    with pytest.raises(RuntimeError, match="Unavailable"):
+        jwt_secret_callback(mpt_client, {"webhook_id": "WH-123-123"})  # act
+
+    assert jwt_secret_callback(mpt_client, {"webhook_id": "WH-123-123"}) == get_for_product(
+        settings, "WEBHOOKS_SECRETS", "PRD-1111-1111"
+    )
+    assert mocked_webhook.call_count == 2
+
+
+def test_jwt_secret_callback_reloads_expired_webhook_product(mocker, settings, mpt_client, webhook):
+    mocked_webhook = mocker.patch(
+        "swo_aws_extension.extension.fetch_webhook",
+        return_value=webhook,
+    )
+    mock_monotonic = mocker.patch(
+        "swo_aws_extension.utils.ttl_cache.time.monotonic", autospec=True, return_value=0
+    )
+    jwt_secret_callback(mpt_client, {"webhook_id": "WH-123-123"})
+    mock_monotonic.return_value = WEBHOOK_PRODUCT_CACHE_TTL_SECONDS + 1
+
+    result = jwt_secret_callback(mpt_client, {"webhook_id": "WH-123-123"})
+
+    assert result == get_for_product(settings, "WEBHOOKS_SECRETS", "PRD-1111-1111")
+    assert mocked_webhook.call_count == 2
+
+
 def test_process_order_fulfillment(mocker):
     mocked_fulfill_order = mocker.patch(
         "swo_aws_extension.extension.fulfill_order",
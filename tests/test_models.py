@@ -75,3 +75,23 @@ def test_last_day_property_february():
     result = billing_period.last_day
 
     assert result == "2025-02-28"
+
+
+def test_split_by_month_across_years():
+    billing_period = BillingPeriod(start_date="2025-11-01", end_date="2026-02-01")
+
+    result = billing_period.split_by_month()
+
+    assert result == [
+        BillingPeriod(start_date="2025-11-01", end_date="2025-12-01"),
+        BillingPeriod(start_date="2025-12-01", end_date="2026-01-01"),
+        BillingPeriod(start_date="2026-01-01", end_date="2026-02-01"),
+    ]
+
+
+def test_split_by_month_single_month():
+    billing_period = BillingPeriod(start_date="2025-10-01", end_date="2025-11-01")
+
+    result = billing_period.split_by_month()
+
+    assert result == [billing_period]
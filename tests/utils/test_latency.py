@@ -0,0 +1,41 @@
+from swo_aws_extension.utils.latency import LatencyPercentiles, LatencyWindow
+
+DURATION_COUNT = 20
+
+
+def test_latency_window_percentiles():
+    window = LatencyWindow(size=DURATION_COUNT)
+    for duration in range(DURATION_COUNT):
+        window.record(duration + 1)
+
+    result = window.get_percentiles()
+
+    assert result == LatencyPercentiles(
+        count=DURATION_COUNT, p50=DURATION_COUNT // 2, p95=DURATION_COUNT - 1
+    )
+
+
+def test_latency_window_keeps_latest_durations():
+    window = LatencyWindow(size=2)
+    for duration in (10, 1, 2):
+        window.record(duration)
+
+    result = window.get_percentiles()
+
+    assert result == LatencyPercentiles(count=2, p50=1, p95=2)
+
+
+def test_latency_window_without_durations():
+    window = LatencyWindow(size=10)
+
+    result = window.get_percentiles()
+
+    assert result == LatencyPercentiles(count=0, p50=0, p95=0)
+
+
+def test_latency_percentiles_describe():
+    percentiles = LatencyPercentiles(count=3, p50=1, p95=2)
+
+    result = percentiles.describe()
+
+    assert result == "p50=1.000s p95=2.000s over 3 calls"
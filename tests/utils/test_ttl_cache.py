@@ -0,0 +1,108 @@
+import pytest
+
+from swo_aws_extension.utils.ttl_cache import TTLCache, TTLCacheStats
+
+MODULE = "swo_aws_extension.utils.ttl_cache"
+
+
+@pytest.fixture
+def mock_monotonic(mocker):
+    return mocker.patch(f"{MODULE}.time.monotonic", autospec=True, return_value=100)
+
+
+@pytest.fixture
+def ttl_cache(mock_monotonic):
+    return TTLCache("test", ttl_seconds=60, max_size=2)
+
+
+def test_get_or_load_caches_value(mocker, ttl_cache):
+    mock_load = mocker.MagicMock(return_value={"id": "ITM-1"})
+    ttl_cache.get_or_load("ITM-1", mock_load)
+
+    result = ttl_cache.get_or_load("ITM-1", mock_load)
+
+    assert result == {"id": "ITM-1"}
+    mock_load.assert_called_once_with()
+    assert ttl_cache.get_stats() == TTLCacheStats("test", hits=1, misses=1, size=1)
+
+
+def test_get_or_load_reloads_expired_value(mocker, ttl_cache, mock_monotonic):
+    mock_load = mocker.MagicMock(side_effect=["first", "second"])
+    ttl_cache.get_or_load("key", mock_load)
+    mock_monotonic.return_value = 160
+
+    result = ttl_cache.get_or_load("key", mock_load)
+
+    assert result == "second"
+    assert mock_load.call_count == 2
+
+
+def test_get_or_load_evicts_least_recently_used(ttl_cache):
+    ttl_cache.get_or_load("first", lambda: 1)
+    ttl_cache.get_or_load("second", lambda: 2)
+    ttl_cache.get_or_load("first", lambda: 1)
+
+    ttl_cache.get_or_load("third", lambda: 3)  # act
+
+    assert ttl_cache.get_or_load("first", lambda: "reloaded") == 1
+    assert ttl_cache.get_or_load("second", lambda: "reloaded") == "reloaded"
+
+
+def test_get_or_load_does_not_cache_errors(mocker, ttl_cache):
+    mock_load = mocker.MagicMock(side_effect=[RuntimeError("Throttled"), "value"])
+
+    with pytest.raises(RuntimeError, match="Throttled"):
+        ttl_cache.get_or_load("key", mock_load)  # act
+
+    assert ttl_cache.get_or_load("key", mock_load) == "value"
+    assert ttl_cache.get_stats().misses == 2
+
+
+def test_get_returns_stored_value(ttl_cache):
+    ttl_cache.put("key", "value")
+
+    result = ttl_cache.get("key")
+
+    assert result == "value"
+    assert ttl_cache.get_stats().hits == 1
+
+
+def test_get_returns_none_on_miss(ttl_cache, mock_monotonic):
+    ttl_cache.put("key", "value")
+    mock_monotonic.return_value = 160
+
+    result = ttl_cache.get("key")
+
+    assert result is None
+    assert ttl_cache.get_stats().misses == 1
+
+
+def test_invalidate_key(ttl_cache):
+    ttl_cache.get_or_load("first", lambda: 1)
+    ttl_cache.get_or_load("second", lambda: 2)
+
+    ttl_cache.invalidate("first")  # act
+
+    assert ttl_cache.get_or_load("first", lambda: "reloaded") == "reloaded"
+    assert ttl_cache.get_or_load("second", lambda: "reloaded") == 2
+
+
+def test_invalidate_all(ttl_cache):
+    ttl_cache.get_or_load("first", lambda: 1)
+    ttl_cache.get_or_load("second", lambda: 2)
+
+    ttl_cache.invalidate()  # act
+
+    assert ttl_cache.get_stats().size == 0
+
+
+@pytest.mark.parametrize(
+    ("hits", "misses", "expected_hit_rate"),
+    [(0, 0, 0), (3, 1, 0.75)],
+)
+def test_stats_hit_rate(hits, misses, expected_hit_rate):
+    stats = TTLCacheStats("test", hits=hits, misses=misses, size=1)
+
+    result = stats.hit_rate
+
+    assert result == expected_hit_rate
@@ -0,0 +1,181 @@
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+from freezegun import freeze_time
+
+from swo_aws_extension.work_queue.errors import NetworkFilesystemError
+from swo_aws_extension.work_queue.models import WorkQueueStats
+from swo_aws_extension.work_queue.sqlite_queue import SQLiteWorkQueue, get_filesystem_type
+
+QUEUE_NAME = "billing-2025-10"
+
+
+@pytest.fixture
+def work_queue(tmp_path):
+    return SQLiteWorkQueue(tmp_path / "queue.db", lease_seconds=60, max_attempts=2)
+
+
+def test_enqueue_ignores_tasks_already_in_queue(work_queue):
+    work_queue.enqueue(QUEUE_NAME, {"AUT-1": {"id": "AUT-1"}})
+    payloads_by_key = {"AUT-1": {"id": "AUT-1"}, "AUT-2": {"id": "AUT-2"}}
+
+    result = work_queue.enqueue(QUEUE_NAME, payloads_by_key)
+
+    assert result == 1
+    assert work_queue.list_task_keys(QUEUE_NAME) == ["AUT-1", "AUT-2"]
+
+
+def test_lease_takes_tasks_in_enqueue_order(work_queue):
+    work_queue.enqueue(QUEUE_NAME, {"AUT-1": {"id": "AUT-1"}, "AUT-2": {"id": "AUT-2"}})
+
+    result = [work_queue.lease(QUEUE_NAME, "worker-1") for _ in range(2)]
+
+    assert [task.key for task in result] == ["AUT-1", "AUT-2"]
+    assert result[0].payload == {"id": "AUT-1"}
+    assert result[0].attempts == 1
+    assert work_queue.lease(QUEUE_NAME, "worker-1") is None
+
+
+def test_expired_lease_is_taken_over(work_queue):
+    work_queue.enqueue(QUEUE_NAME, {"AUT-1": {"id": "AUT-1"}})
+    with freeze_time("2025-10-01 10:00:00"):
+        lost_task = work_queue.lease(QUEUE_NAME, "worker-1")
+
+    with freeze_time("2025-10-01 10:01:01"):
+        result = work_queue.lease(QUEUE_NAME, "worker-2")
+
+    assert result.lease_owner == "worker-2"
+    assert result.attempts == 2
+    assert work_queue.complete(lost_task) is False
+    assert work_queue.complete(result) is True
+
+
+def test_renewed_lease_is_not_taken_over(work_queue):
+    work_queue.enqueue(QUEUE_NAME, {"AUT-1": {"id": "AUT-1"}})
+    with freeze_time("2025-10-01 10:00:00"):
+        task = work_queue.lease(QUEUE_NAME, "worker-1")
+    with freeze_time("2025-10-01 10:00:50"):
+        is_renewed = work_queue.renew(task)
+
+    with freeze_time("2025-10-01 10:01:10"):
+        result = work_queue.lease(QUEUE_NAME, "worker-2")
+
+    assert is_renewed is True
+    assert result is None
+    assert work_queue.complete(task) is True
+
+
+def test_renew_lost_lease(work_queue):
+    work_queue.enqueue(QUEUE_NAME, {"AUT-1": {"id": "AUT-1"}})
+    with freeze_time("2025-10-01 10:00:00"):
+        lost_task = work_queue.lease(QUEUE_NAME, "worker-1")
+    with freeze_time("2025-10-01 10:01:01"):
+        work_queue.lease(QUEUE_NAME, "worker-2")
+
+    result = work_queue.renew(lost_task)
+
+    assert result is False
+
+
+def test_expired_lease_of_last_attempt_fails_task(work_queue):
+    work_queue.enqueue(QUEUE_NAME, {"AUT-1": {"id": "AUT-1"}})
+    with freeze_time("2025-10-01 10:00:00"):
+        work_queue.lease(QUEUE_NAME, "worker-1")
+    with freeze_time("2025-10-01 10:01:01"):
+        work_queue.lease(QUEUE_NAME, "worker-2")
+
+    with freeze_time("2025-10-01 10:02:02"):
+        result = work_queue.lease(QUEUE_NAME, "worker-3")
+
+    assert result is None
+    assert work_queue.list_task_keys(QUEUE_NAME) == []
+
+
+def test_fail_releases_task_until_last_attempt(work_queue):
+    work_queue.enqueue(QUEUE_NAME, {"AUT-1": {"id": "AUT-1"}})
+    work_queue.fail(work_queue.lease(QUEUE_NAME, "worker-1"), "Throttled")
+    retried_task = work_queue.lease(QUEUE_NAME, "worker-1")
+
+    work_queue.fail(retried_task, "Throttled")  # act
+
+    assert retried_task.attempts == 2
+    assert work_queue.lease(QUEUE_NAME, "worker-1") is None
+    assert work_queue.get_stats(0)[0].failed == 1
+
+
+def test_get_stats(work_queue):
+    work_queue.enqueue(QUEUE_NAME, {f"AUT-{number}": {} for number in range(4)})
+    work_queue.enqueue("agreements", {"AGR-1": {}})
+    work_queue.complete(work_queue.lease(QUEUE_NAME, "worker-1"))
+    work_queue.lease(QUEUE_NAME, "worker-1")
+
+    result = work_queue.get_stats(0)
+
+    assert result == [
+        WorkQueueStats("agreements", 1, 0, 0, 0, 0),
+        WorkQueueStats(QUEUE_NAME, 2, 1, 1, 0, 1),
+    ]
+
+
+def test_list_leases(work_queue):
+    work_queue.enqueue(QUEUE_NAME, {"AUT-1": {}})
+    work_queue.enqueue("agreements", {"AGR-1": {}})
+    work_queue.lease(QUEUE_NAME, "worker-1")
+    work_queue.lease("agreements", "worker-2")
+
+    result = work_queue.list_leases(QUEUE_NAME)
+
+    assert [(lease.key, lease.lease_owner, lease.attempts) for lease in result] == [
+        ("AUT-1", "worker-1", 1)
+    ]
+    assert len(work_queue.list_leases()) == 2
+
+
+def test_purge(work_queue):
+    work_queue.enqueue(QUEUE_NAME, {"AUT-1": {}, "AUT-2": {}})
+    work_queue.enqueue("agreements", {"AGR-1": {}})
+
+    result = work_queue.purge(QUEUE_NAME)
+
+    assert result == 2
+    assert [stats.queue_name for stats in work_queue.get_stats(0)] == ["agreements"]
+
+
+def test_open_on_network_filesystem_fails(mocker, tmp_path):
+    mocker.patch(
+        "swo_aws_extension.work_queue.sqlite_queue._read_mounts",
+        autospec=True,
+        return_value={Path("/"): "overlay", tmp_path: "nfs4"},
+    )
+
+    with pytest.raises(NetworkFilesystemError, match="nfs4 network filesystem"):
+        SQLiteWorkQueue(tmp_path / "queue.db", lease_seconds=60, max_attempts=2)  # act
+
+
+def test_open_uses_rollback_journal(tmp_path):
+    SQLiteWorkQueue(tmp_path / "queue.db", lease_seconds=60, max_attempts=2)  # act
+
+    with closing(sqlite3.connect(tmp_path / "queue.db")) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+
+
+@pytest.mark.parametrize(
+    ("mounts", "expected_type"),
+    [
+        ({Path("/"): "overlay", Path("/data"): "ext4"}, "ext4"),
+        ({Path("/"): "overlay"}, "overlay"),
+        ({}, None),
+    ],
+)
+def test_get_filesystem_type(mocker, mounts, expected_type):
+    mocker.patch(
+        "swo_aws_extension.work_queue.sqlite_queue._read_mounts",
+        autospec=True,
+        return_value=mounts,
+    )
+
+    result = get_filesystem_type(Path("/data/queue"))
+
+    assert result == expected_type
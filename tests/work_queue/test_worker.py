@@ -0,0 +1,134 @@
+import time
+
+import pytest
+from freezegun import freeze_time
+
+from swo_aws_extension.work_queue.sqlite_queue import SQLiteWorkQueue
+from swo_aws_extension.work_queue.worker import (
+    QueueWorker,
+    build_queue_worker,
+    get_run_queue_name,
+    process_payloads,
+)
+
+QUEUE_NAME = "agreements"
+RENEW_SECONDS = 0.01
+PROCESS_SECONDS = 0.1
+
+
+@pytest.fixture
+def work_queue(tmp_path):
+    return SQLiteWorkQueue(tmp_path / "queue.db", lease_seconds=60, max_attempts=1)
+
+
+def test_run_processes_tasks_until_queue_is_drained(mocker, work_queue):
+    mock_process = mocker.MagicMock()
+    queue_worker = QueueWorker(work_queue, QUEUE_NAME, worker_id="worker-1")
+
+    result = queue_worker.run([{"id": "AGR-1"}, {"id": "AGR-2"}], mock_process)
+
+    assert result == 2
+    assert mock_process.call_args_list == [
+        mocker.call({"id": "AGR-1"}),
+        mocker.call({"id": "AGR-2"}),
+    ]
+    assert work_queue.get_stats(0)[0].completed == 2
+
+
+def test_run_skips_tasks_processed_by_other_workers(work_queue):
+    payloads = [{"id": "AGR-1"}, {"id": "AGR-2"}]
+    QueueWorker(work_queue, QUEUE_NAME, worker_id="worker-1").run(payloads, lambda _payload: None)
+    queue_worker = QueueWorker(work_queue, QUEUE_NAME, worker_id="worker-2")
+
+    result = queue_worker.run(payloads, lambda _payload: None)
+
+    assert result == 0
+
+
+def test_run_fails_tasks_that_raise(mocker, work_queue, caplog):
+    mock_process = mocker.MagicMock(side_effect=[RuntimeError("Throttled"), None])
+    queue_worker = QueueWorker(work_queue, QUEUE_NAME, worker_id="worker-1")
+
+    result = queue_worker.run([{"id": "AGR-1"}, {"id": "AGR-2"}], mock_process)
+
+    assert result == 2
+    assert queue_worker.list_task_keys() == ["AGR-2"]
+    assert "AGR-1 - Task of work queue agreements failed" in caplog.text
+
+
+def test_run_renews_lease_while_processing(mocker, work_queue):
+    mock_renew = mocker.spy(work_queue, "renew")
+    queue_worker = QueueWorker(
+        work_queue, QUEUE_NAME, worker_id="worker-1", renew_seconds=RENEW_SECONDS
+    )
+    payloads = [{"id": "AGR-1"}]
+
+    result = queue_worker.run(payloads, lambda _payload: time.sleep(PROCESS_SECONDS))
+
+    assert result == 1
+    assert mock_renew.call_count > 1
+    assert all(call.args[0].key == "AGR-1" for call in mock_renew.call_args_list)
+    assert work_queue.get_stats(0)[0].completed == 1
+
+
+def test_run_waits_for_leases_of_other_workers(mocker, work_queue):
+    work_queue.enqueue(QUEUE_NAME, {"AGR-1": {"id": "AGR-1"}})
+    stuck_task = work_queue.lease(QUEUE_NAME, "worker-1")
+    mock_sleep = mocker.patch(
+        "swo_aws_extension.work_queue.worker.time.sleep",
+        autospec=True,
+        side_effect=lambda _seconds: work_queue.complete(stuck_task),
+    )
+    queue_worker = QueueWorker(work_queue, QUEUE_NAME, worker_id="worker-2", poll_seconds=1)
+
+    result = queue_worker.run([{"id": "AGR-1"}], lambda _payload: None)
+
+    assert result == 0
+    mock_sleep.assert_called_once_with(1)
+
+
+def test_process_payloads_without_worker(mocker):
+    mock_process = mocker.MagicMock()
+
+    process_payloads([{"id": "AGR-1"}, {"id": "AGR-2"}], mock_process)  # act
+
+    assert mock_process.call_count == 2
+
+
+def test_process_payloads_with_worker(mocker):
+    mock_queue_worker = mocker.MagicMock(spec=QueueWorker)
+    mock_process = mocker.MagicMock()
+    payloads = [{"id": "AGR-1"}]
+
+    process_payloads(payloads, mock_process, mock_queue_worker)  # act
+
+    mock_queue_worker.run.assert_called_once_with(payloads, mock_process)
+    mock_process.assert_not_called()
+
+
+@freeze_time("2026-01-05 23:30:00")
+def test_get_run_queue_name_defaults_to_today():
+    result = get_run_queue_name("agreements")
+
+    assert result == "agreements/2026-01-05"
+
+
+def test_get_run_queue_name_with_run_id():
+    result = get_run_queue_name("agreements", "run-2")
+
+    assert result == "agreements/run-2"
+
+
+def test_next_run_processes_tasks_again(mocker, tmp_path):
+    config = mocker.MagicMock(
+        work_queue_path=str(tmp_path / "queue.db"),
+        work_queue_lease_seconds=60,
+        work_queue_max_attempts=1,
+    )
+    payloads = [{"id": "AGR-1"}, {"id": "AGR-2"}]
+    build_queue_worker(config, QUEUE_NAME, "2026-01-05").run(payloads, lambda _payload: None)
+    queue_worker = build_queue_worker(config, QUEUE_NAME, "2026-01-06")
+
+    result = queue_worker.run(payloads, lambda _payload: None)
+
+    assert result == 2